@@ -6,13 +6,17 @@
 # SPDX-License-Identifier: MIT
 """
 The dicts defined in this module are used in the json and xml modules to translate enum members of our
-implementation to the respective string and vice versa.
+implementation to the respective string and vice versa. Additionally, this module contains helpers shared by the
+deserializers of all adapters.
 """
+import logging
 import os
-from typing import BinaryIO, Dict, IO, Type, Union
+from typing import BinaryIO, Dict, IO, Iterable, Set, Type, Union
 
 from basyx.aas import model
 
+logger = logging.getLogger(__name__)
+
 # type aliases for path-like objects and IO
 # used by write_aas_xml_file, read_aas_xml_file, write_aas_json_file, read_aas_json_file
 Path = Union[str, bytes, os.PathLike]
@@ -120,3 +124,41 @@ IEC61360_LEVEL_TYPES_INVERSE: Dict[str, model.base.IEC61360LevelType] = \
 
 KEY_TYPES_CLASSES_INVERSE: Dict[model.KeyTypes, Type[model.Referable]] = \
     {v: k for k, v in model.KEY_TYPES_CLASSES.items()}
+
+
+def insert_identifiables(object_store: model.AbstractObjectStore, identifiables: Iterable[model.Identifiable],
+                         replace_existing: bool = False, ignore_existing: bool = False) -> Set[model.Identifier]:
+    """
+    Insert deserialized :class:`Identifiables <basyx.aas.model.base.Identifiable>` into an object store, using the bulk
+    methods of the store
+
+    All existing objects are looked up before anything is inserted, so an error about an existing identifier leaves
+    the object store unchanged.
+
+    :param object_store: The :class:`ObjectStore <basyx.aas.model.provider.AbstractObjectStore>` to insert the
+                         Identifiables into
+    :param identifiables: The Identifiables to insert. Their identifiers must be unique.
+    :param replace_existing: Whether to replace existing objects with the same identifier in the object store or not
+    :param ignore_existing: Whether to ignore existing objects (e.g. log a message) or raise an error.
+                            This parameter is ignored if replace_existing is ``True``.
+    :raises KeyError: Encountered an identifier that already exists in the given ``object_store`` with both
+                     ``replace_existing`` and ``ignore_existing`` set to ``False``
+    :return: A set of :class:`Identifiers <basyx.aas.model.base.Identifier>` that were added to object_store
+    """
+    identifiables = list(identifiables)
+    existing = object_store.get_many(identifiable.id for identifiable in identifiables)
+    new = []
+    for identifiable in identifiables:
+        existing_identifiable = existing.get(identifiable.id)
+        if existing_identifiable is not None and not replace_existing:
+            error_message = f"object with identifier {identifiable.id} already exists " \
+                            f"in the object store: {existing_identifiable}!"
+            if not ignore_existing:
+                raise KeyError(error_message + f" failed to insert {identifiable}!")
+            logger.info(error_message + f" skipping insertion of {identifiable}...")
+            continue
+        new.append(identifiable)
+    if replace_existing:
+        object_store.discard_many(existing.values())
+    object_store.add_many(new)
+    return {identifiable.id for identifiable in new}
@@ -195,18 +195,22 @@ class AASXReader:
         :param override_existing: If True, existing objects in the object store are overridden with objects from the
             AASX that have the same Identifier. Default behavior is to skip those objects from the AASX.
         """
-        for obj in self._parse_aas_part(part_name, **kwargs):
-            if obj.id in read_identifiables:
-                continue
-            if obj.id in object_store:
+        objects = [obj for obj in self._parse_aas_part(part_name, **kwargs) if obj.id not in read_identifiables]
+        existing = object_store.get_many(obj.id for obj in objects)
+        new_objects = []
+        for obj in objects:
+            if obj.id in existing:
                 if override_existing:
                     logger.info("Overriding existing object in  ObjectStore with {} ...".format(obj))
-                    object_store.discard(obj)
                 else:
                     logger.warning("Skipping {}, since an object with the same id is already contained in the "
                                    "ObjectStore".format(obj))
                     continue
-            object_store.add(obj)
+            new_objects.append(obj)
+        if override_existing:
+            object_store.discard_many(existing.values())
+        object_store.add_many(new_objects)
+        for obj in new_objects:
             read_identifiables.add(obj.id)
             if isinstance(obj, model.Submodel):
                 self._collect_supplementary_files(part_name, obj, file_store)
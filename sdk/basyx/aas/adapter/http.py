@@ -37,6 +37,7 @@ However, several features and routes are currently not supported:
 import abc
 import base64
 import binascii
+import contextvars
 import datetime
 import enum
 import io
@@ -60,7 +61,7 @@ from .xml import XMLConstructables, read_aas_xml_element, xml_serialization, obj
 from .json import AASToJsonEncoder, StrictAASFromJsonDecoder, StrictStrippedAASFromJsonDecoder
 from . import aasx
 
-from typing import Callable, Dict, Iterable, Iterator, List, Optional, Type, TypeVar, Union, Tuple
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Type, TypeVar, Union, Tuple
 
 
 @enum.unique
@@ -431,10 +432,31 @@ class IdShortPathConverter(werkzeug.routing.UnicodeConverter):
 
 
 class WSGIApp:
+    """
+    WSGI application implementing the AAS Repository, Submodel Repository and Concept Description Repository API
+
+    Before objects are returned, they are updated from their external data sources via
+    :meth:`~basyx.aas.model.base.Referable.update`. To avoid hitting the backends on every request, a staleness budget
+    can be given, i.e. the maximum age in seconds of the local data that may be served without updating:
+
+    :param object_store: The object store holding the Identifiables served by this application
+    :param file_store: The store for supplementary files, referenced by :class:`~basyx.aas.model.submodel.File`
+    :param base_path: The path prefix of all routes
+    :param update_max_age: The default staleness budget in seconds for all routes. ``0`` updates the objects on every
+                           request.
+    :param update_max_age_per_route: Staleness budgets overriding ``update_max_age`` for single routes, keyed by the
+                                     name of the route's endpoint method, e.g. ``{"get_submodel": 5.0}``
+    :raises ValueError: If ``update_max_age_per_route`` contains a name, which is not an endpoint of this application
+    """
     def __init__(self, object_store: model.AbstractObjectStore, file_store: aasx.AbstractSupplementaryFileContainer,
-                 base_path: str = "/api/v3.0"):
+                 base_path: str = "/api/v3.0", update_max_age: float = 0,
+                 update_max_age_per_route: Optional[Dict[str, float]] = None):
         self.object_store: model.AbstractObjectStore = object_store
         self.file_store: aasx.AbstractSupplementaryFileContainer = file_store
+        self.update_max_age: float = update_max_age
+        # staleness budget of the request currently handled in this context
+        self._request_max_age: contextvars.ContextVar[float] = \
+            contextvars.ContextVar("request_max_age", default=update_max_age)
         self.url_map = werkzeug.routing.Map([
             Submount(base_path, [
                 Rule("/serialization", methods=["GET"], endpoint=self.not_implemented),
@@ -570,6 +592,11 @@ class WSGIApp:
             "base64url": Base64URLConverter,
             "id_short_path": IdShortPathConverter
         }, strict_slashes=False)
+        endpoint_names = {rule.endpoint.__name__ for rule in self.url_map.iter_rules()}
+        self.update_max_age_per_route: Dict[str, float] = dict(update_max_age_per_route or {})
+        for name in self.update_max_age_per_route:
+            if name not in endpoint_names:
+                raise ValueError(f"Cannot set staleness budget for unknown route {name}!")
 
     # TODO: the parameters can be typed via builtin wsgiref with Python 3.11+
     def __call__(self, environ, start_response) -> Iterable[bytes]:
@@ -580,13 +607,26 @@ class WSGIApp:
         identifiable = self.object_store.get(identifier)
         if not isinstance(identifiable, type_):
             raise NotFound(f"No {type_.__name__} with {identifier} found!")
-        identifiable.update()
+        identifiable.update(max_age=self._request_max_age.get())
         return identifiable
 
-    def _get_all_obj_of_type(self, type_: Type[model.provider._IT]) -> Iterator[model.provider._IT]:
-        for obj in self.object_store:
+    def _get_all_obj_of_type(self, type_: Type[model.provider._IT], index: Optional[model.ObjectStoreIndex] = None,
+                             key: Hashable = None) -> Iterator[model.provider._IT]:
+        """
+        Get all objects of the given type or, if an index is given, only the ones with the given key in this secondary
+        index of the object store. Only the returned objects are updated, so the caller still has to filter them by
+        their updated values.
+        """
+        if index is None:
+            index, key = model.TYPE_INDEX, type_
+        # the budget is looked up eagerly, since the returned iterator may be consumed after the request was handled
+        return self._iter_updated_obj_of_type(type_, self._request_max_age.get(), index, key)
+
+    def _iter_updated_obj_of_type(self, type_: Type[model.provider._IT], max_age: float,
+                                  index: model.ObjectStoreIndex, key: Hashable) -> Iterator[model.provider._IT]:
+        for obj in self.object_store.find(index, key):
             if isinstance(obj, type_):
-                obj.update()
+                obj.update(max_age=max_age)
                 yield obj
 
     def _resolve_reference(self, reference: model.ModelReference[model.base._RT]) -> model.base._RT:
@@ -667,31 +707,41 @@ class WSGIApp:
         return paginated_slice, end_index
 
     def _get_shells(self, request: Request) -> Tuple[Iterator[model.AssetAdministrationShell], int]:
-        aas: Iterator[model.AssetAdministrationShell] = self._get_all_obj_of_type(model.AssetAdministrationShell)
-
         id_short = request.args.get("idShort")
+        asset_ids = request.args.getlist("assetIds")
+        specific_asset_ids: List[model.SpecificAssetId] = []
+        global_asset_ids: List[str] = []
+
+        for asset_id in asset_ids:
+            asset_id_json = base64url_decode(asset_id)
+            asset_dict = json.loads(asset_id_json)
+            name = asset_dict["name"]
+            value = asset_dict["value"]
+
+            if name == "specificAssetId":
+                decoded_specific_id = HTTPApiDecoder.json_list(value, model.SpecificAssetId,
+                                                               False, True)[0]
+                specific_asset_ids.append(decoded_specific_id)
+            elif name == "globalAssetId":
+                global_asset_ids.append(value)
+
+        # The candidates are looked up by the first filter, which is covered by an index of the object store
+        aas: Iterator[model.AssetAdministrationShell]
         if id_short is not None:
-            aas = filter(lambda shell: shell.id_short == id_short, aas)
+            aas = self._get_all_obj_of_type(model.AssetAdministrationShell, model.ID_SHORT_INDEX, id_short)
+        elif len(global_asset_ids) == 1:
+            aas = self._get_all_obj_of_type(model.AssetAdministrationShell, model.GLOBAL_ASSET_ID_INDEX,
+                                            global_asset_ids[0])
+        elif specific_asset_ids:
+            aas = self._get_all_obj_of_type(model.AssetAdministrationShell, model.SPECIFIC_ASSET_ID_INDEX,
+                                            specific_asset_ids[0])
+        else:
+            aas = self._get_all_obj_of_type(model.AssetAdministrationShell)
 
-        asset_ids = request.args.getlist("assetIds")
+        if id_short is not None:
+            aas = filter(lambda shell: shell.id_short == id_short, aas)
 
         if asset_ids:
-            specific_asset_ids = []
-            global_asset_ids = []
-
-            for asset_id in asset_ids:
-                asset_id_json = base64url_decode(asset_id)
-                asset_dict = json.loads(asset_id_json)
-                name = asset_dict["name"]
-                value = asset_dict["value"]
-
-                if name == "specificAssetId":
-                    decoded_specific_id = HTTPApiDecoder.json_list(value, model.SpecificAssetId,
-                                                                   False, True)[0]
-                    specific_asset_ids.append(decoded_specific_id)
-                elif name == "globalAssetId":
-                    global_asset_ids.append(value)
-
             # Filter AAS based on both SpecificAssetIds and globalAssetIds
             aas = filter(lambda shell: (
                     (not specific_asset_ids or all(specific_asset_id in shell.asset_information.specific_asset_id
@@ -707,14 +757,25 @@ class WSGIApp:
         return self._get_obj_ts(url_args["aas_id"], model.AssetAdministrationShell)
 
     def _get_submodels(self, request: Request) -> Tuple[Iterator[model.Submodel], int]:
-        submodels: Iterator[model.Submodel] = self._get_all_obj_of_type(model.Submodel)
         id_short = request.args.get("idShort")
-        if id_short is not None:
-            submodels = filter(lambda sm: sm.id_short == id_short, submodels)
         semantic_id = request.args.get("semanticId")
+        spec_semantic_id: Optional[model.Reference] = None
         if semantic_id is not None:
             spec_semantic_id = HTTPApiDecoder.base64urljson(
                 semantic_id, model.Reference, False)  # type: ignore[type-abstract]
+
+        # The candidates are looked up by the first filter, which is covered by an index of the object store
+        submodels: Iterator[model.Submodel]
+        if id_short is not None:
+            submodels = self._get_all_obj_of_type(model.Submodel, model.ID_SHORT_INDEX, id_short)
+        elif spec_semantic_id is not None:
+            submodels = self._get_all_obj_of_type(model.Submodel, model.SEMANTIC_ID_INDEX, spec_semantic_id)
+        else:
+            submodels = self._get_all_obj_of_type(model.Submodel)
+
+        if id_short is not None:
+            submodels = filter(lambda sm: sm.id_short == id_short, submodels)
+        if semantic_id is not None:
             submodels = filter(lambda sm: sm.semantic_id == spec_semantic_id, submodels)
         paginated_submodels, end_index = self._get_slice(request, submodels)
         return paginated_submodels, end_index
@@ -746,12 +807,19 @@ class WSGIApp:
 
         try:
             endpoint, values = map_adapter.match()
-            return endpoint(request, values, response_t=response_t, map_adapter=map_adapter)
+            token = self._request_max_age.set(self.update_max_age_per_route.get(endpoint.__name__,
+                                                                                self.update_max_age))
+            try:
+                return endpoint(request, values, response_t=response_t, map_adapter=map_adapter)
+            finally:
+                self._request_max_age.reset(token)
 
         # any raised error that leaves this function will cause a 500 internal server error
         # so catch raised http exceptions and return them
         except werkzeug.exceptions.HTTPException as e:
             return http_exception_to_response(e, response_t)
+        except model.FrozenObjectError as e:
+            return http_exception_to_response(werkzeug.exceptions.Forbidden(str(e)), response_t)
 
     # ------ all not implemented ROUTES -------
     def not_implemented(self, request: Request, url_args: Dict, **_kwargs) -> Response:
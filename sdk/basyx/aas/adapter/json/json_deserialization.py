@@ -34,12 +34,12 @@ import contextlib
 import json
 import logging
 import pprint
-from typing import Dict, Callable, ContextManager, TypeVar, Type, List, IO, Optional, Set, get_args
+from typing import Any, Dict, Callable, ContextManager, TypeVar, Type, List, IO, Optional, Set, get_args
 
 from basyx.aas import model
 from .._generic import MODELLING_KIND_INVERSE, ASSET_KIND_INVERSE, KEY_TYPES_INVERSE, ENTITY_TYPES_INVERSE, \
     IEC61360_DATA_TYPES_INVERSE, IEC61360_LEVEL_TYPES_INVERSE, KEY_TYPES_CLASSES_INVERSE, REFERENCE_TYPES_INVERSE, \
-    DIRECTION_INVERSE, STATE_OF_EVENT_INVERSE, QUALIFIER_KIND_INVERSE, PathOrIO, Path
+    DIRECTION_INVERSE, STATE_OF_EVENT_INVERSE, QUALIFIER_KIND_INVERSE, PathOrIO, Path, insert_identifiables
 
 logger = logging.getLogger(__name__)
 
@@ -146,13 +146,34 @@ class AASFromJsonDecoder(json.JSONDecoder):
     :cvar stripped: If ``True``, the JSON objects will be parsed in a stripped manner, excluding some attributes.
                     Defaults to ``False``.
                     See https://git.rwth-aachen.de/acplt/pyi40aas/-/issues/91
+    :cvar reference_pool: An optional :class:`~basyx.aas.model.base.ReferencePool`. If given, all
+                          :class:`Keys <basyx.aas.model.base.Key>` and
+                          :class:`References <basyx.aas.model.base.Reference>` are interned in this pool, i.e. equal
+                          Keys and References share a single instance. This saves memory for data with many recurring
+                          (semantic) references. Defaults to ``None``. To use it, create a subclass of the decoder:
+
+                          .. code-block:: python
+
+                              class InterningAASDecoder(AASFromJsonDecoder):
+                                  reference_pool = model.ReferencePool()
+    :cvar trusted: If ``True``, the data is decoded within :func:`~basyx.aas.model.base.trusted_load`, i.e. without
+                   checking the constraints of the constructed objects. Only use this for data, which has been
+                   validated before. Defaults to ``False``.
     """
     failsafe = True
     stripped = False
+    reference_pool: Optional[model.ReferencePool] = None
+    trusted = False
 
     def __init__(self, *args, **kwargs):
         json.JSONDecoder.__init__(self, object_hook=self.object_hook, *args, **kwargs)
 
+    def decode(self, s: str, *args, **kwargs) -> Any:
+        if not self.trusted:
+            return super().decode(s, *args, **kwargs)
+        with model.trusted_load():
+            return super().decode(s, *args, **kwargs)
+
     @classmethod
     def object_hook(cls, dct: Dict[str, object]) -> object:
         # Check if JSON object seems to be a deserializable AAS object (i.e. it has a modelType). Otherwise, the JSON
@@ -256,9 +277,8 @@ class AASFromJsonDecoder(json.JSONDecoder):
         # However, the `cls._get_kind()` function may assist by retrieving them from the JSON object
         if isinstance(obj, model.Qualifiable) and not cls.stripped:
             if 'qualifiers' in dct:
-                for constraint_dct in _get_ts(dct, 'qualifiers', list):
-                    constraint = cls._construct_qualifier(constraint_dct)
-                    obj.qualifier.add(constraint)
+                obj.qualifier.add_many(cls._construct_qualifier(constraint_dct)
+                                       for constraint_dct in _get_ts(dct, 'qualifiers', list))
         if isinstance(obj, model.HasDataSpecification) and not cls.stripped:
             if 'embeddedDataSpecifications' in dct:
                 for dspec in _get_ts(dct, 'embeddedDataSpecifications', list):
@@ -273,8 +293,8 @@ class AASFromJsonDecoder(json.JSONDecoder):
                     )
         if isinstance(obj, model.HasExtension) and not cls.stripped:
             if 'extensions' in dct:
-                for extension in _get_ts(dct, 'extensions', list):
-                    obj.extension.add(cls._construct_extension(extension))
+                obj.extension.add_many(cls._construct_extension(extension)
+                                       for extension in _get_ts(dct, 'extensions', list))
 
     @classmethod
     def _get_kind(cls, dct: Dict[str, object]) -> model.ModellingKind:
@@ -296,8 +316,20 @@ class AASFromJsonDecoder(json.JSONDecoder):
 
     @classmethod
     def _construct_key(cls, dct: Dict[str, object], object_class=model.Key) -> model.Key:
-        return object_class(type_=KEY_TYPES_INVERSE[_get_ts(dct, 'type', str)],
-                            value=_get_ts(dct, 'value', str))
+        key = object_class(type_=KEY_TYPES_INVERSE[_get_ts(dct, 'type', str)],
+                           value=_get_ts(dct, 'value', str))
+        if cls.reference_pool is not None:
+            return cls.reference_pool.intern_key(key)
+        return key
+
+    @classmethod
+    def _intern_reference(cls, reference: model.base._RefT) -> model.base._RefT:
+        """
+        Helper method to intern a constructed Reference in the :attr:`reference_pool`, if one is configured
+        """
+        if cls.reference_pool is not None:
+            return cls.reference_pool.intern_reference(reference)
+        return reference
 
     @classmethod
     def _construct_specific_asset_id(cls, dct: Dict[str, object], object_class=model.SpecificAssetId) \
@@ -330,8 +362,9 @@ class AASFromJsonDecoder(json.JSONDecoder):
         if reference_type is not model.ExternalReference:
             raise ValueError(f"Expected a reference of type {model.ExternalReference}, got {reference_type}!")
         keys = [cls._construct_key(key_data) for key_data in _get_ts(dct, "keys", list)]
-        return object_class(tuple(keys), cls._construct_reference(_get_ts(dct, 'referredSemanticId', dict))
-                            if 'referredSemanticId' in dct else None)
+        ret = object_class(tuple(keys), cls._construct_reference(_get_ts(dct, 'referredSemanticId', dict))
+                           if 'referredSemanticId' in dct else None)
+        return cls._intern_reference(ret)
 
     @classmethod
     def _construct_model_reference(cls, dct: Dict[str, object], type_: Type[T], object_class=model.ModelReference)\
@@ -348,9 +381,10 @@ class AASFromJsonDecoder(json.JSONDecoder):
         # `type_` is often a `model.Referable`, which is more abstract than e.g. a `model.ConceptDescription`,
         # leading to information loss while deserializing.
         # TODO Remove this fix, when this function is called with correct `type_`
-        return object_class(tuple(keys), last_key_type,
-                            cls._construct_reference(_get_ts(dct, 'referredSemanticId', dict))
-                            if 'referredSemanticId' in dct else None)
+        ret = object_class(tuple(keys), last_key_type,
+                           cls._construct_reference(_get_ts(dct, 'referredSemanticId', dict))
+                           if 'referredSemanticId' in dct else None)
+        return cls._intern_reference(ret)
 
     @classmethod
     def _construct_administrative_information(
@@ -523,9 +557,8 @@ class AASFromJsonDecoder(json.JSONDecoder):
                            specific_asset_id=specific_asset_id)
         cls._amend_abstract_attributes(ret, dct)
         if not cls.stripped and 'statements' in dct:
-            for element in _get_ts(dct, "statements", list):
-                if _expect_type(element, model.SubmodelElement, str(ret), cls.failsafe):
-                    ret.statement.add(element)
+            ret.statement.add_many(element for element in _get_ts(dct, "statements", list)
+                                   if _expect_type(element, model.SubmodelElement, str(ret), cls.failsafe))
         return ret
 
     @classmethod
@@ -560,9 +593,8 @@ class AASFromJsonDecoder(json.JSONDecoder):
                            kind=cls._get_kind(dct))
         cls._amend_abstract_attributes(ret, dct)
         if not cls.stripped and 'submodelElements' in dct:
-            for element in _get_ts(dct, "submodelElements", list):
-                if _expect_type(element, model.SubmodelElement, str(ret), cls.failsafe):
-                    ret.submodel_element.add(element)
+            ret.submodel_element.add_many(element for element in _get_ts(dct, "submodelElements", list)
+                                          if _expect_type(element, model.SubmodelElement, str(ret), cls.failsafe))
         return ret
 
     @classmethod
@@ -635,9 +667,8 @@ class AASFromJsonDecoder(json.JSONDecoder):
             second=cls._construct_reference(_get_ts(dct, 'second', dict)))
         cls._amend_abstract_attributes(ret, dct)
         if not cls.stripped and 'annotations' in dct:
-            for element in _get_ts(dct, 'annotations', list):
-                if _expect_type(element, model.DataElement, str(ret), cls.failsafe):
-                    ret.annotation.add(element)
+            ret.annotation.add_many(element for element in _get_ts(dct, 'annotations', list)
+                                    if _expect_type(element, model.DataElement, str(ret), cls.failsafe))
         return ret
 
     @classmethod
@@ -647,9 +678,8 @@ class AASFromJsonDecoder(json.JSONDecoder):
         ret = object_class(id_short=None)
         cls._amend_abstract_attributes(ret, dct)
         if not cls.stripped and 'value' in dct:
-            for element in _get_ts(dct, "value", list):
-                if _expect_type(element, model.SubmodelElement, str(ret), cls.failsafe):
-                    ret.value.add(element)
+            ret.value.add_many(element for element in _get_ts(dct, "value", list)
+                               if _expect_type(element, model.SubmodelElement, str(ret), cls.failsafe))
         return ret
 
     @classmethod
@@ -672,9 +702,8 @@ class AASFromJsonDecoder(json.JSONDecoder):
                            value_type_list_element=value_type_list_element)
         cls._amend_abstract_attributes(ret, dct)
         if not cls.stripped and 'value' in dct:
-            for element in _get_ts(dct, 'value', list):
-                if _expect_type(element, type_value_list_element, str(ret), cls.failsafe):
-                    ret.value.add(element)
+            ret.value.add_many(element for element in _get_ts(dct, 'value', list)
+                               if _expect_type(element, type_value_list_element, str(ret), cls.failsafe))
         return ret
 
     @classmethod
@@ -799,7 +828,8 @@ def _select_decoder(failsafe: bool, stripped: bool, decoder: Optional[Type[AASFr
 
 def read_aas_json_file_into(object_store: model.AbstractObjectStore, file: PathOrIO, replace_existing: bool = False,
                             ignore_existing: bool = False, failsafe: bool = True, stripped: bool = False,
-                            decoder: Optional[Type[AASFromJsonDecoder]] = None) -> Set[model.Identifier]:
+                            decoder: Optional[Type[AASFromJsonDecoder]] = None,
+                            trusted: bool = False) -> Set[model.Identifier]:
     """
     Read an Asset Administration Shell JSON file according to 'Details of the Asset Administration Shell', chapter 5.5
     into a given object store.
@@ -817,6 +847,9 @@ def read_aas_json_file_into(object_store: model.AbstractObjectStore, file: PathO
                      See https://git.rwth-aachen.de/acplt/pyi40aas/-/issues/91
                      This parameter is ignored if a decoder class is specified.
     :param decoder: The decoder class used to decode the JSON objects
+    :param trusted: If ``True``, the constraints of the constructed objects are not checked (see
+                    :func:`~basyx.aas.model.base.trusted_load`). Only use this for data, which has been validated
+                    before. :func:`~basyx.aas.model.base.validate` may be used to check the objects later on.
     :raises KeyError: **Non-failsafe**: Encountered a duplicate identifier
     :raises KeyError: Encountered an identifier that already exists in the given ``object_store`` with both
                      ``replace_existing`` and ``ignore_existing`` set to ``False``
@@ -826,7 +859,6 @@ def read_aas_json_file_into(object_store: model.AbstractObjectStore, file: PathO
                                          (e.g. an AssetAdministrationShell in ``submodels``)
     :return: A set of :class:`Identifiers <basyx.aas.model.base.Identifier>` that were added to object_store
     """
-    ret: Set[model.Identifier] = set()
     decoder_ = _select_decoder(failsafe, stripped, decoder)
 
     # json.load() accepts TextIO and BinaryIO
@@ -840,9 +872,11 @@ def read_aas_json_file_into(object_store: model.AbstractObjectStore, file: PathO
         cm = contextlib.nullcontext(file)  # type: ignore[arg-type]
 
     # read, parse and convert JSON file
-    with cm as fp:
+    with cm as fp, model.trusted_load() if trusted else contextlib.nullcontext():
         data = json.load(fp, cls=decoder_)
 
+    # The parsed Identifiables by their id, which are inserted into the object store in bulk afterwards
+    identifiables: Dict[model.Identifier, model.Identifiable] = {}
     for name, expected_type in (('assetAdministrationShells', model.AssetAdministrationShell),
                                 ('submodels', model.Submodel),
                                 ('conceptDescriptions', model.ConceptDescription)):
@@ -860,29 +894,18 @@ def read_aas_json_file_into(object_store: model.AbstractObjectStore, file: PathO
                         logger.warning("{} was in wrong list '{}'; nevertheless, we'll use it".format(item, name))
                     else:
                         raise TypeError(error_message)
-                if item.id in ret:
+                if item.id in identifiables:
                     error_message = f"{item} has a duplicate identifier already parsed in the document!"
                     if not decoder_.failsafe:
                         raise KeyError(error_message)
                     logger.error(error_message + " skipping it...")
                     continue
-                existing_element = object_store.get(item.id)
-                if existing_element is not None:
-                    if not replace_existing:
-                        error_message = f"object with identifier {item.id} already exists " \
-                                        f"in the object store: {existing_element}!"
-                        if not ignore_existing:
-                            raise KeyError(error_message + f" failed to insert {item}!")
-                        logger.info(error_message + f" skipping insertion of {item}...")
-                        continue
-                    object_store.discard(existing_element)
-                object_store.add(item)
-                ret.add(item.id)
+                identifiables[item.id] = item
             elif decoder_.failsafe:
                 logger.error(error_message)
             else:
                 raise TypeError(error_message)
-    return ret
+    return insert_identifiables(object_store, identifiables.values(), replace_existing, ignore_existing)
 
 
 def read_aas_json_file(file: PathOrIO, **kwargs) -> model.DictObjectStore[model.Identifiable]:
@@ -61,9 +61,37 @@ class AASToJsonEncoder(json.JSONEncoder):
         """
         The overwritten ``default`` method for :class:`json.JSONEncoder`
 
+        Frozen :class:`Referables <basyx.aas.model.base.Referable>` (see :meth:`~basyx.aas.model.base.Referable.freeze`)
+        are converted into plain Python objects including all contained objects only once per encoder class. Further
+        serializations copy the result, which the standard encode method serializes without calling ``default()``.
+
         :param obj: The object to serialize to json
         :return: The serialized object
         """
+        if isinstance(obj, model.Referable):
+            plain = self._frozen_to_plain(obj)
+            if plain is not None:
+                # The caller may modify the returned object, so it must be a copy of the cached one
+                return _copy_plain(plain)
+        return self._convert(obj)
+
+    def _frozen_to_plain(self, obj: model.Referable) -> Optional[object]:
+        """
+        Get the cached conversion of a frozen Referable into plain Python objects, converting it on first use
+
+        :param obj: The Referable to convert
+        :return: The cached conversion, which is shared and must not be modified, or None, if the Referable is not
+                 frozen
+        """
+        frozen_cache = obj._get_frozen_cache()
+        if frozen_cache is None:
+            return None
+        key = type(self)
+        if key not in frozen_cache:
+            frozen_cache[key] = self._to_plain(self._convert(obj))
+        return frozen_cache[key]
+
+    def _convert(self, obj: object) -> object:
         mapping: Dict[Type, Callable] = {
             model.AdministrativeInformation: self._administrative_information_to_json,
             model.AnnotatedRelationshipElement: self._annotated_relationship_element_to_json,
@@ -100,6 +128,26 @@ class AASToJsonEncoder(json.JSONEncoder):
                 return mapping_method(obj)
         return super().default(obj)
 
+    def _to_plain(self, obj: object) -> object:
+        """
+        Recursively convert the contained BaSyx Python SDK objects of the result of a conversion function
+
+        :param obj: The result of a conversion function
+        :return: An equivalent object, only consisting of dicts, lists and types natively supported by the encoder
+        """
+        if isinstance(obj, dict):
+            return {key: self._to_plain(value) for key, value in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return [self._to_plain(value) for value in obj]
+        if obj is None or isinstance(obj, (str, int, float)):
+            return obj
+        if isinstance(obj, model.Referable):
+            plain = self._frozen_to_plain(obj)
+            if plain is not None:
+                # The cached conversion of a frozen Referable is plain already and shared with its parent's
+                return plain
+        return self._to_plain(self.default(obj))
+
     @classmethod
     def _abstract_classes_to_json(cls, obj: object) -> Dict[str, object]:
         """
@@ -679,6 +727,17 @@ class StrippedAASToJsonEncoder(AASToJsonEncoder):
     stripped = True
 
 
+def _copy_plain(obj: object) -> object:
+    """
+    Copy the dicts and lists of a conversion into plain Python objects (see :meth:`AASToJsonEncoder._to_plain`)
+    """
+    if isinstance(obj, dict):
+        return {key: _copy_plain(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_copy_plain(value) for value in obj]
+    return obj
+
+
 def _select_encoder(stripped: bool, encoder: Optional[Type[AASToJsonEncoder]] = None) -> Type[AASToJsonEncoder]:
     """
     Returns the correct encoder based on the stripped parameter. If an encoder class is given, stripped is ignored.
@@ -43,6 +43,7 @@ and construct them if available, and so on.
 
 from ... import model
 from lxml import etree
+import contextlib
 import logging
 import base64
 import enum
@@ -50,7 +51,8 @@ import enum
 from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple, Type, TypeVar
 from .._generic import XML_NS_MAP, XML_NS_AAS, MODELLING_KIND_INVERSE, ASSET_KIND_INVERSE, KEY_TYPES_INVERSE, \
     ENTITY_TYPES_INVERSE, IEC61360_DATA_TYPES_INVERSE, IEC61360_LEVEL_TYPES_INVERSE, KEY_TYPES_CLASSES_INVERSE, \
-    REFERENCE_TYPES_INVERSE, DIRECTION_INVERSE, STATE_OF_EVENT_INVERSE, QUALIFIER_KIND_INVERSE, PathOrIO
+    REFERENCE_TYPES_INVERSE, DIRECTION_INVERSE, STATE_OF_EVENT_INVERSE, QUALIFIER_KIND_INVERSE, PathOrIO, \
+    insert_identifiables
 
 NS_AAS = XML_NS_AAS
 REQUIRED_NAMESPACES: Set[str] = {XML_NS_MAP["aas"]}
@@ -440,9 +442,19 @@ class AASFromXmlDecoder:
     will be skipped.
     Most member functions support the ``object_class`` parameter. It was introduced, so they can be overwritten
     in subclasses, which allows constructing instances of subtypes.
+
+    :cvar reference_pool: An optional :class:`~basyx.aas.model.base.ReferencePool`. If given, all
+                          :class:`Keys <basyx.aas.model.base.Key>` and
+                          :class:`References <basyx.aas.model.base.Reference>` are interned in this pool, i.e. equal
+                          Keys and References share a single instance. Defaults to ``None``.
+    :cvar trusted: If ``True``, :func:`read_aas_xml_element` and :func:`read_aas_xml_file_into` construct the objects
+                   within :func:`~basyx.aas.model.base.trusted_load`, i.e. without checking their constraints. Only use
+                   this for data, which has been validated before. Defaults to ``False``.
     """
     failsafe = True
     stripped = False
+    reference_pool: Optional[model.ReferencePool] = None
+    trusted = False
 
     @classmethod
     def _amend_abstract_attributes(cls, obj: object, element: etree._Element) -> None:
@@ -488,8 +500,8 @@ class AASFromXmlDecoder:
         if isinstance(obj, model.Qualifiable) and not cls.stripped:
             qualifiers_elem = element.find(NS_AAS + "qualifiers")
             if qualifiers_elem is not None and len(qualifiers_elem) > 0:
-                for qualifier in _failsafe_construct_multiple(qualifiers_elem, cls.construct_qualifier, cls.failsafe):
-                    obj.qualifier.add(qualifier)
+                obj.qualifier.add_many(_failsafe_construct_multiple(qualifiers_elem, cls.construct_qualifier,
+                                                                    cls.failsafe))
         if isinstance(obj, model.HasDataSpecification) and not cls.stripped:
             embedded_data_specifications_elem = element.find(NS_AAS + "embeddedDataSpecifications")
             if embedded_data_specifications_elem is not None:
@@ -499,9 +511,8 @@ class AASFromXmlDecoder:
         if isinstance(obj, model.HasExtension) and not cls.stripped:
             extension_elem = element.find(NS_AAS + "extensions")
             if extension_elem is not None:
-                for extension in _child_construct_multiple(extension_elem, NS_AAS + "extension",
-                                                           cls.construct_extension, cls.failsafe):
-                    obj.extension.add(extension)
+                obj.extension.add_many(_child_construct_multiple(extension_elem, NS_AAS + "extension",
+                                                                 cls.construct_extension, cls.failsafe))
 
     @classmethod
     def _construct_relationship_element_internal(cls, element: etree._Element, object_class: Type[RE], **_kwargs: Any) \
@@ -570,10 +581,22 @@ class AASFromXmlDecoder:
     @classmethod
     def construct_key(cls, element: etree._Element, object_class=model.Key, **_kwargs: Any) \
             -> model.Key:
-        return object_class(
+        key = object_class(
             _child_text_mandatory_mapped(element, NS_AAS + "type", KEY_TYPES_INVERSE),
             _child_text_mandatory(element, NS_AAS + "value")
         )
+        if cls.reference_pool is not None:
+            return cls.reference_pool.intern_key(key)
+        return key
+
+    @classmethod
+    def _intern_reference(cls, reference: model.base._RefT) -> model.base._RefT:
+        """
+        Helper function to intern a constructed Reference in the :attr:`reference_pool`, if one is configured
+        """
+        if cls.reference_pool is not None:
+            return cls.reference_pool.intern_reference(reference)
+        return reference
 
     @classmethod
     def construct_reference(cls, element: etree._Element, namespace: str = NS_AAS, **kwargs: Any) -> model.Reference:
@@ -592,9 +615,10 @@ class AASFromXmlDecoder:
                                      object_class=model.ExternalReference, **_kwargs: Any) \
             -> model.ExternalReference:
         _expect_reference_type(element, model.ExternalReference)
-        return object_class(cls._construct_key_tuple(element, namespace=namespace),
-                            _failsafe_construct(element.find(NS_AAS + "referredSemanticId"), cls.construct_reference,
-                                                cls.failsafe, namespace=namespace))
+        return cls._intern_reference(object_class(
+            cls._construct_key_tuple(element, namespace=namespace),
+            _failsafe_construct(element.find(NS_AAS + "referredSemanticId"), cls.construct_reference, cls.failsafe,
+                                namespace=namespace)))
 
     @classmethod
     def construct_model_reference(cls, element: etree._Element, object_class=model.ModelReference, **_kwargs: Any) \
@@ -610,8 +634,8 @@ class AASFromXmlDecoder:
         type_: Type[model.Referable] = model.Referable  # type: ignore
         if len(keys) > 0:
             type_ = KEY_TYPES_CLASSES_INVERSE.get(keys[-1].type, model.Referable)  # type: ignore
-        return object_class(keys, type_, _failsafe_construct(element.find(NS_AAS + "referredSemanticId"),
-                                                             cls.construct_reference, cls.failsafe))
+        return cls._intern_reference(object_class(keys, type_, _failsafe_construct(
+            element.find(NS_AAS + "referredSemanticId"), cls.construct_reference, cls.failsafe)))
 
     @classmethod
     def construct_model_reference_expect_type(cls, element: etree._Element, type_: Type[model.base._RT],
@@ -627,8 +651,8 @@ class AASFromXmlDecoder:
         if keys and not issubclass(KEY_TYPES_CLASSES_INVERSE.get(keys[-1].type, type(None)), type_):
             logger.warning("type %s of last key of reference to %s does not match reference type %s",
                            keys[-1].type.name, " / ".join(str(k) for k in keys), type_.__name__)
-        return object_class(keys, type_, _failsafe_construct(element.find(NS_AAS + "referredSemanticId"),
-                                                             cls.construct_reference, cls.failsafe))
+        return cls._intern_reference(object_class(keys, type_, _failsafe_construct(
+            element.find(NS_AAS + "referredSemanticId"), cls.construct_reference, cls.failsafe)))
 
     @classmethod
     def construct_administrative_information(cls, element: etree._Element, object_class=model.AdministrativeInformation,
@@ -767,9 +791,8 @@ class AASFromXmlDecoder:
         if not cls.stripped:
             annotations = element.find(NS_AAS + "annotations")
             if annotations is not None:
-                for data_element in _failsafe_construct_multiple(annotations, cls.construct_data_element,
-                                                                 cls.failsafe):
-                    annotated_relationship_element.annotation.add(data_element)
+                annotated_relationship_element.annotation.add_many(
+                    _failsafe_construct_multiple(annotations, cls.construct_data_element, cls.failsafe))
         return annotated_relationship_element
 
     @classmethod
@@ -837,9 +860,8 @@ class AASFromXmlDecoder:
         if not cls.stripped:
             statements = element.find(NS_AAS + "statements")
             if statements is not None:
-                for submodel_element in _failsafe_construct_multiple(statements, cls.construct_submodel_element,
-                                                                     cls.failsafe):
-                    entity.statement.add(submodel_element)
+                entity.statement.add_many(_failsafe_construct_multiple(statements, cls.construct_submodel_element,
+                                                                       cls.failsafe))
         cls._amend_abstract_attributes(entity, element)
         return entity
 
@@ -948,9 +970,8 @@ class AASFromXmlDecoder:
         if not cls.stripped:
             value = element.find(NS_AAS + "value")
             if value is not None:
-                for submodel_element in _failsafe_construct_multiple(value, cls.construct_submodel_element,
-                                                                     cls.failsafe):
-                    collection.value.add(submodel_element)
+                collection.value.add_many(_failsafe_construct_multiple(value, cls.construct_submodel_element,
+                                                                       cls.failsafe))
         cls._amend_abstract_attributes(collection, element)
         return collection
 
@@ -1050,9 +1071,9 @@ class AASFromXmlDecoder:
         if not cls.stripped:
             submodel_elements = element.find(NS_AAS + "submodelElements")
             if submodel_elements is not None:
-                for submodel_element in _failsafe_construct_multiple(submodel_elements, cls.construct_submodel_element,
-                                                                     cls.failsafe):
-                    submodel.submodel_element.add(submodel_element)
+                submodel.submodel_element.add_many(_failsafe_construct_multiple(submodel_elements,
+                                                                                cls.construct_submodel_element,
+                                                                                cls.failsafe))
         cls._amend_abstract_attributes(submodel, element)
         return submodel
 
@@ -1310,7 +1331,8 @@ class XMLConstructables(enum.Enum):
 
 
 def read_aas_xml_element(file: PathOrIO, construct: XMLConstructables, failsafe: bool = True, stripped: bool = False,
-                         decoder: Optional[Type[AASFromXmlDecoder]] = None, **constructor_kwargs) -> Optional[object]:
+                         decoder: Optional[Type[AASFromXmlDecoder]] = None, trusted: bool = False,
+                         **constructor_kwargs) -> Optional[object]:
     """
     Construct a single object from an XML string. The namespaces have to be declared on the object itself, since there
     is no surrounding environment element.
@@ -1324,6 +1346,9 @@ def read_aas_xml_element(file: PathOrIO, construct: XMLConstructables, failsafe:
                      See https://git.rwth-aachen.de/acplt/pyi40aas/-/issues/91
                      This parameter is ignored if a decoder class is specified.
     :param decoder: The decoder class used to decode the XML elements
+    :param trusted: If ``True``, the constraints of the constructed objects are not checked (see
+                    :func:`~basyx.aas.model.base.trusted_load`). Only use this for data, which has been validated
+                    before.
     :param constructor_kwargs: Keyword arguments passed to the constructor function
     :raises ~lxml.etree.XMLSyntaxError: **Non-failsafe**: If the given file(-handle) has invalid XML
     :raises KeyError: **Non-failsafe**: If a required namespace has not been declared on the XML document
@@ -1418,13 +1443,14 @@ def read_aas_xml_element(file: PathOrIO, construct: XMLConstructables, failsafe:
         raise ValueError(f"{construct.name} cannot be constructed!")
 
     element = _parse_xml_document(file, failsafe=decoder_.failsafe)
-    return _failsafe_construct(element, constructor, decoder_.failsafe, **constructor_kwargs)
+    with model.trusted_load() if trusted or decoder_.trusted else contextlib.nullcontext():
+        return _failsafe_construct(element, constructor, decoder_.failsafe, **constructor_kwargs)
 
 
 def read_aas_xml_file_into(object_store: model.AbstractObjectStore[model.Identifiable], file: PathOrIO,
                            replace_existing: bool = False, ignore_existing: bool = False, failsafe: bool = True,
                            stripped: bool = False, decoder: Optional[Type[AASFromXmlDecoder]] = None,
-                           **parser_kwargs: Any) -> Set[model.Identifier]:
+                           trusted: bool = False, **parser_kwargs: Any) -> Set[model.Identifier]:
     """
     Read an Asset Administration Shell XML file according to 'Details of the Asset Administration Shell', chapter 5.4
     into a given :class:`ObjectStore <basyx.aas.model.provider.AbstractObjectStore>`.
@@ -1442,6 +1468,9 @@ def read_aas_xml_file_into(object_store: model.AbstractObjectStore[model.Identif
                      See https://git.rwth-aachen.de/acplt/pyi40aas/-/issues/91
                      This parameter is ignored if a decoder class is specified.
     :param decoder: The decoder class used to decode the XML elements
+    :param trusted: If ``True``, the constraints of the constructed objects are not checked (see
+                    :func:`~basyx.aas.model.base.trusted_load`). Only use this for data, which has been validated
+                    before. :func:`~basyx.aas.model.base.validate` may be used to check the objects later on.
     :param parser_kwargs: Keyword arguments passed to the XMLParser constructor
     :raises ~lxml.etree.XMLSyntaxError: **Non-failsafe**: If the given file(-handle) has invalid XML
     :raises KeyError: **Non-failsafe**: If a required namespace has not been declared on the XML document
@@ -1453,8 +1482,6 @@ def read_aas_xml_file_into(object_store: model.AbstractObjectStore[model.Identif
     :raises TypeError: **Non-failsafe**: Encountered an undefined top-level list (e.g. ``<aas:submodels1>``)
     :return: A set of :class:`Identifiers <basyx.aas.model.base.Identifier>` that were added to object_store
     """
-    ret: Set[model.Identifier] = set()
-
     decoder_ = _select_decoder(failsafe, stripped, decoder)
 
     element_constructors: Dict[str, Callable[..., model.Identifiable]] = {
@@ -1468,38 +1495,29 @@ def read_aas_xml_file_into(object_store: model.AbstractObjectStore[model.Identif
     root = _parse_xml_document(file, failsafe=decoder_.failsafe, **parser_kwargs)
 
     if root is None:
-        return ret
-
-    # Add AAS objects to ObjectStore
-    for list_ in root:
-        element_tag = list_.tag[:-1]
-        if list_.tag[-1] != "s" or element_tag not in element_constructors:
-            error_message = f"Unexpected top-level list {_element_pretty_identifier(list_)}!"
-            if not decoder_.failsafe:
-                raise TypeError(error_message)
-            logger.warning(error_message)
-            continue
-        constructor = element_constructors[element_tag]
-        for element in _child_construct_multiple(list_, element_tag, constructor, decoder_.failsafe):
-            if element.id in ret:
-                error_message = f"{element} has a duplicate identifier already parsed in the document!"
+        return set()
+
+    # The parsed Identifiables by their id, which are inserted into the object store in bulk afterwards
+    identifiables: Dict[model.Identifier, model.Identifiable] = {}
+    with model.trusted_load() if trusted or decoder_.trusted else contextlib.nullcontext():
+        for list_ in root:
+            element_tag = list_.tag[:-1]
+            if list_.tag[-1] != "s" or element_tag not in element_constructors:
+                error_message = f"Unexpected top-level list {_element_pretty_identifier(list_)}!"
                 if not decoder_.failsafe:
-                    raise KeyError(error_message)
-                logger.error(error_message + " skipping it...")
+                    raise TypeError(error_message)
+                logger.warning(error_message)
                 continue
-            existing_element = object_store.get(element.id)
-            if existing_element is not None:
-                if not replace_existing:
-                    error_message = f"object with identifier {element.id} already exists " \
-                                    f"in the object store: {existing_element}!"
-                    if not ignore_existing:
-                        raise KeyError(error_message + f" failed to insert {element}!")
-                    logger.info(error_message + f" skipping insertion of {element}...")
+            constructor = element_constructors[element_tag]
+            for element in _child_construct_multiple(list_, element_tag, constructor, decoder_.failsafe):
+                if element.id in identifiables:
+                    error_message = f"{element} has a duplicate identifier already parsed in the document!"
+                    if not decoder_.failsafe:
+                        raise KeyError(error_message)
+                    logger.error(error_message + " skipping it...")
                     continue
-                object_store.discard(existing_element)
-            object_store.add(element)
-            ret.add(element.id)
-    return ret
+                identifiables[element.id] = element
+    return insert_identifiables(object_store, identifiables.values(), replace_existing, ignore_existing)
 
 
 def read_aas_xml_file(file: PathOrIO, **kwargs: Any) -> model.DictObjectStore[model.Identifiable]:
@@ -34,6 +34,7 @@ How to use:
 from lxml import etree
 from typing import Callable, Dict, Optional, Type
 import base64
+import copy
 
 from basyx.aas import model
 from .. import _generic
@@ -873,8 +874,22 @@ def object_to_xml_element(obj: object) -> etree._Element:
     """
     Serialize a single object to an :class:`~lxml.etree._Element`.
 
+    The serialization of a frozen :class:`~basyx.aas.model.base.Referable` (see
+    :meth:`~basyx.aas.model.base.Referable.freeze`) is cached, so further calls only need to copy it.
+
     :param obj: The object to serialize
     """
+    frozen_cache = obj._get_frozen_cache() if isinstance(obj, model.Referable) else None
+    if frozen_cache is None:
+        return _object_to_xml_element(obj)
+    element = frozen_cache.get(object_to_xml_element)
+    if element is None:
+        element = frozen_cache[object_to_xml_element] = _object_to_xml_element(obj)
+    # The caller may modify the returned element (e.g. move its children into another one), so it must be a copy
+    return copy.deepcopy(element)
+
+
+def _object_to_xml_element(obj: object) -> etree._Element:
     serialization_func: Callable[..., etree._Element]
 
     if isinstance(obj, model.Key):
@@ -21,7 +21,7 @@ Then, the Backend class needs to be registered to handle update/commit requests
 """
 import abc
 import re
-from typing import List, Dict, Type, TYPE_CHECKING
+from typing import List, Dict, Optional, Type, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..model import Referable
@@ -36,14 +36,20 @@ class Backend(metaclass=abc.ABCMeta):
     from this class and be registered via :meth:`~basyx.aas.backend.backends.register_backend`. to be used by Referable
     object's :meth:`~basyx.aas.model.base.Referable.update` and :meth:`~basyx.aas.model.base.Referable.commit` methods
     when required.
+
+    :cvar supports_partial_commit: If True, :meth:`~.Backend.commit_object` is passed the paths of the modified subtrees
+        and is only called, if there are any. Backends, which are able to apply partial updates to their data source,
+        should set this to avoid transferring unchanged data.
     """
+    supports_partial_commit: bool = False
 
     @classmethod
     @abc.abstractmethod
     def commit_object(cls,
                       committed_object: "Referable",
                       store_object: "Referable",
-                      relative_path: List[str]) -> None:
+                      relative_path: List[str],
+                      changed_paths: Optional[List[List[str]]] = None) -> None:
         """
         Function (class method) to be called when an object shall be committed (local changes pushed to the external
         data source) via this backend implementation.
@@ -72,6 +78,12 @@ class Backend(metaclass=abc.ABCMeta):
             ``store_object``, such that `obj = store_object; for i in relative_path: obj = obj.get_referable(i)`
             resolves to the ``committed_object``. In case that ``store_object is committed_object``, it is an empty
             list.
+        :param changed_paths: Only passed to backends with ``supports_partial_commit``: List of id_short paths, starting
+            at the ``store_object``, to the roots of all subtrees of the ``committed_object``, which have been modified
+            since their last synchronisation. The backend MAY restrict the commit to these subtrees instead of the
+            whole ``committed_object``. Each path starts with the ``relative_path``; if the ``committed_object`` itself
+            has been modified, the ``relative_path`` is the only path. Modified paths outside of the
+            ``committed_object`` are not included.
         :raises BackendNotAvailableException: when the external data source cannot be reached
         """
         pass
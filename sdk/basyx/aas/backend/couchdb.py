@@ -63,7 +63,8 @@ class CouchDBBackend(backends.Backend):
     def commit_object(cls,
                       committed_object: model.Referable,
                       store_object: model.Referable,
-                      relative_path: List[str]) -> None:
+                      relative_path: List[str],
+                      changed_paths: Optional[List[List[str]]] = None) -> None:
         if not isinstance(store_object, model.Identifiable):
             raise CouchDBSourceError("The given store_object is not Identifiable, therefore cannot be found "
                                      "in the CouchDB")
@@ -299,7 +300,15 @@ class CouchDBObjectStore(model.AbstractObjectStore):
             if e.code == 404:
                 raise KeyError("No Identifiable with couchdb-id {} found in CouchDB database".format(couchdb_id)) from e
             raise
+        return self._register_retrieved_document(couchdb_id, data)
+
+    def _register_retrieved_document(self, couchdb_id: str, data: MutableMapping[str, Any]) -> model.Identifiable:
+        """
+        Prepare the object of a document retrieved from the database for being returned to the caller
 
+        The CouchDB metadata is added to the object. If we still have a local replication of the object, it is updated
+        and returned instead.
+        """
         # Add CouchDB metadata (for later commits) to object
         obj = data['data']
         if not isinstance(obj, model.Identifiable):
@@ -365,6 +374,125 @@ class CouchDBObjectStore(model.AbstractObjectStore):
         with self._object_cache_lock:
             self._object_cache[x.id] = x
         self.generate_source(x)  # Set the source of the object
+        self._notify_change(x.id)
+
+    def get_many(self, identifiers: Iterable[model.Identifier]) -> Dict[model.Identifier, model.Identifiable]:
+        """
+        Retrieve multiple AAS objects from the CouchDB with a single ``_all_docs`` request
+
+        :param identifiers: The :class:`Identifiers <basyx.aas.model.base.Identifier>` of the objects to retrieve
+        :return: A dict of all found objects by their Identifiers. Identifiers, which are not found, are omitted.
+        :raises CouchDBError: If error occur during the request to the CouchDB server
+                              (see ``_do_request()`` for details)
+        """
+        keys = [self._transform_id(identifier, False) for identifier in identifiers]
+        if not keys:
+            return {}
+        logger.debug("Fetching %s objects from CouchDB database ...", len(keys))
+        # The keys are sent in the request body (instead of the keys query parameter) to not exceed the maximum URL
+        # length with large batches
+        data = CouchDBBackend.do_request(
+            "{}/{}/_all_docs?include_docs=true".format(self.url, self.database_name),
+            'POST',
+            {'Content-type': 'application/json'},
+            json.dumps({'keys': keys}).encode('utf-8'))
+        result: Dict[model.Identifier, model.Identifiable] = {}
+        for row in data['rows']:
+            # Rows of missing documents have an error, rows of deleted documents have no doc
+            if row.get('doc') is None:
+                continue
+            obj = self._register_retrieved_document(row['id'], row['doc'])
+            result[obj.id] = obj
+        return result
+
+    def add_many(self, objects: Iterable[model.Identifiable]) -> None:
+        """
+        Add multiple objects to the store with a single ``_bulk_docs`` request
+
+        :raises KeyError: If objects with the same ids as some of the given objects exist already in the database. All
+                          other objects are added nonetheless.
+        :raises CouchDBError: If error occur during the request to the CouchDB server
+                              (see ``_do_request()`` for details)
+        """
+        objects = list(objects)
+        if not objects:
+            return
+        logger.debug("Adding %s objects to CouchDB database ...", len(objects))
+        data = json.dumps({'docs': [{'_id': self._transform_id(x.id, False), 'data': x} for x in objects]},
+                          cls=json_serialization.AASToJsonEncoder)
+        results: Any = CouchDBBackend.do_request(
+            "{}/{}/_bulk_docs".format(self.url, self.database_name),
+            'POST',
+            {'Content-type': 'application/json'},
+            data.encode('utf-8'))
+        # The results are in the order of the given documents
+        existing: List[model.Identifier] = []
+        errors: List[str] = []
+        for x, result in zip(objects, results):
+            if result.get('error') == 'conflict':
+                existing.append(x.id)
+                continue
+            if 'error' in result:
+                errors.append("{}: {} (reason: {})".format(x.id, result['error'], result.get('reason')))
+                continue
+            set_couchdb_revision("{}/{}/{}".format(self.url, self.database_name, self._transform_id(x.id)),
+                                 result["rev"])
+            with self._object_cache_lock:
+                self._object_cache[x.id] = x
+            self.generate_source(x)  # Set the source of the object
+            self._notify_change(x.id)
+        if errors:
+            raise CouchDBResponseError("Could not add objects to CouchDB database: {}".format("; ".join(errors)))
+        if existing:
+            raise KeyError("Identifiables with ids {} already exist in CouchDB database".format(", ".join(existing)))
+
+    def discard_many(self, objects: Iterable[model.Identifiable]) -> None:
+        """
+        Delete multiple :class:`~basyx.aas.model.base.Identifiable` AAS objects from the CouchDB database with a
+        single ``_bulk_docs`` request. Objects, which do not exist in the database, are ignored.
+
+        The current revisions of the objects are fetched from the database beforehand (like by :meth:`discard` with
+        ``safe_delete=False``) with a single ``_all_docs`` request.
+
+        :param objects: The objects to be deleted
+        :raises CouchDBConflictError: If some of the objects have been modified in the database in the meantime. All
+                                      other objects are deleted nonetheless.
+        :raises CouchDBError: If error occur during the request to the CouchDB server
+                              (see ``_do_request()`` for details)
+        """
+        objects_by_couchdb_id = {self._transform_id(x.id, False): x for x in objects}
+        if not objects_by_couchdb_id:
+            return
+        logger.debug("Deleting %s objects from CouchDB database ...", len(objects_by_couchdb_id))
+        data = CouchDBBackend.do_request(
+            "{}/{}/_all_docs".format(self.url, self.database_name),
+            'POST',
+            {'Content-type': 'application/json'},
+            json.dumps({'keys': list(objects_by_couchdb_id)}).encode('utf-8'))
+        docs = [{'_id': row['id'], '_rev': row['value']['rev'], '_deleted': True}
+                for row in data['rows']
+                if 'value' in row and not row['value'].get('deleted')]
+        if not docs:
+            return
+        results: Any = CouchDBBackend.do_request(
+            "{}/{}/_bulk_docs".format(self.url, self.database_name),
+            'POST',
+            {'Content-type': 'application/json'},
+            json.dumps({'docs': docs}).encode('utf-8'))
+        conflicts: List[model.Identifier] = []
+        for doc, result in zip(docs, results):
+            x = objects_by_couchdb_id[doc['_id']]
+            if 'error' in result:
+                conflicts.append(x.id)
+                continue
+            delete_couchdb_revision("{}/{}/{}".format(self.url, self.database_name, self._transform_id(x.id)))
+            with self._object_cache_lock:
+                self._object_cache.pop(x.id, None)
+            x.source = ""
+            self._notify_change(x.id)
+        if conflicts:
+            raise CouchDBConflictError("Objects with ids {} have been modified in the database since their revisions "
+                                       "have been fetched for deletion.".format(", ".join(conflicts)))
 
     def discard(self, x: model.Identifiable, safe_delete=False) -> None:
         """
@@ -420,6 +548,7 @@ class CouchDBObjectStore(model.AbstractObjectStore):
         with self._object_cache_lock:
             del self._object_cache[x.id]
         x.source = ""
+        self._notify_change(x.id)
 
     def __contains__(self, x: object) -> bool:
         """
@@ -11,7 +11,7 @@ in local files.
 The :class:`~.LocalFileBackend` takes care of updating and committing objects from and to the files, while the
 :class:`~LocalFileObjectStore` handles adding, deleting and otherwise managing the AAS objects in a specific Directory.
 """
-from typing import List, Iterator, Iterable, Union
+from typing import Dict, List, Iterator, Iterable, Optional, Set, Union
 import logging
 import json
 import os
@@ -54,7 +54,8 @@ class LocalFileBackend(backends.Backend):
     def commit_object(cls,
                       committed_object: model.Referable,
                       store_object: model.Referable,
-                      relative_path: List[str]) -> None:
+                      relative_path: List[str],
+                      changed_paths: Optional[List[List[str]]] = None) -> None:
         if not isinstance(store_object, model.Identifiable):
             raise FileBackendSourceError("The given store_object is not Identifiable, therefore cannot be found "
                                          "in the FileBackend")
@@ -153,6 +154,76 @@ class LocalFileObjectStore(model.AbstractObjectStore):
             with self._object_cache_lock:
                 self._object_cache[x.id] = x
             self.generate_source(x)  # Set the source of the object
+        self._notify_change(x.id)
+
+    def get_many(self, identifiers: Iterable[model.Identifier]) -> Dict[model.Identifier, model.Identifiable]:
+        """
+        Retrieve multiple AAS objects from the local files. The directory is listed once, instead of probing for each
+        file.
+
+        :param identifiers: The :class:`Identifiers <basyx.aas.model.base.Identifier>` of the objects to retrieve
+        :return: A dict of all found objects by their Identifiers. Identifiers, which are not found, are omitted.
+        """
+        stored_hashes = self._list_hashes()
+        result: Dict[model.Identifier, model.Identifiable] = {}
+        for identifier in identifiers:
+            hash_ = self._transform_id(identifier)
+            if hash_ not in stored_hashes:
+                continue
+            try:
+                result[identifier] = self.get_identifiable_by_hash(hash_)
+            except KeyError:
+                # The file has been removed in the meantime
+                pass
+        return result
+
+    def add_many(self, objects: Iterable[model.Identifiable]) -> None:
+        """
+        Add multiple objects to the store. The directory is listed once, instead of probing for each file.
+
+        :raises KeyError: If objects with the same ids as some of the given objects exist already in the object store.
+                          All other objects are added nonetheless.
+        """
+        stored_hashes = self._list_hashes()
+        existing: List[model.Identifier] = []
+        for x in objects:
+            hash_ = self._transform_id(x.id)
+            if hash_ in stored_hashes:
+                existing.append(x.id)
+                continue
+            logger.debug("Adding object %s to Local File Store ...", repr(x))
+            with open("{}/{}.json".format(self.directory_path, hash_), "w") as file:
+                json.dump({"data": x}, file, cls=json_serialization.AASToJsonEncoder, indent=4)
+            stored_hashes.add(hash_)
+            with self._object_cache_lock:
+                self._object_cache[x.id] = x
+            self.generate_source(x)  # Set the source of the object
+            self._notify_change(x.id)
+        if existing:
+            raise KeyError("Identifiables with ids {} already exist in local file database".format(", ".join(existing)))
+
+    def discard_many(self, objects: Iterable[model.Identifiable]) -> None:
+        """
+        Delete multiple :class:`~basyx.aas.model.base.Identifiable` AAS objects from the local file store. Objects,
+        which do not exist in the store, are ignored. The directory is listed once, instead of probing for each file.
+
+        :param objects: The objects to be deleted
+        """
+        stored_hashes = self._list_hashes()
+        for x in objects:
+            hash_ = self._transform_id(x.id)
+            if hash_ not in stored_hashes:
+                continue
+            logger.debug("Deleting object %s from Local File Store database ...", repr(x))
+            try:
+                os.remove("{}/{}.json".format(self.directory_path, hash_))
+            except FileNotFoundError:
+                continue
+            stored_hashes.discard(hash_)
+            with self._object_cache_lock:
+                self._object_cache.pop(x.id, None)
+            x.source = ""
+            self._notify_change(x.id)
 
     def discard(self, x: model.Identifiable) -> None:
         """
@@ -169,6 +240,7 @@ class LocalFileObjectStore(model.AbstractObjectStore):
         with self._object_cache_lock:
             del self._object_cache[x.id]
         x.source = ""
+        self._notify_change(x.id)
 
     def __contains__(self, x: object) -> bool:
         """
@@ -208,6 +280,12 @@ class LocalFileObjectStore(model.AbstractObjectStore):
         for name in os.listdir(self.directory_path):
             yield self.get_identifiable_by_hash(name.rstrip(".json"))
 
+    def _list_hashes(self) -> Set[str]:
+        """
+        Get the identifier hashes of all objects in the local file database
+        """
+        return {name[:-len(".json")] for name in os.listdir(self.directory_path) if name.endswith(".json")}
+
     @staticmethod
     def _transform_id(identifier: model.Identifier) -> str:
         """
@@ -27,14 +27,23 @@ The following types aliased in the :mod:`~basyx.aas.model.base` module are const
 - :class:`~basyx.aas.model.base.ValueTypeIEC61360`
 """
 
+import functools
 import re
+from contextvars import ContextVar
 
-from typing import Callable, Optional, Type, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
 
 _T = TypeVar("_T")
 AASD130_RE = re.compile("[\x09\x0A\x0D\x20-\uD7FF\uE000-\uFFFD\U00010000-\U0010FFFF]*")
 
+# Set by :func:`basyx.aas.model.base.trusted_load` to skip all constraint checks while constructing objects from trusted
+# data. It is defined here, since this module is the lowest one, which checks constraints.
+TRUSTED_LOAD: ContextVar[bool] = ContextVar("TRUSTED_LOAD", default=False)
+
+# The attributes constrained by constrain_attr(), by the decorated class
+_CONSTRAINED_ATTRIBUTES: Dict[type, List[Tuple[str, Callable[[str], None]]]] = {}
+
 
 def _unicode_escape(value: str) -> str:
     """
@@ -46,6 +55,8 @@ def _unicode_escape(value: str) -> str:
 # Functions to verify the constraints for a given value.
 def check(value: str, type_name: str, min_length: int = 0, max_length: Optional[int] = None,
           pattern: Optional[re.Pattern] = None) -> None:
+    if TRUSTED_LOAD.get():
+        return
     if len(value) < min_length:
         raise ValueError(f"{type_name} has a minimum length of {min_length}! (length: {len(value)})")
     if max_length is not None and len(value) > max_length:
@@ -119,9 +130,35 @@ def create_check_function(min_length: int = 0, max_length: Optional[int] = None,
     values are :class:`ShortNames <basyx.aas.model.base.ShortNameType>`. All other
     :class:`:class:`ConstrainedLangStringSets <basyx.aas.model.base.ConstrainedLangStringSet>` use custom constraints.
     """
-    def check_fn(value: str, type_name: str) -> None:
-        return check(value, type_name, min_length, max_length, pattern)
-    return check_fn
+    # A partial object of the module-level check() function, unlike a closure, can be pickled along with the
+    # ConstrainedLangStringSets using it.
+    return functools.partial(check, min_length=min_length, max_length=max_length, pattern=pattern)
+
+
+# A function running a single constraint check, i.e. calling the given check function with the given arguments. Checks
+# of multiple values are passed to a runner one by one, so that a runner, which records the raised violations instead of
+# propagating them, gets all violations of an object.
+CheckRunner = Callable[..., None]
+
+
+def run_check(check_fn: Callable[..., None], *args: Any) -> None:
+    """
+    The default :data:`CheckRunner`: Runs the check, raising the first violation
+    """
+    check_fn(*args)
+
+
+def check_constrained_attributes(obj: object, run: CheckRunner = run_check) -> None:
+    """
+    Checks the current values of all attributes of an object, which are constrained by :func:`~.constrain_attr`.
+
+    :param run: The :data:`CheckRunner` for checking each attribute
+    """
+    for cls in type(obj).__mro__:
+        for pub_attr_name, constraint_check_fn in _CONSTRAINED_ATTRIBUTES.get(cls, ()):
+            value = getattr(obj, pub_attr_name)
+            if value is not None:
+                run(constraint_check_fn, value)
 
 
 # Decorator functions to add getter/setter to classes for verification, whenever a value is updated.
@@ -131,15 +168,23 @@ def constrain_attr(pub_attr_name: str, constraint_check_fn: Callable[[str], None
         def _getter(self) -> Optional[str]:
             return getattr(self, "_" + pub_attr_name)
 
+        # Classes, which record the modifications of their attributes, provide an _assign_attribute() method (see
+        # basyx.aas.model.base._track_attributes())
+        track_modifications = hasattr(decorated_class, "_assign_attribute")
+
         def _setter(self, value: Optional[str]) -> None:
             # if value is None, skip checks. incorrect 'None' assignments are caught by the type checker anyway
             if value is not None:
                 constraint_check_fn(value)
-            setattr(self, "_" + pub_attr_name, value)
+            if track_modifications:
+                self._assign_attribute("_" + pub_attr_name, value)
+            else:
+                setattr(self, "_" + pub_attr_name, value)
 
         if hasattr(decorated_class, pub_attr_name):
             raise AttributeError(f"{decorated_class.__name__} already has an attribute named '{pub_attr_name}'")
         setattr(decorated_class, pub_attr_name, property(_getter, _setter))
+        _CONSTRAINED_ATTRIBUTES.setdefault(decorated_class, []).append((pub_attr_name, constraint_check_fn))
         return decorated_class
 
     return decorator_fn
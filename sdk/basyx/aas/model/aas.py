@@ -16,7 +16,8 @@ from .submodel import Submodel
 
 
 @_string_constraints.constrain_identifier("asset_type")
-class AssetInformation:
+@base._track_attributes("asset_kind", "default_thumbnail")
+class AssetInformation(base._OwnedValue):
     """
     In AssetInformation identifying metadata of the asset that is represented by an AAS is defined.
 
@@ -57,15 +58,19 @@ class AssetInformation:
                  default_thumbnail: Optional[base.Resource] = None):
 
         super().__init__()
-        self.asset_kind: base.AssetKind = asset_kind
+        self.asset_kind: base.AssetKind
+        self._asset_kind: base.AssetKind = asset_kind
         self.asset_type: Optional[base.Identifier] = asset_type
-        self.default_thumbnail: Optional[base.Resource] = default_thumbnail
+        self.default_thumbnail: Optional[base.Resource]
+        self._default_thumbnail: Optional[base.Resource] = default_thumbnail
         # assign private attributes, bypassing setters, as constraints will be checked below
         self._specific_asset_id: base.ConstrainedList[base.SpecificAssetId] = base.ConstrainedList(
             specific_asset_id,
+            item_add_hook=self._check_constraint_add_spec_asset_id,
             item_set_hook=self._check_constraint_set_spec_asset_id,
             item_del_hook=self._check_constraint_del_spec_asset_id
         )
+        self._specific_asset_id._modified_hook = self._notify_owner
         self._global_asset_id: Optional[base.Identifier] = global_asset_id
         self._validate_global_asset_id(global_asset_id)
         self._validate_aasd_131(global_asset_id, bool(specific_asset_id))
@@ -78,7 +83,7 @@ class AssetInformation:
     def global_asset_id(self, global_asset_id: Optional[base.Identifier]) -> None:
         self._validate_global_asset_id(global_asset_id)
         self._validate_aasd_131(global_asset_id, bool(self.specific_asset_id))
-        self._global_asset_id = global_asset_id
+        self._assign_attribute("_global_asset_id", global_asset_id)
 
     @property
     def specific_asset_id(self) -> base.ConstrainedList[base.SpecificAssetId]:
@@ -89,14 +94,20 @@ class AssetInformation:
         # constraints are checked via _check_constraint_set_spec_asset_id() in this case
         self._specific_asset_id[:] = specific_asset_id
 
+    def _check_constraint_add_spec_asset_id(self, _new_item: base.SpecificAssetId,
+                                            _old_list: List[base.SpecificAssetId]) -> None:
+        self._check_not_frozen()
+
     def _check_constraint_set_spec_asset_id(self, items_to_replace: List[base.SpecificAssetId],
                                             new_items: List[base.SpecificAssetId],
                                             old_list: List[base.SpecificAssetId]) -> None:
+        self._check_not_frozen()
         self._validate_aasd_131(self.global_asset_id,
                                 len(old_list) - len(items_to_replace) + len(new_items) > 0)
 
     def _check_constraint_del_spec_asset_id(self, _item_to_del: base.SpecificAssetId,
                                             old_list: List[base.SpecificAssetId]) -> None:
+        self._check_not_frozen()
         self._validate_aasd_131(self.global_asset_id, len(old_list) > 1)
 
     @staticmethod
@@ -106,18 +117,24 @@ class AssetInformation:
 
     @staticmethod
     def _validate_aasd_131(global_asset_id: Optional[base.Identifier], specific_asset_id_nonempty: bool) -> None:
+        if _string_constraints.TRUSTED_LOAD.get():
+            return
         if global_asset_id is None and not specific_asset_id_nonempty:
             raise base.AASConstraintViolation(131,
                                               "An AssetInformation has to have a globalAssetId or a specificAssetId")
         if global_asset_id is not None:
             _string_constraints.check_identifier(global_asset_id)
 
+    def _validate_constraints(self, run: _string_constraints.CheckRunner = _string_constraints.run_check) -> None:
+        run(self._validate_aasd_131, self._global_asset_id, bool(self._specific_asset_id))
+
     def __repr__(self) -> str:
         return "AssetInformation(assetKind={}, globalAssetId={}, specificAssetId={}, assetType={}, " \
                "defaultThumbnail={})".format(self.asset_kind, self._global_asset_id, str(self.specific_asset_id),
                                              self.asset_type, str(self.default_thumbnail))
 
 
+@base._track_attributes("derived_from", "submodel")
 class AssetAdministrationShell(base.Identifiable, base.UniqueIdShortNamespace, base.HasDataSpecification):
     """
     An Asset Administration Shell
@@ -161,14 +178,29 @@ class AssetAdministrationShell(base.Identifiable, base.UniqueIdShortNamespace, b
                  extension: Iterable[base.Extension] = ()):
         super().__init__()
         self.id: base.Identifier = id_
+        self._asset_information: AssetInformation
         self.asset_information: AssetInformation = asset_information
         self.id_short = id_short
-        self.display_name: Optional[base.MultiLanguageNameType] = display_name
+        self._display_name = display_name
         self.category = category
-        self.description: Optional[base.MultiLanguageTextType] = description
+        self._description = description
         self.parent: Optional[base.UniqueIdShortNamespace] = parent
         self.administration: Optional[base.AdministrativeInformation] = administration
-        self.derived_from: Optional[base.ModelReference["AssetAdministrationShell"]] = derived_from
-        self.submodel: Set[base.ModelReference[Submodel]] = set() if submodel is None else submodel
-        self.embedded_data_specifications: List[base.EmbeddedDataSpecification] = list(embedded_data_specifications)
+        self.derived_from: Optional[base.ModelReference["AssetAdministrationShell"]]
+        self._derived_from: Optional[base.ModelReference["AssetAdministrationShell"]] = derived_from
+        self.submodel: Set[base.ModelReference[Submodel]]
+        self._submodel: Set[base.ModelReference[Submodel]] = set() if submodel is None else submodel
+        self._embedded_data_specifications = list(embedded_data_specifications)
         self.extension = base.NamespaceSet(self, [("name", True)], extension)
+
+    @property
+    def asset_information(self) -> AssetInformation:
+        return self._asset_information
+
+    @asset_information.setter
+    def asset_information(self, asset_information: AssetInformation) -> None:
+        self._assign_owned_value("_asset_information", asset_information)
+
+    def _rebuild_indexes(self) -> None:
+        super()._rebuild_indexes()
+        base._own(self._asset_information, self, "_asset_information")
@@ -10,12 +10,21 @@ the higher level classes to inherit from.
 """
 
 import abc
+import contextlib
+import contextvars
+import copy
+import functools
+import hashlib
 import inspect
 import itertools
+import operator
 from enum import Enum, unique
 from typing import List, Optional, Set, TypeVar, MutableSet, Generic, Iterable, Dict, Iterator, Union, overload, \
-    MutableSequence, Type, Any, TYPE_CHECKING, Tuple, Callable, MutableMapping
+    MutableSequence, Type, Any, TYPE_CHECKING, Tuple, Callable, MutableMapping, Mapping, NamedTuple, \
+    Sequence
 import re
+import time
+import weakref
 
 from . import datatypes, _string_constraints
 from ..backend import backends
@@ -278,7 +287,25 @@ class StateOfEvent(Enum):
     OFF = 1
 
 
-class LangStringSet(MutableMapping[str, str]):
+class _Freezable:
+    """
+    Mixin for the mutable values held by Referables, like :class:`~.LangStringSet`, which are made immutable, when a
+    Referable holding them is frozen (see :meth:`.Referable.freeze`). Copies of a frozen value are mutable.
+    """
+    # Set, when a Referable holding this value is frozen
+    _frozen: bool = False
+
+    def _check_not_frozen(self) -> None:
+        if self._frozen:
+            raise FrozenObjectError(f"{self!r} is frozen and cannot be modified")
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_frozen", None)
+        return state
+
+
+class LangStringSet(_Freezable, MutableMapping[str, str]):
     """
     A mapping of language code to string. Must be non-empty.
 
@@ -299,6 +326,8 @@ class LangStringSet(MutableMapping[str, str]):
 
     @classmethod
     def _check_language_tag_constraints(cls, ltag: str):
+        if _string_constraints.TRUSTED_LOAD.get():
+            return
         split = ltag.split("-", 1)
         lang_code = split[0]
         if len(lang_code) != 2 or not lang_code.isalpha() or not lang_code.islower():
@@ -309,10 +338,12 @@ class LangStringSet(MutableMapping[str, str]):
         return self._dict[item]
 
     def __setitem__(self, key: str, value: str) -> None:
+        self._check_not_frozen()
         self._check_language_tag_constraints(key)
         self._dict[key] = value
 
     def __delitem__(self, key: str) -> None:
+        self._check_not_frozen()
         if len(self._dict) == 1:
             raise KeyError(f"A {self.__class__.__name__} must not be empty!")
         del self._dict[key]
@@ -329,6 +360,10 @@ class LangStringSet(MutableMapping[str, str]):
     def clear(self) -> None:
         raise KeyError(f"A {self.__class__.__name__} must not be empty!")
 
+    def _validate_constraints(self, run: _string_constraints.CheckRunner = _string_constraints.run_check) -> None:
+        for ltag in self._dict:
+            run(self._check_language_tag_constraints, ltag)
+
 
 class ConstrainedLangStringSet(LangStringSet, metaclass=abc.ABCMeta):
     """
@@ -347,7 +382,13 @@ class ConstrainedLangStringSet(LangStringSet, metaclass=abc.ABCMeta):
         except ValueError as e:
             raise ValueError(f"The text for the language tag '{ltag}' is invalid: {e}") from e
 
+    def _validate_constraints(self, run: _string_constraints.CheckRunner = _string_constraints.run_check) -> None:
+        super()._validate_constraints(run)
+        for ltag, text in self._dict.items():
+            run(self._check_text_constraints, ltag, text)
+
     def __setitem__(self, key: str, value: str) -> None:
+        self._check_not_frozen()
         self._check_text_constraints(key, value)
         super().__setitem__(key, value)
 
@@ -393,6 +434,42 @@ class ShortNameTypeIEC61360(ConstrainedLangStringSet):
         super().__init__(dict_, _string_constraints.create_check_function(min_length=1, max_length=18))
 
 
+# The abstract base classes of the metamodel (Namespace, Referable, Qualifiable, ...) are combined by multiple
+# inheritance, which Python does not allow for more than one base class with non-empty ``__slots__``. Thus, they
+# declare empty ``__slots__`` and leave storing their attributes to the concrete classes: Concrete classes listing all
+# of these attributes in their own ``__slots__`` (like :class:`~basyx.aas.model.submodel.SubmodelElement`) get along
+# without an instance ``__dict__``, all others just store them in their ``__dict__`` as usual.
+# The empty slots are given as a constant instead of a literal, so that type checkers don't check the attribute
+# assignments within the abstract classes against them.
+_MIXIN_SLOTS: Tuple[str, ...] = ()
+
+# Placeholder for attributes, which are not set on an object
+_NOT_SET = object()
+
+_C = TypeVar("_C", bound=type)
+
+
+def _track_attributes(*pub_attr_names: str) -> Callable[[_C], _C]:
+    """
+    Class decorator, which turns the given public attributes into properties storing their value in the respective
+    private attribute (e.g. ``_value_type`` for ``value_type``), like the decorators of
+    :mod:`~basyx.aas.model._string_constraints`. Assigning the property calls the object's ``_assign_attribute()``
+    method, which records the modification (see :meth:`Referable._assign_attribute`), while constructors initialize
+    the private attributes directly.
+    """
+    def decorator_fn(decorated_class: _C) -> _C:
+        for pub_attr_name in pub_attr_names:
+            def _setter(self, value: Any, attr_name: str = "_" + pub_attr_name) -> None:
+                self._assign_attribute(attr_name, value)
+
+            if hasattr(decorated_class, pub_attr_name):
+                raise AttributeError(f"{decorated_class.__name__} already has an attribute named '{pub_attr_name}'")
+            setattr(decorated_class, pub_attr_name, property(operator.attrgetter("_" + pub_attr_name), _setter))
+        return decorated_class
+
+    return decorator_fn
+
+
 class Key:
     """
     A key is a reference to an element by its id.
@@ -402,6 +479,7 @@ class Key:
                of another AAS. The name of the model element is explicitly listed.
     :ivar value: The key value, for example an IRDI or IRI
     """
+    __slots__ = ('type', 'value', '__weakref__')
 
     def __init__(self,
                  type_: KeyTypes,
@@ -419,6 +497,20 @@ class Key:
         """Prevent modification of attributes."""
         raise AttributeError('Reference is immutable')
 
+    def __reduce__(self):
+        # Slotted and immutable: (deep)copy and pickle must go through the constructor instead of setting the slots
+        return self.__class__, (self.type, self.value)
+
+    def __copy__(self) -> "Key":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Key":
+        # Immutable, so copies can share it
+        return self
+
+    def _validate_constraints(self, run: _string_constraints.CheckRunner = _string_constraints.run_check) -> None:
+        run(_string_constraints.check_identifier, self.value)
+
     def __repr__(self) -> str:
         return "Key(type={}, value={})".format(self.type.name, self.value)
 
@@ -487,6 +579,8 @@ class Namespace(metaclass=abc.ABCMeta):
 
     :ivar namespace_element_sets: List of :class:`NamespaceSets <basyx.aas.model.base.NamespaceSet>`
     """
+    __slots__ = _MIXIN_SLOTS
+
     @abc.abstractmethod
     def __init__(self) -> None:
         super().__init__()
@@ -546,6 +640,8 @@ class HasExtension(Namespace, metaclass=abc.ABCMeta):
     :ivar namespace_element_sets: List of :class:`NamespaceSets <basyx.aas.model.base.NamespaceSet>`
     :ivar extension: A :class:`~.NamespaceSet` of :class:`Extensions <.Extension>` of the element.
     """
+    __slots__ = _MIXIN_SLOTS
+
     @abc.abstractmethod
     def __init__(self) -> None:
         super().__init__()
@@ -579,6 +675,7 @@ class HasExtension(Namespace, metaclass=abc.ABCMeta):
         return super()._remove_object(HasExtension, "name", name)
 
 
+@_track_attributes("display_name", "description")
 class Referable(HasExtension, metaclass=abc.ABCMeta):
     """
     An element that is referable by its id_short. This id is not globally unique. This id is unique within
@@ -606,18 +703,91 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
     :ivar source: Source of the object, a URI, that defines where this object's data originates from.
                   This is used to specify where the Referable should be updated from and committed to.
                   Default is an empty string, making it use the source of its ancestor, if possible.
+
+    Modifications of a Referable are tracked, to allow committing only the changed parts of an object hierarchy to
+    backends, which support partial commits (see :meth:`get_dirty_paths`), and to cache the :attr:`content_hash`.
+    Assigning an attribute of the model (i.e. any attribute but ``parent`` and ``source``), adding or removing
+    elements of its :class:`NamespaceSets <.NamespaceSet>` and assigning attributes of its
+    :class:`Qualifiers <.Qualifier>` and :class:`Extensions <.Extension>` is detected automatically.
+    In-place modifications of other attribute values (e.g. of a :class:`~.LangStringSet` or a list) need to be recorded
+    by calling :meth:`mark_dirty`.
+
+    The same modifications can be observed with :meth:`add_observer`, or prohibited by :meth:`freeze`.
+
+    Referables can be copied with :func:`copy.deepcopy` and pickled. Both include all descendants of the object, but
+    not its ancestors, i.e. the copy has no parent. The object hierarchy is flattened iteratively, so its depth is not
+    limited by the recursion limit, and the NamespaceSets of the copy are rebuilt without checking the constraints
+    again. Copies are not frozen and have no observers.
     """
+    __slots__ = _MIXIN_SLOTS
+
     @abc.abstractmethod
     def __init__(self):
+        # These attributes are checked by _assign_attribute(), which may be called by the other base classes. A new
+        # object has not been synchronised with any external data source yet. The cache of a frozen object is not
+        # None, which doubles as its frozen flag (see freeze()).
+        self._dirty: bool = True
+        self._content_hash: Optional[bytes] = None
+        self._frozen_cache: Optional[Dict[Any, Any]] = None
         super().__init__()
+        self._dirty_descendants: bool = False
         self._id_short: Optional[NameType] = None
-        self.display_name: Optional[MultiLanguageNameType] = dict()
+        self.display_name: Optional[MultiLanguageNameType]
+        self._display_name: Optional[MultiLanguageNameType] = dict()
         self._category: Optional[NameType] = None
-        self.description: Optional[MultiLanguageTextType] = dict()
+        self.description: Optional[MultiLanguageTextType]
+        self._description: Optional[MultiLanguageTextType] = dict()
         # We use a Python reference to the parent Namespace instead of a Reference Object, as specified. This allows
         # simpler and faster navigation/checks and it has no effect in the serialized data formats anyway.
         self.parent: Optional[UniqueIdShortNamespace] = None
         self.source: str = ""
+        # time.monotonic() timestamp of the last synchronisation of this object with an external data source by update()
+        self._update_timestamp: Optional[float] = None
+
+    def _assign_attribute(self, name: str, value: Any, old_value: Any = _NOT_SET) -> None:
+        """
+        Assign the private attribute holding the value of a property and record the modification of this object for
+        dirty tracking, the :attr:`content_hash` and observers. It is called by the property setters (see
+        :func:`_track_attributes`). Constructors initialize the private attributes directly instead, since a new object
+        is dirty anyway.
+
+        :param name: The name of the private attribute, e.g. ``_value_type``
+        :param value: The new value
+        :param old_value: The previous value of the property, if the setter has assigned the private attribute already
+        :raises FrozenObjectError: If this object is frozen
+        """
+        if self._frozen_cache is not None:
+            raise FrozenObjectError(f"{self!r} is frozen and cannot be modified")
+        if _OBSERVERS and old_value is _NOT_SET:
+            old_value = getattr(self, name, _NOT_SET)
+        object.__setattr__(self, name, value)
+        # The ancestors of a dirty object without content hash are already marked, so there's nothing left to do
+        if not self._dirty or self._content_hash is not None:
+            self._set_dirty()
+        if _OBSERVERS:
+            _notify_attribute_set(self, name, value, old_value)
+
+    def _record_modification(self, *_args: Any) -> None:
+        """
+        Record an in-place modification of an attribute value of this object for dirty tracking and the
+        :attr:`content_hash`. It is used as hook of :class:`ConstrainedLists <.ConstrainedList>`, so it accepts and
+        ignores their arguments.
+        """
+        if not self._dirty or self._content_hash is not None:
+            self._set_dirty()
+
+    def _assign_owned_value(self, name: str, value: Optional["_OwnedValue"]) -> None:
+        """
+        Assign a value object to the private attribute ``name`` like :meth:`_assign_attribute` and make this object its
+        owner, such that modifications of the value object are recorded as well (see :class:`_OwnedValue`)
+        """
+        self._check_not_frozen()
+        old_value: Optional[_OwnedValue] = getattr(self, name, None)
+        _own(value, self, name)
+        self._assign_attribute(name, value, old_value)
+        if old_value is not None and old_value is not value and old_value._owner is not None \
+                and old_value._owner[0] is self:
+            old_value._owner = None
 
     def __repr__(self) -> str:
         reversed_path = []
@@ -654,7 +824,7 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
         """
         if category is not None:
             _string_constraints.check_name_type(category)
-        self._category = category
+        self._assign_attribute("_category", category)
 
     def _get_category(self) -> Optional[NameType]:
         return self._category
@@ -704,9 +874,11 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
             id_short doesn't comply to Constraint AASd-002.
         """
 
-        if id_short == self.id_short:
+        old_id_short = self.id_short
+        if id_short == old_id_short:
             return
-        if id_short is not None:
+        self._check_not_frozen()
+        if id_short is not None and not _string_constraints.TRUSTED_LOAD.get():
             self.validate_id_short(id_short)
 
         if self.parent is not None:
@@ -723,15 +895,16 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
                                                      "Namespace".format(id_short))
 
             set_add_list: List[NamespaceSet] = []
-            for set_ in self.parent.namespace_element_sets:
-                if self in set_:
-                    set_add_list.append(set_)
-                    set_.discard(self)
-            self._id_short = id_short
-            for set_ in set_add_list:
-                set_.add(self)
+            with _suppress_events():
+                for set_ in self.parent.namespace_element_sets:
+                    if self in set_:
+                        set_add_list.append(set_)
+                        set_.discard(self)
+                self._id_short = id_short
+                for set_ in set_add_list:
+                    set_.add(self)
         # Redundant to the line above. However, this way, we make sure that we really update the _id_short
-        self._id_short = id_short
+        self._assign_attribute("_id_short", id_short, old_id_short)
 
     def update(self,
                max_age: float = 0,
@@ -744,31 +917,38 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
         If there is no source in any ancestor, this function will do nothing
 
         :param max_age: Maximum age of the local data in seconds. This method may return early, if the previous update
-                        of the object has been performed less than ``max_age`` seconds ago.
+                        of the object has been performed less than ``max_age`` seconds ago. When updating
+                        recursively, the same applies to each child with its own source.
         :param recursive: Also call update on all children of this object. Default is True
         :param _indirect_source: Internal parameter to avoid duplicate updating.
         :raises backends.BackendError: If no appropriate backend or the data source is not available
         """
-        # TODO consider max_age
-        if not _indirect_source:
-            # Update was already called on an ancestor of this Referable. Only update it, if it has its own source
-            if self.source != "":
-                backends.get_backend(self.source).update_object(updated_object=self,
-                                                                store_object=self,
-                                                                relative_path=[])
+        if not self._is_fresh(max_age):
+            if not _indirect_source:
+                # Update was already called on an ancestor of this Referable. Only update it, if it has its own source
+                if self.source != "":
+                    backends.get_backend(self.source).update_object(updated_object=self,
+                                                                    store_object=self,
+                                                                    relative_path=[])
+                    self._update_timestamp = time.monotonic()
+                    self._clear_dirty()
 
-        else:
-            # Try to find a valid source for this Referable
-            if self.source != "":
-                backends.get_backend(self.source).update_object(updated_object=self,
-                                                                store_object=self,
-                                                                relative_path=[])
             else:
-                store_object, relative_path = self.find_source()
-                if store_object and relative_path is not None:
-                    backends.get_backend(store_object.source).update_object(updated_object=self,
-                                                                            store_object=store_object,
-                                                                            relative_path=list(relative_path))
+                # Try to find a valid source for this Referable
+                if self.source != "":
+                    backends.get_backend(self.source).update_object(updated_object=self,
+                                                                    store_object=self,
+                                                                    relative_path=[])
+                    self._update_timestamp = time.monotonic()
+                    self._clear_dirty()
+                else:
+                    store_object, relative_path = self.find_source()
+                    if store_object and relative_path is not None:
+                        backends.get_backend(store_object.source).update_object(updated_object=self,
+                                                                                store_object=store_object,
+                                                                                relative_path=list(relative_path))
+                        self._update_timestamp = time.monotonic()
+                        self._clear_dirty()
 
         if recursive:
             # update all the children who have their own source
@@ -779,6 +959,14 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
                     for referable in namespace_set:
                         referable.update(max_age, recursive=True, _indirect_source=False)
 
+    def _is_fresh(self, max_age: float) -> bool:
+        """
+        Check if this object has been synchronised with its external data source less than ``max_age`` seconds ago
+        """
+        if max_age <= 0 or self._update_timestamp is None:
+            return False
+        return time.monotonic() - self._update_timestamp < max_age
+
     def find_source(self) -> Tuple[Optional["Referable"], Optional[List[str]]]:  # type: ignore
         """
         Finds the closest source in these objects ancestors. If there is no source, returns None
@@ -800,56 +988,95 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
             break
         return None, None
 
-    def update_from(self, other: "Referable", update_source: bool = False):
+    def update_from(self, other: "Referable", update_source: bool = False) -> "ChangeSummary":
         """
         Internal function to updates the object's attributes from another object of a similar type.
 
         This function should not be used directly. It is typically used by backend implementations (database adapters,
         protocol clients, etc.) to update the object's data, after ``update()`` has been called.
 
+        The update is a structural merge: Only attributes, whose values differ, are overwritten and contained
+        Referables are updated recursively, so that unchanged subtrees and the identity of all Referables, which exist
+        in both objects, are preserved. Contained Referables, which only exist in ``other``, are moved into this
+        object.
+
         :param other: The object to update from
         :param update_source: Update the source attribute with the other's source attribute. This is not propagated
                               recursively
+        :return: A :class:`~.ChangeSummary` of all changes applied to this object and its descendants
         """
-        for name, var in vars(other).items():
-            # do not update the parent, namespace_element_sets or source (depending on update_source parameter)
-            if name in ("parent", "namespace_element_sets") or name == "source" and not update_source:
+        summary = ChangeSummary()
+        self._update_from(other, update_source, summary, ())
+        return summary
+
+    def _update_from(self, other: "Referable", update_source: bool, summary: "ChangeSummary",
+                     path: Tuple[NameType, ...]) -> None:
+        self._check_not_frozen()
+        modified_attributes: Set[str] = set()
+        for name, var in _instance_attributes(other):
+            # do not update the parent, namespace_element_sets, internal indexes and caches or source (depending on
+            # update_source parameter)
+            if name in _UPDATE_FROM_IGNORED_ATTRIBUTES or name == "source" and not update_source:
                 continue
             if isinstance(var, NamespaceSet):
                 # update the elements of the NameSpaceSet
-                vars(self)[name].update_nss_from(var)
+                getattr(self, name)._update_nss_from(var, summary, path, name.lstrip("_"))
             else:
-                vars(self)[name] = var  # that variable is not a NameSpaceSet, so it isn't Referable
+                old_value = getattr(self, name, _NOT_SET)
+                if _values_equal(old_value, var):
+                    continue
+                if other._frozen_cache is not None and type(var) not in _IMMUTABLE_TYPES \
+                        and not isinstance(var, (Key, Reference)):
+                    # The values of a frozen object must stay immutable, while this object's values must not be frozen
+                    var = copy.deepcopy(var)
+                # that variable is not a NameSpaceSet, so it isn't Referable. We bypass any property setters here, just
+                # like writing to the instance __dict__ would.
+                if name == "_id" and isinstance(self, Identifiable):
+                    with self._update_object_stores(var):
+                        object.__setattr__(self, name, var)
+                else:
+                    object.__setattr__(self, name, var)
+                if isinstance(var, _OwnedValue):
+                    var._owner = (self, name)
+                modified_attributes.add(name.lstrip("_"))
+                if _OBSERVERS and name != "source":
+                    _notify(_attribute_event(self, name.lstrip("_"), var, old_value))
+        if modified_attributes:
+            summary._add_modified(path, modified_attributes)
+            if modified_attributes != {"source"}:
+                self._set_dirty()
+            if isinstance(self, Identifiable) and self._object_stores:
+                self._notify_object_stores(modified_attributes)
 
     def commit(self) -> None:
         """
         Transfer local changes on this object to all underlying external data sources.
 
         This function commits the current state of this object to its own and each external data source of its
-        ancestors. If there is no source, this function will do nothing.
+        ancestors. If there is no source, this function will do nothing. Backends, which support partial commits, only
+        receive the paths of the subtrees, which have been modified since the last synchronisation (see
+        :meth:`get_dirty_paths`). Afterwards, this object and all of its descendants are considered as synchronised.
         """
+        dirty_paths = self.get_dirty_paths()
         current_ancestor = self.parent
         relative_path: List[NameType] = [self.id_short]
         # Commit to all ancestors with sources
         while current_ancestor:
             assert isinstance(current_ancestor, Referable)
             if current_ancestor.source != "":
-                backends.get_backend(current_ancestor.source).commit_object(committed_object=self,
-                                                                            store_object=current_ancestor,
-                                                                            relative_path=list(relative_path))
+                self._commit_to_backend(current_ancestor, list(relative_path), dirty_paths)
             relative_path.insert(0, current_ancestor.id_short)
             current_ancestor = current_ancestor.parent
         # Commit to own source and check if there are children with sources to commit to
         self._direct_source_commit()
+        self._clear_dirty()
 
     def _direct_source_commit(self):
         """
         Commits children of an ancestor recursively, if they have a specific source given
         """
         if self.source != "":
-            backends.get_backend(self.source).commit_object(committed_object=self,
-                                                            store_object=self,
-                                                            relative_path=[])
+            self._commit_to_backend(self, [], self.get_dirty_paths())
 
         if isinstance(self, UniqueIdShortNamespace):
             for namespace_set in self.namespace_element_sets:
@@ -858,12 +1085,775 @@ class Referable(HasExtension, metaclass=abc.ABCMeta):
                 for referable in namespace_set:
                     referable._direct_source_commit()
 
+    def _commit_to_backend(self, store_object: "Referable", relative_path: List[NameType],
+                           dirty_paths: List[List[NameType]]) -> None:
+        """
+        Commit this object to the backend of the given ``store_object``. Backends supporting partial commits only
+        receive the modified paths, relative to the ``store_object``, and are not called at all, if there are none.
+
+        :param store_object: The object with the relevant source, i.e. this object or one of its ancestors
+        :param relative_path: The id_short path from the ``store_object`` to this object
+        :param dirty_paths: The modified paths, relative to this object, as returned by :meth:`get_dirty_paths`
+        """
+        backend = backends.get_backend(store_object.source)
+        if not backend.supports_partial_commit:
+            backend.commit_object(committed_object=self, store_object=store_object, relative_path=relative_path)
+        elif dirty_paths:
+            backend.commit_object(committed_object=self, store_object=store_object, relative_path=relative_path,
+                                  changed_paths=[relative_path + path for path in dirty_paths])
+
+    def mark_dirty(self) -> None:
+        """
+        Mark this object as modified since its last synchronisation with its external data sources
+
+        This is only required after in-place modifications of attribute values, which are not detected automatically,
+        e.g. of a :class:`~.LangStringSet` or of a contained :class:`~.Qualifier`.
+
+        :raises FrozenObjectError: If this object is frozen
+        """
+        self._check_not_frozen()
+        self._set_dirty()
+
+    def freeze(self) -> None:
+        """
+        Make this object and all of its descendants immutable
+
+        Afterwards, assigning attributes of the objects, adding or removing elements of their
+        :class:`NamespaceSets <.NamespaceSet>`, modifying their :class:`Qualifiers <.Qualifier>` and
+        :class:`Extensions <.Extension>`, the :class:`LangStringSets <.LangStringSet>` and
+        :class:`ConstrainedLists <.ConstrainedList>` held by them or the value objects held by them (like their
+        :class:`~.AdministrativeInformation`, :class:`~basyx.aas.model.aas.AssetInformation`, :class:`~.Resource` and
+        :class:`~.EmbeddedDataSpecification`), as well as :meth:`update_from` raise a :class:`~.FrozenObjectError`.
+        Frozen objects and their AdministrativeInformation and AssetInformation cannot be moved into another object
+        either. Other attribute values, like plain lists and sets, are assumed not to be modified in-place (see
+        :meth:`mark_dirty`).
+
+        Thus, a frozen object hierarchy can be read concurrently by multiple threads without locking. Since it never
+        changes, its :attr:`content_hash` and data derived from it by the adapters (like its JSON and XML serialization)
+        are cached permanently. Freezing cannot be undone.
+        """
+        stack: List[Referable] = [self]
+        while stack:
+            referable = stack.pop()
+            if referable._frozen_cache is not None:
+                # The descendants of a frozen object are frozen as well
+                continue
+            for name, value in _instance_attributes(referable):
+                if not isinstance(value, NamespaceSet):
+                    _freeze_value(value)
+                    continue
+                value._frozen = True
+                for element in value:
+                    if isinstance(element, Referable):
+                        stack.append(element)
+                    else:
+                        for _name, element_value in _instance_attributes(element):
+                            _freeze_value(element_value)
+            referable._frozen_cache = {}
+
+    @property
+    def frozen(self) -> bool:
+        """
+        True, if this object has been made immutable by :meth:`freeze`
+        """
+        return self._frozen_cache is not None
+
+    def _check_not_frozen(self) -> None:
+        if self._frozen_cache is not None:
+            raise FrozenObjectError(f"{self!r} is frozen and cannot be modified")
+
+    def _get_frozen_cache(self) -> Optional[Dict[Any, Any]]:
+        """
+        Get the cache for data derived from this object (e.g. its serialization), keyed by the respective producer
+
+        :return: The cache dict, if this object is frozen, otherwise None, since the data may be outdated anytime
+        """
+        return self._frozen_cache
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return _restore_referable, (_flatten_hierarchy(self)[1],)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Referable":
+        originals, copies = _copy_hierarchy(self, memo)
+        # Other references to objects of the hierarchy (e.g. from a copied list of them) are replaced by their copies
+        for obj, obj_copy in zip(originals, copies):
+            memo[id(obj)] = obj_copy
+        return copies[0]  # type: ignore[return-value]
+
+    def _rebuild_indexes(self) -> None:
+        """
+        Rebuild the internal indexes of this object, which refer to its children, and the back references of its value
+        objects (see :class:`_OwnedValue`), after this object has been restored from a copy or by unpickling. The
+        consolidated id_short index is rebuilt by the NamespaceSets.
+        """
+
+    def _clone(self: "_RT", overrides: Optional[Mapping[Union[NameType, Tuple[NameType, ...]], Any]]) -> "_RT":
+        """
+        Copy this object and its descendants like :meth:`__deepcopy__`, but share frozen LangStringSets, and assign new
+        values to the ``value`` attribute of the copied objects given by their id_short path. See
+        :meth:`basyx.aas.model.submodel.Submodel.clone`.
+
+        :raises TypeError: If a copied object given by the overrides has no ``value`` attribute holding a single value
+        """
+        clone: _RT = _copy_hierarchy(self, {}, share_frozen=True)[1][0]  # type: ignore[assignment]
+        for path, value in (overrides or {}).items():
+            referable = UniqueIdShortNamespace._resolve_id_short_path(
+                clone, (path,) if isinstance(path, str) else path)  # type: ignore[arg-type]
+            # The value of e.g. a SubmodelElementCollection is a NamespaceSet of its children, which cannot be replaced
+            old_value = getattr(referable, "value", _NOT_SET)
+            if old_value is _NOT_SET or isinstance(old_value, NamespaceSet):
+                raise TypeError(f"The value of {referable!r} cannot be overridden, since it has no single value")
+            referable.value = value  # type: ignore[attr-defined]
+        return clone
+
+    def add_observer(self, observer: Callable[["ModelEvent"], None]) -> None:
+        """
+        Register a function to be called with a :class:`~.ModelEvent` for each modification of this object or any of
+        its descendants
+
+        Observers are called synchronously, after the modification has been applied. Exceptions raised by an observer
+        are propagated to the modifying code. As long as no observer is registered on any object, observing costs
+        nothing. Observers are not part of the object's data, i.e. they are neither copied nor serialized.
+
+        Assignments of attributes, adding and removing elements of :class:`NamespaceSets <.NamespaceSet>`, changes of
+        the id_short or id and updates by :meth:`update_from` are observed. Just like for :meth:`mark_dirty`, in-place
+        modifications of other attribute values (e.g. of a :class:`~.LangStringSet`) are not.
+
+        :param observer: The function to call
+        """
+        entry = _OBSERVERS.get(id(self))
+        if entry is None or entry[0]() is not self:
+            entry = (weakref.ref(self, functools.partial(_drop_observers, id(self))), [])
+            _OBSERVERS[id(self)] = entry
+        entry[1].append(observer)
+
+    def remove_observer(self, observer: Callable[["ModelEvent"], None]) -> None:
+        """
+        Unregister a function registered by :meth:`add_observer`
+
+        :raises ValueError: If the function is not registered on this object
+        """
+        entry = _OBSERVERS.get(id(self))
+        if entry is None or entry[0]() is not self:
+            raise ValueError(f"{observer!r} is not registered as observer of {self!r}")
+        entry[1].remove(observer)
+        if not entry[1]:
+            del _OBSERVERS[id(self)]
+
+    def get_dirty_paths(self) -> List[List[NameType]]:
+        """
+        Get the paths of all subtrees of this object, which have been modified since the last synchronisation with the
+        external data sources (i.e. the last :meth:`update` or :meth:`commit` covering them).
+
+        Each path is a list of id_shorts, relative to this object, such that `obj = self; for i in path:
+        obj = obj.get_referable(i)` resolves to the root of a modified subtree. Paths are minimal, i.e. no path is
+        contained within another one. If this object itself has been modified, ``[[]]`` is returned.
+
+        :return: List of id_short paths to the modified subtrees
+        """
+        if self._dirty:
+            return [[]]
+        if not self._dirty_descendants or not isinstance(self, UniqueIdShortNamespace):
+            return []
+        dirty_paths: List[List[NameType]] = []
+        for namespace_set in self.namespace_element_sets:
+            if "id_short" not in namespace_set.get_attribute_name_list():
+                continue
+            for referable in namespace_set:
+                dirty_paths.extend([referable.id_short] + path for path in referable.get_dirty_paths())
+        return dirty_paths
+
+    def _set_dirty(self) -> None:
+        """
+        Record a modification of this object: Mark it as dirty and invalidate the cached content hashes of this object
+        and its ancestors
+        """
+        self._dirty = True
+        self._content_hash = None
+        # Ancestors with a dirty descendant and without content hash are already marked, together with all of their
+        # ancestors. (A content hash is only cached, if the content hashes of all descendants are cached.)
+        ancestor = getattr(self, "parent", None)
+        while isinstance(ancestor, Referable) and (not ancestor._dirty_descendants
+                                                   or ancestor._content_hash is not None):
+            ancestor._dirty_descendants = True
+            ancestor._content_hash = None
+            ancestor = ancestor.parent
+
+    @property
+    def content_hash(self) -> bytes:
+        """
+        Structural fingerprint (SHA-256 digest) of the content of this object and all of its descendants
+
+        Objects of the same type with equal attribute values and equal descendants have the same content hash. The
+        ``source``, the ``parent`` and the id_short of the object itself are not part of its content, but the id_shorts
+        of its children are part of their parent's content. The elements of unordered
+        :class:`NamespaceSets <.NamespaceSet>` are hashed independently of their order.
+
+        The content hash is computed lazily from the content hashes of the children and cached. Modifications of the
+        object invalidate the cached content hashes of the object and its ancestors, so only the modified path needs to
+        be recomputed. See the class documentation on which modifications are detected automatically.
+        """
+        content_hash = self._content_hash
+        if content_hash is None:
+            content_hash = self._compute_hash(include_children=True)
+            self._content_hash = content_hash
+        return content_hash
+
+    def _compute_hash(self, include_children: bool) -> bytes:
+        """
+        Compute the content hash of this object (see :attr:`content_hash`)
+
+        :param include_children: If False, the child Referables (i.e. the elements of NamespaceSets identified by
+                                 id_short) are omitted, resulting in a fingerprint of the object's own attributes only
+        """
+        hash_ = hashlib.sha256()
+        _update_hash_token(hash_, b"C", type(self).__qualname__)
+        for name, value in sorted(_instance_attributes(self), key=lambda item: item[0]):
+            if name in _CONTENT_HASH_IGNORED_ATTRIBUTES \
+                    or not include_children and isinstance(value, NamespaceSet) and "id_short" in value._backend:
+                continue
+            _update_hash_token(hash_, b"A", name.lstrip("_"))
+            _update_fingerprint(hash_, value)
+        return hash_.digest()
+
+    def _clear_dirty(self) -> None:
+        self._dirty = False
+        if not self._dirty_descendants:
+            return
+        self._dirty_descendants = False
+        if isinstance(self, UniqueIdShortNamespace):
+            for namespace_set in self.namespace_element_sets:
+                if "id_short" not in namespace_set.get_attribute_name_list():
+                    continue
+                for referable in namespace_set:
+                    referable._clear_dirty()
+
+    def _validate_constraints(self, run: _string_constraints.CheckRunner = _string_constraints.run_check) -> None:
+        if self._id_short is not None:
+            run(self.validate_id_short, self._id_short)
+        if self._category is not None:
+            run(_string_constraints.check_name_type, self._category)
+
     id_short = property(_get_id_short, _set_id_short)
 
 
 _RT = TypeVar('_RT', bound=Referable)
 
 
+# Attributes, which are not copied by Referable.update_from(), since they are bound to the object itself
+_UPDATE_FROM_IGNORED_ATTRIBUTES = frozenset(("parent", "namespace_element_sets", "_id_short_index",
+                                             "_structure_generation", "_path_cache", "_update_timestamp", "_dirty",
+                                             "_dirty_descendants", "_content_hash",
+                                             "_id_short_seq", "_semantic_id_elements", "_frozen_cache",
+                                             "_object_stores"))
+
+# Attributes of Referables, which are not part of the object's content hash
+_CONTENT_HASH_IGNORED_ATTRIBUTES = _UPDATE_FROM_IGNORED_ATTRIBUTES | {"source", "_id_short", "_content_hash"}
+
+
+def _instance_attributes(obj: object) -> Iterator[Tuple[str, Any]]:
+    """
+    Iterate the (name, value) pairs of all instance attributes of an object, regardless of whether they are stored in
+    ``__slots__`` or in the instance ``__dict__``. This is a replacement for ``vars()``, which only covers the latter.
+
+    Slots, which have not been assigned yet, are skipped.
+    """
+    for name in _slot_names(type(obj)):
+        try:
+            yield name, object.__getattribute__(obj, name)
+        except AttributeError:
+            continue
+    yield from getattr(obj, "__dict__", {}).items()
+
+
+# Cache of _slot_names() by class
+_SLOT_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """
+    Get the names of the ``__slots__`` of a class and all of its base classes, which hold instance attributes
+    """
+    names = _SLOT_NAMES.get(cls)
+    if names is None:
+        names_list: List[str] = []
+        for base_class in cls.__mro__:
+            slots = base_class.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            names_list.extend(name for name in slots if name not in ("__dict__", "__weakref__"))
+        names = _SLOT_NAMES[cls] = tuple(names_list)
+    return names
+
+
+# Attributes of value objects, which refer to other objects or hold their state, but are not part of their data
+_VALUE_IGNORED_ATTRIBUTES = frozenset(("parent", "_owner", "_frozen"))
+
+
+def _values_equal(value: Any, other: Any) -> bool:
+    """
+    Compare two attribute values for :meth:`Referable.update_from`. In contrast to ``==``, objects without value
+    semantics (i.e. without their own ``__eq__()``, like :class:`~.Qualifier`) are compared by their attributes and
+    sequences of them element-wise.
+    """
+    if value is other:
+        return True
+    if type(value) is not type(other):
+        return False
+    if isinstance(value, (list, tuple, ConstrainedList)):
+        return len(value) == len(other) and all(_values_equal(v, o) for v, o in zip(value, other))
+    if type(value).__eq__ is object.__eq__:
+        value_attributes = {name: v for name, v in _instance_attributes(value) if name not in _VALUE_IGNORED_ATTRIBUTES}
+        other_attributes = {name: o for name, o in _instance_attributes(other) if name not in _VALUE_IGNORED_ATTRIBUTES}
+        return value_attributes.keys() == other_attributes.keys() \
+            and all(_values_equal(v, other_attributes[name]) for name, v in value_attributes.items())
+    return value == other
+
+
+# Attributes, which are not part of the flat state of an object hierarchy, since they refer to other objects of the
+# hierarchy or hold caches and indexes. They are reset to the values created by these factories, when the hierarchy is
+# restored, and the indexes are rebuilt.
+_COPY_RESET_ATTRIBUTES: Dict[str, Callable[[], Any]] = {
+    "parent": lambda: None,
+    "namespace_element_sets": list,
+    "_id_short_index": lambda: None,
+    "_path_cache": lambda: None,
+    "_semantic_id_elements": dict,
+    "_frozen_cache": lambda: None,
+    "_object_stores": tuple,
+}
+
+# Types of attribute values, which are immutable and thus shared by copies of an object hierarchy, in addition to
+# Keys and References
+_IMMUTABLE_TYPES = frozenset((type(None), bool, int, float, str, bytes, type))
+
+# The flat state of each object of a hierarchy (see _flatten_hierarchy()) consists of its class, its attributes, the
+# states of its ConstrainedLists and the states of its NamespaceSets. Plain tuples are used, since they are pickled
+# much faster than NamedTuples. As few containers as possible are created per object, since each of them counts towards
+# triggering the garbage collector.
+# ConstrainedList state: attribute name, class, items, item_add_hook, item_set_hook, item_del_hook
+_ListState = Tuple[str, Type["ConstrainedList"], List[Any], Any, Any, Any]
+# NamespaceSet state: attribute name, class, attribute names, item_add_hook, item_id_set_hook, item_id_del_hook, index
+# of the first item, number of items. The items are consecutive objects of the hierarchy.
+_SetState = Tuple[str, Type["NamespaceSet"], Tuple[Tuple[str, bool], ...], Any, Any, Any, int, int]
+_ObjectState = Tuple[Type[Any], Dict[str, Any], Sequence[_ListState], Sequence[_SetState]]
+
+
+def _encode_hook(hook: Optional[Callable], owner: object) -> Any:
+    """
+    Replace a hook, which is a method of the object holding the NamespaceSet or ConstrainedList, by the method's name.
+    It is bound to the restored object again by :func:`_decode_hook`.
+    """
+    if hook is None or getattr(hook, "__self__", None) is not owner:
+        return hook
+    return hook.__name__
+
+
+def _decode_hook(hook: Any, owner: object) -> Optional[Callable]:
+    return getattr(owner, hook) if isinstance(hook, str) else hook
+
+
+def _flatten_hierarchy(root: "Referable") -> Tuple[List[object], List[_ObjectState]]:
+    """
+    Flatten a :class:`~.Referable` and all of its descendants into a list of object states for pickling and copying
+
+    The objects are collected iteratively and breadth-first, so that the items of each :class:`~.NamespaceSet` are
+    consecutive and follow their parent. The states don't refer to other objects of the hierarchy, but only to their
+    index. Thus, pickling or deep-copying them does not recurse into the hierarchy, regardless of its depth. The parent
+    of the root object is not included.
+
+    :return: The objects of the hierarchy and their states, in the same order
+    """
+    objects: List[object] = [root]
+    states: List[_ObjectState] = []
+    # Equal attribute name lists of NamespaceSets are shared by their states
+    attribute_names_cache: Dict[Tuple[Tuple[str, bool], ...], Tuple[Tuple[str, bool], ...]] = {}
+    # The list of objects grows while it is iterated
+    for obj in objects:
+        attributes: Dict[str, Any] = {}
+        list_states: List[_ListState] = []
+        namespace_sets: List[NamespaceSet] = getattr(obj, "namespace_element_sets", [])
+        set_attributes: Dict[int, str] = {id(namespace_set): "" for namespace_set in namespace_sets}
+        for name, value in _instance_attributes(obj):
+            if name in _COPY_RESET_ATTRIBUTES:
+                attributes[name] = None
+            elif type(value) in _IMMUTABLE_TYPES:
+                attributes[name] = value
+            elif id(value) in set_attributes:
+                set_attributes[id(value)] = name
+            elif isinstance(value, ConstrainedList):
+                list_states.append((name, type(value), value._list, _encode_hook(value._item_add_hook, obj),
+                                    _encode_hook(value._item_set_hook, obj), _encode_hook(value._item_del_hook, obj)))
+            else:
+                attributes[name] = value
+        set_states: List[_SetState] = []
+        for namespace_set in namespace_sets:
+            attribute_names = _attribute_names(namespace_set)
+            set_states.append((
+                set_attributes[id(namespace_set)], type(namespace_set),
+                attribute_names_cache.setdefault(attribute_names, attribute_names),
+                _encode_hook(namespace_set._item_add_hook, obj), _encode_hook(namespace_set._item_id_set_hook, obj),
+                _encode_hook(namespace_set._item_id_del_hook, obj), len(objects), len(namespace_set)))
+            objects.extend(namespace_set)
+        states.append((type(obj), attributes, list_states or (), set_states or ()))
+    return objects, states
+
+
+def _copy_hierarchy(root: "Referable", memo: Dict[int, Any], share_frozen: bool = False) \
+        -> Tuple[List[Any], List[Any]]:
+    """
+    Deep-copy a :class:`~.Referable` and all of its descendants, without its parent
+
+    The objects are copied iteratively and breadth-first, like :func:`_flatten_hierarchy` collects them, but directly
+    into new objects. Immutable attribute values are shared with the copies and the NamespaceSets of the copies are
+    rebuilt without checking the uniqueness of their items or calling their hooks.
+
+    :param memo: The memo dict of :func:`copy.deepcopy`, used for copying the attribute values
+    :param share_frozen: If True, frozen LangStringSets are considered immutable as well
+    :return: The original objects and their copies, in the same order
+    """
+    def copy_value(value: Any) -> Any:
+        if type(value) in _IMMUTABLE_TYPES or isinstance(value, (Key, Reference)) \
+                or (share_frozen and isinstance(value, LangStringSet) and value._frozen):
+            return value
+        return copy.deepcopy(value, memo)
+
+    originals: List[Any] = [root]
+    copies: List[Any] = []
+    # Index of the owner, attribute name, original set, index of the first item
+    namespace_sets_to_copy: List[Tuple[int, str, NamespaceSet, int]] = []
+    # The list of originals grows while it is iterated
+    for obj in originals:
+        obj_copy = object.__new__(type(obj))
+        namespace_sets: List[NamespaceSet] = getattr(obj, "namespace_element_sets", [])
+        set_attributes: Dict[int, str] = {id(namespace_set): "" for namespace_set in namespace_sets}
+        for name, value in _instance_attributes(obj):
+            if name in _COPY_RESET_ATTRIBUTES:
+                value = _COPY_RESET_ATTRIBUTES[name]()
+            elif type(value) in _IMMUTABLE_TYPES:
+                pass
+            elif id(value) in set_attributes:
+                set_attributes[id(value)] = name
+                continue
+            elif isinstance(value, ConstrainedList):
+                value = _new_constrained_list(
+                    type(value), [copy_value(item) for item in value._list], obj_copy,
+                    _encode_hook(value._item_add_hook, obj), _encode_hook(value._item_set_hook, obj),
+                    _encode_hook(value._item_del_hook, obj))
+            else:
+                value = copy_value(value)
+            object.__setattr__(obj_copy, name, value)
+        for namespace_set in namespace_sets:
+            namespace_sets_to_copy.append((len(copies), set_attributes[id(namespace_set)], namespace_set,
+                                           len(originals)))
+            originals.extend(namespace_set)
+        copies.append(obj_copy)
+    for index, name, namespace_set, start in namespace_sets_to_copy:
+        owner, owner_copy = originals[index], copies[index]
+        set_copy = type(namespace_set).__new__(type(namespace_set))
+        set_copy._restore(owner_copy, _attribute_names(namespace_set), tuple(
+            _decode_hook(_encode_hook(hook, owner), owner_copy)
+            for hook in (namespace_set._item_add_hook, namespace_set._item_id_set_hook,
+                         namespace_set._item_id_del_hook)), copies[start:start + len(namespace_set)])
+        object.__setattr__(owner_copy, name, set_copy)
+    for obj_copy in copies:
+        if isinstance(obj_copy, Referable):
+            obj_copy._rebuild_indexes()
+    return originals, copies
+
+
+def _attribute_names(namespace_set: "NamespaceSet") -> Tuple[Tuple[str, bool], ...]:
+    """
+    Get the names of the identifying attributes of a NamespaceSet along with their case-sensitivity
+    """
+    return tuple((name, case_sensitive) for name, (_backend, case_sensitive) in namespace_set._backend.items())
+
+
+def _new_constrained_list(list_type: Type["ConstrainedList"], items: List[Any], owner: object, add_hook: Any,
+                          set_hook: Any, del_hook: Any) -> "ConstrainedList":
+    """
+    Create a restored or copied ConstrainedList with the given items without calling its hooks. The hooks have been
+    encoded by :func:`_encode_hook`.
+    """
+    constrained_list = list_type.__new__(list_type)
+    constrained_list._list = items
+    constrained_list._item_add_hook = _decode_hook(add_hook, owner)
+    constrained_list._item_set_hook = _decode_hook(set_hook, owner)
+    constrained_list._item_del_hook = _decode_hook(del_hook, owner)
+    return constrained_list
+
+
+def _restore_hierarchy(states: List[_ObjectState]) -> List[object]:
+    """
+    Restore an object hierarchy from the object states created by :func:`_flatten_hierarchy`
+
+    The NamespaceSets are rebuilt without checking the uniqueness of their items or calling their hooks, since the items
+    have been valid when the hierarchy was flattened.
+
+    :return: The restored objects, in the order of their states. The first one is the root object.
+    """
+    objects: List[object] = []
+    for cls, attributes, list_states, _set_states in states:
+        obj = object.__new__(cls)
+        for name, value in attributes.items():
+            reset = _COPY_RESET_ATTRIBUTES.get(name)
+            object.__setattr__(obj, name, value if reset is None else reset())
+        for name, list_type, items, add_hook, set_hook, del_hook in list_states:
+            object.__setattr__(obj, name, _new_constrained_list(list_type, list(items), obj, add_hook, set_hook,
+                                                                del_hook))
+        objects.append(obj)
+    for obj, (_cls, _attributes, _list_states, set_states) in zip(objects, states):
+        for name, set_type, attribute_names, add_hook, id_set_hook, id_del_hook, start, count in set_states:
+            namespace_set = set_type.__new__(set_type)
+            namespace_set._restore(obj, attribute_names, (_decode_hook(add_hook, obj), _decode_hook(id_set_hook, obj),
+                                                          _decode_hook(id_del_hook, obj)), objects[start:start + count])
+            object.__setattr__(obj, name, namespace_set)
+    for obj in objects:
+        if isinstance(obj, Referable):
+            obj._rebuild_indexes()
+    return objects
+
+
+def _restore_referable(states: List[_ObjectState]) -> "Referable":
+    """
+    Restore a pickled :class:`~.Referable` (see :meth:`.Referable.__reduce__`)
+    """
+    return _restore_hierarchy(states)[0]  # type: ignore[return-value]
+
+
+# Types of values, which are fingerprinted by their XSD lexical representation
+_XSD_TYPES = tuple(datatypes.XSD_TYPE_NAMES)
+
+
+def _update_hash_token(hash_: Any, tag: bytes, text: str) -> None:
+    data = text.encode()
+    hash_.update(b"%s%d:%s" % (tag, len(data), data))
+
+
+def _update_fingerprint(hash_: Any, value: Any) -> None:
+    """
+    Feed a canonical representation of an attribute value into a hash object for :attr:`Referable.content_hash`.
+    Contained Referables are represented by their (cached) content hash.
+    """
+    if value is None:
+        hash_.update(b"N")
+    elif isinstance(value, Referable):
+        hash_.update(b"R" + value.content_hash)
+    elif isinstance(value, OrderedNamespaceSet):
+        hash_.update(b"O%d:" % len(value))
+        for element in value:
+            _update_fingerprint(hash_, element)
+    elif isinstance(value, NamespaceSet):
+        # Unordered sets are hashed in the order of the identifying attribute
+        backend = next(iter(value._backend.values()))[0]
+        hash_.update(b"S%d:" % len(backend))
+        for key in sorted(backend, key=str):
+            _update_fingerprint(hash_, key)
+            _update_fingerprint(hash_, backend[key])
+    elif isinstance(value, Enum):
+        _update_hash_token(hash_, b"E", "{}.{}".format(type(value).__qualname__, value.name))
+    elif isinstance(value, type):
+        _update_hash_token(hash_, b"T", "{}.{}".format(value.__module__, value.__qualname__))
+    elif isinstance(value, _XSD_TYPES):
+        _update_hash_token(hash_, b"V", "{}:{}".format(type(value).__name__, datatypes.xsd_repr(value)))
+    elif isinstance(value, (bytes, bytearray)):
+        hash_.update(b"B%d:%s" % (len(value), value))
+    elif isinstance(value, Mapping):
+        hash_.update(b"M%d:" % len(value))
+        for key in sorted(value, key=str):
+            _update_fingerprint(hash_, key)
+            _update_fingerprint(hash_, value[key])
+    elif isinstance(value, (list, tuple, ConstrainedList)):
+        hash_.update(b"L%d:" % len(value))
+        for element in value:
+            _update_fingerprint(hash_, element)
+    elif isinstance(value, (set, frozenset)):
+        element_hashes = []
+        for element in value:
+            element_hash = hashlib.sha256()
+            _update_fingerprint(element_hash, element)
+            element_hashes.append(element_hash.digest())
+        hash_.update(b"U%d:%s" % (len(value), b"".join(sorted(element_hashes))))
+    else:
+        # Any other object (e.g. a Reference or a Qualifier) is represented by its attributes
+        _update_hash_token(hash_, b"C", type(value).__qualname__)
+        for name, attribute_value in sorted(_instance_attributes(value), key=lambda item: item[0]):
+            if name in _VALUE_IGNORED_ATTRIBUTES or name == "_hash":
+                continue
+            _update_hash_token(hash_, b"A", name.lstrip("_"))
+            _update_fingerprint(hash_, attribute_value)
+
+
+class ChangeSummary:
+    """
+    Summary of the changes applied to an object hierarchy by :meth:`~.Referable.update_from`, e.g. to invalidate caches
+    and indexes selectively
+
+    All paths are tuples of id_shorts, relative to the updated object, i.e. the empty tuple refers to the updated object
+    itself.
+
+    :ivar modified: Dict of the paths of all modified Referables to the names of their modified attributes. Attributes
+                    are named like their public property, e.g. ``value`` instead of ``_value``. Modifications of a
+                    NamespaceSet of non-Referable objects (i.e. :class:`Qualifiers <.Qualifier>` and
+                    :class:`Extensions <.Extension>`) are reported as a modification of the NamespaceSet's attribute.
+    :ivar added: Paths of all Referables, which have been added. Their descendants are not listed separately.
+    :ivar removed: Paths of all Referables, which have been removed. Their descendants are not listed separately.
+    """
+    def __init__(self):
+        self.modified: Dict[Tuple[NameType, ...], Set[str]] = {}
+        self.added: List[Tuple[NameType, ...]] = []
+        self.removed: List[Tuple[NameType, ...]] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.modified or self.added or self.removed)
+
+    def __repr__(self) -> str:
+        return "ChangeSummary(modified={!r}, added={!r}, removed={!r})".format(self.modified, self.added, self.removed)
+
+    @property
+    def structure_changed(self) -> bool:
+        """
+        True, if Referables have been added or removed, i.e. the set of valid id_short paths has changed
+        """
+        return bool(self.added or self.removed)
+
+    def _add_modified(self, path: Tuple[NameType, ...], attribute_names: Iterable[str]) -> None:
+        self.modified.setdefault(path, set()).update(attribute_names)
+
+
+@unique
+class ModelEventKind(Enum):
+    """
+    Kind of a :class:`~.ModelEvent`
+
+    :cvar ATTRIBUTE_SET: An attribute of a Referable has been assigned, or an attribute of one of its
+                         :class:`Qualifiers <.Qualifier>` or :class:`Extensions <.Extension>`
+    :cvar CHILD_ADDED: An object has been added to a :class:`~.NamespaceSet` of a Referable
+    :cvar CHILD_REMOVED: An object has been removed from a :class:`~.NamespaceSet` of a Referable
+    :cvar ID_CHANGED: The id_short of a Referable or the id of an :class:`~.Identifiable` has been changed
+    """
+    ATTRIBUTE_SET = 0
+    CHILD_ADDED = 1
+    CHILD_REMOVED = 2
+    ID_CHANGED = 3
+
+
+class ModelEvent(NamedTuple):
+    """
+    A modification of a :class:`~.Referable`, as passed to the observers registered by :meth:`.Referable.add_observer`
+
+    :ivar kind: The :class:`~.ModelEventKind` of the modification
+    :ivar referable: The modified Referable. For added or removed children, this is their (former) parent. For
+                     modified Qualifiers and Extensions, this is the Referable they belong to.
+    :ivar attribute: The name of the modified attribute, named like its public property (e.g. ``value`` instead of
+                     ``_value``). For children and modified Qualifiers or Extensions, this is the name of the attribute
+                     holding their NamespaceSet (e.g. ``submodel_element`` or ``qualifier``).
+    :ivar value: The new value of the attribute, resp. the added, removed or modified child object
+    :ivar old_value: The previous value of the attribute, if it has been set before. None for all other kinds of events.
+    """
+    kind: ModelEventKind
+    referable: Referable
+    attribute: str
+    value: Any
+    old_value: Any = None
+
+
+# Observers of Referables: id() of the Referable -> (weak reference to it, observer functions). The entries are dropped
+# together with the Referables. As long as the dict is empty, modifications are not observed at all.
+_OBSERVERS: Dict[int, Tuple["weakref.ref[Referable]", List[Callable[[ModelEvent], None]]]] = {}
+
+# Set while an object is re-added to its NamespaceSets after changing its identifying attribute, which is reported as a
+# single event instead of a removal and addition
+_EVENTS_SUPPRESSED: contextvars.ContextVar[bool] = contextvars.ContextVar("_EVENTS_SUPPRESSED", default=False)
+
+
+def _drop_observers(referable_id: int, _ref: "weakref.ref[Referable]") -> None:
+    entry = _OBSERVERS.get(referable_id)
+    if entry is not None and entry[0] is _ref:
+        del _OBSERVERS[referable_id]
+
+
+def _notify(event: ModelEvent) -> None:
+    """
+    Call the observers of the modified Referable and all of its ancestors
+    """
+    if _EVENTS_SUPPRESSED.get():
+        return
+    referable: Any = event.referable
+    while isinstance(referable, Referable):
+        entry = _OBSERVERS.get(id(referable))
+        if entry is not None and entry[0]() is referable:
+            for observer in list(entry[1]):
+                observer(event)
+        # The parent may not be set yet, while the Referable is initialized
+        referable = getattr(referable, "parent", None)
+
+
+def _attribute_event(referable: Referable, attribute: str, value: Any, old_value: Any) -> ModelEvent:
+    kind = ModelEventKind.ID_CHANGED if attribute in ("id_short", "id") else ModelEventKind.ATTRIBUTE_SET
+    return ModelEvent(kind, referable, attribute, value, None if old_value is _NOT_SET else old_value)
+
+
+def _notify_attribute_set(referable: Referable, name: str, value: Any, old_value: Any) -> None:
+    event = _attribute_event(referable, name.lstrip("_"), value, old_value)
+    if event.kind is ModelEventKind.ID_CHANGED and event.value == event.old_value:
+        return
+    _notify(event)
+
+
+def _notify_element_attribute_set(element: "HasSemantics") -> None:
+    """
+    Report the assignment of an attribute of a :class:`~.Qualifier` or :class:`~.Extension` as a modification of the
+    Referable it belongs to
+    """
+    parent = element.parent
+    if not isinstance(parent, Referable):
+        return
+    namespace_set = next((set_ for set_ in parent.namespace_element_sets if element in set_), None)
+    if namespace_set is not None:
+        _notify(ModelEvent(ModelEventKind.ATTRIBUTE_SET, parent, namespace_set._parent_attribute_name(), element))
+
+
+@contextlib.contextmanager
+def _suppress_events() -> Iterator[None]:
+    token = _EVENTS_SUPPRESSED.set(True)
+    try:
+        yield
+    finally:
+        _EVENTS_SUPPRESSED.reset(token)
+
+
+def _freeze_value(value: Any) -> None:
+    """
+    Make a mutable value held by a frozen object immutable, including the values nested in it. The attributes of value
+    objects owned by the frozen object (see :class:`_OwnedValue`) are immutable through their owner already.
+    """
+    if isinstance(value, _Freezable):
+        if value._frozen:
+            return
+        object.__setattr__(value, "_frozen", True)
+        if isinstance(value, ConstrainedList):
+            for item in value._list:
+                _freeze_value(item)
+        elif isinstance(value, _FreezableValue):
+            for _name, attribute_value in _instance_attributes(value):
+                _freeze_value(attribute_value)
+    elif isinstance(value, _OwnedValue):
+        for name, attribute_value in _instance_attributes(value):
+            if name != "_owner":
+                _freeze_value(attribute_value)
+    elif isinstance(value, (list, set)):
+        for item in value:
+            _freeze_value(item)
+
+
+class FrozenObjectError(AttributeError):
+    """
+    Exception raised when trying to modify an object, which has been made immutable by :meth:`.Referable.freeze`.
+    Like :class:`dataclasses.FrozenInstanceError`, it is a subclass of :class:`AttributeError`.
+    """
+
+
 class UnexpectedTypeError(TypeError):
     """
     Exception to be raised by :meth:`.ModelReference.resolve` if the retrieved object has not
@@ -898,6 +1888,8 @@ class Reference(metaclass=abc.ABCMeta):
     :ivar referred_semantic_id: SemanticId of the referenced model element. For external references there typically is
                                 no semantic id.
     """
+    __slots__ = ('key', 'referred_semantic_id', '_hash', '__weakref__')
+
     @abc.abstractmethod
     def __init__(self, key: Tuple[Key, ...], referred_semantic_id: Optional["Reference"] = None):
         if len(key) < 1:
@@ -907,15 +1899,42 @@ class Reference(metaclass=abc.ABCMeta):
 
         self.key: Tuple[Key, ...]
         self.referred_semantic_id: Optional["Reference"]
+        self._hash: Optional[int]
         super().__setattr__('key', key)
         super().__setattr__('referred_semantic_id', referred_semantic_id)
+        super().__setattr__('_hash', None)
 
     def __setattr__(self, key, value):
         """Prevent modification of attributes."""
         raise AttributeError('Reference is immutable')
 
+    def __reduce__(self):
+        # Slotted and immutable: (deep)copy and pickle must go through the constructor instead of setting the slots
+        return self.__class__, (self.key, self.referred_semantic_id)
+
+    def __copy__(self) -> "Reference":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Reference":
+        # Immutable, so copies can share it
+        return self
+
+    @staticmethod
+    def _check_key_constraints(key: Tuple[Key, ...]) -> None:
+        """
+        Check the constraints on the types and values of the keys, which depend on the type of the Reference. The
+        checks are skipped within :func:`trusted_load`.
+        """
+        pass
+
+    def _validate_constraints(self, run: _string_constraints.CheckRunner = _string_constraints.run_check) -> None:
+        run(self._check_key_constraints, self.key)
+
     def __hash__(self):
-        return hash((self.__class__, self.key))
+        # References are immutable, so we can compute the hash once, when it is first needed
+        if self._hash is None:
+            object.__setattr__(self, '_hash', hash((self.__class__, self.key)))
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, self.__class__):
@@ -946,10 +1965,16 @@ class ExternalReference(Reference):
     :ivar referred_semantic_id: SemanticId of the referenced model element. For external references there typically is
                                 no semantic id.
     """
+    __slots__ = ()
 
     def __init__(self, key: Tuple[Key, ...], referred_semantic_id: Optional["Reference"] = None):
         super().__init__(key, referred_semantic_id)
+        self._check_key_constraints(key)
 
+    @staticmethod
+    def _check_key_constraints(key: Tuple[Key, ...]) -> None:
+        if _string_constraints.TRUSTED_LOAD.get():
+            return
         if not key[0].type.is_generic_globally_identifiable:
             raise AASConstraintViolation(122, "The type of the first key of an ExternalReference must be a "
                                               f"GenericGloballyIdentifiable: {key[0]!r}")
@@ -995,9 +2020,18 @@ class ModelReference(Reference, Generic[_RT]):
     :ivar referred_semantic_id: SemanticId of the referenced model element. For external references there typically is
                                 no semantic id.
     """
+    __slots__ = ('type',)
+
     def __init__(self, key: Tuple[Key, ...], type_: Type[_RT], referred_semantic_id: Optional[Reference] = None):
         super().__init__(key, referred_semantic_id)
+        self._check_key_constraints(key)
+        self.type: Type[_RT]
+        object.__setattr__(self, 'type', type_)
 
+    @staticmethod
+    def _check_key_constraints(key: Tuple[Key, ...]) -> None:
+        if _string_constraints.TRUSTED_LOAD.get():
+            return
         if not key[0].type.is_aas_identifiable:
             raise AASConstraintViolation(123, "The type of the first key of a ModelReference must be an "
                                               f"AasIdentifiable: {key[0]!r}")
@@ -1018,8 +2052,8 @@ class ModelReference(Reference, Generic[_RT]):
                                                   f"but the value of the succeeding key ({k!r}) is not a non-negative "
                                                   f"integer: {k.value}")
 
-        self.type: Type[_RT]
-        object.__setattr__(self, 'type', type_)
+    def __reduce__(self):
+        return self.__class__, (self.key, self.type, self.referred_semantic_id)
 
     def resolve(self, provider_: "provider.AbstractObjectProvider") -> _RT:
         """
@@ -1046,15 +2080,24 @@ class ModelReference(Reference, Generic[_RT]):
             item: Referable = provider_.get_identifiable(identifier)
         except KeyError as e:
             raise KeyError("Could not resolve identifier {}".format(identifier)) from e
+        return self._check_type(self._resolve_path(item))
 
+    def _resolve_path(self, identifiable: Referable) -> Referable:
+        """
+        Resolve the keys following the first one, starting at the already retrieved :class:`~.Identifiable`, without
+        checking the type of the result. See :meth:`resolve` for the exceptions raised.
+        """
         # All keys following the first must not reference identifiables (AASd-125). Thus, we can just resolve the
         # id_short path via get_referable().
         # This is cursed af, but at least it keeps the code DRY. get_referable() will check the type of self in the
         # first iteration, so we can ignore the type here.
-        item = UniqueIdShortNamespace.get_referable(item,  # type: ignore[arg-type]
+        return UniqueIdShortNamespace.get_referable(identifiable,  # type: ignore[arg-type]
                                                     map(lambda k: k.value, self.key[1:]))
 
-        # Check type
+    def _check_type(self, item: Referable) -> _RT:
+        """
+        :raises UnexpectedTypeError: If the resolved object is not of the expected type (or one of its subclasses)
+        """
         if not isinstance(item, self.type):
             raise UnexpectedTypeError(item, "Retrieved object {} is not an instance of referenced type {}"
                                             .format(item, self.type.__name__))
@@ -1115,9 +2158,82 @@ class ModelReference(Reference, Generic[_RT]):
             ref = ref.parent
 
 
+_RefT = TypeVar('_RefT', bound=Reference)
+
+
+class ReferencePool:
+    """
+    A pool for interning :class:`Keys <.Key>` and :class:`References <.Reference>`.
+
+    Real-world data often contains the same semantic ids, value ids, etc. over and over again. Since Keys and References
+    are immutable, all equal occurrences may share a single instance. :meth:`intern_key` and :meth:`intern_reference`
+    return the pooled instance, which is equal to the given one, or add the given object to the pool, if there is none
+    yet.
+
+    The pool only holds weak references to the pooled objects, i.e. objects are dropped from the pool as soon as they
+    are not used anywhere else anymore.
+
+    Usually, the pool is used by the deserialization adapters, see e.g.
+    :attr:`basyx.aas.adapter.json.json_deserialization.AASFromJsonDecoder.reference_pool`.
+
+    .. note::
+        :class:`ModelReferences <.ModelReference>` are only considered equal by the pool, if their ``type`` is
+        identical, too. In contrast, ``ModelReference.__eq__()`` ignores the ``type``.
+    """
+    def __init__(self) -> None:
+        self._keys: weakref.WeakValueDictionary[Tuple[KeyTypes, Identifier], Key] = weakref.WeakValueDictionary()
+        self._references: weakref.WeakValueDictionary[Tuple[Any, ...], Reference] = weakref.WeakValueDictionary()
+
+    def intern_key(self, key: Key) -> Key:
+        """
+        Get the pooled :class:`~.Key` equal to the given one
+
+        :param key: The :class:`~.Key` to intern
+        :return: The pooled :class:`~.Key`. This is the given object, if there was no equal Key in the pool.
+        """
+        if type(key) is not Key:
+            # Subclasses may carry additional data, which is not covered by the pool key
+            return key
+        return self._keys.setdefault((key.type, key.value), key)
+
+    def intern_reference(self, reference: _RefT) -> _RefT:
+        """
+        Get the pooled :class:`~.Reference` equal to the given one (including its type, for ModelReferences)
+
+        The :class:`Keys <.Key>` and the ``referred_semantic_id`` of a Reference, which is newly added to the pool, are
+        interned as well.
+
+        :param reference: The :class:`~.Reference` to intern
+        :return: The pooled :class:`~.Reference`. This is the given object, if there was no equal Reference in the pool.
+        """
+        key = tuple(self.intern_key(k) for k in reference.key)
+        referred_semantic_id = reference.referred_semantic_id
+        if referred_semantic_id is not None:
+            referred_semantic_id = self.intern_reference(referred_semantic_id)
+        pool_key = (reference.__class__, key, referred_semantic_id, getattr(reference, 'type', None))
+        pooled = self._references.get(pool_key)
+        if pooled is not None:
+            return pooled  # type: ignore[return-value]
+        # The equal, but not identical, interned attributes may replace the given ones without any visible effect
+        object.__setattr__(reference, 'key', key)
+        object.__setattr__(reference, 'referred_semantic_id', referred_semantic_id)
+        return self._references.setdefault(pool_key, reference)  # type: ignore[return-value]
+
+
+class _FreezableValue(_Freezable):
+    """
+    Base class of value objects like :class:`~.Resource`, which are held by Referables without being owned by them
+    (in contrast to :class:`_OwnedValue`). They are made immutable, when a Referable holding them is frozen (see
+    :meth:`.Referable.freeze`).
+    """
+    def __setattr__(self, name: str, value: Any) -> None:
+        self._check_not_frozen()
+        object.__setattr__(self, name, value)
+
+
 @_string_constraints.constrain_content_type("content_type")
 @_string_constraints.constrain_path_type("path")
-class Resource:
+class Resource(_FreezableValue):
     """
     Resource represents an address to a file (a locator). The value is a URI that can represent an absolute or relative
     path.
@@ -1134,7 +2250,7 @@ class Resource:
         return f"Resource[{self.path}]"
 
 
-class DataSpecificationContent:
+class DataSpecificationContent(_FreezableValue):
     """
     Data specification content is part of a data specification template and defines
     which additional attributes shall be added to the element instance that references
@@ -1150,7 +2266,7 @@ class DataSpecificationContent:
         pass
 
 
-class EmbeddedDataSpecification:
+class EmbeddedDataSpecification(_FreezableValue):
     """
     Embed the content of a data specification.
 
@@ -1169,6 +2285,7 @@ class EmbeddedDataSpecification:
         return f"EmbeddedDataSpecification[{self.data_specification}]"
 
 
+@_track_attributes("embedded_data_specifications")
 class HasDataSpecification(metaclass=abc.ABCMeta):
     """
     Element that can be extended by using data specification templates.
@@ -1182,17 +2299,73 @@ class HasDataSpecification(metaclass=abc.ABCMeta):
 
     :ivar embedded_data_specifications: List of :class:`~.EmbeddedDataSpecification`.
     """
+    __slots__ = _MIXIN_SLOTS
+
     @abc.abstractmethod
     def __init__(
         self,
         embedded_data_specifications: Iterable[EmbeddedDataSpecification] = (),
     ) -> None:
-        self.embedded_data_specifications = list(embedded_data_specifications)
+        self.embedded_data_specifications: List[EmbeddedDataSpecification]
+        self._embedded_data_specifications: List[EmbeddedDataSpecification] = list(embedded_data_specifications)
+
+    def _assign_attribute(self, name: str, value: Any, old_value: Any = _NOT_SET) -> None:
+        object.__setattr__(self, name, value)
+
+
+class _OwnedValue:
+    """
+    Base class of value objects like :class:`~.AdministrativeInformation`, which are part of the data of the
+    :class:`~.Referable` holding them, their owner. Assigning their attributes is handled like assigning the owner's
+    attribute holding the object (see :meth:`.Referable._assign_attribute`): It is prohibited, if the owner is frozen,
+    and otherwise marks the owner dirty and notifies its observers and object stores.
+
+    The owner is set by the Referable, when the object is assigned to it. Thus, an object can only be owned by one
+    Referable at a time.
+    """
+    # The owner and the name of its private attribute holding this object. The owner is not part of this object's data,
+    # so it is neither compared nor hashed, copied or pickled.
+    _owner: Optional[Tuple["Referable", str]] = None
+
+    def _check_not_frozen(self) -> None:
+        if self._owner is not None:
+            self._owner[0]._check_not_frozen()
+
+    def _assign_attribute(self, name: str, value: Any, old_value: Any = _NOT_SET) -> None:
+        self._check_not_frozen()
+        object.__setattr__(self, name, value)
+        self._notify_owner()
+
+    def _notify_owner(self) -> None:
+        """
+        Record a modification of this object, which has already been applied, in the owner
+        """
+        owner = self._owner
+        if owner is not None:
+            owner[0]._assign_attribute(owner[1], self, self)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_owner", None)
+        return state
+
+
+def _own(value: Optional[_OwnedValue], owner: "Referable", name: str) -> None:
+    """
+    Make a Referable the owner of a value object held by its private attribute ``name`` (see :class:`_OwnedValue`)
+
+    :raises FrozenObjectError: If the value object is owned by another Referable, which is frozen
+    """
+    if value is not None:
+        if value._owner is not None and value._owner[0] is not owner:
+            value._check_not_frozen()
+        value._owner = (owner, name)
 
 
 @_string_constraints.constrain_version_type("version")
 @_string_constraints.constrain_identifier("template_id")
-class AdministrativeInformation(HasDataSpecification):
+@_track_attributes("creator")
+class AdministrativeInformation(_OwnedValue, HasDataSpecification):
     """
     Administrative meta-information for an element like version information.
 
@@ -1237,20 +2410,29 @@ class AdministrativeInformation(HasDataSpecification):
         self.version: Optional[VersionType] = version
         self._revision: Optional[RevisionType]
         self.revision = revision
-        self.creator: Optional[Reference] = creator
+        self.creator: Optional[Reference]
+        self._creator: Optional[Reference] = creator
         self.template_id: Optional[Identifier] = template_id
-        self.embedded_data_specifications: List[EmbeddedDataSpecification] = list(embedded_data_specifications)
+        self._embedded_data_specifications = list(embedded_data_specifications)
 
     def _get_revision(self):
         return self._revision
 
     def _set_revision(self, revision: Optional[RevisionType]):
+        self._check_revision(revision)
+        self._assign_attribute("_revision", revision)
+
+    def _check_revision(self, revision: Optional[RevisionType]) -> None:
+        if _string_constraints.TRUSTED_LOAD.get():
+            return
         if self.version is None and revision:
             raise AASConstraintViolation(5, "A revision requires a version. This means, if there is no version "
                                             "there is no revision neither. Please set version first.")
         if revision is not None:
             _string_constraints.check_revision_type(revision)
-        self._revision = revision
+
+    def _validate_constraints(self, run: _string_constraints.CheckRunner = _string_constraints.run_check) -> None:
+        run(self._check_revision, self._revision)
 
     revision = property(_get_revision, _set_revision)
 
@@ -1277,21 +2459,86 @@ class Identifiable(Referable, metaclass=abc.ABCMeta):
     :ivar administration: :class:`~.AdministrativeInformation` of an identifiable element.
     :ivar id: The globally unique id of the element.
     """
+    # Weak references to the IndexedObjectStores containing this object, which are notified about changes of its id
+    # and other attributes. The attribute is only assigned to the instance, when the object is added to such a store.
+    _object_stores: Tuple["weakref.ref[provider.IndexedObjectStore]", ...] = ()
+
     @abc.abstractmethod
     def __init__(self) -> None:
         super().__init__()
-        self.administration: Optional[AdministrativeInformation] = None
+        self._administration: Optional[AdministrativeInformation] = None
         # The id attribute is set by all inheriting classes __init__ functions.
         self.id: Identifier
 
     def __repr__(self) -> str:
         return "{}[{}]".format(self.__class__.__name__, self.id)
 
+    @property
+    def administration(self) -> Optional[AdministrativeInformation]:
+        return self._administration
+
+    @administration.setter
+    def administration(self, administration: Optional[AdministrativeInformation]) -> None:
+        self._assign_owned_value("_administration", administration)
+
+    def _rebuild_indexes(self) -> None:
+        super()._rebuild_indexes()
+        _own(self._administration, self, "_administration")
+
+    def _assign_attribute(self, name: str, value: Any, old_value: Any = _NOT_SET) -> None:
+        if not self._object_stores:
+            super()._assign_attribute(name, value, old_value)
+        elif name == "_id":
+            with self._update_object_stores(value):
+                super()._assign_attribute(name, value, old_value)
+        else:
+            super()._assign_attribute(name, value, old_value)
+            self._notify_object_stores((name,))
+
+    @contextlib.contextmanager
+    def _update_object_stores(self, id_: Identifier) -> Iterator[None]:
+        """
+        Re-key this object in all :class:`IndexedObjectStores <basyx.aas.model.provider.IndexedObjectStore>`
+        containing it, when its id is changed to ``id_`` within the context
+
+        :raises KeyError: If another object with the new id is already stored in one of the stores. The id is not
+                          changed in this case.
+        """
+        old_id = getattr(self, "id", None)
+        stores = [store for store in (ref() for ref in self._object_stores) if store is not None]
+        if id_ == old_id or not stores:
+            yield
+            return
+        for store in stores:
+            store._check_id_change(self, id_)
+        yield
+        for store in stores:
+            store._id_changed(self, old_id)  # type: ignore[arg-type]
+
+    def _notify_object_stores(self, names: Iterable[str]) -> None:
+        """
+        Notify all :class:`IndexedObjectStores <basyx.aas.model.provider.IndexedObjectStore>` containing this object
+        about the assignment of the given attributes, so they can update their secondary indexes
+        """
+        for ref in self._object_stores:
+            store = ref()
+            if store is not None:
+                store._attributes_changed(self, names)
+
+    def _add_object_store(self, store: "provider.IndexedObjectStore") -> None:
+        # The attribute is bookkeeping data, so it's assigned even to frozen objects, without marking them dirty
+        object.__setattr__(self, "_object_stores", tuple(ref for ref in self._object_stores
+                                                         if ref() is not None) + (weakref.ref(store),))
+
+    def _remove_object_store(self, store: "provider.IndexedObjectStore") -> None:
+        object.__setattr__(self, "_object_stores", tuple(ref for ref in self._object_stores
+                                                         if ref() is not None and ref() is not store))
+
 
 _T = TypeVar("_T")
 
 
-class ConstrainedList(MutableSequence[_T], Generic[_T]):
+class ConstrainedList(_Freezable, MutableSequence[_T], Generic[_T]):
     """
     A type of list that can be constrained by hooks, useful when implementing AASd constraints. This list can be
     initialized with an ``item_add_hook``, ``item_set_hook`` and an ``item_del_hook``.
@@ -1308,6 +2555,9 @@ class ConstrainedList(MutableSequence[_T], Generic[_T]):
     Finally, ``item_del_hook`` is called whenever an item is removed from the list, (e.g. via ``.remove()``, ``.pop()``
     or ``del list[i]``. It is passed the item about to be deleted and the current list elements.
     """
+    # Called without arguments after each modification of the list, e.g. to notify the owner of a value object holding
+    # the list (see _OwnedValue), since the other hooks are called before the modification
+    _modified_hook: Optional[Callable[[], None]] = None
 
     def __init__(self, items: Iterable[_T], item_add_hook: Optional[Callable[[_T, List[_T]], None]] = None,
                  item_set_hook: Optional[Callable[[List[_T], List[_T], List[_T]], None]] = None,
@@ -1320,16 +2570,22 @@ class ConstrainedList(MutableSequence[_T], Generic[_T]):
         self.extend(items)
 
     def insert(self, index: int, value: _T) -> None:
+        self._check_not_frozen()
         if self._item_add_hook is not None:
             self._item_add_hook(value, self._list)
         self._list.insert(index, value)
+        if self._modified_hook is not None:
+            self._modified_hook()
 
     def extend(self, values: Iterable[_T]) -> None:
+        self._check_not_frozen()
         v_list = list(values)
         if self._item_add_hook is not None:
             for idx, v in enumerate(v_list):
                 self._item_add_hook(v, self._list + v_list[:idx])
         self._list = self._list + v_list
+        if self._modified_hook is not None:
+            self._modified_hook()
 
     def clear(self) -> None:
         # clear() repeatedly deletes the last item by default, making it not atomic
@@ -1353,14 +2609,17 @@ class ConstrainedList(MutableSequence[_T], Generic[_T]):
     def __setitem__(self, index: Union[int, slice], value: Union[_T, Iterable[_T]]) -> None:
         # TODO: remove the following type: ignore once mypy supports type narrowing using overload information
         # https://github.com/python/mypy/issues/4063
+        self._check_not_frozen()
         if isinstance(index, int):
             if self._item_set_hook is not None:
                 self._item_set_hook([self._list[index]], [value], self._list)  # type: ignore
             self._list[index] = value  # type: ignore
-            return
-        if self._item_set_hook is not None:
-            self._item_set_hook(self._list[index], list(value), self._list)  # type: ignore
-        self._list[index] = value  # type: ignore
+        else:
+            if self._item_set_hook is not None:
+                self._item_set_hook(self._list[index], list(value), self._list)  # type: ignore
+            self._list[index] = value  # type: ignore
+        if self._modified_hook is not None:
+            self._modified_hook()
 
     @overload
     def __delitem__(self, index: int) -> None: ...
@@ -1369,21 +2628,24 @@ class ConstrainedList(MutableSequence[_T], Generic[_T]):
     def __delitem__(self, index: slice) -> None: ...
 
     def __delitem__(self, index: Union[int, slice]) -> None:
+        self._check_not_frozen()
         if isinstance(index, int):
             if self._item_del_hook is not None:
                 self._item_del_hook(self._list[index], self._list)
             del self._list[index]
-            return
-        if self._item_del_hook is not None:
-            indices = range(len(self._list))[index]
-            # To avoid partial deletions, perform a dry run first.
-            dry_run_list = self._list.copy()
-            # Delete high indices first to avoid conflicts by changing indices due to deletion of other objects.
-            for i in sorted(indices, reverse=True):
-                self._item_del_hook(dry_run_list[i], dry_run_list)
-                del dry_run_list[i]
-        # If all went well, we can now perform the real deletion.
-        del self._list[index]
+        else:
+            if self._item_del_hook is not None:
+                indices = range(len(self._list))[index]
+                # To avoid partial deletions, perform a dry run first.
+                dry_run_list = self._list.copy()
+                # Delete high indices first to avoid conflicts by changing indices due to deletion of other objects.
+                for i in sorted(indices, reverse=True):
+                    self._item_del_hook(dry_run_list[i], dry_run_list)
+                    del dry_run_list[i]
+            # If all went well, we can now perform the real deletion.
+            del self._list[index]
+        if self._modified_hook is not None:
+            self._modified_hook()
 
     def __len__(self) -> int:
         return len(self._list)
@@ -1410,6 +2672,8 @@ class HasSemantics(metaclass=abc.ABCMeta):
     :ivar supplemental_semantic_id: Identifier of a supplemental semantic definition of the element. It is called
                                     supplemental semantic ID of the element.
     """
+    __slots__ = ('parent', '_supplemental_semantic_id', '_semantic_id')
+
     @abc.abstractmethod
     def __init__(self) -> None:
         super().__init__()
@@ -1417,12 +2681,48 @@ class HasSemantics(metaclass=abc.ABCMeta):
         #  of Referable.parent as `UniqueIdShortNamespace`
         self.parent: Optional[Any] = None
         self._supplemental_semantic_id: ConstrainedList[Reference] = ConstrainedList(
-            [], item_add_hook=self._check_constraint_add)
+            [], item_add_hook=self._check_constraint_add, item_set_hook=self._record_modification,
+            item_del_hook=self._record_modification)
         self._semantic_id: Optional[Reference] = None
 
+    def _check_not_frozen(self) -> None:
+        parent = self.parent
+        if isinstance(parent, Referable) and parent._frozen_cache is not None:
+            raise FrozenObjectError(f"{self!r} belongs to the frozen {parent!r} and cannot be modified")
+
+    def _assign_attribute(self, name: str, value: Any, old_value: Any = _NOT_SET) -> None:
+        """
+        Assign the private attribute holding the value of a property. Elements like :class:`Qualifiers <.Qualifier>`
+        and :class:`Extensions <.Extension>` are part of their parent Referable's data, so the assignment is prohibited,
+        if the parent is frozen, and recorded as a modification of the parent otherwise (see
+        :meth:`.Referable._assign_attribute`).
+        """
+        parent = self.parent
+        if parent is None or not isinstance(parent, Referable):
+            object.__setattr__(self, name, value)
+            return
+        if parent._frozen_cache is not None:
+            raise FrozenObjectError(f"{self!r} belongs to the frozen {parent!r} and cannot be modified")
+        object.__setattr__(self, name, value)
+        if not parent._dirty or parent._content_hash is not None:
+            parent._set_dirty()
+        if _OBSERVERS:
+            _notify_element_attribute_set(self)
+
+    def _record_modification(self, *_args: Any) -> None:
+        """
+        Record an in-place modification of an attribute value (e.g. of the supplemental_semantic_id) as modification of
+        the parent Referable, like :meth:`_assign_attribute` does for assignments (see
+        :meth:`.Referable._record_modification`)
+        """
+        parent = self.parent
+        if isinstance(parent, Referable):
+            parent._record_modification()
+
     def _check_constraint_add(self, _new: Reference, _list: List[Reference]) -> None:
         if self.semantic_id is None:
             raise AASConstraintViolation(118, "A semantic_id must be defined before adding a supplemental_semantic_id!")
+        self._record_modification()
 
     @property
     def semantic_id(self) -> Optional[Reference]:
@@ -1433,21 +2733,24 @@ class HasSemantics(metaclass=abc.ABCMeta):
         if semantic_id is None and len(self.supplemental_semantic_id) > 0:
             raise AASConstraintViolation(118, "semantic_id can not be removed while there is at least one "
                                               f"supplemental_semantic_id: {self.supplemental_semantic_id!r}")
+        self._check_not_frozen()
+        old_semantic_id = self._semantic_id
         if self.parent is not None:
             if semantic_id is not None:
                 for set_ in self.parent.namespace_element_sets:
                     if set_.contains_id("semantic_id", semantic_id):
                         raise KeyError("Object with semantic_id is already present in the parent Namespace")
             set_add_list: List[NamespaceSet] = []
-            for set_ in self.parent.namespace_element_sets:
-                if self in set_:
-                    set_add_list.append(set_)
-                    set_.discard(self)
-            self._semantic_id = semantic_id
-            for set_ in set_add_list:
-                set_.add(self)
+            with _suppress_events():
+                for set_ in self.parent.namespace_element_sets:
+                    if self in set_:
+                        set_add_list.append(set_)
+                        set_.discard(self)
+                self._semantic_id = semantic_id
+                for set_ in set_add_list:
+                    set_.add(self)
         # Redundant to the line above. However, this way, we make sure that we really update the _semantic_id
-        self._semantic_id = semantic_id
+        self._assign_attribute("_semantic_id", semantic_id, old_semantic_id)
 
     @property
     def supplemental_semantic_id(self) -> ConstrainedList[Reference]:
@@ -1458,6 +2761,7 @@ class HasSemantics(metaclass=abc.ABCMeta):
         self._supplemental_semantic_id[:] = supplemental_semantic_id
 
 
+@_track_attributes("value_type", "refers_to")
 class Extension(HasSemantics):
     """
     Single extension of an element
@@ -1471,6 +2775,10 @@ class Extension(HasSemantics):
                                     supplemental semantic ID of the element. (inherited from
                                     :class:`~basyx.aas.model.base.HasSemantics`)
     """
+    __slots__ = ('_name', '_value_type', '_value', '_refers_to')
+    # Properties created by _track_attributes()
+    value_type: Optional[DataTypeDefXsd]
+    refers_to: Set[ModelReference]
 
     def __init__(self,
                  name: NameType,
@@ -1483,12 +2791,12 @@ class Extension(HasSemantics):
         self.parent: Optional[HasExtension] = None
         self._name: NameType
         self.name: NameType = name
-        self.value_type: Optional[DataTypeDefXsd] = value_type
+        self._value_type: Optional[DataTypeDefXsd] = value_type
         self._value: Optional[ValueDataType]
         self.value = value
-        self.refers_to: Set[ModelReference] = set(refers_to)
-        self.semantic_id: Optional[Reference] = semantic_id
-        self.supplemental_semantic_id: ConstrainedList[Reference] = ConstrainedList(supplemental_semantic_id)
+        self._refers_to: Set[ModelReference] = set(refers_to)
+        self.semantic_id = semantic_id
+        self.supplemental_semantic_id = ConstrainedList(supplemental_semantic_id)
 
     def __repr__(self) -> str:
         return "Extension(name={})".format(self.name)
@@ -1500,11 +2808,11 @@ class Extension(HasSemantics):
     @value.setter
     def value(self, value) -> None:
         if value is None:
-            self._value = None
+            self._assign_attribute("_value", None)
         else:
             if self.value_type is None:
                 raise ValueError('ValueType must be set, if value is not None')
-            self._value = datatypes.trivial_cast(value, self.value_type)
+            self._assign_attribute("_value", datatypes.trivial_cast(value, self.value_type))
 
     @property
     def name(self):
@@ -1513,21 +2821,26 @@ class Extension(HasSemantics):
     @name.setter
     def name(self, name: NameType) -> None:
         _string_constraints.check_name_type(name)
+        self._check_not_frozen()
         if self.parent is not None:
             for set_ in self.parent.namespace_element_sets:
                 if set_.contains_id("name", name):
                     raise KeyError("Object with name '{}' is already present in the parent Namespace"
                                    .format(name))
             set_add_list: List[NamespaceSet] = []
-            for set_ in self.parent.namespace_element_sets:
-                if self in set_:
-                    set_add_list.append(set_)
-                    set_.discard(self)
-            self._name = name
-            for set_ in set_add_list:
-                set_.add(self)
+            with _suppress_events():
+                for set_ in self.parent.namespace_element_sets:
+                    if self in set_:
+                        set_add_list.append(set_)
+                        set_.discard(self)
+                self._name = name
+                for set_ in set_add_list:
+                    set_.add(self)
         # Redundant to the line above. However, this way, we make sure that we really update the _name
-        self._name = name
+        self._assign_attribute("_name", name)
+
+    def _validate_constraints(self, run: _string_constraints.CheckRunner = _string_constraints.run_check) -> None:
+        run(_string_constraints.check_name_type, self._name)
 
 
 class HasKind(metaclass=abc.ABCMeta):
@@ -1550,7 +2863,10 @@ class HasKind(metaclass=abc.ABCMeta):
 
     @kind.setter
     def kind(self, value: ModellingKind):
-        self._kind = value
+        self._assign_attribute("_kind", value)
+
+    def _assign_attribute(self, name: str, value: Any, old_value: Any = _NOT_SET) -> None:
+        object.__setattr__(self, name, value)
 
 
 class Qualifiable(Namespace, metaclass=abc.ABCMeta):
@@ -1564,6 +2880,8 @@ class Qualifiable(Namespace, metaclass=abc.ABCMeta):
     :ivar qualifier: Unordered list of :class:`Qualifiers <Qualifier>` that gives additional qualification of a
                      qualifiable element.
     """
+    __slots__ = _MIXIN_SLOTS
+
     @abc.abstractmethod
     def __init__(self) -> None:
         super().__init__()
@@ -1597,6 +2915,7 @@ class Qualifiable(Namespace, metaclass=abc.ABCMeta):
         return super()._remove_object(Qualifiable, "type", qualifier_type)
 
 
+@_track_attributes("value_type", "value_id", "kind")
 class Qualifier(HasSemantics):
     """
     A qualifier is a type-value pair that makes additional statements w.r.t. the value of the element.
@@ -1616,6 +2935,11 @@ class Qualifier(HasSemantics):
                                     supplemental semantic ID of the element. (inherited from
                                     :class:`~basyx.aas.model.base.HasSemantics`)
     """
+    __slots__ = ('_type', '_value_type', '_value', '_value_id', '_kind')
+    # Properties created by _track_attributes()
+    value_type: DataTypeDefXsd
+    value_id: Optional[Reference]
+    kind: QualifierKind
 
     def __init__(self,
                  type_: QualifierType,
@@ -1632,12 +2956,12 @@ class Qualifier(HasSemantics):
         self.parent: Optional[Qualifiable] = None
         self._type: QualifierType
         self.type: QualifierType = type_
-        self.value_type: DataTypeDefXsd = value_type
+        self._value_type: DataTypeDefXsd = value_type
         self._value: Optional[ValueDataType] = datatypes.trivial_cast(value, value_type) if value is not None else None
-        self.value_id: Optional[Reference] = value_id
-        self.kind: QualifierKind = kind
-        self.semantic_id: Optional[Reference] = semantic_id
-        self.supplemental_semantic_id: ConstrainedList[Reference] = ConstrainedList(supplemental_semantic_id)
+        self._value_id: Optional[Reference] = value_id
+        self._kind: QualifierKind = kind
+        self.semantic_id = semantic_id
+        self.supplemental_semantic_id = ConstrainedList(supplemental_semantic_id)
 
     def __repr__(self) -> str:
         return "Qualifier(type={})".format(self.type)
@@ -1649,9 +2973,9 @@ class Qualifier(HasSemantics):
     @value.setter
     def value(self, value) -> None:
         if value is None:
-            self._value = None
+            self._assign_attribute("_value", None)
         else:
-            self._value = datatypes.trivial_cast(value, self.value_type)
+            self._assign_attribute("_value", datatypes.trivial_cast(value, self.value_type))
 
     @property
     def type(self):
@@ -1660,25 +2984,30 @@ class Qualifier(HasSemantics):
     @type.setter
     def type(self, type_: QualifierType) -> None:
         _string_constraints.check_qualifier_type(type_)
+        self._check_not_frozen()
         if self.parent is not None:
             for set_ in self.parent.namespace_element_sets:
                 if set_.contains_id("type", type_):
                     raise KeyError("Object with type '{}' is already present in the parent Namespace"
                                    .format(type_))
             set_add_list: List[NamespaceSet] = []
-            for set_ in self.parent.namespace_element_sets:
-                if self in set_:
-                    set_add_list.append(set_)
-                    set_.discard(self)
-            self._type = type_
-            for set_ in set_add_list:
-                set_.add(self)
+            with _suppress_events():
+                for set_ in self.parent.namespace_element_sets:
+                    if self in set_:
+                        set_add_list.append(set_)
+                        set_.discard(self)
+                self._type = type_
+                for set_ in set_add_list:
+                    set_.add(self)
         # Redundant to the line above. However, this way, we make sure that we really update the _type
-        self._type = type_
+        self._assign_attribute("_type", type_)
+
+    def _validate_constraints(self, run: _string_constraints.CheckRunner = _string_constraints.run_check) -> None:
+        run(_string_constraints.check_qualifier_type, self._type)
 
 
 @_string_constraints.constrain_value_type_iec61360("value")
-class ValueReferencePair:
+class ValueReferencePair(_FreezableValue):
     """
     A value reference pair within a value list. Each value has a global unique id defining its semantic.
 
@@ -1711,14 +3040,33 @@ class UniqueIdShortNamespace(Namespace, metaclass=abc.ABCMeta):
     A Namespace can contain multiple :class:`NamespaceSets <NamespaceSet>`, which contain :class:`~.Referable` objects
     of different types. However, the id_short of each object must be unique across all NamespaceSets of one Namespace.
 
+    To check this uniqueness and to resolve id_shorts without searching each NamespaceSet, the Namespace keeps a
+    consolidated index of the :class:`~.Referable` objects of all its NamespaceSets by their id_short, which is
+    maintained by the NamespaceSets.
 
+    Each Namespace has a structural generation counter, which is incremented whenever a :class:`~.Referable` is
+    added to or removed from it (this includes changing the id_short of a :class:`~.Referable`). If
+    ``path_cache_enabled`` is set, the Namespace caches the results of resolving id_short paths with
+    :meth:`get_referable`, along with the generations of all Namespaces on the path. A cached result is used as long as
+    none of these generations has changed.
 
     :ivar namespace_element_sets: A list of all :class:`NamespaceSets <.NamespaceSet>` of this Namespace
+    :cvar path_cache_enabled: If True, cache the :class:`~.Referable` objects found by :meth:`get_referable` by their
+                              id_short path. Enabled for :class:`~basyx.aas.model.submodel.Submodel` by default.
     """
+    path_cache_enabled: bool = False
+
     @abc.abstractmethod
     def __init__(self) -> None:
         super().__init__()
         self.namespace_element_sets: List[NamespaceSet] = []
+        # The consolidated id_short index. It is created by the first NamespaceSet, which stores objects by their
+        # id_short. Case-insensitive NamespaceSets contribute to it as well, using the exact id_short as key.
+        self._id_short_index: Optional[Dict[NameType, Referable]] = None
+        self._structure_generation: int = 0
+        # Cache of resolved id_short paths -> (resolved Referable, generations of the Namespaces on the path). It is
+        # only created, when it is used.
+        self._path_cache: Optional[Dict[Tuple[NameType, ...], Tuple[Referable, _PathGenerations]]] = None
 
     def get_referable(self, id_short: Union[NameType, Iterable[NameType]]) -> Referable:
         """
@@ -1733,16 +3081,42 @@ class UniqueIdShortNamespace(Namespace, metaclass=abc.ABCMeta):
                             :class:`~basyx.aas.model.submodel.SubmodelElementList`
         :raises KeyError: If no such :class:`~.Referable` can be found
         """
-        from .submodel import SubmodelElementList
         if isinstance(id_short, NameType):
             id_short = [id_short]
-        item: Union[UniqueIdShortNamespace, Referable] = self
+        # ModelReference.resolve() calls this method on arbitrary Identifiables, which might not be a Namespace at all.
+        # Resolving a single id_short is a single lookup in the id_short index anyway, so only cache longer paths.
+        if not isinstance(self, UniqueIdShortNamespace) or not self.path_cache_enabled:
+            return UniqueIdShortNamespace._resolve_id_short_path(self, id_short)
+        path = tuple(id_short)
+        if len(path) < 2:
+            return UniqueIdShortNamespace._resolve_id_short_path(self, path)
+        if self._path_cache is None:
+            self._path_cache = {}
+        entry = self._path_cache.get(path)
+        if entry is not None and UniqueIdShortNamespace._path_generations_valid(entry[1]):
+            return entry[0]
+        item, generations = UniqueIdShortNamespace._resolve_id_short_path_generations(self, path)
+        self._path_cache[path] = (item, generations)
+        return item
+
+    @staticmethod
+    def _resolve_id_short_path(namespace: "UniqueIdShortNamespace", id_short: Iterable[NameType],
+                               traversed: Optional[List["UniqueIdShortNamespace"]] = None) -> Referable:
+        """
+        Resolve an id_short path segment by segment, starting at the given Namespace. See :meth:`get_referable`.
+
+        :param traversed: If given, the Namespaces on the path are appended to this list
+        """
+        from .submodel import SubmodelElementList
+        item: Union[UniqueIdShortNamespace, Referable] = namespace
         for id_ in id_short:
             # This is redundant on first iteration, but it's a negligible overhead.
             # Also, ModelReference.resolve() relies on this check.
             if not isinstance(item, UniqueIdShortNamespace):
                 raise TypeError(f"Cannot resolve id_short or index '{id_}' at {item!r}, "
                                 f"because it is not a {UniqueIdShortNamespace.__name__}!")
+            if traversed is not None:
+                traversed.append(item)
             is_submodel_element_list = isinstance(item, SubmodelElementList)
             try:
                 if is_submodel_element_list:
@@ -1751,7 +3125,7 @@ class UniqueIdShortNamespace(Namespace, metaclass=abc.ABCMeta):
                     # stored in boolean variables.
                     item = item.value[int(id_)]  # type: ignore
                 else:
-                    item = item._get_object(Referable, "id_short", id_)  # type: ignore[type-abstract]
+                    item = item._get_referable(id_)  # type: ignore[union-attr]
             except ValueError as e:
                 raise ValueError(f"Cannot resolve '{id_}' at {item!r}, because it is not a numeric index!") from e
             except (KeyError, IndexError) as e:
@@ -1760,6 +3134,51 @@ class UniqueIdShortNamespace(Namespace, metaclass=abc.ABCMeta):
         # All UniqueIdShortNamespaces are Referables, and we only ever assign Referable to item.
         return item  # type: ignore[return-value]
 
+    @staticmethod
+    def _resolve_id_short_path_generations(namespace: "UniqueIdShortNamespace", id_short: Iterable[NameType]) \
+            -> Tuple[Referable, "_PathGenerations"]:
+        """
+        Resolve an id_short path like :meth:`_resolve_id_short_path` and return the structure generations of the
+        Namespaces on the path along with the result. The result remains valid, as long as these generations do not
+        change (see :meth:`_path_generations_valid`).
+        """
+        traversed: List[UniqueIdShortNamespace] = []
+        item = UniqueIdShortNamespace._resolve_id_short_path(namespace, id_short, traversed)
+        return item, tuple((namespace_, namespace_._structure_generation) for namespace_ in traversed)
+
+    @staticmethod
+    def _path_generations_valid(generations: "_PathGenerations") -> bool:
+        """
+        Check if none of the Namespaces on a resolved id_short path has been modified since it has been resolved
+        """
+        for namespace, generation in generations:
+            if namespace._structure_generation != generation:
+                return False
+        return True
+
+    @property
+    def structure_generation(self) -> int:
+        """
+        The structural generation counter of this Namespace. It is incremented whenever a :class:`~.Referable` is
+        added to or removed from this Namespace. Modifications of descendant Namespaces only increment their own
+        counter, so checking the validity of a resolved id_short path takes the counters of all Namespaces on the path.
+        """
+        return self._structure_generation
+
+    def _get_referable(self, id_short: NameType) -> Referable:
+        """
+        Find a :class:`~.Referable` in this Namespace by its id_short, using the consolidated id_short index
+
+        :raises KeyError: If no such :class:`~.Referable` can be found
+        """
+        if self._id_short_index is not None:
+            try:
+                return self._id_short_index[id_short]
+            except KeyError:
+                pass
+        # Objects in case-insensitive NamespaceSets may only be found by searching the NamespaceSets themselves
+        return self._get_object(Referable, "id_short", id_short)  # type: ignore[type-abstract]
+
     def add_referable(self, referable: Referable) -> None:
         """
         Add a :class:`~.Referable` to this Namespace
@@ -1790,6 +3209,10 @@ class UniqueIdShortNamespace(Namespace, metaclass=abc.ABCMeta):
         return itertools.chain.from_iterable(namespace_set_list)
 
 
+# The Namespaces on a resolved id_short path with their structure generations at the time of resolving it
+_PathGenerations = Tuple[Tuple[UniqueIdShortNamespace, int], ...]
+
+
 class UniqueSemanticIdNamespace(Namespace, metaclass=abc.ABCMeta):
     """
     Abstract baseclass for all objects which form a Namespace to hold HasSemantics objects and resolve them by
@@ -1857,6 +3280,9 @@ class NamespaceSet(MutableSet[_NSO], Generic[_NSO]):
 
     :raises KeyError: When ``items`` contains multiple objects with same unique attribute
     """
+    # Set, when the parent of this set is frozen (see :meth:`.Referable.freeze`)
+    _frozen: bool = False
+
     def __init__(self, parent: Union[UniqueIdShortNamespace, UniqueSemanticIdNamespace, Qualifiable, HasExtension],
                  attribute_names: List[Tuple[str, bool]], items: Iterable[_NSO] = (),
                  item_add_hook: Optional[Callable[[_NSO, Iterable[_NSO]], None]] = None,
@@ -1883,6 +3309,15 @@ class NamespaceSet(MutableSet[_NSO], Generic[_NSO]):
         :raises AASConstraintViolation: When ``items`` contains multiple objects with same unique attribute or when an
                                         item doesn't have an identifying attribute
         """
+        self._init_empty(parent, attribute_names, item_add_hook, item_id_set_hook, item_id_del_hook)
+        # add_many() does a rollback by itself, when an exception occurs while adding items
+        self.add_many(items)
+
+    def _init_empty(self, parent: Union[UniqueIdShortNamespace, UniqueSemanticIdNamespace, Qualifiable, HasExtension],
+                    attribute_names: Iterable[Tuple[str, bool]],
+                    item_add_hook: Optional[Callable[[_NSO, Iterable[_NSO]], None]],
+                    item_id_set_hook: Optional[Callable[[_NSO], None]],
+                    item_id_del_hook: Optional[Callable[[_NSO], None]]) -> None:
         self.parent = parent
         parent.namespace_element_sets.append(self)
         self._backend: Dict[str, Tuple[Dict[ATTRIBUTE_TYPES, _NSO], bool]] = {}
@@ -1891,13 +3326,33 @@ class NamespaceSet(MutableSet[_NSO], Generic[_NSO]):
         self._item_id_del_hook: Optional[Callable[[_NSO], None]] = item_id_del_hook
         for name, case_sensitive in attribute_names:
             self._backend[name] = ({}, case_sensitive)
-        try:
-            for i in items:
-                self.add(i)
-        except Exception:
-            # Do a rollback, when an exception occurs while adding items
-            self.clear()
-            raise
+        # The consolidated id_short index of the parent Namespace, if this set stores objects by their id_short
+        self._id_short_index: Optional[Dict[NameType, _NSO]] = None
+        if "id_short" in self._backend and isinstance(parent, UniqueIdShortNamespace):
+            if parent._id_short_index is None:
+                parent._id_short_index = {}
+            self._id_short_index = parent._id_short_index  # type: ignore[assignment]
+
+    def _restore(self, parent: Union[UniqueIdShortNamespace, UniqueSemanticIdNamespace, Qualifiable, HasExtension],
+                 attribute_names: Iterable[Tuple[str, bool]], hooks: Tuple[Any, ...], items: List[_NSO]) -> None:
+        """
+        Initialize a NamespaceSet created by ``__new__()`` with the restored items of a copied or unpickled object
+        hierarchy (see :meth:`.Referable.__deepcopy__`)
+
+        In contrast to ``__init__()``, the items are added without checking their uniqueness or calling the hooks, since
+        they are known to be valid.
+        """
+        self._init_empty(parent, attribute_names, *hooks)
+        for item in items:
+            object.__setattr__(item, "parent", parent)
+            for name, (backend, case_sensitive) in self._backend.items():
+                backend[self._get_attribute(item, name, case_sensitive)] = item
+        if self._id_short_index is not None:
+            self._id_short_index.update((item.id_short, item) for item in items)  # type: ignore[union-attr]
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # A NamespaceSet is pickled and copied along with its parent (see Referable.__reduce__())
+        return getattr, (self.parent, next(name for name, value in _instance_attributes(self.parent) if value is self))
 
     @staticmethod
     def _get_attribute(x: object, attr_name: str, case_sensitive: bool):
@@ -1932,9 +3387,17 @@ class NamespaceSet(MutableSet[_NSO], Generic[_NSO]):
         return iter(next(iter(self._backend.values()))[0].values())
 
     def add(self, element: _NSO):
+        self._add(element)
+        if _OBSERVERS:
+            self._notify_observers(ModelEventKind.CHILD_ADDED, (element,))
+
+    def _add(self, element: _NSO) -> None:
+        self._check_not_frozen()
         if element.parent is not None and element.parent is not self.parent:
             raise ValueError("Object has already a parent; it cannot belong to two namespaces.")
             # TODO remove from current parent instead (allow moving)?
+        # The parent of a frozen object cannot be changed
+        element._check_not_frozen()
 
         self._execute_item_id_set_hook(element)
         self._validate_namespace_constraints(element)
@@ -1943,14 +3406,115 @@ class NamespaceSet(MutableSet[_NSO], Generic[_NSO]):
         element.parent = self.parent
         for key_attr_name, (backend, case_sensitive) in self._backend.items():
             backend[self._get_attribute(element, key_attr_name, case_sensitive)] = element
+        if self._id_short_index is not None:
+            self._id_short_index[element.id_short] = element  # type: ignore[union-attr]
+            self._increment_structure_generation()
+        self._record_change((element,))
+
+    def add_many(self, elements: Iterable[_NSO]) -> None:
+        """
+        Add multiple elements to this set at once.
+
+        In contrast to calling :meth:`add` for each element, the uniqueness of the identifying attributes is checked for
+        the whole batch of elements in a single pass. The operation is atomic: If any of the elements can't be added,
+        none of them is added.
+
+        :param elements: The elements to add
+        :raises ValueError: If one of the elements already belongs to another namespace
+        :raises AASConstraintViolation: If the identifying attribute of an element is already present in the Namespace,
+                                        is present in multiple elements of the batch or is missing
+        """
+        elements = list(elements)
+        self._add_many(elements)
+        if _OBSERVERS:
+            self._notify_observers(ModelEventKind.CHILD_ADDED, elements)
+
+    def _add_many(self, elements: List[_NSO]) -> None:
+        self._check_not_frozen()
+        for element in elements:
+            if element.parent is not None and element.parent is not self.parent:
+                raise ValueError("Object has already a parent; it cannot belong to two namespaces.")
+            element._check_not_frozen()
+
+        hooked_elements: List[_NSO] = []
+        try:
+            for element in elements:
+                self._execute_item_id_set_hook(element)
+                hooked_elements.append(element)
+            self._validate_namespace_constraints_many(elements)
+            if self._item_add_hook is not None:
+                for i, element in enumerate(elements):
+                    # The hook gets to see the elements of the batch, which are already "added", as well
+                    self._item_add_hook(element, itertools.chain(self.__iter__(), itertools.islice(elements, i)))
+        except Exception:
+            # Do a rollback of the already executed item_id_set_hooks
+            for element in hooked_elements:
+                self._execute_item_del_hook(element)
+            raise
+
+        for element in elements:
+            element.parent = self.parent
+        for key_attr_name, (backend, case_sensitive) in self._backend.items():
+            for element in elements:
+                backend[self._get_attribute(element, key_attr_name, case_sensitive)] = element
+        if self._id_short_index is not None:
+            for element in elements:
+                self._id_short_index[element.id_short] = element  # type: ignore[union-attr]
+            self._increment_structure_generation()
+        self._record_change(elements)
+
+    def _validate_namespace_constraints_many(self, elements: List[_NSO]) -> None:
+        # Check the elements against each other. Elements only become part of this set's backends, so collisions
+        # amongst the batch only need to be checked for these.
+        for key_attr_name, (_backend_dict, case_sensitive) in self._backend.items():
+            batch_dict: Dict[ATTRIBUTE_TYPES, _NSO] = {}
+            for element in elements:
+                key_attr_value = self._get_attribute(element, key_attr_name, case_sensitive)
+                self._check_attr_is_not_none(element, key_attr_name, key_attr_value)
+                self._check_value_is_not_in_backend(element, key_attr_name, key_attr_value, batch_dict, self)
+                batch_dict[key_attr_value] = element
+        # Check the elements against the existing elements of all sets of the Namespace
+        for set_ in self.parent.namespace_element_sets:
+            for key_attr_name, (backend_dict, case_sensitive) in set_._backend.items():
+                if key_attr_name == "id_short" and case_sensitive and set_._id_short_index is not None:
+                    # checked by _check_id_short_index() below
+                    continue
+                for element in elements:
+                    if hasattr(element, key_attr_name):
+                        key_attr_value = self._get_attribute(element, key_attr_name, case_sensitive)
+                        self._check_attr_is_not_none(element, key_attr_name, key_attr_value)
+                        self._check_value_is_not_in_backend(element, key_attr_name, key_attr_value, backend_dict,
+                                                            set_)
+        for element in elements:
+            self._check_id_short_index(element)
 
     def _validate_namespace_constraints(self, element: _NSO):
         for set_ in self.parent.namespace_element_sets:
             for key_attr_name, (backend_dict, case_sensitive) in set_._backend.items():
+                if key_attr_name == "id_short" and case_sensitive and set_._id_short_index is not None:
+                    # checked by _check_id_short_index() below
+                    continue
                 if hasattr(element, key_attr_name):
                     key_attr_value = self._get_attribute(element, key_attr_name, case_sensitive)
                     self._check_attr_is_not_none(element, key_attr_name, key_attr_value)
                     self._check_value_is_not_in_backend(element, key_attr_name, key_attr_value, backend_dict, set_)
+        self._check_id_short_index(element)
+
+    def _check_id_short_index(self, element: _NSO):
+        """
+        Check the id_short of an element against the consolidated id_short index of the parent Namespace, which
+        replaces probing the id_short backend of each case-sensitive NamespaceSet of the Namespace.
+        """
+        id_short_index: Optional[Dict[NameType, Referable]] = getattr(self.parent, "_id_short_index", None)
+        if id_short_index is None or not hasattr(element, "id_short"):
+            return
+        id_short = element.id_short
+        self._check_attr_is_not_none(element, "id_short", id_short)
+        existing = id_short_index.get(id_short)
+        if existing is not None:
+            set_ = next(set_ for set_ in self.parent.namespace_element_sets if existing in set_)
+            self._check_value_is_not_in_backend(element, "id_short", id_short, id_short_index,  # type: ignore[arg-type]
+                                                set_)
 
     def _check_attr_is_not_none(self, element: _NSO, attr_name: str, attr):
         if attr is None:
@@ -1971,6 +3535,38 @@ class NamespaceSet(MutableSet[_NSO], Generic[_NSO]):
                        f"is already present in another set in the same namespace"
             raise AASConstraintViolation(ATTRIBUTES_CONSTRAINT_IDS.get(attr_name, 0), text)
 
+    def _increment_structure_generation(self) -> None:
+        """
+        Increment the structural generation counter of the parent Namespace, since the set of Referables reachable by
+        its id_short has changed. The ancestor Namespaces are not touched, see
+        :meth:`UniqueIdShortNamespace._path_generations_valid`.
+        """
+        self.parent._structure_generation += 1  # type: ignore[union-attr]
+
+    def _record_change(self, added: Iterable[_NSO] = ()) -> None:
+        """
+        Record a modification of this set in the dirty tracking of the parent Referable (see
+        :meth:`~.Referable.get_dirty_paths`). Added Referables are marked as modified themselves, such that only their
+        subtrees need to be committed. Any other modification, like removing an element, modifies the parent itself.
+
+        :param added: The elements, which have been added to this set
+        """
+        parent = self.parent
+        if not isinstance(parent, Referable):
+            return
+        if added and "id_short" in self._backend:
+            for element in added:
+                element._set_dirty()  # type: ignore[union-attr]
+        else:
+            parent._set_dirty()
+
+    def _notify_observers(self, kind: ModelEventKind, elements: Iterable[_NSO]) -> None:
+        parent = self.parent
+        if isinstance(parent, Referable):
+            attribute_name = self._parent_attribute_name()
+            for element in elements:
+                _notify(ModelEvent(kind, parent, attribute_name, element))
+
     def _execute_item_id_set_hook(self, element: _NSO):
         if self._item_id_set_hook is not None:
             self._item_id_set_hook(element)
@@ -1996,6 +3592,12 @@ class NamespaceSet(MutableSet[_NSO], Generic[_NSO]):
         self.remove(item)
 
     def remove(self, item: _NSO) -> None:
+        self._remove(item)
+        if _OBSERVERS:
+            self._notify_observers(ModelEventKind.CHILD_REMOVED, (item,))
+
+    def _remove(self, item: _NSO) -> None:
+        self._check_not_frozen()
         item_found = False
         for key_attr_name, (backend_dict, case_sensitive) in self._backend.items():
             key_attr_value = self._get_attribute(item, key_attr_name, case_sensitive)
@@ -2006,7 +3608,11 @@ class NamespaceSet(MutableSet[_NSO], Generic[_NSO]):
                 item_found = True
         if not item_found:
             raise KeyError("Object not found in NamespaceDict")
+        if self._id_short_index is not None:
+            del self._id_short_index[item.id_short]  # type: ignore[union-attr]
+            self._increment_structure_generation()
         self._execute_item_del_hook(item)
+        self._record_change()
 
     def discard(self, x: _NSO) -> None:
         if x not in self:
@@ -2014,17 +3620,37 @@ class NamespaceSet(MutableSet[_NSO], Generic[_NSO]):
         self.remove(x)
 
     def pop(self) -> _NSO:
-        _, value = next(iter(self._backend.values()))[0].popitem()
-        self._execute_item_del_hook(value)
-        value.parent = None
+        try:
+            value = next(reversed(next(iter(self._backend.values()))[0].values()))
+        except StopIteration:
+            raise KeyError("pop from an empty NamespaceSet") from None
+        # remove the value from all backends and the id_short index of the Namespace
+        NamespaceSet.remove(self, value)
         return value
 
     def clear(self) -> None:
+        items = list(self) if _OBSERVERS else []
+        self._clear()
+        if items:
+            self._notify_observers(ModelEventKind.CHILD_REMOVED, items)
+
+    def _clear(self) -> None:
+        self._check_not_frozen()
+        if self._id_short_index is not None:
+            for value in self:
+                del self._id_short_index[value.id_short]  # type: ignore[union-attr]
+            self._increment_structure_generation()
         for attr_name, (backend, case_sensitive) in self._backend.items():
             for value in backend.values():
                 self._execute_item_del_hook(value)
         for attr_name, (backend, case_sensitive) in self._backend.items():
             backend.clear()
+        self._record_change()
+
+    def _check_not_frozen(self) -> None:
+        if self._frozen:
+            raise FrozenObjectError(f"The {self._parent_attribute_name()} of {self.parent!r} are frozen and cannot be "
+                                    f"modified")
 
     def get_object_by_attribute(self, attribute_name: str, attribute_value: ATTRIBUTE_TYPES) -> _NSO:
         """
@@ -2048,48 +3674,268 @@ class NamespaceSet(MutableSet[_NSO], Generic[_NSO]):
         backend, case_sensitive = self._backend[attribute_name]
         return backend.get(attribute_value if case_sensitive else attribute_value.upper(), default)
 
-    # Todo: Implement function including tests
-    def update_nss_from(self, other: "NamespaceSet"):
+    def update_nss_from(self, other: "NamespaceSet") -> ChangeSummary:
         """
         Update a NamespaceSet from a given NamespaceSet.
 
+        Elements are matched by the first identifying attribute of this set. Matching Referables of the same type are
+        updated in place via :meth:`~.Referable.update_from`, other matching elements are replaced, if they differ.
+        Elements, which only exist in ``other``, are moved into this set and elements, which don't exist in ``other``,
+        are removed.
+
         WARNING: By updating, the "other" NamespaceSet gets destroyed.
 
         :param other: The NamespaceSet to update from
+        :return: A :class:`~.ChangeSummary`, with all paths relative to the parent of this set
+        """
+        summary = ChangeSummary()
+        self._update_nss_from(other, summary, (), self._parent_attribute_name())
+        return summary
+
+    def _parent_attribute_name(self) -> str:
+        return next((name.lstrip("_") for name, value in _instance_attributes(self.parent) if value is self), "")
+
+    def _update_nss_from(self, other: "NamespaceSet", summary: ChangeSummary, path: Tuple[NameType, ...],
+                         attribute_name: str) -> None:
         """
+        Implementation of :meth:`update_nss_from`, recording the changes in the given ``summary``
+
+        :param path: The path of the parent of this set, relative to the updated object
+        :param attribute_name: The name of the attribute of the parent holding this set
+        """
+        key_attr_name, (backend, case_sensitive) = next(iter(self._backend.items()))
+        other_backend = other._backend[key_attr_name][0]
+        # Remove the elements first, so that their identifying attributes can't collide with the added ones
+        objects_to_remove: List[_NSO] = [element for key, element in backend.items() if key not in other_backend]
         objects_to_add: List[_NSO] = []  # objects from the other nss to add to self
-        objects_to_remove: List[_NSO] = []  # objects to remove from self
         for other_object in other:
-            try:
-                if isinstance(other_object, Referable):
-                    backend, case_sensitive = self._backend["id_short"]
-                    referable = backend[other_object.id_short if case_sensitive else other_object.id_short.upper()]
-                    referable.update_from(other_object, update_source=True)  # type: ignore
-                elif isinstance(other_object, Qualifier):
-                    backend, case_sensitive = self._backend["type"]
-                    qualifier = backend[other_object.type if case_sensitive else other_object.type.upper()]
-                    # qualifier.update_from(other_object, update_source=True) # TODO: What should happen here?
-                elif isinstance(other_object, Extension):
-                    backend, case_sensitive = self._backend["name"]
-                    extension = backend[other_object.name if case_sensitive else other_object.name.upper()]
-                    # extension.update_from(other_object, update_source=True) # TODO: What should happen here?
-                else:
-                    raise TypeError("Type not implemented")
-            except KeyError:
-                # other object is not in NamespaceSet
+            element = backend.get(self._get_attribute(other_object, key_attr_name, case_sensitive))
+            if element is None:
                 objects_to_add.append(other_object)
-        for attr_name, (backend, case_sensitive) in self._backend.items():
-            for attr_name_other, (backend_other, case_sensitive_other) in other._backend.items():
-                if attr_name is attr_name_other:
-                    for item in backend.values():
-                        if not backend_other.get(self._get_attribute(item, attr_name, case_sensitive)):
-                            # referable does not exist in the other NamespaceSet
-                            objects_to_remove.append(item)
+            elif isinstance(element, Referable) and type(element) is type(other_object):
+                element._update_from(other_object, True, summary,  # type: ignore[arg-type]
+                                     path + (element.id_short,))
+            elif not _values_equal(element, other_object):
+                objects_to_remove.append(element)
+                objects_to_add.append(other_object)
+        for object_to_remove in objects_to_remove:
+            self._record_removal(object_to_remove, summary, path, attribute_name)
+            self.remove(object_to_remove)
         for object_to_add in objects_to_add:
             other.remove(object_to_add)
-            self.add(object_to_add)  # type: ignore
-        for object_to_remove in objects_to_remove:
-            self.remove(object_to_remove)  # type: ignore
+            self.add(object_to_add)
+            self._record_addition(object_to_add, summary, path, attribute_name)
+
+    @staticmethod
+    def _record_removal(element: _NSO, summary: ChangeSummary, path: Tuple[NameType, ...],
+                        attribute_name: str) -> None:
+        if isinstance(element, Referable):
+            summary.removed.append(path + (element.id_short,))
+        else:
+            summary._add_modified(path, (attribute_name,))
+
+    @staticmethod
+    def _record_addition(element: _NSO, summary: ChangeSummary, path: Tuple[NameType, ...],
+                         attribute_name: str) -> None:
+        if isinstance(element, Referable):
+            summary.added.append(path + (element.id_short,))
+        else:
+            summary._add_modified(path, (attribute_name,))
+
+
+class _BlockSequence(Generic[_T]):
+    """
+    A list-like sequence of distinct objects, used by :class:`~.OrderedNamespaceSet` to store the order of its objects.
+
+    The objects are stored in blocks of limited size. A Fenwick tree (binary indexed tree) over the lengths of the
+    blocks allows to find the block of a position in logarithmic time. Thus, getting, inserting and deleting an object
+    by its position only costs O(log n) plus moving the objects within a single block. Additionally, the block of each
+    object is kept in a dict, so that the position of an object can be determined without searching the whole
+    sequence.
+
+    The objects are identified by their ``id()``. Thus, each object must not be contained more than once.
+    """
+    _BLOCK_SIZE = 256
+
+    def __init__(self, items: Iterable[_T] = ()) -> None:
+        self._blocks: List[List[_T]] = []
+        # id() of each object -> block containing the object
+        self._block_of: Dict[int, List[_T]] = {}
+        # id() of each block -> index of the block in self._blocks
+        self._block_index: Dict[int, int] = {}
+        # Fenwick tree over the lengths of the blocks (1-based, self._tree[0] is unused)
+        self._tree: List[int] = [0]
+        self._len = 0
+        self.extend(items)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[_T]:
+        return itertools.chain.from_iterable(self._blocks)
+
+    def __reversed__(self) -> Iterator[_T]:
+        for block in reversed(self._blocks):
+            yield from reversed(block)
+
+    def _rebuild(self) -> None:
+        """
+        Rebuild the block index and the Fenwick tree after blocks have been added or removed
+        """
+        self._block_index = {id(block): i for i, block in enumerate(self._blocks)}
+        tree = [0] * (len(self._blocks) + 1)
+        for i, block in enumerate(self._blocks, 1):
+            tree[i] += len(block)
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _rebalance(self) -> None:
+        """
+        Regroup all objects into blocks of equal size, after many deletions have left behind small blocks
+        """
+        items = list(self)
+        self._blocks = [items[i:i + self._BLOCK_SIZE] for i in range(0, len(items), self._BLOCK_SIZE)]
+        self._block_of = {id(item): block for block in self._blocks for item in block}
+        self._rebuild()
+
+    def _tree_add(self, block_index: int, delta: int) -> None:
+        i = block_index + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, block_index: int) -> int:
+        """
+        Get the number of objects in the blocks before the given block
+        """
+        result = 0
+        i = block_index
+        while i > 0:
+            result += self._tree[i]
+            i -= i & -i
+        return result
+
+    def _locate(self, position: int) -> Tuple[int, int]:
+        """
+        Find the index of the block and the offset within the block of a valid, non-negative position
+        """
+        block_index = 0
+        remaining = position
+        bit = 1 << (len(self._blocks).bit_length() - 1) if self._blocks else 0
+        while bit:
+            next_index = block_index + bit
+            if next_index < len(self._tree) and self._tree[next_index] <= remaining:
+                block_index = next_index
+                remaining -= self._tree[next_index]
+            bit >>= 1
+        return block_index, remaining
+
+    def _normalize(self, position: int) -> int:
+        if position < 0:
+            position += self._len
+        if not 0 <= position < self._len:
+            raise IndexError("sequence index out of range")
+        return position
+
+    @overload
+    def __getitem__(self, i: int) -> _T: ...
+
+    @overload
+    def __getitem__(self, s: slice) -> List[_T]: ...
+
+    def __getitem__(self, s: Union[int, slice]) -> Union[_T, List[_T]]:
+        if isinstance(s, slice):
+            return list(self)[s]
+        block_index, offset = self._locate(self._normalize(s))
+        return self._blocks[block_index][offset]
+
+    def __setitem__(self, position: int, item: _T) -> None:
+        block_index, offset = self._locate(self._normalize(position))
+        block = self._blocks[block_index]
+        del self._block_of[id(block[offset])]
+        block[offset] = item
+        self._block_of[id(item)] = block
+
+    def insert(self, position: int, item: _T) -> None:
+        """
+        Insert an object before the given position. Just like ``list.insert()``, out of range positions are clamped.
+        """
+        if position < 0:
+            position = max(position + self._len, 0)
+        if position >= self._len:
+            if not self._blocks or len(self._blocks[-1]) >= self._BLOCK_SIZE:
+                self._blocks.append([])
+                self._rebuild()
+            block_index = len(self._blocks) - 1
+            block = self._blocks[block_index]
+            block.append(item)
+        else:
+            block_index, offset = self._locate(position)
+            block = self._blocks[block_index]
+            block.insert(offset, item)
+        self._block_of[id(item)] = block
+        self._len += 1
+        self._tree_add(block_index, 1)
+        if len(block) > 2 * self._BLOCK_SIZE:
+            # Split the block
+            new_block = block[self._BLOCK_SIZE:]
+            del block[self._BLOCK_SIZE:]
+            for moved_item in new_block:
+                self._block_of[id(moved_item)] = new_block
+            self._blocks.insert(block_index + 1, new_block)
+            self._rebuild()
+
+    def append(self, item: _T) -> None:
+        self.insert(self._len, item)
+
+    def extend(self, items: Iterable[_T]) -> None:
+        for item in items:
+            self.insert(self._len, item)
+
+    def pop(self, position: int = -1) -> _T:
+        block_index, offset = self._locate(self._normalize(position))
+        block = self._blocks[block_index]
+        item = block.pop(offset)
+        del self._block_of[id(item)]
+        self._len -= 1
+        if block:
+            self._tree_add(block_index, -1)
+        else:
+            del self._blocks[block_index]
+            self._rebuild()
+        if len(self._blocks) > 2 * (self._len // self._BLOCK_SIZE + 1):
+            self._rebalance()
+        return item
+
+    def __delitem__(self, position: int) -> None:
+        self.pop(position)
+
+    def index(self, item: _T) -> int:
+        """
+        Get the position of an object
+
+        :raises ValueError: If the object is not contained in the sequence
+        """
+        try:
+            block = self._block_of[id(item)]
+        except KeyError:
+            raise ValueError(f"{item!r} is not in the sequence") from None
+        offset = block.index(item)
+        if block[offset] is not item:
+            # Another object, which is equal to the given one, comes first
+            offset = next(i for i, other in enumerate(block) if other is item)
+        return self._prefix(self._block_index[id(block)]) + offset
+
+    def remove(self, item: _T) -> None:
+        self.pop(self.index(item))
+
+    def clear(self) -> None:
+        self._blocks = []
+        self._block_of = {}
+        self._rebuild()
+        self._len = 0
 
 
 class OrderedNamespaceSet(NamespaceSet[_NSO], MutableSequence[_NSO], Generic[_NSO]):
@@ -2100,6 +3946,9 @@ class OrderedNamespaceSet(NamespaceSet[_NSO], MutableSequence[_NSO], Generic[_NS
     Additionally, to the MutableSet interface of :class:`~.NamespaceSet`, this class provides a set-like interface
     (actually it is derived from MutableSequence). However, we don't permit duplicate entries in the ordered list of
     objects.
+
+    The order is stored in a block-based sequence, so that inserting and deleting objects at any position and looking
+    up the position of an object take logarithmic instead of linear time.
     """
     def __init__(self, parent: Union[UniqueIdShortNamespace, UniqueSemanticIdNamespace, Qualifiable, HasExtension],
                  attribute_names: List[Tuple[str, bool]], items: Iterable[_NSO] = (),
@@ -2127,38 +3976,144 @@ class OrderedNamespaceSet(NamespaceSet[_NSO], MutableSequence[_NSO], Generic[_NS
         :raises AASConstraintViolation: When ``items`` contains multiple objects with same unique attribute or when an
                                         item doesn't have an identifying attribute
         """
-        self._order: List[_NSO] = []
+        self._order: _BlockSequence[_NSO] = _BlockSequence()
         super().__init__(parent, attribute_names, items, item_add_hook, item_id_set_hook, item_id_del_hook)
 
+    def _restore(self, parent: Union[UniqueIdShortNamespace, UniqueSemanticIdNamespace, Qualifiable, HasExtension],
+                 attribute_names: Iterable[Tuple[str, bool]], hooks: Tuple[Any, ...], items: List[_NSO]) -> None:
+        self._order = _BlockSequence(items)
+        super()._restore(parent, attribute_names, hooks, items)
+
     def __iter__(self) -> Iterator[_NSO]:
         return iter(self._order)
 
+    def __reversed__(self) -> Iterator[_NSO]:
+        return reversed(self._order)
+
+    def index(self, value: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        """
+        Get the position of an object in this set
+
+        :raises ValueError: If the object is not contained in this set or not within the given bounds
+        """
+        index = self._order.index(value)
+        # Negative bounds are interpreted relative to the end and clamped to the sequence, like list.index() does
+        length = len(self._order)
+        if start < 0:
+            start = max(start + length, 0)
+        if stop is None:
+            stop = length
+        elif stop < 0:
+            stop = max(stop + length, 0)
+        if not start <= index < stop:
+            raise ValueError(f"{value!r} is not in the given bounds of the set")
+        return index
+
+    def _record_change(self, added: Iterable[_NSO] = ()) -> None:
+        # The order of the elements is part of the parent's data, so any modification changes the parent itself
+        super()._record_change()
+
+    def _update_nss_from(self, other: "NamespaceSet", summary: ChangeSummary, path: Tuple[NameType, ...],
+                         attribute_name: str) -> None:
+        if self._item_id_set_hook is not None:
+            # The identifying attributes are generated by this set (see SubmodelElementList), so they are unrelated to
+            # the ones of the other set. Thus, the elements are matched by their position instead.
+            self._update_nss_from_by_position(other, summary, path, attribute_name)
+            return
+        key_attr_name, (backend, case_sensitive) = next(iter(self._backend.items()))
+        keys = [self._get_attribute(other_object, key_attr_name, case_sensitive) for other_object in other]
+        super()._update_nss_from(other, summary, path, attribute_name)
+        # Restore the order of the other set
+        order = [backend[key] for key in keys]
+        if not all(element is other_element for element, other_element in zip(self._order, order)):
+            self._order.clear()
+            self._order.extend(order)
+            summary._add_modified(path, (attribute_name,))
+            self._record_change()
+
+    def _update_nss_from_by_position(self, other: "NamespaceSet", summary: ChangeSummary,
+                                     path: Tuple[NameType, ...], attribute_name: str) -> None:
+        own_elements = list(self)
+        other_elements = list(other)
+        for position, (element, other_object) in enumerate(zip(own_elements, other_elements)):
+            if isinstance(element, Referable) and type(element) is type(other_object):
+                # Keep the generated id_short of the element, the other set is destroyed anyway
+                object.__setattr__(other_object, "_id_short", element.id_short)
+                element._update_from(other_object, True, summary,  # type: ignore[arg-type]
+                                     path + (element.id_short,))
+            elif not _values_equal(element, other_object):
+                self._record_removal(element, summary, path, attribute_name)
+                del self[position]
+                other.remove(other_object)
+                self.insert(position, other_object)
+                self._record_addition(other_object, summary, path, attribute_name)
+        for element in own_elements[len(other_elements):]:
+            self._record_removal(element, summary, path, attribute_name)
+            self.remove(element)
+        for other_object in other_elements[len(own_elements):]:
+            other.remove(other_object)
+            self.add(other_object)
+            self._record_addition(other_object, summary, path, attribute_name)
+
+    # The order is updated before observers are notified by the public methods of NamespaceSet, so the modifying
+    # methods are overridden as a whole.
+
     def add(self, element: _NSO):
-        super().add(element)
+        self._add(element)
         self._order.append(element)
+        if _OBSERVERS:
+            self._notify_observers(ModelEventKind.CHILD_ADDED, (element,))
+
+    def add_many(self, elements: Iterable[_NSO]) -> None:
+        elements = list(elements)
+        self._add_many(elements)
+        self._order.extend(elements)
+        if _OBSERVERS:
+            self._notify_observers(ModelEventKind.CHILD_ADDED, elements)
+
+    def extend(self, values: Iterable[_NSO]) -> None:
+        """
+        Append all given objects to the end of this set. In contrast to ``MutableSequence.extend()``, this is done in a
+        single batch via :meth:`~.NamespaceSet.add_many`, i.e. if any of the objects can't be added, none of them is.
+        """
+        self.add_many(values)
 
     def remove(self, item: Union[Tuple[str, ATTRIBUTE_TYPES], _NSO]):
         if isinstance(item, tuple):
             item = self.get_object_by_attribute(item[0], item[1])
-        super().remove(item)
+        self._remove(item)
         self._order.remove(item)
+        if _OBSERVERS:
+            self._notify_observers(ModelEventKind.CHILD_REMOVED, (item,))
 
     def pop(self, i: Optional[int] = None) -> _NSO:
         if i is None:
-            value = super().pop()
+            try:
+                value = next(reversed(next(iter(self._backend.values()))[0].values()))
+            except StopIteration:
+                raise KeyError("pop from an empty NamespaceSet") from None
+            self._remove(value)
             self._order.remove(value)
         else:
+            self._check_not_frozen()
             value = self._order.pop(i)
-            super().remove(value)
+            self._remove(value)
+        if _OBSERVERS:
+            self._notify_observers(ModelEventKind.CHILD_REMOVED, (value,))
         return value
 
     def clear(self) -> None:
-        super().clear()
+        items = list(self) if _OBSERVERS else []
+        self._clear()
         self._order.clear()
+        if items:
+            self._notify_observers(ModelEventKind.CHILD_REMOVED, items)
 
     def insert(self, index: int, object_: _NSO) -> None:
-        super().add(object_)
+        self._add(object_)
         self._order.insert(index, object_)
+        if _OBSERVERS:
+            self._notify_observers(ModelEventKind.CHILD_ADDED, (object_,))
 
     @overload
     def __getitem__(self, i: int) -> _NSO: ...
@@ -2169,6 +4124,9 @@ class OrderedNamespaceSet(NamespaceSet[_NSO], MutableSequence[_NSO], Generic[_NS
     def __getitem__(self, s: Union[int, slice]) -> Union[_NSO, MutableSequence[_NSO]]:
         return self._order[s]
 
+    def _slice_positions(self, s: slice) -> range:
+        return range(*s.indices(len(self._order)))
+
     @overload
     def __setitem__(self, i: int, o: _NSO) -> None: ...
 
@@ -2176,26 +4134,37 @@ class OrderedNamespaceSet(NamespaceSet[_NSO], MutableSequence[_NSO], Generic[_NS
     def __setitem__(self, s: slice, o: Iterable[_NSO]) -> None: ...
 
     def __setitem__(self, s, o) -> None:
+        self._check_not_frozen()
         if isinstance(s, int):
             deleted_items = [self._order[s]]
-            super().add(o)
+            new_items = [o]
+            self._add(o)
             self._order[s] = o
         else:
-            deleted_items = self._order[s]
-            new_items = itertools.islice(o, len(deleted_items))
+            positions = self._slice_positions(s)
+            deleted_items = [self._order[position] for position in positions]
+            new_items = list(itertools.islice(o, len(deleted_items)))
             successful_new_items = []
             try:
                 for i in new_items:
-                    super().add(i)
+                    self._add(i)
                     successful_new_items.append(i)
             except Exception:
                 # Do a rollback, when an exception occurs while adding items
                 for i in successful_new_items:
-                    super().remove(i)
+                    self._remove(i)
                 raise
-            self._order[s] = new_items
+            for position, i in zip(positions, new_items):
+                self._order[position] = i
+            # If less new items than deleted items were given, the remaining positions are removed. Start from the
+            # end, so that the positions don't shift.
+            for position in sorted(positions[len(new_items):], reverse=True):
+                del self._order[position]
         for i in deleted_items:
-            super().remove(i)
+            self._remove(i)
+        if _OBSERVERS:
+            self._notify_observers(ModelEventKind.CHILD_REMOVED, deleted_items)
+            self._notify_observers(ModelEventKind.CHILD_ADDED, new_items)
 
     @overload
     def __delitem__(self, i: int) -> None: ...
@@ -2204,11 +4173,18 @@ class OrderedNamespaceSet(NamespaceSet[_NSO], MutableSequence[_NSO], Generic[_NS
     def __delitem__(self, i: slice) -> None: ...
 
     def __delitem__(self, i: Union[int, slice]) -> None:
+        self._check_not_frozen()
         if isinstance(i, int):
-            i = slice(i, i+1)
-        for o in self._order[i]:
-            super().remove(o)
-        del self._order[i]
+            deleted_items = [self._order.pop(i)]
+            self._remove(deleted_items[0])
+        else:
+            deleted_items = []
+            # Start from the end, so that the positions don't shift
+            for position in sorted(self._slice_positions(i), reverse=True):
+                deleted_items.append(self._order.pop(position))
+                self._remove(deleted_items[-1])
+        if _OBSERVERS:
+            self._notify_observers(ModelEventKind.CHILD_REMOVED, deleted_items)
 
 
 class SpecificAssetId(HasSemantics):
@@ -2280,6 +4256,10 @@ class SpecificAssetId(HasSemantics):
                     self.name, self.value, self.external_subject_id, self.semantic_id,
                     self.supplemental_semantic_id)
 
+    def _validate_constraints(self, run: _string_constraints.CheckRunner = _string_constraints.run_check) -> None:
+        run(_string_constraints.check_label_type, self.name)
+        run(_string_constraints.check_identifier, self.value)
+
 
 class AASConstraintViolation(Exception):
     """
@@ -2295,6 +4275,104 @@ class AASConstraintViolation(Exception):
         super().__init__(self.message)
 
 
+@contextlib.contextmanager
+def trusted_load() -> Iterator[None]:
+    """
+    A context manager for constructing objects from trusted data, e.g. data that has been validated before it was
+    stored, without checking their constraints:
+
+    .. code-block:: python
+
+        with model.trusted_load():
+            object_store = read_aas_json_file("validated.json")
+
+    Within the context, the checks of the constrained string types (length, pattern and Constraint AASd-130), of
+    id_shorts (Constraint AASd-002), of language tags, of the keys of :class:`References <.Reference>`, of
+    :class:`~basyx.aas.model.submodel.SubmodelElementList` elements, of :class:`~basyx.aas.model.submodel.Entity` and
+    :class:`~basyx.aas.model.aas.AssetInformation` (Constraints AASd-014 and AASd-131) and of
+    :class:`.AdministrativeInformation` are skipped. Checks, which the model objects rely on, like the uniqueness of
+    id_shorts within a namespace, are still performed. Use :func:`validate` to run the skipped checks later on.
+
+    The setting only applies to the current thread (or asyncio task).
+    """
+    token = _string_constraints.TRUSTED_LOAD.set(True)
+    try:
+        yield
+    finally:
+        _string_constraints.TRUSTED_LOAD.reset(token)
+
+
+def validate(obj: object) -> None:
+    """
+    Check the constraints of an object and all objects contained in it, e.g. a Submodel with all its
+    SubmodelElements, Qualifiers, References and LangStringSets, in a single traversal
+
+    This runs all checks, which are skipped within :func:`trusted_load`, even if it is called within that context.
+
+    :param obj: The object to validate
+    :raises AASConstraintViolation: If an AASd-Constraint is violated
+    :raises ValueError: If a constrained string attribute or a language tag is invalid
+    """
+    _Validator().validate(obj)
+
+
+class _Validator:
+    """
+    Traverses an object tree to check the constraints of all contained objects (see :func:`validate`)
+
+    :ivar collect: If True, violations are collected in :attr:`violations` instead of being raised, together with the
+                   Referable, which contains the violating object (if any). All violations of each object are
+                   recorded.
+    :ivar model_references: All :class:`ModelReferences <.ModelReference>` within the tree, together with the
+                            Referable containing them, for checking their integrity. Only collected, if ``collect`` is
+                            True.
+    """
+    def __init__(self, collect: bool = False):
+        self.collect: bool = collect
+        self.violations: List[Tuple[Optional[Referable], Exception]] = []
+        self.model_references: List[Tuple[Optional[Referable], ModelReference]] = []
+        self._visited: Set[int] = set()
+
+    def validate(self, obj: object) -> None:
+        token = _string_constraints.TRUSTED_LOAD.set(False)
+        try:
+            self._validate_value(obj, obj if isinstance(obj, Referable) else None)
+        finally:
+            _string_constraints.TRUSTED_LOAD.reset(token)
+
+    def _validate_value(self, value: object, referable: Optional[Referable]) -> None:
+        if value is None or isinstance(value, (str, int, float, bytes, bytearray, Enum, type) + _XSD_TYPES):
+            return
+        if self.collect and isinstance(value, ModelReference):
+            self.model_references.append((referable, value))
+        # Shared objects, e.g. References from a ReferencePool, are only validated once
+        if id(value) in self._visited:
+            return
+        self._visited.add(id(value))
+        if isinstance(value, (NamespaceSet, ConstrainedList, list, tuple, set, frozenset)):
+            for element in value:
+                self._validate_value(element, referable)
+            return
+        if isinstance(value, Referable):
+            referable = value
+        run: _string_constraints.CheckRunner = _string_constraints.run_check
+        if self.collect:
+            def run(check_fn: Callable[..., None], *args: Any) -> None:
+                try:
+                    check_fn(*args)
+                except (AASConstraintViolation, ValueError) as e:
+                    self.violations.append((referable, e))
+        validate_constraints = getattr(value, "_validate_constraints", None)
+        if validate_constraints is not None:
+            validate_constraints(run)
+        _string_constraints.check_constrained_attributes(value, run)
+        if isinstance(value, LangStringSet):
+            return
+        for name, attribute_value in _instance_attributes(value):
+            if name != "parent":
+                self._validate_value(attribute_value, referable)
+
+
 @unique
 class DataTypeIEC61360(Enum):
     """
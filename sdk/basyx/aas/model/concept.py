@@ -27,6 +27,7 @@ ALLOWED_CONCEPT_DESCRIPTION_CATEGORIES: Set[str] = {
 }
 
 
+@base._track_attributes("is_case_of")
 class ConceptDescription(base.Identifiable, base.HasDataSpecification):
     """
     The semantics of a :class:`~.Property` or other elements that may have a semantic description is defined by a
@@ -71,24 +72,24 @@ class ConceptDescription(base.Identifiable, base.HasDataSpecification):
 
         super().__init__()
         self.id: base.Identifier = id_
-        self.is_case_of: Set[base.Reference] = set() if is_case_of is None else is_case_of
+        self.is_case_of: Set[base.Reference]
+        self._is_case_of: Set[base.Reference] = set() if is_case_of is None else is_case_of
         self.id_short = id_short
-        self.display_name: Optional[base.MultiLanguageNameType] = display_name
+        self._display_name = display_name
         self.category = category
-        self.description: Optional[base.MultiLanguageTextType] = description
+        self._description = description
         self.parent: Optional[base.UniqueIdShortNamespace] = parent
         self.administration: Optional[base.AdministrativeInformation] = administration
-        self.embedded_data_specifications: List[base.EmbeddedDataSpecification] = list(embedded_data_specifications)
+        self._embedded_data_specifications = list(embedded_data_specifications)
         self.extension = base.NamespaceSet(self, [("name", True)], extension)
 
     def _set_category(self, category: Optional[str]):
         if category is None:
-            self._category = "PROPERTY"
-        else:
-            if category not in ALLOWED_CONCEPT_DESCRIPTION_CATEGORIES:
-                raise base.AASConstraintViolation(
-                    51,
-                    "ConceptDescription must have one of the following "
-                    "categories: " + str(ALLOWED_CONCEPT_DESCRIPTION_CATEGORIES)
-                )
-            self._category = category
+            category = "PROPERTY"
+        elif category not in ALLOWED_CONCEPT_DESCRIPTION_CATEGORIES:
+            raise base.AASConstraintViolation(
+                51,
+                "ConceptDescription must have one of the following "
+                "categories: " + str(ALLOWED_CONCEPT_DESCRIPTION_CATEGORIES)
+            )
+        self._assign_attribute("_category", category)
@@ -11,9 +11,16 @@ This module implements Registries for the AAS, in order to enable resolving glob
 """
 
 import abc
-from typing import MutableSet, Iterator, Generic, TypeVar, Dict, List, Optional, Iterable, Set
+import collections
+import concurrent.futures
+import threading
+import time
+import weakref
+from typing import MutableSet, Iterator, Generic, TypeVar, Dict, List, Optional, Iterable, Set, Tuple, Any, \
+    Hashable, FrozenSet, Union, Callable
 
-from .base import Identifier, Identifiable
+from .base import Identifier, Identifiable, Referable, ModelReference, UniqueIdShortNamespace, Key, \
+    _PathGenerations
 
 
 class AbstractObjectProvider(metaclass=abc.ABCMeta):
@@ -59,6 +66,92 @@ class AbstractObjectProvider(metaclass=abc.ABCMeta):
 _IT = TypeVar('_IT', bound=Identifiable)
 
 
+class ObjectStoreIndex(metaclass=abc.ABCMeta):
+    """
+    Abstract baseclass for the definitions of secondary indexes of object stores, which allow to find
+    :class:`~basyx.aas.model.base.Identifiable` objects by other properties than their
+    :class:`~basyx.aas.model.base.Identifier` via :meth:`AbstractObjectStore.find`.
+
+    An index definition computes the keys of an object, under which it can be found. It does not hold any data itself,
+    so the same definition can be used for multiple stores. The :class:`~.IndexedObjectStore` maintains the indexes
+    given to it, all other stores fall back to checking the keys of each object.
+
+    :ivar attributes: The names of the attributes of the Identifiable (named like their public property), whose
+                      assignment changes the keys of the object
+    """
+    def __init__(self, attributes: Iterable[str]):
+        self.attributes: FrozenSet[str] = frozenset(attributes)
+
+    @abc.abstractmethod
+    def get_keys(self, identifiable: Identifiable) -> Iterable[Hashable]:
+        """
+        Compute the keys of an object for this index
+
+        :param identifiable: The object to compute the keys of
+        :return: All keys, under which the object can be found
+        """
+        pass
+
+
+class TypeIndex(ObjectStoreIndex):
+    """
+    Index of the objects by their type. Objects are found by their class and all of its base classes, which are
+    :class:`~basyx.aas.model.base.Identifiable`, e.g. by ``Submodel``.
+    """
+    def __init__(self) -> None:
+        super().__init__(())
+
+    def get_keys(self, identifiable: Identifiable) -> Iterable[Hashable]:
+        return (cls for cls in type(identifiable).__mro__ if issubclass(cls, Identifiable))
+
+    def __repr__(self) -> str:
+        return "TypeIndex()"
+
+
+class AttributeIndex(ObjectStoreIndex):
+    """
+    Index of the objects by the value of an attribute. Objects without the attribute or with a value of None are not
+    indexed.
+
+    :ivar path: The name of the attribute, or a dotted path of attribute names to an attribute of a nested object,
+                e.g. ``asset_information.global_asset_id``
+    :ivar multi_valued: If True, the value of the attribute is an iterable and each of its items is a key of the object
+    """
+    def __init__(self, path: str, multi_valued: bool = False):
+        super().__init__((path.split(".")[0],))
+        self.path: str = path
+        self.multi_valued: bool = multi_valued
+        self._names: Tuple[str, ...] = tuple(path.split("."))
+
+    def get_keys(self, identifiable: Identifiable) -> Iterable[Hashable]:
+        value: Any = identifiable
+        for name in self._names:
+            value = getattr(value, name, None)
+            if value is None:
+                return ()
+        return tuple(value) if self.multi_valued else (value,)
+
+    def __repr__(self) -> str:
+        return "AttributeIndex({!r}{})".format(self.path, ", multi_valued=True" if self.multi_valued else "")
+
+
+#: Index of all objects by their type, see :class:`~.TypeIndex`
+TYPE_INDEX = TypeIndex()
+#: Index of all objects by their id_short
+ID_SHORT_INDEX = AttributeIndex("id_short")
+#: Index of all :class:`~basyx.aas.model.base.HasSemantics` objects (e.g. Submodels) by their semantic_id
+SEMANTIC_ID_INDEX = AttributeIndex("semantic_id")
+#: Index of all :class:`AssetAdministrationShells <basyx.aas.model.aas.AssetAdministrationShell>` by the
+#: global_asset_id of their asset_information
+GLOBAL_ASSET_ID_INDEX = AttributeIndex("asset_information.global_asset_id")
+#: Index of all :class:`AssetAdministrationShells <basyx.aas.model.aas.AssetAdministrationShell>` by each
+#: :class:`~basyx.aas.model.base.SpecificAssetId` of their asset_information
+SPECIFIC_ASSET_ID_INDEX = AttributeIndex("asset_information.specific_asset_id", multi_valued=True)
+#: All built-in indexes, as used by the :class:`~basyx.aas.adapter.http.WSGIApp` for filtering
+BUILTIN_INDEXES: Tuple[ObjectStoreIndex, ...] = (TYPE_INDEX, ID_SHORT_INDEX, SEMANTIC_ID_INDEX, GLOBAL_ASSET_ID_INDEX,
+                                                 SPECIFIC_ASSET_ID_INDEX)
+
+
 class AbstractObjectStore(AbstractObjectProvider, MutableSet[_IT], Generic[_IT], metaclass=abc.ABCMeta):
     """
     Abstract baseclass of for container-like objects for storage of :class:`~basyx.aas.model.base.Identifiable` objects.
@@ -76,8 +169,91 @@ class AbstractObjectStore(AbstractObjectProvider, MutableSet[_IT], Generic[_IT],
         pass
 
     def update(self, other: Iterable[_IT]) -> None:
-        for x in other:
-            self.add(x)
+        self.add_many(other)
+
+    def get_many(self, identifiers: Iterable[Identifier]) -> Dict[Identifier, _IT]:
+        """
+        Retrieve multiple objects by their :class:`Identifiers <basyx.aas.model.base.Identifier>` at once
+
+        This default implementation calls :meth:`get_identifiable` for each identifier. Database and file backed stores
+        retrieve all objects in a single request resp. pass.
+
+        :param identifiers: The :class:`Identifiers <basyx.aas.model.base.Identifier>` of the objects to retrieve
+        :return: A dict of all found objects by their Identifiers. Identifiers, which are not found, are omitted.
+        """
+        result: Dict[Identifier, _IT] = {}
+        for identifier in identifiers:
+            try:
+                result[identifier] = self.get_identifiable(identifier)  # type: ignore[assignment]
+            except KeyError:
+                pass
+        return result
+
+    def add_many(self, objects: Iterable[_IT]) -> None:
+        """
+        Add multiple objects at once
+
+        This default implementation calls :meth:`add` for each object. Database and file backed stores add all objects
+        in a single request resp. pass.
+
+        :param objects: The objects to add
+        :raises KeyError: If objects with the same :class:`~basyx.aas.model.base.Identifier` as some of the given
+                          objects are already stored. All other objects are added nonetheless.
+        """
+        existing: List[Identifier] = []
+        for x in objects:
+            try:
+                self.add(x)
+            except KeyError:
+                existing.append(x.id)
+        if existing:
+            raise KeyError("Identifiable objects with ids {} are already stored in this store"
+                           .format(", ".join(existing)))
+
+    def discard_many(self, objects: Iterable[_IT]) -> None:
+        """
+        Remove multiple objects at once. Objects, which are not contained in the store, are ignored.
+
+        This default implementation calls :meth:`discard` for each object. Database and file backed stores remove all
+        objects in a single request resp. pass.
+
+        :param objects: The objects to remove
+        """
+        for x in objects:
+            self.discard(x)
+
+    def find(self, index: ObjectStoreIndex, key: Hashable) -> Iterator[_IT]:
+        """
+        Find all objects in this store with the given key in a secondary index
+
+        This default implementation checks the keys of each object in the store. Implementations maintaining the index
+        (like the :class:`~.IndexedObjectStore`) look the objects up instead.
+
+        :param index: The definition of the index, e.g. :data:`~.TYPE_INDEX`
+        :param key: The key to look up, e.g. ``Submodel`` for the ``TYPE_INDEX``
+        :return: An iterator of all objects, which have the key in the index
+        """
+        return (x for x in self if key in index.get_keys(x))
+
+    def _add_resolver(self, resolver: "_Invalidatable") -> None:
+        # Implementations don't call our __init__, so the set of resolvers is created on demand
+        resolvers: Optional[weakref.WeakSet[_Invalidatable]] = getattr(self, "_resolvers", None)
+        if resolvers is None:
+            resolvers = weakref.WeakSet()
+            self._resolvers = resolvers
+        resolvers.add(resolver)
+
+    def _notify_change(self, identifier: Identifier) -> None:
+        """
+        Invalidate everything the :class:`ReferenceResolvers <.ReferenceResolver>` of this store have cached for the
+        given :class:`~basyx.aas.model.base.Identifier`, as well as the routes of the
+        :class:`ObjectProviderMultiplexers <.ObjectProviderMultiplexer>` using this store. Implementations must call
+        this method, whenever an object is added to or removed from the store.
+        """
+        resolvers: Optional[weakref.WeakSet[_Invalidatable]] = getattr(self, "_resolvers", None)
+        if resolvers:
+            for resolver in list(resolvers):
+                resolver.invalidate(identifier)
 
 
 class DictObjectStore(AbstractObjectStore[_IT], Generic[_IT]):
@@ -92,7 +268,7 @@ class DictObjectStore(AbstractObjectStore[_IT], Generic[_IT]):
         For more details, see [issue #216](https://github.com/eclipse-basyx/basyx-python-sdk/issues/216).
         As a result, the `DictObjectStore` is unsuitable for storing objects whose
         :class:`~basyx.aas.model.base.Identifier` may change.
-        In such cases, consider using a :class:`~.SetObjectStore` instead.
+        In such cases, consider using an :class:`~.IndexedObjectStore` instead.
     """
     def __init__(self, objects: Iterable[_IT] = ()) -> None:
         self._backend: Dict[Identifier, _IT] = {}
@@ -107,10 +283,12 @@ class DictObjectStore(AbstractObjectStore[_IT], Generic[_IT]):
             raise KeyError("Identifiable object with same id {} is already stored in this store"
                            .format(x.id))
         self._backend[x.id] = x
+        self._notify_change(x.id)
 
     def discard(self, x: _IT) -> None:
         if self._backend.get(x.id) is x:
             del self._backend[x.id]
+            self._notify_change(x.id)
 
     def __contains__(self, x: object) -> bool:
         if isinstance(x, Identifier):
@@ -136,7 +314,8 @@ class SetObjectStore(AbstractObjectStore[_IT], Generic[_IT]):
         On the other hand, the `SetObjectStore` is more secure, because it is less affected by changes in the
         :class:`~basyx.aas.model.base.Identifier` of an :class:`~basyx.aas.model.base.Identifiable` object.
         Therefore, the `SetObjectStore` is suitable for storing objects whose :class:`~basyx.aas.model.base.Identifier`
-        may change.
+        may change. However, the :class:`~.IndexedObjectStore` is suitable as well and much faster for large amounts of
+        objects.
     """
     def __init__(self, objects: Iterable[_IT] = ()) -> None:
         self._backend: Set[_IT] = set()
@@ -157,14 +336,18 @@ class SetObjectStore(AbstractObjectStore[_IT], Generic[_IT]):
             self.get_identifiable(x.id)
         except KeyError:
             self._backend.add(x)
+            self._notify_change(x.id)
         else:
             raise KeyError(f"Identifiable object with same id {x.id} is already stored in this store")
 
     def discard(self, x: _IT) -> None:
-        self._backend.discard(x)
+        if x in self._backend:
+            self._backend.discard(x)
+            self._notify_change(x.id)
 
     def remove(self, x: _IT) -> None:
         self._backend.remove(x)
+        self._notify_change(x.id)
 
     def __contains__(self, x: object) -> bool:
         if isinstance(x, Identifier):
@@ -184,6 +367,343 @@ class SetObjectStore(AbstractObjectStore[_IT], Generic[_IT]):
         return iter(self._backend)
 
 
+class IndexedObjectStore(AbstractObjectStore[_IT], Generic[_IT]):
+    """
+    A local in-memory object store for :class:`~basyx.aas.model.base.Identifiable` objects, backed by a dict, mapping
+    :class:`~basyx.aas.model.base.Identifier` → :class:`~basyx.aas.model.base.Identifiable`, which is kept up to date
+    when the :class:`~basyx.aas.model.base.Identifier` of a contained object changes.
+
+    Like the :class:`~.DictObjectStore`, it retrieves and adds objects in constant time, so loading n objects takes
+    linear time. In addition, each contained :class:`~basyx.aas.model.base.Identifiable` holds a weak reference to the
+    store and notifies it about changes of its ``id`` (including changes by
+    :meth:`~basyx.aas.model.base.Referable.update_from`). Thus, like the :class:`~.SetObjectStore`, it is suitable
+    for storing objects whose :class:`~basyx.aas.model.base.Identifier` may change. Changing the ``id`` of a
+    contained object to the ``id`` of another object in the same store raises a :class:`KeyError` and leaves the id
+    unchanged.
+
+    Additionally, the store maintains the given secondary indexes, so that :meth:`find` looks objects up, instead of
+    checking all of them. The indexes are updated when objects are added or discarded and when the attributes of an
+    object are assigned (including by :meth:`~basyx.aas.model.base.Referable.update_from`). This includes the
+    attributes of the :class:`~basyx.aas.model.aas.AssetInformation` and
+    :class:`~basyx.aas.model.base.AdministrativeInformation` held by an object. Just like for
+    :meth:`~basyx.aas.model.base.Referable.mark_dirty`, other in-place modifications of attribute values (e.g. of a
+    Reference's keys) are not noticed. Call :meth:`reindex` after such modifications.
+
+    :param objects: The objects to add to the store
+    :param indexes: The definitions of the secondary indexes to maintain, e.g. :data:`~.BUILTIN_INDEXES`
+    """
+    def __init__(self, objects: Iterable[_IT] = (), indexes: Iterable[ObjectStoreIndex] = ()) -> None:
+        self._backend: Dict[Identifier, _IT] = {}
+        # index -> key -> id() of the object -> object. The inner dicts keep the objects in order of insertion.
+        self._indexes: Dict[ObjectStoreIndex, Dict[Hashable, Dict[int, _IT]]] = {index: {} for index in indexes}
+        # index -> id() of the object -> its keys, as indexed
+        self._index_keys: Dict[ObjectStoreIndex, Dict[int, Tuple[Hashable, ...]]] = {index: {}
+                                                                                     for index in self._indexes}
+        self._indexed_attributes: FrozenSet[str] = frozenset().union(*(index.attributes for index in self._indexes))
+        for x in objects:
+            self.add(x)
+
+    def get_identifiable(self, identifier: Identifier) -> _IT:
+        return self._backend[identifier]
+
+    def add(self, x: _IT) -> None:
+        stored = self._backend.get(x.id)
+        if stored is x:
+            # Object is already in store
+            return
+        if stored is not None:
+            raise KeyError(f"Identifiable object with same id {x.id} is already stored in this store")
+        self._backend[x.id] = x
+        x._add_object_store(self)
+        for index in self._indexes:
+            self._add_to_index(index, x)
+        self._notify_change(x.id)
+
+    def discard(self, x: _IT) -> None:
+        if self._backend.get(x.id) is x:
+            del self._backend[x.id]
+            x._remove_object_store(self)
+            for index in self._indexes:
+                self._remove_from_index(index, x)
+            self._notify_change(x.id)
+
+    def find(self, index: ObjectStoreIndex, key: Hashable) -> Iterator[_IT]:
+        objects = self._indexes.get(index)
+        if objects is None:
+            return super().find(index, key)
+        # The objects are copied, so the store may be modified while iterating
+        return iter(list(objects.get(key, {}).values()))
+
+    def reindex(self, x: _IT) -> None:
+        """
+        Update the secondary indexes for an object in this store, after attribute values of it have been modified in
+        place
+
+        :param x: The modified object
+        :raises KeyError: If the object is not in this store
+        """
+        if self._backend.get(x.id) is not x:
+            raise KeyError(f"{x!r} is not stored in this store")
+        for index in self._indexes:
+            self._remove_from_index(index, x)
+            self._add_to_index(index, x)
+
+    def _add_to_index(self, index: ObjectStoreIndex, x: _IT) -> None:
+        keys = tuple(index.get_keys(x))
+        self._index_keys[index][id(x)] = keys
+        objects = self._indexes[index]
+        for key in keys:
+            objects.setdefault(key, {})[id(x)] = x
+
+    def _remove_from_index(self, index: ObjectStoreIndex, x: _IT) -> None:
+        # The keys are taken from the index, since the object may have been modified in place since it was indexed
+        objects = self._indexes[index]
+        for key in self._index_keys[index].pop(id(x), ()):
+            key_objects = objects[key]
+            del key_objects[id(x)]
+            if not key_objects:
+                del objects[key]
+
+    def __contains__(self, x: object) -> bool:
+        if isinstance(x, Identifier):
+            return x in self._backend
+        if not isinstance(x, Identifiable):
+            return False
+        return self._backend.get(x.id) is x
+
+    def __len__(self) -> int:
+        return len(self._backend)
+
+    def __iter__(self) -> Iterator[_IT]:
+        return iter(self._backend.values())
+
+    def _check_id_change(self, x: Identifiable, identifier: Identifier) -> None:
+        """
+        Called by a contained object before changing its id
+
+        :raises KeyError: If another object with the new id is already stored in this store
+        """
+        stored = self._backend.get(identifier)
+        if stored is not None and stored is not x:
+            raise KeyError(f"Identifiable object with same id {identifier} is already stored in this store")
+
+    def _id_changed(self, x: Identifiable, old_identifier: Identifier) -> None:
+        """
+        Called by a contained object after changing its id to re-key it
+        """
+        if self._backend.get(old_identifier) is not x:
+            return
+        del self._backend[old_identifier]
+        self._backend[x.id] = x  # type: ignore[assignment]
+        self._notify_change(old_identifier)
+        self._notify_change(x.id)
+
+    def _attributes_changed(self, x: Identifiable, names: Iterable[str]) -> None:
+        """
+        Called by a contained object after assigning the given attributes to update the affected secondary indexes
+        """
+        if not self._indexed_attributes:
+            return
+        # Private attributes behind properties are reported as well, e.g. by update_from()
+        public_names = {name.lstrip("_") for name in names}
+        if public_names.isdisjoint(self._indexed_attributes) or self._backend.get(x.id) is not x:
+            return
+        for index in self._indexes:
+            if not public_names.isdisjoint(index.attributes):
+                self._remove_from_index(index, x)  # type: ignore[arg-type]
+                self._add_to_index(index, x)  # type: ignore[arg-type]
+
+
+class _CacheInvalidator:
+    """
+    Forwards the invalidations of a backing store to a :class:`~.CachingObjectStore`
+    """
+    def __init__(self, cache: "CachingObjectStore"):
+        self.cache: CachingObjectStore = cache
+
+    def invalidate(self, identifier: Optional[Identifier] = None) -> None:
+        self.cache.invalidate(identifier)
+
+
+def _count_referables(identifiable: Identifiable) -> int:
+    """
+    Count the Referables of an object hierarchy, as an estimate of its size for the :class:`~.CachingObjectStore`
+    """
+    count = 0
+    stack: List[Referable] = [identifiable]
+    while stack:
+        referable = stack.pop()
+        count += 1
+        if isinstance(referable, UniqueIdShortNamespace):
+            for namespace_set in referable.namespace_element_sets:
+                stack.extend(element for element in namespace_set if isinstance(element, Referable))
+    return count
+
+
+class CachingObjectStore(AbstractObjectStore[_IT], Generic[_IT]):
+    """
+    A read-through cache for another :class:`~.AbstractObjectStore`, e.g. a
+    :class:`~basyx.aas.backend.couchdb.CouchDBObjectStore` or a
+    :class:`~basyx.aas.backend.local_file.LocalFileObjectStore`
+
+    Database and file backed stores only keep weak references to the objects they have retrieved, so each object is
+    fetched and deserialized again, as soon as no one else references it anymore. The CachingObjectStore keeps strong
+    references to the most recently used objects, so that :meth:`get_identifiable` returns them without querying the
+    backing store. The cache is bounded by the number of entries and/or by their total size, as computed by
+    ``size_of`` (the number of Referables in the object by default). Least recently used entries are evicted first.
+    Optionally, entries expire ``ttl`` seconds after they have been fetched, so that modifications by other processes
+    become visible.
+
+    Adding and discarding objects is written through to the backing store. Cached entries are invalidated, when objects
+    are added to or removed from the backing store directly. Iterating the store and counting the objects is delegated
+    to the backing store, without caching the objects.
+
+    :param store: The backing store
+    :param max_entries: The maximum number of cached objects or None for no limit
+    :param max_size: The maximum total size of the cached objects or None for no limit
+    :param ttl: The time in seconds, after which cached objects expire, or None, if they don't expire
+    :param size_of: The function to compute the size of an object for ``max_size``
+    :ivar hits: The number of lookups, which have been answered from the cache
+    :ivar misses: The number of lookups, which have been forwarded to the backing store
+    :ivar evictions: The number of objects, which have been evicted from the cache to satisfy its bounds
+    """
+    def __init__(self, store: AbstractObjectStore[_IT], max_entries: Optional[int] = 1024,
+                 max_size: Optional[int] = None, ttl: Optional[float] = None,
+                 size_of: Callable[[Identifiable], int] = _count_referables) -> None:
+        self.store: AbstractObjectStore[_IT] = store
+        self.max_entries: Optional[int] = max_entries
+        self.max_size: Optional[int] = max_size
+        self.ttl: Optional[float] = ttl
+        self.size_of: Callable[[Identifiable], int] = size_of
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        # Identifier -> (object, size, time.monotonic() timestamp of expiry or None), in order of the most recent use
+        self._cache: collections.OrderedDict[Identifier, Tuple[_IT, int, Optional[float]]] = \
+            collections.OrderedDict()
+        self._size: int = 0
+        self._lock = threading.Lock()
+        # Stores are not hashable (like sets), so a hashable proxy is registered with the backing store
+        self._invalidator = _CacheInvalidator(self)
+        store._add_resolver(self._invalidator)
+
+    def get_identifiable(self, identifier: Identifier) -> _IT:
+        x = self._get_cached(identifier)
+        with self._lock:
+            if x is not None:
+                self.hits += 1
+                return x
+            self.misses += 1
+        fetched: _IT = self.store.get_identifiable(identifier)  # type: ignore[assignment]
+        self._put(fetched)
+        return fetched
+
+    def add(self, x: _IT) -> None:
+        # The backing store calls invalidate(), which notifies our own resolvers
+        self.store.add(x)
+        self._put(x)
+
+    def discard(self, x: _IT) -> None:
+        self.store.discard(x)
+
+    def get_many(self, identifiers: Iterable[Identifier]) -> Dict[Identifier, _IT]:
+        result: Dict[Identifier, _IT] = {}
+        missing: List[Identifier] = []
+        for identifier in identifiers:
+            x = self._get_cached(identifier)
+            if x is None:
+                missing.append(identifier)
+            else:
+                result[identifier] = x
+        with self._lock:
+            self.hits += len(result)
+            self.misses += len(missing)
+        if missing:
+            fetched = self.store.get_many(missing)
+            for x in fetched.values():
+                self._put(x)
+            result.update(fetched)
+        return result
+
+    def add_many(self, objects: Iterable[_IT]) -> None:
+        objects = list(objects)
+        self.store.add_many(objects)
+        for x in objects:
+            self._put(x)
+
+    def discard_many(self, objects: Iterable[_IT]) -> None:
+        self.store.discard_many(objects)
+
+    def __contains__(self, x: object) -> bool:
+        if isinstance(x, Identifier):
+            cached = self._get_cached(x)
+            if cached is not None:
+                return True
+        elif isinstance(x, Identifiable):
+            cached = self._get_cached(x.id)
+            if cached is x:
+                return True
+        return x in self.store
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __iter__(self) -> Iterator[_IT]:
+        return iter(self.store)
+
+    def find(self, index: ObjectStoreIndex, key: Hashable) -> Iterator[_IT]:
+        # Use the index of the backing store, if it maintains one, instead of iterating over all of its objects
+        return self.store.find(index, key)
+
+    def invalidate(self, identifier: Optional[Identifier] = None) -> None:
+        """
+        Drop cached objects. This is called by the backing store, whenever an object is added to or removed from it.
+
+        :param identifier: If given, only the object with this :class:`~basyx.aas.model.base.Identifier` is dropped.
+                           Otherwise, the whole cache is cleared.
+        """
+        with self._lock:
+            if identifier is None:
+                self._cache.clear()
+                self._size = 0
+            elif identifier in self._cache:
+                self._remove_entry(identifier)
+        if identifier is not None:
+            self._notify_change(identifier)
+
+    def _get_cached(self, identifier: Identifier) -> Optional[_IT]:
+        """
+        Get the cached object with the given id, if it has not expired, and mark it as most recently used
+        """
+        with self._lock:
+            entry = self._cache.get(identifier)
+            if entry is None:
+                return None
+            x, _size, expiry = entry
+            # The id of the object may have changed since it was cached
+            if x.id != identifier or expiry is not None and expiry <= time.monotonic():
+                self._remove_entry(identifier)
+                return None
+            self._cache.move_to_end(identifier)
+            return x
+
+    def _put(self, x: _IT) -> None:
+        size = self.size_of(x) if self.max_size is not None else 0
+        expiry = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if x.id in self._cache:
+                self._remove_entry(x.id)
+            self._cache[x.id] = (x, size, expiry)
+            self._size += size
+            while self._cache and (self.max_entries is not None and len(self._cache) > self.max_entries
+                                   or self.max_size is not None and self._size > self.max_size):
+                self._remove_entry(next(iter(self._cache)))
+                self.evictions += 1
+
+    def _remove_entry(self, identifier: Identifier) -> None:
+        self._size -= self._cache.pop(identifier)[1]
+
+
 class ObjectProviderMultiplexer(AbstractObjectProvider):
     """
     A multiplexer for Providers of :class:`~basyx.aas.model.base.Identifiable` objects.
@@ -192,17 +712,323 @@ class ObjectProviderMultiplexer(AbstractObjectProvider):
     to allow retrieving :class:`~basyx.aas.model.base.Identifiable` objects from different sources.
     It implements the :class:`~.AbstractObjectProvider` interface to be used as registry itself.
 
+    The providers are queried in order and the object of the first provider, which has it, is returned. To avoid
+    querying all providers in front of the owning one on each lookup, the multiplexer learns which provider owns which
+    :class:`~basyx.aas.model.base.Identifier` in a routing table, which is bounded to the ``route_cache_size`` most
+    recently used identifiers. A route is only a hint: If the routed provider doesn't have the object anymore, all
+    providers are queried again. Optionally, identifiers, which cannot be found in any provider, are remembered for
+    ``negative_cache_ttl`` seconds, so that repeated lookups of them fail without querying any provider. The negative
+    cache is bounded to ``route_cache_size`` identifiers as well.
+
+    Both caches are invalidated for an identifier, when an object with this identifier is added to or removed from any
+    of the :class:`~.AbstractObjectStore` providers at the time the multiplexer is created. Modifications, which are
+    not made through this Python process (e.g. by other clients of the same database), are only noticed by the
+    expiration of the negative cache or the next failed routed lookup. Use :meth:`invalidate` to drop cached routes in
+    such cases.
+
+    If ``max_workers`` is greater than 1, the providers are queried concurrently on a thread pool, which is useful for
+    providers backed by remote databases. The result still is the one of the first provider in order, which has the
+    object. The providers need to be thread-safe in this case.
+
     :param registries: A list of :class:`AbstractObjectProviders <.AbstractObjectProvider>` to query when looking up an
                       object
+    :param route_cache_size: The maximum number of identifiers in the routing table and in the negative cache. 0
+                             disables both caches.
+    :param negative_cache_ttl: The time in seconds, for which identifiers are remembered as missing. 0 (the default)
+                               disables the negative cache.
+    :param max_workers: The maximum number of threads used to query the providers concurrently. With 1 (the default),
+                        the providers are queried one after another in the calling thread.
     """
-    def __init__(self, registries: Optional[List[AbstractObjectProvider]] = None):
+    def __init__(self, registries: Optional[List[AbstractObjectProvider]] = None, route_cache_size: int = 1024,
+                 negative_cache_ttl: float = 0, max_workers: int = 1):
         self.providers: List[AbstractObjectProvider] = registries if registries is not None else []
+        self.route_cache_size: int = route_cache_size
+        self.negative_cache_ttl: float = negative_cache_ttl
+        self.max_workers: int = max_workers
+        # Identifier -> provider owning it, in order of the most recent use
+        self._routes: collections.OrderedDict[Identifier, AbstractObjectProvider] = collections.OrderedDict()
+        # Identifier -> time.monotonic() timestamp, when it expires from the negative cache, in order of insertion
+        self._missing: collections.OrderedDict[Identifier, float] = collections.OrderedDict()
+        # Incremented by each invalidation, to detect invalidations while querying the providers
+        self._invalidation_sequence: int = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        for provider in self.providers:
+            if isinstance(provider, AbstractObjectStore):
+                provider._add_resolver(self)
 
     def get_identifiable(self, identifier: Identifier) -> Identifiable:
+        with self._lock:
+            invalidation_sequence = self._invalidation_sequence
+            route = self._routes.get(identifier)
+            if route is not None:
+                self._routes.move_to_end(identifier)
+            elif identifier in self._missing:
+                if self._missing[identifier] > time.monotonic():
+                    raise self._not_found_error()
+                del self._missing[identifier]
+        # Providers are compared by identity, since object stores compare equal, if they contain the same objects
+        if route is not None and any(provider is route for provider in self.providers):
+            try:
+                return route.get_identifiable(identifier)
+            except KeyError:
+                pass
+        if self.max_workers > 1 and len(self.providers) > 1:
+            provider, identifiable = self._query_concurrently(identifier)
+        else:
+            provider, identifiable = self._query_sequentially(identifier)
+        with self._lock:
+            self._routes.pop(identifier, None)
+            if identifiable is not None and self.route_cache_size > 0:
+                self._routes[identifier] = provider  # type: ignore[assignment]
+                if len(self._routes) > self.route_cache_size:
+                    self._routes.popitem(last=False)
+            elif identifiable is None and self.negative_cache_ttl > 0 and self.route_cache_size > 0 \
+                    and invalidation_sequence == self._invalidation_sequence:
+                # If the caches have been invalidated in the meantime, the object may have been added after its
+                # provider has been queried, so the miss is not remembered
+                self._missing[identifier] = time.monotonic() + self.negative_cache_ttl
+                self._drop_expired_missing()
+        if identifiable is None:
+            raise self._not_found_error()
+        return identifiable
+
+    def invalidate(self, identifier: Optional[Identifier] = None) -> None:
+        """
+        Drop cached routes and missing identifiers
+
+        :param identifier: If given, only the route and negative cache entry of this
+                           :class:`~basyx.aas.model.base.Identifier` are dropped. Otherwise, both caches are cleared.
+        """
+        with self._lock:
+            self._invalidation_sequence += 1
+            if identifier is None:
+                self._routes.clear()
+                self._missing.clear()
+            else:
+                self._routes.pop(identifier, None)
+                self._missing.pop(identifier, None)
+
+    def close(self) -> None:
+        """
+        Shut down the thread pool used for querying the providers concurrently, if it has been started. It is started
+        again on demand.
+        """
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def _query_sequentially(self, identifier: Identifier) \
+            -> Tuple[Optional[AbstractObjectProvider], Optional[Identifiable]]:
         for provider in self.providers:
             try:
-                return provider.get_identifiable(identifier)
+                return provider, provider.get_identifiable(identifier)
             except KeyError:
                 pass
-        raise KeyError("Identifier could not be found in any of the {} consulted registries."
-                       .format(len(self.providers)))
+        return None, None
+
+    def _query_concurrently(self, identifier: Identifier) \
+            -> Tuple[Optional[AbstractObjectProvider], Optional[Identifiable]]:
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(self.max_workers,
+                                                                       thread_name_prefix="ObjectProviderMultiplexer")
+            executor = self._executor
+        providers = list(self.providers)
+        futures = [executor.submit(provider.get_identifiable, identifier) for provider in providers]
+        try:
+            # The results are awaited in order of the providers, so that the first provider having the object wins
+            for provider, future in zip(providers, futures):
+                try:
+                    return provider, future.result()
+                except KeyError:
+                    pass
+            return None, None
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _not_found_error(self) -> KeyError:
+        # Misses served from the negative cache raise the same error as the ones found by querying the providers
+        return KeyError("Identifier could not be found in any of the {} consulted registries."
+                        .format(len(self.providers)))
+
+    def _drop_expired_missing(self) -> None:
+        # Since the TTL is the same for all entries, the ones inserted first expire first
+        now = time.monotonic()
+        while self._missing and next(iter(self._missing.values())) <= now:
+            self._missing.popitem(last=False)
+        while len(self._missing) > self.route_cache_size:
+            self._missing.popitem(last=False)
+
+
+# Objects, which are notified about changes of the objects in an AbstractObjectStore via _notify_change()
+_Invalidatable = Union["ReferenceResolver", ObjectProviderMultiplexer, _CacheInvalidator]
+
+
+_RT = TypeVar('_RT', bound=Referable)
+
+# Placeholder for the default parameter of ReferenceResolver.resolve_many(), if no default is given
+_RAISE: Any = object()
+
+
+class ReferenceResolver(AbstractObjectProvider):
+    """
+    A caching resolver for :class:`ModelReferences <basyx.aas.model.base.ModelReference>`
+
+    :meth:`ModelReference.resolve() <basyx.aas.model.base.ModelReference.resolve>` retrieves the referenced
+    :class:`~basyx.aas.model.base.Identifiable` from the provider and walks the id_short path on every call. For
+    providers backed by a database or files, this means a request and deserialization per resolution. The
+    ReferenceResolver memoizes the retrieved Identifiables as well as the resolved
+    :class:`Referables <basyx.aas.model.base.Referable>`. :meth:`resolve_many` additionally groups a batch of references
+    by the Identifiable they point into, so that each Identifiable is retrieved only once.
+
+    Cached results are invalidated,
+
+    * when an object with the same :class:`~basyx.aas.model.base.Identifier` is added to or removed from the
+      underlying :class:`~.AbstractObjectStore` (resp. any of the object stores of an
+      :class:`~.ObjectProviderMultiplexer` at the time the resolver is created),
+    * when the id of a cached Identifiable changes or
+    * when Referables are added to or removed from any Namespace on the id_short path of a cached Referable (see
+      :attr:`~basyx.aas.model.base.UniqueIdShortNamespace.structure_generation`).
+
+    Modifications, which are not made through this Python process (e.g. by other clients of the same database), are not
+    detected. Use :meth:`invalidate` to drop cached results in such cases.
+
+    The ReferenceResolver is an :class:`~.AbstractObjectProvider` itself. Thus, it can be passed to
+    ``ModelReference.resolve()`` and any other function expecting a provider, to benefit from the cache of
+    Identifiables.
+
+    :param provider: The provider to retrieve the Identifiables from
+    """
+    def __init__(self, provider: AbstractObjectProvider):
+        self.provider: AbstractObjectProvider = provider
+        self._identifiables: Dict[Identifier, Identifiable] = {}
+        # Keys of the resolved references -> (resolved Referable, Identifiable it has been resolved in, structure
+        # generations of the Namespaces on the path at that time). The type of the references is not part of the cache
+        # key, so it is checked on every resolution.
+        self._referables: Dict[Tuple[Key, ...], Tuple[Referable, Identifiable, _PathGenerations]] = {}
+        providers = provider.providers if isinstance(provider, ObjectProviderMultiplexer) else [provider]
+        for provider_ in providers:
+            if isinstance(provider_, AbstractObjectStore):
+                provider_._add_resolver(self)
+
+    def get_identifiable(self, identifier: Identifier) -> Identifiable:
+        identifiable = self._identifiables.get(identifier)
+        if identifiable is not None and identifiable.id == identifier:
+            return identifiable
+        identifiable = self.provider.get_identifiable(identifier)
+        self._identifiables[identifier] = identifiable
+        return identifiable
+
+    def resolve(self, reference: ModelReference[_RT]) -> _RT:
+        """
+        Resolve a :class:`~basyx.aas.model.base.ModelReference`, like
+        :meth:`ModelReference.resolve() <basyx.aas.model.base.ModelReference.resolve>` does, but using the cache
+
+        :param reference: The reference to resolve
+        :return: The referenced object
+        :raises KeyError: If the reference could not be resolved
+        :raises TypeError: If one of the intermediate objects on the path is not a
+                           :class:`~basyx.aas.model.base.UniqueIdShortNamespace`
+        :raises ValueError: If a non-numeric index is given to resolve in a
+                            :class:`~basyx.aas.model.submodel.SubmodelElementList`
+        :raises ~basyx.aas.model.base.UnexpectedTypeError: If the retrieved object is not of the expected type
+        """
+        referable = self._get_cached(reference)
+        if referable is None:
+            referable = self._resolve_in(reference, self._get_identifiable_of(reference))
+        return reference._check_type(referable)
+
+    def resolve_many(self, references: Iterable[ModelReference[_RT]], default: Any = _RAISE) -> List[_RT]:
+        """
+        Resolve multiple :class:`ModelReferences <basyx.aas.model.base.ModelReference>` at once
+
+        The references are grouped by the :class:`~basyx.aas.model.base.Identifier` of their first key, so that each
+        :class:`~basyx.aas.model.base.Identifiable` is retrieved only once, even if it isn't cached yet.
+
+        :param references: The references to resolve
+        :param default: If given, this object is returned for each reference, which cannot be resolved, instead of
+                        raising an exception
+        :return: The referenced objects in the order of the given references
+        :raises KeyError, TypeError, ValueError: If a reference cannot be resolved and no default is given (see
+                                                 :meth:`resolve`)
+        """
+        references = list(references)
+        results: List[Any] = [None] * len(references)
+        errors: Dict[int, Exception] = {}
+        # Identifier -> indices of the references into the Identifiable with this Identifier, which are not cached
+        uncached: Dict[Identifier, List[int]] = {}
+        for i, reference in enumerate(references):
+            referable = self._get_cached(reference)
+            if referable is None:
+                uncached.setdefault(reference.key[0].value, []).append(i)
+                continue
+            try:
+                results[i] = reference._check_type(referable)
+            except TypeError as e:
+                errors[i] = e
+        for indices in uncached.values():
+            identifiable: Optional[Identifiable] = None
+            for i in indices:
+                reference = references[i]
+                try:
+                    if identifiable is None:
+                        identifiable = self._get_identifiable_of(reference)
+                    results[i] = reference._check_type(self._resolve_in(reference, identifiable))
+                except (KeyError, TypeError, ValueError) as e:
+                    errors[i] = e
+        if errors and default is _RAISE:
+            # Raise the error of the first reference, which cannot be resolved
+            raise errors[min(errors)]
+        for i in errors:
+            results[i] = default
+        return results
+
+    def invalidate(self, identifier: Optional[Identifier] = None) -> None:
+        """
+        Drop cached results
+
+        :param identifier: If given, only the :class:`~basyx.aas.model.base.Identifiable` with this
+                           :class:`~basyx.aas.model.base.Identifier` and all Referables resolved within it are dropped.
+                           Otherwise, the whole cache is cleared.
+        """
+        if identifier is None:
+            self._identifiables.clear()
+            self._referables.clear()
+        else:
+            # The resolved Referables are dropped lazily by _get_cached(), when they are not backed by the cached
+            # Identifiable anymore
+            self._identifiables.pop(identifier, None)
+
+    def _get_cached(self, reference: ModelReference) -> Optional[Referable]:
+        """
+        Get the cached result of resolving the keys of the given reference, if it is still valid
+        """
+        entry = self._referables.get(reference.key)
+        if entry is None:
+            return None
+        referable, identifiable, generations = entry
+        identifier = reference.key[0].value
+        if identifiable.id != identifier or self._identifiables.get(identifier) is not identifiable \
+                or not UniqueIdShortNamespace._path_generations_valid(generations):
+            self._referables.pop(reference.key, None)
+            return None
+        return referable
+
+    def _get_identifiable_of(self, reference: ModelReference) -> Identifiable:
+        identifier = reference.key[0].get_identifier()
+        if identifier is None:
+            raise AssertionError(f"Retrieving the identifier of the first {reference.key[0]!r} failed.")
+        try:
+            return self.get_identifiable(identifier)
+        except KeyError as e:
+            raise KeyError("Could not resolve identifier {}".format(identifier)) from e
+
+    def _resolve_in(self, reference: ModelReference, identifiable: Identifiable) -> Referable:
+        # Like ModelReference._resolve_path(), but keeping track of the Namespaces on the path
+        referable, generations = UniqueIdShortNamespace._resolve_id_short_path_generations(
+            identifiable,  # type: ignore[arg-type]
+            [key.value for key in reference.key[1:]])
+        self._referables[reference.key] = (referable, identifiable, generations)
+        return referable
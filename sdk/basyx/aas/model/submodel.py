@@ -9,14 +9,20 @@ This module contains everything needed to model Submodels and define Events acco
 """
 
 import abc
-import uuid
-from typing import Optional, Set, Iterable, TYPE_CHECKING, List, Type, TypeVar, Generic, Union
+from typing import Optional, Set, Iterable, TYPE_CHECKING, List, Type, TypeVar, Generic, Union, Dict, Tuple, Mapping, \
+    Any
 
 from . import base, datatypes, _string_constraints
 if TYPE_CHECKING:
     from . import aas
 
 
+# New values of the ``value`` attribute of the SubmodelElements of a clone by their id_short path (see Submodel.clone())
+CloneOverrides = Mapping[Union[base.NameType, Tuple[base.NameType, ...]], Any]
+
+_SubmodelElementT = TypeVar("_SubmodelElementT", bound="SubmodelElement")
+
+
 class SubmodelElement(base.Referable, base.Qualifiable, base.HasSemantics,
                       base.HasDataSpecification, metaclass=abc.ABCMeta):
     """
@@ -51,6 +57,13 @@ class SubmodelElement(base.Referable, base.Qualifiable, base.HasSemantics,
                                     :class:`~basyx.aas.model.base.HasSemantics`)
     :ivar embedded_data_specifications: List of Embedded data specification.
     """
+    # SubmodelElements are by far the most numerous objects in a model, so the attributes of the abstract base classes
+    # (which only declare empty ``__slots__``) are stored in slots here instead of an instance ``__dict__``.
+    # ``parent`` and the semantic id attributes are slots of :class:`~basyx.aas.model.base.HasSemantics`.
+    __slots__ = ('namespace_element_sets', 'extension', '_id_short', '_display_name', '_category', '_description',
+                 'source', '_update_timestamp', '_dirty', '_dirty_descendants', '_content_hash', 'qualifier',
+                 '_embedded_data_specifications', '_frozen_cache', '__weakref__')
+
     @abc.abstractmethod
     def __init__(self,
                  id_short: Optional[base.NameType],
@@ -69,16 +82,36 @@ class SubmodelElement(base.Referable, base.Qualifiable, base.HasSemantics,
 
         super().__init__()
         self.id_short = id_short
-        self.display_name: Optional[base.MultiLanguageNameType] = display_name
+        self._display_name = display_name
         self.category = category
-        self.description: Optional[base.MultiLanguageTextType] = description
+        self._description = description
         self.parent: Optional[base.UniqueIdShortNamespace] = parent
         self.semantic_id: Optional[base.Reference] = semantic_id
         self.qualifier = base.NamespaceSet(self, [("type", True)], qualifier)
         self.extension = base.NamespaceSet(self, [("name", True)], extension)
         self.supplemental_semantic_id: base.ConstrainedList[base.Reference] = \
             base.ConstrainedList(supplemental_semantic_id)
-        self.embedded_data_specifications: List[base.EmbeddedDataSpecification] = list(embedded_data_specifications)
+        self._embedded_data_specifications = list(embedded_data_specifications)
+
+    def clone(self: _SubmodelElementT, id_short: Optional[base.NameType],
+              overrides: Optional[CloneOverrides] = None) -> _SubmodelElementT:
+        """
+        Create a copy of this SubmodelElement and all of its descendants with a new id_short and new values, e.g. to
+        instantiate a template. See :meth:`Submodel.clone`.
+
+        :param id_short: The id_short of the clone. Must be None, if the clone is to be added to a
+                         :class:`~.SubmodelElementList`.
+        :param overrides: New values of the ``value`` attribute of the clone's descendants by their id_short path
+                          relative to the clone. The empty path ``()`` refers to the clone itself.
+        :return: The clone, which has no parent
+        :raises KeyError: If an id_short path of the overrides cannot be resolved (see
+                          :meth:`~basyx.aas.model.base.UniqueIdShortNamespace.get_referable`)
+        :raises TypeError: If an overridden SubmodelElement has no single value or a new value is of the wrong type
+                           (see :meth:`Submodel.clone`)
+        """
+        clone = self._clone(overrides)
+        clone.id_short = id_short
+        return clone
 
 
 class Submodel(base.Identifiable, base.HasSemantics, base.HasKind, base.Qualifiable,
@@ -119,6 +152,9 @@ class Submodel(base.Identifiable, base.HasSemantics, base.HasKind, base.Qualifia
     :ivar embedded_data_specifications: List of Embedded data specification.
     """
 
+    # Submodels are the entry point for resolving the id_short paths of the HTTP API and ModelReferences
+    path_cache_enabled = True
+
     def __init__(self,
                  id_: base.Identifier,
                  submodel_element: Iterable[SubmodelElement] = (),
@@ -138,9 +174,9 @@ class Submodel(base.Identifiable, base.HasSemantics, base.HasKind, base.Qualifia
         self.id: base.Identifier = id_
         self.submodel_element = base.NamespaceSet(self, [("id_short", True)], submodel_element)
         self.id_short = id_short
-        self.display_name: Optional[base.MultiLanguageNameType] = display_name
+        self._display_name = display_name
         self.category = category
-        self.description: Optional[base.MultiLanguageTextType] = description
+        self._description = description
         self.parent: Optional[base.UniqueIdShortNamespace] = parent
         self.administration: Optional[base.AdministrativeInformation] = administration
         self.semantic_id: Optional[base.Reference] = semantic_id
@@ -149,7 +185,44 @@ class Submodel(base.Identifiable, base.HasSemantics, base.HasKind, base.Qualifia
         self.extension = base.NamespaceSet(self, [("name", True)], extension)
         self.supplemental_semantic_id: base.ConstrainedList[base.Reference] = \
             base.ConstrainedList(supplemental_semantic_id)
-        self.embedded_data_specifications: List[base.EmbeddedDataSpecification] = list(embedded_data_specifications)
+        self._embedded_data_specifications = list(embedded_data_specifications)
+
+    def clone(self, id_: base.Identifier, overrides: Optional[CloneOverrides] = None) -> "Submodel":
+        """
+        Create a copy of this Submodel and all of its descendants with a new id and new values, e.g. to instantiate a
+        template
+
+        The object hierarchy is copied iteratively, like with :func:`copy.deepcopy`, and the constraints known to hold
+        in this Submodel are not checked again. Immutable attribute values are shared with this Submodel instead of
+        copying them, i.e. :class:`Keys <basyx.aas.model.base.Key>`,
+        :class:`References <basyx.aas.model.base.Reference>` and
+        :class:`LangStringSets <basyx.aas.model.base.LangStringSet>`, which have been made immutable by
+        :meth:`~basyx.aas.model.base.Referable.freeze`. The latter cannot be modified in-place in the clone, but they
+        can be replaced. Thus, a frozen template can be cloned most efficiently. The clone itself is not frozen.
+
+        .. code-block:: python
+
+            instance = template.clone("https://example.com/instance/1", {
+                "SerialNumber": "1234",
+                ("Nameplate", "ManufacturerName"): model.MultiLanguageTextType({"en": "ACME Inc."}),
+            })
+
+        :param id_: The id of the clone
+        :param overrides: New values of the ``value`` attribute of the clone's SubmodelElements by their id_short (or
+                          id_short path). Only SubmodelElements with a single value, like
+                          :class:`Properties <.Property>`, :class:`MultiLanguageProperties <.MultiLanguageProperty>`,
+                          :class:`Files <.File>` or :class:`ReferenceElements <.ReferenceElement>`, can be overridden.
+                          The values are checked, like when assigning them.
+        :return: The clone
+        :raises KeyError: If an id_short path of the overrides cannot be resolved (see
+                          :meth:`~basyx.aas.model.base.UniqueIdShortNamespace.get_referable`)
+        :raises TypeError: If an overridden object has no single value (e.g. a
+                           :class:`~.SubmodelElementCollection`, an :class:`~.Entity` or the Submodel itself) or a
+                           new value is of the wrong type
+        """
+        clone = self._clone(overrides)
+        clone.id = id_
+        return clone
 
 
 ALLOWED_DATA_ELEMENT_CATEGORIES: Set[str] = {
@@ -190,6 +263,8 @@ class DataElement(SubmodelElement, metaclass=abc.ABCMeta):
                                     :class:`~basyx.aas.model.base.HasSemantics`)
     :ivar embedded_data_specifications: List of Embedded data specification.
     """
+    __slots__ = ()
+
     @abc.abstractmethod
     def __init__(self,
                  id_short: Optional[base.NameType],
@@ -209,18 +284,16 @@ class DataElement(SubmodelElement, metaclass=abc.ABCMeta):
         if category == "":
             raise base.AASConstraintViolation(100,
                                               "category is not allowed to be an empty string")
-        if category is None:
-            self._category = None
-        else:
-            if category not in ALLOWED_DATA_ELEMENT_CATEGORIES:
-                if not (isinstance(self, File) or isinstance(self, Blob)):
-                    raise base.AASConstraintViolation(
-                        90,
-                        "DataElement.category must be one of the following: " +
-                        ", ".join(ALLOWED_DATA_ELEMENT_CATEGORIES))
-            self._category = category
+        if category is not None and category not in ALLOWED_DATA_ELEMENT_CATEGORIES:
+            if not (isinstance(self, File) or isinstance(self, Blob)):
+                raise base.AASConstraintViolation(
+                    90,
+                    "DataElement.category must be one of the following: " +
+                    ", ".join(ALLOWED_DATA_ELEMENT_CATEGORIES))
+        self._assign_attribute("_category", category)
 
 
+@base._track_attributes("value_type", "value_id")
 class Property(DataElement):
     """
     A property is a :class:`DataElement` that has a single value.
@@ -253,6 +326,7 @@ class Property(DataElement):
                                     :class:`~basyx.aas.model.base.HasSemantics`)
     :ivar embedded_data_specifications: List of Embedded data specification.
     """
+    __slots__ = ('_value_type', '_value', '_value_id')
 
     def __init__(self,
                  id_short: Optional[base.NameType],
@@ -274,10 +348,12 @@ class Property(DataElement):
 
         super().__init__(id_short, display_name, category, description, parent, semantic_id, qualifier, extension,
                          supplemental_semantic_id, embedded_data_specifications)
-        self.value_type: base.DataTypeDefXsd = value_type
+        self.value_type: base.DataTypeDefXsd
+        self._value_type: base.DataTypeDefXsd = value_type
         self._value: Optional[base.ValueDataType] = (datatypes.trivial_cast(value, value_type)
                                                      if value is not None else None)
-        self.value_id: Optional[base.Reference] = value_id
+        self.value_id: Optional[base.Reference]
+        self._value_id: Optional[base.Reference] = value_id
 
     @property
     def value(self):
@@ -286,11 +362,12 @@ class Property(DataElement):
     @value.setter
     def value(self, value) -> None:
         if value is None:
-            self._value = None
+            self._assign_attribute("_value", None)
         else:
-            self._value = datatypes.trivial_cast(value, self.value_type)
+            self._assign_attribute("_value", datatypes.trivial_cast(value, self.value_type))
 
 
+@base._track_attributes("value", "value_id")
 class MultiLanguageProperty(DataElement):
     """
     A multi language property is a :class:`~.DataElement` that has a multi language value.
@@ -343,10 +420,13 @@ class MultiLanguageProperty(DataElement):
 
         super().__init__(id_short, display_name, category, description, parent, semantic_id, qualifier, extension,
                          supplemental_semantic_id, embedded_data_specifications)
-        self.value: Optional[base.MultiLanguageTextType] = value
-        self.value_id: Optional[base.Reference] = value_id
+        self.value: Optional[base.MultiLanguageTextType]
+        self._value: Optional[base.MultiLanguageTextType] = value
+        self.value_id: Optional[base.Reference]
+        self._value_id: Optional[base.Reference] = value_id
 
 
+@base._track_attributes("value_type")
 class Range(DataElement):
     """
     A range is a :class:`~.DataElement` that has a range value.
@@ -401,7 +481,8 @@ class Range(DataElement):
 
         super().__init__(id_short, display_name, category, description, parent, semantic_id, qualifier, extension,
                          supplemental_semantic_id, embedded_data_specifications)
-        self.value_type: base.DataTypeDefXsd = value_type
+        self.value_type: base.DataTypeDefXsd
+        self._value_type: base.DataTypeDefXsd = value_type
         self._min: Optional[base.ValueDataType] = datatypes.trivial_cast(min, value_type) if min is not None else None
         self._max: Optional[base.ValueDataType] = datatypes.trivial_cast(max, value_type) if max is not None else None
 
@@ -412,9 +493,9 @@ class Range(DataElement):
     @min.setter
     def min(self, value) -> None:
         if value is None:
-            self._min = None
+            self._assign_attribute("_min", None)
         else:
-            self._min = datatypes.trivial_cast(value, self.value_type)
+            self._assign_attribute("_min", datatypes.trivial_cast(value, self.value_type))
 
     @property
     def max(self):
@@ -423,12 +504,13 @@ class Range(DataElement):
     @max.setter
     def max(self, value) -> None:
         if value is None:
-            self._max = None
+            self._assign_attribute("_max", None)
         else:
-            self._max = datatypes.trivial_cast(value, self.value_type)
+            self._assign_attribute("_max", datatypes.trivial_cast(value, self.value_type))
 
 
 @_string_constraints.constrain_content_type("content_type")
+@base._track_attributes("value")
 class Blob(DataElement):
     """
     A BLOB is a :class:`~.DataElement` that represents a file that is contained with its source code in the value
@@ -483,7 +565,8 @@ class Blob(DataElement):
 
         super().__init__(id_short, display_name, category, description, parent, semantic_id, qualifier, extension,
                          supplemental_semantic_id, embedded_data_specifications)
-        self.value: Optional[base.BlobType] = value
+        self.value: Optional[base.BlobType]
+        self._value: Optional[base.BlobType] = value
         self.content_type: base.ContentType = content_type
 
 
@@ -541,6 +624,7 @@ class File(DataElement):
         self.content_type: base.ContentType = content_type
 
 
+@base._track_attributes("value")
 class ReferenceElement(DataElement):
     """
     A reference element is a :class:`DataElement` that defines a :class:`~basyx.aas.model.base.Reference` to another
@@ -591,7 +675,8 @@ class ReferenceElement(DataElement):
 
         super().__init__(id_short, display_name, category, description, parent, semantic_id, qualifier, extension,
                          supplemental_semantic_id, embedded_data_specifications)
-        self.value: Optional[base.Reference] = value
+        self.value: Optional[base.Reference]
+        self._value: Optional[base.Reference] = value
 
 
 class SubmodelElementCollection(SubmodelElement, base.UniqueIdShortNamespace):
@@ -711,7 +796,10 @@ class SubmodelElementList(SubmodelElement, base.UniqueIdShortNamespace, Generic[
         super().__init__(id_short, display_name, category, description, parent, semantic_id, qualifier, extension,
                          supplemental_semantic_id, embedded_data_specifications)
         # Counter to generate a unique idShort whenever a SubmodelElement is added
-        self._uuid_seq: int = 0
+        self._id_short_seq: int = 0
+        # The contained SubmodelElements with a semantic_id, by their id(). Due to Constraint AASd-114, all of them
+        # have the same semantic_id, so any new element only needs to be compared to one of them.
+        self._semantic_id_elements: Dict[int, _SE] = {}
 
         # It doesn't really make sense to change any of these properties. thus they are immutable here.
         self._type_value_list_element: Type[_SE] = type_value_list_element
@@ -719,9 +807,8 @@ class SubmodelElementList(SubmodelElement, base.UniqueIdShortNamespace, Generic[
         self._semantic_id_list_element: Optional[base.Reference] = semantic_id_list_element
         self._value_type_list_element: Optional[base.DataTypeDefXsd] = value_type_list_element
 
-        if self.type_value_list_element in (Property, Range) and self.value_type_list_element is None:
-            raise base.AASConstraintViolation(109, f"type_value_list_element={self.type_value_list_element.__name__}, "
-                                                   "but value_type_list_element is not set!")
+        if not _string_constraints.TRUSTED_LOAD.get():
+            self._check_value_type_list_element()
 
         # Items must be added after the above constraint has been checked. Otherwise, it can lead to errors, since the
         # constraints in _check_constraints() assume that this constraint has been checked.
@@ -748,17 +835,43 @@ class SubmodelElementList(SubmodelElement, base.UniqueIdShortNamespace, Generic[
         # Generate a unique id_short when a SubmodelElement is added, because children of a SubmodelElementList may not
         # have an id_short. The alternative would be making SubmodelElementList a special kind of base.Namespace without
         # a unique attribute for child-elements (which contradicts the definition of a Namespace).
-        new.id_short = "generated_submodel_list_hack_" + uuid.uuid1(clock_seq=self._uuid_seq).hex
-        self._uuid_seq += 1
+        # A sequence number is sufficient to make the id_short unique within this list, since it is never reused. The
+        # id_short is assigned directly, as it is known to be valid and the object has no parent, yet.
+        new._id_short = "generated_submodel_list_hack_{}".format(self._id_short_seq)
+        self._id_short_seq += 1
+
+    def _update_from(self, other: base.Referable, update_source: bool, summary: base.ChangeSummary,
+                     path: Tuple[base.NameType, ...]) -> None:
+        super()._update_from(other, update_source, summary, path)
+        # The semantic_ids of contained elements may have been updated in place, bypassing _check_constraints()
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self) -> None:
+        super()._rebuild_indexes()
+        self._semantic_id_elements.clear()
+        self._semantic_id_elements.update((id(element), element) for element in self._value
+                                          if element.semantic_id is not None)
 
     def _unset_id_short(self, old: _SE) -> None:
-        old.id_short = None
+        old._id_short = None
+        self._semantic_id_elements.pop(id(old), None)
+
+    def _check_value_type_list_element(self) -> None:
+        if self.type_value_list_element in (Property, Range) and self.value_type_list_element is None:
+            raise base.AASConstraintViolation(109, f"type_value_list_element={self.type_value_list_element.__name__}, "
+                                                   "but value_type_list_element is not set!")
 
     def _check_constraints(self, new: _SE, existing: Iterable[_SE]) -> None:
-        # Since the id_short contains randomness, unset it temporarily for pretty and predictable error messages.
-        # This also prevents the random id_short from remaining set in case a constraint violation is encountered.
+        if not _string_constraints.TRUSTED_LOAD.get():
+            self._check_element_constraints(new)
+        if new.semantic_id is not None:
+            self._semantic_id_elements[id(new)] = new
+
+    def _check_element_constraints(self, new: _SE) -> None:
+        # Since the id_short is generated, unset it temporarily for pretty and predictable error messages.
+        # This also prevents the generated id_short from remaining set in case a constraint violation is encountered.
         saved_id_short = new.id_short
-        new.id_short = None
+        new._id_short = None
 
         # We can't use isinstance(new, self.type_value_list_element) here, because each subclass of
         # self.type_value_list_element wouldn't raise a ConstraintViolation, when it should.
@@ -791,16 +904,27 @@ class SubmodelElementList(SubmodelElement, base.UniqueIdShortNamespace, Generic[
 
         # If semantic_id_list_element is not None that would already enforce the semantic_id for all first level
         # elements. Thus, we only need to perform this check if semantic_id_list_element is None.
-        if new.semantic_id is not None and self.semantic_id_list_element is None:
-            for item in existing:
-                if item.semantic_id is not None and new.semantic_id != item.semantic_id:
-                    raise base.AASConstraintViolation(114, f"Element to be added {new!r} has semantic_id "
-                                                           f"{new.semantic_id!r}, while already contained element "
-                                                           f"{item!r} has semantic_id {item.semantic_id!r}, which "
-                                                           "aren't equal.")
+        # Instead of comparing to all `existing` elements, we compare to one of the contained elements with a
+        # semantic_id, since all of them are known to have the same semantic_id.
+        if new.semantic_id is not None and self.semantic_id_list_element is None and self._semantic_id_elements:
+            item = next(iter(self._semantic_id_elements.values()))
+            if new.semantic_id != item.semantic_id:
+                # If the item is added in the same batch (see NamespaceSet.add_many()), it has no parent yet, and thus
+                # no meaningful path.
+                item_repr = repr(item) if item.parent is not None else item.__class__.__name__
+                raise base.AASConstraintViolation(114, f"Element to be added {new!r} has semantic_id "
+                                                       f"{new.semantic_id!r}, while already contained element "
+                                                       f"{item_repr} has semantic_id {item.semantic_id!r}, which "
+                                                       "aren't equal.")
 
         # Re-assign id_short
-        new.id_short = saved_id_short
+        new._id_short = saved_id_short
+
+    def _validate_constraints(self, run: _string_constraints.CheckRunner = _string_constraints.run_check) -> None:
+        super()._validate_constraints(run)
+        run(self._check_value_type_list_element)
+        for element in self._value:
+            run(self._check_element_constraints, element)
 
     @property
     def value(self) -> base.OrderedNamespaceSet[_SE]:
@@ -828,6 +952,7 @@ class SubmodelElementList(SubmodelElement, base.UniqueIdShortNamespace, Generic[
         return self._value_type_list_element
 
 
+@base._track_attributes("first", "second")
 class RelationshipElement(SubmodelElement):
     """
     A relationship element is used to define a relationship between two :class:`~basyx.aas.model.base.Referable`
@@ -879,8 +1004,10 @@ class RelationshipElement(SubmodelElement):
 
         super().__init__(id_short, display_name, category, description, parent, semantic_id, qualifier, extension,
                          supplemental_semantic_id, embedded_data_specifications)
-        self.first: base.Reference = first
-        self.second: base.Reference = second
+        self.first: base.Reference
+        self._first: base.Reference = first
+        self.second: base.Reference
+        self._second: base.Reference = second
 
 
 class AnnotatedRelationshipElement(RelationshipElement, base.UniqueIdShortNamespace):
@@ -1128,7 +1255,7 @@ class Entity(SubmodelElement, base.UniqueIdShortNamespace):
     @entity_type.setter
     def entity_type(self, entity_type: base.EntityType) -> None:
         self._validate_aasd_014(entity_type, self.global_asset_id, bool(self.specific_asset_id))
-        self._entity_type = entity_type
+        self._assign_attribute("_entity_type", entity_type)
 
     @property
     def global_asset_id(self) -> Optional[base.Identifier]:
@@ -1138,7 +1265,7 @@ class Entity(SubmodelElement, base.UniqueIdShortNamespace):
     def global_asset_id(self, global_asset_id: Optional[base.Identifier]) -> None:
         self._validate_global_asset_id(global_asset_id)
         self._validate_aasd_014(self.entity_type, global_asset_id, bool(self.specific_asset_id))
-        self._global_asset_id = global_asset_id
+        self._assign_attribute("_global_asset_id", global_asset_id)
 
     @property
     def specific_asset_id(self) -> base.ConstrainedList[base.SpecificAssetId]:
@@ -1152,16 +1279,19 @@ class Entity(SubmodelElement, base.UniqueIdShortNamespace):
     def _check_constraint_add_spec_asset_id(self, _new_item: base.SpecificAssetId,
                                             _old_list: List[base.SpecificAssetId]) -> None:
         self._validate_aasd_014(self.entity_type, self.global_asset_id, True)
+        self._record_modification()
 
     def _check_constraint_set_spec_asset_id(self, items_to_replace: List[base.SpecificAssetId],
                                             new_items: List[base.SpecificAssetId],
                                             old_list: List[base.SpecificAssetId]) -> None:
         self._validate_aasd_014(self.entity_type, self.global_asset_id,
                                 len(old_list) - len(items_to_replace) + len(new_items) > 0)
+        self._record_modification()
 
     def _check_constraint_del_spec_asset_id(self, _item_to_del: base.SpecificAssetId,
                                             old_list: List[base.SpecificAssetId]) -> None:
         self._validate_aasd_014(self.entity_type, self.global_asset_id, len(old_list) > 1)
+        self._record_modification()
 
     @staticmethod
     def _validate_global_asset_id(global_asset_id: Optional[base.Identifier]) -> None:
@@ -1172,6 +1302,8 @@ class Entity(SubmodelElement, base.UniqueIdShortNamespace):
     def _validate_aasd_014(entity_type: base.EntityType,
                            global_asset_id: Optional[base.Identifier],
                            specific_asset_id_nonempty: bool) -> None:
+        if _string_constraints.TRUSTED_LOAD.get():
+            return
         if entity_type == base.EntityType.SELF_MANAGED_ENTITY and global_asset_id is None \
                 and not specific_asset_id_nonempty:
             raise base.AASConstraintViolation(
@@ -1181,6 +1313,11 @@ class Entity(SubmodelElement, base.UniqueIdShortNamespace):
             raise base.AASConstraintViolation(
                 14, "A co-managed entity has to have neither a globalAssetId nor a specificAssetId")
 
+    def _validate_constraints(self, run: _string_constraints.CheckRunner = _string_constraints.run_check) -> None:
+        super()._validate_constraints(run)
+        run(self._validate_global_asset_id, self._global_asset_id)
+        run(self._validate_aasd_014, self._entity_type, self._global_asset_id, bool(self._specific_asset_id))
+
 
 class EventElement(SubmodelElement, metaclass=abc.ABCMeta):
     """
@@ -1226,6 +1363,7 @@ class EventElement(SubmodelElement, metaclass=abc.ABCMeta):
 
 
 @_string_constraints.constrain_message_topic_type("message_topic")
+@base._track_attributes("observed", "state", "message_broker", "min_interval")
 class BasicEventElement(EventElement):
     """
     A basic event element.
@@ -1304,17 +1442,25 @@ class BasicEventElement(EventElement):
 
         super().__init__(id_short, display_name, category, description, parent, semantic_id, qualifier, extension,
                          supplemental_semantic_id, embedded_data_specifications)
-        self.observed: base.ModelReference[Union["aas.AssetAdministrationShell", Submodel, SubmodelElement]] = observed
+        self.observed: base.ModelReference[Union["aas.AssetAdministrationShell", Submodel, SubmodelElement]]
+        self._observed: base.ModelReference[Union["aas.AssetAdministrationShell", Submodel, SubmodelElement]] = \
+            observed
         # max_interval must be set here because the direction setter attempts to read it
-        self.max_interval: Optional[datatypes.Duration] = None
-        self.direction: base.Direction = direction
-        self.state: base.StateOfEvent = state
+        self._max_interval: Optional[datatypes.Duration] = None
+        self._direction: base.Direction
+        self.direction = direction
+        self.state: base.StateOfEvent
+        self._state: base.StateOfEvent = state
         self.message_topic: Optional[base.MessageTopicType] = message_topic
         self.message_broker: Optional[base.ModelReference[Union[Submodel, SubmodelElementList,
-                                                                SubmodelElementCollection, Entity]]] = message_broker
-        self.last_update: Optional[datatypes.DateTime] = last_update
-        self.min_interval: Optional[datatypes.Duration] = min_interval
-        self.max_interval: Optional[datatypes.Duration] = max_interval
+                                                                SubmodelElementCollection, Entity]]]
+        self._message_broker: Optional[base.ModelReference[Union[Submodel, SubmodelElementList,
+                                                                 SubmodelElementCollection, Entity]]] = message_broker
+        self._last_update: Optional[datatypes.DateTime]
+        self.last_update = last_update
+        self.min_interval: Optional[datatypes.Duration]
+        self._min_interval: Optional[datatypes.Duration] = min_interval
+        self.max_interval = max_interval
 
     @property
     def direction(self) -> base.Direction:
@@ -1324,7 +1470,7 @@ class BasicEventElement(EventElement):
     def direction(self, direction: base.Direction) -> None:
         if direction is base.Direction.INPUT and self.max_interval is not None:
             raise ValueError("max_interval is not applicable if direction = input!")
-        self._direction: base.Direction = direction
+        self._assign_attribute("_direction", direction)
 
     @property
     def last_update(self) -> Optional[datatypes.DateTime]:
@@ -1334,7 +1480,7 @@ class BasicEventElement(EventElement):
     def last_update(self, last_update: Optional[datatypes.DateTime]) -> None:
         if last_update is not None and last_update.tzname() != "UTC":
             raise ValueError("last_update must be specified in UTC!")
-        self._last_update: Optional[datatypes.DateTime] = last_update
+        self._assign_attribute("_last_update", last_update)
 
     @property
     def max_interval(self) -> Optional[datatypes.Duration]:
@@ -1344,4 +1490,4 @@ class BasicEventElement(EventElement):
     def max_interval(self, max_interval: Optional[datatypes.Duration]) -> None:
         if max_interval is not None and self.direction is base.Direction.INPUT:
             raise ValueError("max_interval is not applicable if direction = input!")
-        self._max_interval: Optional[datatypes.Duration] = max_interval
+        self._assign_attribute("_max_interval", max_interval)
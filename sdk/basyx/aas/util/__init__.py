@@ -1,9 +1,18 @@
 """
 This package provides helpful utilities for working with a python based AAS model.
 
+:mod:`.diff`:
+    Compute the differences between versions of AAS objects or object stores and apply them as patches.
+
+:mod:`.garbage_collection`:
+    Exclude large, long-lived object stores from Python's cyclic garbage collector.
+
 :mod:`.identification`:
     Generate :class:`Identifiers <basyx.aas.model.base.Identifier>`
 
 :mod:`.traversal`:
     A module with helper functions for traversing AAS object structures.
+
+:mod:`.validation`:
+    Validate all objects of an object store, collecting all constraint violations and broken references.
 """
@@ -0,0 +1,203 @@
+# Copyright (c) 2025 the Eclipse BaSyx Authors
+#
+# This program and the accompanying materials are made available under the terms of the MIT License, available in
+# the LICENSE file of this project.
+#
+# SPDX-License-Identifier: MIT
+"""
+A module for computing the differences between two versions of :class:`Identifiables
+<basyx.aas.model.base.Identifiable>` or of whole object stores as a patch, and for applying such a patch to an object
+store.
+
+Both versions are compared top-down by the :attr:`~basyx.aas.model.base.Referable.content_hash` of their objects, so
+unchanged subtrees are skipped right away. Children are matched by their id_short using dicts, so the time to compute a
+diff is linear in the number of objects within changed subtrees.
+
+A patch is a list of :class:`PatchOperations <.PatchOperation>`, each of them adding, removing or replacing a single
+:class:`~basyx.aas.model.base.Referable`, addressed by the id of its Identifiable and its id_short path:
+
+.. code-block:: python
+
+    patch = diff_object_stores(old_store, new_store)
+    apply_patch(replica_store, patch)
+"""
+
+import copy
+from enum import Enum
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .. import model
+
+
+class PatchOperationType(Enum):
+    ADD = "add"
+    REMOVE = "remove"
+    REPLACE = "replace"
+
+
+class PatchOperation(NamedTuple):
+    """
+    A single operation of a patch, as created by :func:`diff_identifiables` and :func:`diff_object_stores`
+
+    :ivar type: The type of the operation
+    :ivar identifier: The id of the affected :class:`~basyx.aas.model.base.Identifiable`
+    :ivar path: The id_short path from the Identifiable to the affected :class:`~basyx.aas.model.base.Referable`. It is
+                empty, if the Identifiable itself is affected. Elements of
+                :class:`SubmodelElementLists <basyx.aas.model.submodel.SubmodelElementList>` are addressed by their
+                index.
+    :ivar value: The added or replacing Referable of the new version (None for removals). It is not copied when creating
+                 the patch, so it must not be modified until the patch has been applied.
+    :ivar attribute: For additions of contained Referables: The name of the parent's attribute, holding the
+                     :class:`~basyx.aas.model.base.NamespaceSet` the Referable belongs to (e.g. ``submodel_element``)
+    """
+    type: PatchOperationType
+    identifier: model.Identifier
+    path: Tuple[model.NameType, ...] = ()
+    value: Optional[model.Referable] = None
+    attribute: Optional[str] = None
+
+
+def diff_identifiables(old: model.Identifiable, new: model.Identifiable) -> List[PatchOperation]:
+    """
+    Compute the differences between two versions of an :class:`~basyx.aas.model.base.Identifiable`
+
+    Contained Referables, whose own attributes (i.e. excluding their children) differ, are replaced as a whole.
+    :class:`SubmodelElementLists <basyx.aas.model.submodel.SubmodelElementList>` are compared element-wise, if their
+    length is unchanged, otherwise they are replaced as a whole as well.
+
+    :param old: The old version
+    :param new: The new version
+    :return: The patch, transforming the old version into the new one
+    :raises ValueError: If the ids of both objects differ
+    """
+    if old.id != new.id:
+        raise ValueError(f"Cannot compare Identifiables with different ids {old.id} and {new.id}")
+    operations: List[PatchOperation] = []
+    _diff_referable(old, new, old.id, (), operations)
+    return operations
+
+
+def diff_object_stores(old: model.AbstractObjectStore, new: model.AbstractObjectStore) -> List[PatchOperation]:
+    """
+    Compute the differences between two versions of an :class:`~basyx.aas.model.provider.AbstractObjectStore`
+
+    :param old: The old version
+    :param new: The new version
+    :return: The patch, transforming the Identifiables of the old version into the ones of the new version. See
+             :func:`diff_identifiables` for the differences within Identifiables.
+    """
+    operations: List[PatchOperation] = []
+    for old_identifiable in old:
+        new_identifiable = new.get(old_identifiable.id)
+        if new_identifiable is None:
+            operations.append(PatchOperation(PatchOperationType.REMOVE, old_identifiable.id))
+        else:
+            _diff_referable(old_identifiable, new_identifiable, old_identifiable.id, (), operations)
+    for added_identifiable in new:
+        if old.get(added_identifiable.id) is None:
+            operations.append(PatchOperation(PatchOperationType.ADD, added_identifiable.id, (), added_identifiable))
+    return operations
+
+
+def _diff_referable(old: model.Referable, new: model.Referable, identifier: model.Identifier,
+                    path: Tuple[model.NameType, ...], operations: List[PatchOperation]) -> None:
+    # The id_short of an object is not part of its own content hash, but of its parent's. Thus, it only needs to be
+    # compared for the Identifiable at the top.
+    if old.content_hash == new.content_hash and (path or old.id_short == new.id_short):
+        return
+    if type(old) is not type(new) or not isinstance(old, model.UniqueIdShortNamespace) \
+            or not path and old.id_short != new.id_short \
+            or old._compute_hash(include_children=False) != new._compute_hash(include_children=False):
+        operations.append(PatchOperation(PatchOperationType.REPLACE, identifier, path, new))
+        return
+    if isinstance(old, model.SubmodelElementList):
+        assert isinstance(new, model.SubmodelElementList)
+        if len(old.value) != len(new.value):
+            operations.append(PatchOperation(PatchOperationType.REPLACE, identifier, path, new))
+            return
+        for index, (old_element, new_element) in enumerate(zip(old.value, new.value)):
+            _diff_referable(old_element, new_element, identifier, path + (str(index),), operations)
+        return
+    assert isinstance(new, model.UniqueIdShortNamespace)
+    old_children = _get_children(old)
+    new_children = _get_children(new)
+    for key, old_child in old_children.items():
+        new_child = new_children.get(key)
+        if new_child is None:
+            operations.append(PatchOperation(PatchOperationType.REMOVE, identifier, path + (key[1],)))
+        else:
+            _diff_referable(old_child, new_child, identifier, path + (key[1],), operations)
+    for key, new_child in new_children.items():
+        if key not in old_children:
+            operations.append(PatchOperation(PatchOperationType.ADD, identifier, path + (key[1],), new_child,
+                                             key[0]))
+
+
+def _get_children(namespace: model.UniqueIdShortNamespace) -> Dict[Tuple[str, model.NameType], model.Referable]:
+    """
+    Get the child Referables of a Namespace by the name of their NamespaceSet's attribute and their id_short. The
+    attribute name is part of the key, so that moving a Referable into another NamespaceSet of the same parent is
+    detected.
+    """
+    children: Dict[Tuple[str, model.NameType], model.Referable] = {}
+    for namespace_set in namespace.namespace_element_sets:
+        if "id_short" not in namespace_set.get_attribute_name_list():
+            continue
+        attribute_name = namespace_set._parent_attribute_name()
+        for referable in namespace_set:
+            children[(attribute_name, referable.id_short)] = referable
+    return children
+
+
+def apply_patch(store: model.AbstractObjectStore, patch: Iterable[PatchOperation]) -> None:
+    """
+    Apply a patch, as created by :func:`diff_identifiables` or :func:`diff_object_stores`, to an object store
+
+    The added and replacing objects are copied, so the patch stays independent of the store and may be applied to
+    multiple stores. Replacements of whole Identifiables are applied to the existing objects via
+    :meth:`~basyx.aas.model.base.Referable.update_from`, so their identity is preserved.
+
+    :param store: The object store to modify
+    :param patch: The operations to apply, in order
+    :raises KeyError: If an Identifiable or Referable to be modified can't be found in the store
+    """
+    for operation in patch:
+        if not operation.path:
+            if operation.type is PatchOperationType.ADD:
+                store.add(_detached_copy(operation.value))  # type: ignore[arg-type]
+            elif operation.type is PatchOperationType.REMOVE:
+                store.discard(store.get_identifiable(operation.identifier))
+            else:
+                store.get_identifiable(operation.identifier).update_from(
+                    _detached_copy(operation.value))  # type: ignore[arg-type]
+            continue
+
+        parent: model.Referable = store.get_identifiable(operation.identifier)
+        if len(operation.path) > 1:
+            if not isinstance(parent, model.UniqueIdShortNamespace):
+                raise KeyError(f"{parent!r} does not contain any Referables")
+            parent = parent.get_referable(operation.path[:-1])
+        if not isinstance(parent, model.UniqueIdShortNamespace):
+            raise KeyError(f"{parent!r} does not contain any Referables")
+        id_short = operation.path[-1]
+        if operation.type is PatchOperationType.ADD:
+            getattr(parent, operation.attribute).add(_detached_copy(operation.value))  # type: ignore[arg-type]
+        elif isinstance(parent, model.SubmodelElementList):
+            # Elements of SubmodelElementLists are only replaced in place
+            element = _detached_copy(operation.value)  # type: ignore[arg-type]
+            element.id_short = None
+            parent.value[int(id_short)] = element
+        else:
+            old_referable = parent.get_referable(id_short)
+            namespace_set = next(set_ for set_ in parent.namespace_element_sets if old_referable in set_)
+            namespace_set.remove(old_referable)
+            if operation.type is PatchOperationType.REPLACE:
+                namespace_set.add(_detached_copy(operation.value))  # type: ignore[arg-type]
+
+
+def _detached_copy(referable: model.Referable) -> model.Referable:
+    """
+    Deep-copy a Referable without its parent
+    """
+    # Deep copies of Referables don't include their ancestors
+    return copy.deepcopy(referable)
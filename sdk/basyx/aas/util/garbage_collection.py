@@ -0,0 +1,64 @@
+# Copyright (c) 2025 the Eclipse BaSyx Authors
+#
+# This program and the accompanying materials are made available under the terms of the MIT License, available in
+# the LICENSE file of this project.
+#
+# SPDX-License-Identifier: MIT
+"""
+A module for excluding large, long-lived object stores from Python's cyclic garbage collector.
+
+Each :class:`~basyx.aas.model.base.Referable` references its parent and each parent references its children (via
+:class:`NamespaceSets <basyx.aas.model.base.NamespaceSet>`, which reference their parent as well). Thus, a loaded
+object store forms a few large reference cycles, which cannot be freed by reference counting and are traversed by each
+full collection of the cyclic garbage collector. With millions of objects, this results in GC pauses of seconds.
+
+If an object store is loaded once and kept until the process ends (like in read-only deployments of the HTTP server),
+its objects can be excluded from garbage collection, using :func:`gc.freeze`, right after loading:
+
+.. code-block:: python
+
+    with garbage_collection.loading():
+        read_aas_json_file_into(object_store, file)
+
+.. attention::
+    :func:`gc.freeze` is global: It excludes *all* objects existing at that time from garbage collection, not only
+    the objects of the store. Objects, which are removed from the store afterwards, are not freed (as long as they are
+    part of a reference cycle), unless :func:`gc.unfreeze` is called.
+"""
+
+import contextlib
+import gc
+from typing import Iterator
+
+
+def freeze() -> int:
+    """
+    Collect the current garbage and exclude all remaining objects from future garbage collections
+
+    :return: The number of objects excluded from garbage collection (including the ones of previous calls)
+    """
+    gc.collect()
+    gc.freeze()
+    return gc.get_freeze_count()
+
+
+@contextlib.contextmanager
+def loading(freeze_loaded: bool = True) -> Iterator[None]:
+    """
+    Context manager for loading large amounts of objects, e.g. reading files into an object store
+
+    Automatic garbage collection is disabled while loading, since all of the newly created objects survive anyway, but
+    would trigger a number of (increasingly expensive) collections, traversing them over and over.
+
+    :param freeze_loaded: If True, all objects are excluded from garbage collection (see :func:`freeze`) after loading
+                          completed successfully
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+    if freeze_loaded:
+        freeze()
@@ -0,0 +1,158 @@
+# Copyright (c) 2025 the Eclipse BaSyx Authors
+#
+# This program and the accompanying materials are made available under the terms of the MIT License, available in
+# the LICENSE file of this project.
+#
+# SPDX-License-Identifier: MIT
+"""
+A module for validating all :class:`Identifiables <basyx.aas.model.base.Identifiable>` of an object store at once,
+e.g. for periodically checking a large store, which has been loaded with :func:`~basyx.aas.model.base.trusted_load`.
+
+In contrast to :func:`basyx.aas.model.base.validate`, :func:`validate_store` does not stop at the first violation, but
+returns all of them as :class:`Violations <.Violation>`. Additionally, it checks the integrity of all
+:class:`ModelReferences <basyx.aas.model.base.ModelReference>`, i.e. whether they can be resolved within the store.
+Independent Identifiables are distributed over a pool of processes:
+
+.. code-block:: python
+
+    for violation in validate_store(object_store):
+        print(violation.identifier, "/".join(violation.path), violation.message)
+"""
+
+import concurrent.futures
+import multiprocessing
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from .. import model
+
+_ChunkResult = Tuple[List["Violation"], List[Tuple[model.Identifier, Tuple[model.NameType, ...], model.ModelReference]]]
+
+# The Identifiables to validate within a forked worker process. They are set by the initializer of the process and
+# inherited from the parent process instead of pickling them.
+_forked_identifiables: Sequence[model.Identifiable] = ()
+
+
+class Violation(NamedTuple):
+    """
+    A violated constraint or broken :class:`~basyx.aas.model.base.ModelReference`, as found by :func:`validate_store`
+
+    :ivar identifier: The id of the :class:`~basyx.aas.model.base.Identifiable` containing the violating object
+    :ivar path: The id_short path from the Identifiable to the :class:`~basyx.aas.model.base.Referable`, which is or
+                contains the violating object. It is empty, if this is the Identifiable itself. Elements of
+                :class:`SubmodelElementLists <basyx.aas.model.submodel.SubmodelElementList>` are addressed by their
+                index.
+    :ivar constraint_id: The id of the violated AASd-Constraint, or None for other violations, like invalid strings or
+                         unresolvable ModelReferences
+    :ivar message: A description of the violation
+    """
+    identifier: model.Identifier
+    path: Tuple[model.NameType, ...]
+    constraint_id: Optional[int]
+    message: str
+
+
+def validate_store(object_store: model.AbstractObjectStore, check_references: bool = True,
+                   max_workers: Optional[int] = None, chunk_size: int = 64) -> List[Violation]:
+    """
+    Check the constraints of all Identifiables in an object store and all objects contained in them
+
+    :param object_store: The object store to validate
+    :param check_references: If True, check that all ModelReferences within the store can be resolved within the
+                             store. References to fragments (e.g. within a File) are resolved up to the fragment.
+    :param max_workers: The maximum number of worker processes (see :class:`concurrent.futures.ProcessPoolExecutor`).
+                        If it is 1 or there are not more than ``chunk_size`` Identifiables, they are validated in the
+                        current process.
+    :param chunk_size: The number of Identifiables to validate within each task of a worker process
+    :return: All violations found, ordered by the Identifiables of the store
+    """
+    identifiables = list(object_store)
+    if max_workers == 1 or len(identifiables) <= chunk_size:
+        results: Iterable[_ChunkResult] = [_validate_identifiables(identifiables)]
+    else:
+        results = _validate_in_processes(identifiables, max_workers, chunk_size)
+
+    violations: List[Violation] = []
+    broken_references: Dict[model.ModelReference, Optional[str]] = {}
+    # The resolver retrieves each referenced Identifiable from the store only once
+    resolver = model.ReferenceResolver(object_store)
+    for chunk_violations, chunk_references in results:
+        violations.extend(chunk_violations)
+        if not check_references:
+            continue
+        for identifier, path, reference in chunk_references:
+            if reference not in broken_references:
+                broken_references[reference] = _check_reference(resolver, reference)
+            error = broken_references[reference]
+            if error is not None:
+                violations.append(Violation(identifier, path, None, f"{reference!r} cannot be resolved: {error}"))
+    return violations
+
+
+def _validate_in_processes(identifiables: List[model.Identifiable], max_workers: Optional[int],
+                           chunk_size: int) -> List[_ChunkResult]:
+    starts = range(0, len(identifiables), chunk_size)
+    if "fork" not in multiprocessing.get_all_start_methods():
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            return list(executor.map(_validate_identifiables,
+                                     (identifiables[start:start + chunk_size] for start in starts)))
+    # Forked worker processes share the Identifiables with this process, so only the bounds of the chunks need to be
+    # sent to them. The arguments of the initializer are passed to the forked processes without pickling. Since each
+    # call uses its own pool, concurrent calls don't interfere.
+    with concurrent.futures.ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context("fork"),
+                                                initializer=_init_forked_worker, initargs=(identifiables,)) \
+            as executor:
+        return list(executor.map(_validate_forked_chunk, starts, (start + chunk_size for start in starts)))
+
+
+def _init_forked_worker(identifiables: Sequence[model.Identifiable]) -> None:
+    global _forked_identifiables
+    _forked_identifiables = identifiables
+
+
+def _validate_forked_chunk(start: int, stop: int) -> _ChunkResult:
+    return _validate_identifiables(_forked_identifiables[start:stop])
+
+
+def _validate_identifiables(identifiables: Iterable[model.Identifiable]) -> _ChunkResult:
+    violations: List[Violation] = []
+    references: List[Tuple[model.Identifier, Tuple[model.NameType, ...], model.ModelReference]] = []
+    for identifiable in identifiables:
+        validator = model.base._Validator(collect=True)
+        validator.validate(identifiable)
+        for referable, exception in validator.violations:
+            violations.append(Violation(identifiable.id, _get_path(referable),
+                                        getattr(exception, "constraint_id", None), str(exception)))
+        references.extend((identifiable.id, _get_path(referable), reference)
+                          for referable, reference in validator.model_references)
+    return violations, references
+
+
+def _get_path(referable: Optional[model.Referable]) -> Tuple[model.NameType, ...]:
+    reversed_path: List[model.NameType] = []
+    while referable is not None and not isinstance(referable, model.Identifiable):
+        parent = referable.parent
+        if isinstance(parent, model.SubmodelElementList):
+            reversed_path.append(str(parent.value.index(referable)))
+        else:
+            reversed_path.append(referable.id_short)  # type: ignore[arg-type]
+        referable = parent  # type: ignore[assignment]
+    return tuple(reversed(reversed_path))
+
+
+def _check_reference(resolver: model.ReferenceResolver, reference: model.ModelReference) -> Optional[str]:
+    """
+    Try to resolve a ModelReference within the object store of the resolver
+
+    :return: The error message, if the reference cannot be resolved, otherwise None
+    """
+    if len(reference.key) > 1 and reference.key[-1].type.is_generic_fragment_key:
+        # Fragments can't be resolved within the store, so only the fragment's container is resolved
+        reference = model.ModelReference(reference.key[:-1], model.Referable)  # type: ignore[type-abstract]
+    try:
+        resolver.resolve(reference)
+    except KeyError as e:
+        # The message of a KeyError is its only argument, str() would quote it
+        return str(e.args[0]) if e.args else repr(e)
+    except (TypeError, ValueError) as e:
+        return str(e)
+    return None
@@ -1,9 +1,13 @@
 import configparser
 import os.path
+import unittest
 import urllib.request
 import urllib.error
 import base64
 
+from basyx.aas import model
+from basyx.aas.examples.data.example_aas import create_full_example
+
 TEST_CONFIG = configparser.ConfigParser()
 TEST_CONFIG.read((os.path.join(os.path.dirname(__file__), "..", "test_config.default.ini"),
                   os.path.join(os.path.dirname(__file__), "..", "test_config.ini")))
@@ -25,3 +29,28 @@ try:
 except urllib.error.URLError as e:
     COUCHDB_OKAY = False
     COUCHDB_ERROR = e
+
+
+def check_bulk_methods(test_case: unittest.TestCase, object_store: model.AbstractObjectStore) -> None:
+    """
+    Check the bulk methods get_many(), add_many() and discard_many() of an empty object store, like the ones of the
+    backends
+    """
+    example_data = list(create_full_example())
+    object_store.add_many(example_data[:3])
+    with test_case.assertRaises(KeyError):
+        object_store.add_many(example_data)
+    # The other objects are added nonetheless
+    test_case.assertEqual(5, len(object_store))
+
+    retrieved = object_store.get_many([x.id for x in example_data] + ['https://acplt.org/Missing'])
+    test_case.assertEqual({x.id for x in example_data}, set(retrieved))
+    for x in example_data:
+        test_case.assertIs(x, retrieved[x.id])
+
+    object_store.discard_many(example_data[:3])
+    test_case.assertEqual(2, len(object_store))
+    # Objects, which have already been deleted, are ignored
+    object_store.discard_many(example_data)
+    test_case.assertEqual(0, len(object_store))
+    test_case.assertEqual({}, object_store.get_many([x.id for x in example_data]))
@@ -237,6 +237,55 @@ class JsonDeserializationDerivingTest(unittest.TestCase):
         self.assertIsInstance(parsed_data[0], EnhancedSubmodel)
         self.assertEqual(parsed_data[0].enhanced_attribute, "fancy!")
 
+    def test_reference_pool(self) -> None:
+        class InterningAASDecoder(StrictAASFromJsonDecoder):
+            reference_pool = model.ReferencePool()
+
+        data = """
+            [
+                {
+                    "modelType": "Property",
+                    "idShort": "prop%d",
+                    "valueType": "xs:string",
+                    "semanticId": {
+                        "type": "ExternalReference",
+                        "keys": [{"type": "GlobalReference", "value": "https://acplt.org/Test_Semantic"}]
+                    },
+                    "valueId": {
+                        "type": "ModelReference",
+                        "keys": [{"type": "Submodel", "value": "https://acplt.org/Test_Submodel"}]
+                    }
+                }
+            ]"""
+        prop1 = json.loads(data % 1, cls=InterningAASDecoder)[0]
+        prop2 = json.loads(data % 2, cls=InterningAASDecoder)[0]
+        self.assertIs(prop1.semantic_id, prop2.semantic_id)
+        self.assertIs(prop1.value_id, prop2.value_id)
+
+        # Without a pool, each reference is a separate object
+        prop3 = json.loads(data % 3, cls=StrictAASFromJsonDecoder)[0]
+        self.assertEqual(prop1.semantic_id, prop3.semantic_id)
+        self.assertIsNot(prop1.semantic_id, prop3.semantic_id)
+
+    def test_trusted(self) -> None:
+        class TrustingAASDecoder(StrictAASFromJsonDecoder):
+            trusted = True
+
+        data = """
+            [
+                {
+                    "modelType": "Property",
+                    "idShort": "1_invalid",
+                    "valueType": "xs:string"
+                }
+            ]"""
+        with self.assertRaises(TypeError):
+            json.loads(data, cls=StrictAASFromJsonDecoder)
+        prop = json.loads(data, cls=TrustingAASDecoder)[0]
+        self.assertEqual("1_invalid", prop.id_short)
+        with self.assertRaises(model.AASConstraintViolation):
+            model.validate(prop)
+
 
 class JsonDeserializationStrippedObjectsTest(unittest.TestCase):
     def test_stripped_qualifiable(self) -> None:
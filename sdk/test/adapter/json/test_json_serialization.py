@@ -46,6 +46,26 @@ class JsonSerializationTest(unittest.TestCase):
             }, cls=AASToJsonEncoder)
         json_data_new = json.loads(json_data)
 
+    def test_frozen_object_serialization(self) -> None:
+        submodel = example_aas.create_example_submodel()
+        expected = json.dumps(submodel, cls=AASToJsonEncoder)
+        expected_stripped = json.dumps(submodel, cls=StrippedAASToJsonEncoder)
+        submodel.freeze()
+        self.assertEqual(expected, json.dumps(submodel, cls=AASToJsonEncoder))
+        self.assertEqual(expected_stripped, json.dumps(submodel, cls=StrippedAASToJsonEncoder))
+        # The serialization is cached per encoder class, reusing the cached serializations of the children
+        cached = submodel._get_frozen_cache()[AASToJsonEncoder]  # type: ignore[index]
+        collection = submodel.get_referable("ExampleSubmodelCollection")
+        self.assertTrue(any(element is collection._get_frozen_cache()[AASToJsonEncoder]  # type: ignore[index]
+                            for element in cached["submodelElements"]))  # type: ignore[index]
+        # default() returns a copy, which the caller may modify without affecting the cache
+        converted = AASToJsonEncoder().default(submodel)
+        self.assertEqual(cached, converted)
+        self.assertIsNot(cached, converted)
+        converted["submodelElements"][0]["idShort"] = "Modified"  # type: ignore[index]
+        converted["submodelElements"].clear()  # type: ignore[index]
+        self.assertEqual(expected, json.dumps(submodel, cls=AASToJsonEncoder))
+
 
 class JsonSerializationSchemaTest(unittest.TestCase):
     @classmethod
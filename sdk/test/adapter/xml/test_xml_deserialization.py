@@ -327,6 +327,23 @@ class XmlDeserializationTest(unittest.TestCase):
         submodel = read_aas_xml_element(string_io, XMLConstructables.SUBMODEL)
         self.assertIsInstance(submodel, model.Submodel)
 
+    def test_trusted(self) -> None:
+        xml = _xml_wrap("""
+        <aas:submodels>
+            <aas:submodel>
+                <aas:idShort>1_invalid</aas:idShort>
+                <aas:id>http://acplt.org/test_submodel</aas:id>
+            </aas:submodel>
+        </aas:submodels>
+        """)
+        with self.assertRaises(ValueError):
+            read_aas_xml_file(io.StringIO(xml), failsafe=False)
+        object_store = read_aas_xml_file(io.StringIO(xml), failsafe=False, trusted=True)
+        submodel = object_store.get_identifiable("http://acplt.org/test_submodel")
+        self.assertEqual("1_invalid", submodel.id_short)
+        with self.assertRaises(model.AASConstraintViolation):
+            model.validate(submodel)
+
     def test_no_namespace_prefix(self) -> None:
         def xml(id_: str) -> str:
             return f"""
@@ -447,6 +464,31 @@ class XmlDeserializationDerivingTest(unittest.TestCase):
         assert isinstance(submodel, EnhancedSubmodel)
         self.assertEqual(submodel.enhanced_attribute, "fancy!")
 
+    def test_reference_pool(self) -> None:
+        class InterningAASDecoder(StrictAASFromXmlDecoder):
+            reference_pool = model.ReferencePool()
+
+        xml = f"""
+        <aas:property xmlns:aas="{XML_NS_MAP["aas"]}">
+            <aas:idShort>prop</aas:idShort>
+            <aas:semanticId>
+                <aas:type>ExternalReference</aas:type>
+                <aas:keys>
+                    <aas:key>
+                        <aas:type>GlobalReference</aas:type>
+                        <aas:value>https://acplt.org/Test_Semantic</aas:value>
+                    </aas:key>
+                </aas:keys>
+            </aas:semanticId>
+            <aas:valueType>xs:string</aas:valueType>
+        </aas:property>
+        """
+        prop1 = read_aas_xml_element(io.StringIO(xml), XMLConstructables.PROPERTY, decoder=InterningAASDecoder)
+        prop2 = read_aas_xml_element(io.StringIO(xml), XMLConstructables.PROPERTY, decoder=InterningAASDecoder)
+        assert isinstance(prop1, model.Property) and isinstance(prop2, model.Property)
+        self.assertIsNot(prop1, prop2)
+        self.assertIs(prop1.semantic_id, prop2.semantic_id)
+
 
 class TestTagReplaceNamespace(unittest.TestCase):
     def test_known_namespace(self):
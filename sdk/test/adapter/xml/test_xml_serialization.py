@@ -46,6 +46,16 @@ class XMLSerializationTest(unittest.TestCase):
         test_file = io.BytesIO()
         write_aas_xml_file(file=test_file, data=test_data)
 
+    def test_frozen_object_serialization(self) -> None:
+        submodel = example_aas.create_example_submodel()
+        expected = etree.tostring(xml_serialization.object_to_xml_element(submodel))
+        submodel.freeze()
+        element = xml_serialization.object_to_xml_element(submodel)
+        self.assertEqual(expected, etree.tostring(element))
+        # Modifying the returned element doesn't affect the cached serialization
+        element.clear()
+        self.assertEqual(expected, etree.tostring(xml_serialization.object_to_xml_element(submodel)))
+
 
 class XMLSerializationSchemaTest(unittest.TestCase):
     @classmethod
@@ -5,7 +5,7 @@
 #
 # SPDX-License-Identifier: MIT
 
-from typing import List
+from typing import List, Optional
 import unittest
 
 from basyx.aas.backend import backends
@@ -14,7 +14,8 @@ from basyx.aas.model import Referable
 
 class ExampleBackend(backends.Backend):
     @classmethod
-    def commit_object(cls, committed_object: Referable, store_object: Referable, relative_path: List[str]) -> None:
+    def commit_object(cls, committed_object: Referable, store_object: Referable, relative_path: List[str],
+                      changed_paths: Optional[List[List[str]]] = None) -> None:
         raise NotImplementedError("This is a mock")
 
     @classmethod
@@ -11,7 +11,7 @@ import urllib.error
 from basyx.aas.backend import couchdb
 from basyx.aas.examples.data.example_aas import *
 
-from test._helper.test_helpers import TEST_CONFIG, COUCHDB_OKAY, COUCHDB_ERROR
+from test._helper.test_helpers import TEST_CONFIG, COUCHDB_OKAY, COUCHDB_ERROR, check_bulk_methods
 
 
 source_core: str = "couchdb://" + TEST_CONFIG["couchdb"]["url"].lstrip("http://") + "/" + \
@@ -169,6 +169,23 @@ class CouchDBBackendTest(unittest.TestCase):
         # Committing after deletion should not raise a conflict error due to removal of the source attribute
         retrieved_submodel.commit()
 
+    def test_bulk(self) -> None:
+        check_bulk_methods(self, self.object_store)
+
+        # Each bulk method sends a single _bulk_docs request (deleting fetches the revisions with another request)
+        example_data = list(create_full_example())
+        with unittest.mock.patch.object(couchdb.CouchDBBackend, "do_request",
+                                        wraps=couchdb.CouchDBBackend.do_request) as do_request:
+            self.object_store.add_many(example_data)
+            self.assertEqual(["_bulk_docs"], [call.args[0].rsplit("/", 1)[1] for call in do_request.call_args_list])
+            do_request.reset_mock()
+            self.object_store.get_many([x.id for x in example_data])
+            self.assertEqual(1, do_request.call_count)
+            do_request.reset_mock()
+            self.object_store.discard_many(example_data)
+            self.assertEqual(["_all_docs", "_bulk_docs"],
+                             [call.args[0].rsplit("/", 1)[1] for call in do_request.call_args_list])
+
     def test_editing(self):
         test_object = create_example_submodel()
         self.object_store.add(test_object)
@@ -12,6 +12,8 @@ import unittest.mock
 from basyx.aas.backend import local_file
 from basyx.aas.examples.data.example_aas import *
 
+from test._helper.test_helpers import check_bulk_methods
+
 
 store_path: str = os.path.dirname(__file__) + "/local_file_test_folder"
 source_core: str = "file://localhost/{}/".format(store_path)
@@ -112,6 +114,18 @@ class LocalFileBackendTest(unittest.TestCase):
         self.assertEqual("'No AAS object with id https://acplt.org/Test_Submodel exists in "
                          "local file database'", str(cm.exception))
 
+    def test_bulk(self) -> None:
+        check_bulk_methods(self, self.object_store)
+
+        # Each bulk method lists the directory once, instead of probing for each file
+        example_data = list(create_full_example())
+        with unittest.mock.patch.object(self.object_store, "_list_hashes",
+                                        wraps=self.object_store._list_hashes) as list_hashes:
+            self.object_store.add_many(example_data)
+            self.assertEqual(5, len(self.object_store.get_many([x.id for x in example_data])))
+            self.object_store.discard_many(example_data)
+        self.assertEqual(3, list_hashes.call_count)
+
     def test_editing(self):
         test_object = create_example_submodel()
         self.object_store.add(test_object)
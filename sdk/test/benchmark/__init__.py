@@ -0,0 +1,8 @@
+"""
+Benchmarks for the BaSyx Python SDK.
+
+The modules in this package are no unittests (and thus not collected by the test runner), but scripts to be run
+manually, e.g. for comparing the performance of different implementations::
+
+    python -m test.benchmark.memory --help
+"""
@@ -0,0 +1,69 @@
+# Copyright (c) 2025 the Eclipse BaSyx Authors
+#
+# This program and the accompanying materials are made available under the terms of the MIT License, available in
+# the LICENSE file of this project.
+#
+# SPDX-License-Identifier: MIT
+"""
+Copy and pickle benchmark: Measures :func:`copy.deepcopy` and pickling of a generated
+:class:`~basyx.aas.model.submodel.Submodel` (see :mod:`test.benchmark.memory`) and of deeply nested
+:class:`SubmodelElementCollections <basyx.aas.model.submodel.SubmodelElementCollection>`, as well as cloning the
+frozen Submodel with :meth:`~basyx.aas.model.submodel.Submodel.clone`::
+
+    python -m test.benchmark.copy_pickle --elements 20000 --depth 2000
+"""
+import argparse
+import copy
+import pickle
+import time
+
+from basyx.aas import model
+from .memory import create_submodel
+
+
+def create_nested_collections(depth: int) -> model.SubmodelElementCollection:
+    root = model.SubmodelElementCollection("Collection0")
+    collection = root
+    for i in range(1, depth):
+        child = model.SubmodelElementCollection("Collection{}".format(i))
+        collection.value.add(child)
+        collection = child
+    return root
+
+
+def measure(label: str, referable: model.Referable) -> None:
+    start_time = time.perf_counter()
+    copy.deepcopy(referable)
+    deepcopy_duration = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    data = pickle.dumps(referable)
+    dumps_duration = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    pickle.loads(data)
+    loads_duration = time.perf_counter() - start_time
+    print("{:<12} {:>14.3f} {:>12.3f} {:>12.3f} {:>14}".format(
+        label, deepcopy_duration, dumps_duration, loads_duration, len(data)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-e", "--elements", type=int, default=20_000,
+                        help="Number of Properties in the generated Submodel")
+    parser.add_argument("-d", "--depth", type=int, default=2_000,
+                        help="Nesting depth of the generated SubmodelElementCollections")
+    args = parser.parse_args()
+
+    print("{:<12} {:>14} {:>12} {:>12} {:>14}".format(
+        "Object", "deepcopy [s]", "dumps [s]", "loads [s]", "pickle [bytes]"))
+    submodel = create_submodel(args.elements)
+    measure("Submodel", submodel)
+    measure("Nested", create_nested_collections(args.depth))
+
+    submodel.freeze()
+    start_time = time.perf_counter()
+    submodel.clone("https://example.com/benchmark/clone", {"Property0": 1})
+    print("Submodel.clone() of the frozen Submodel: {:.3f} s".format(time.perf_counter() - start_time))
+
+
+if __name__ == "__main__":
+    main()
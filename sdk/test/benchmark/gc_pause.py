@@ -0,0 +1,105 @@
+# Copyright (c) 2025 the Eclipse BaSyx Authors
+#
+# This program and the accompanying materials are made available under the terms of the MIT License, available in
+# the LICENSE file of this project.
+#
+# SPDX-License-Identifier: MIT
+"""
+GC pause benchmark: Measures the pauses of Python's cyclic garbage collector caused by a large DictObjectStore.
+
+The store is filled with generated :class:`Submodels <basyx.aas.model.submodel.Submodel>` (see
+:mod:`test.benchmark.memory`). Afterwards, the duration of a full collection is measured and a request-like workload
+is run, while the duration of all garbage collections is recorded. The workload creates short-lived object cycles,
+which need to be collected, by deserializing a serialized Submodel. This is repeated after excluding the store from
+garbage collection with :func:`basyx.aas.util.garbage_collection.freeze`::
+
+    python -m test.benchmark.gc_pause --submodels 100 --elements 10000
+"""
+import argparse
+import gc
+import json
+import time
+from typing import Dict, List
+
+from basyx.aas import model
+from basyx.aas.adapter.json import AASFromJsonDecoder, AASToJsonEncoder
+from basyx.aas.util import garbage_collection
+from .memory import create_submodel
+
+
+class PauseRecorder:
+    """
+    Records the duration of each garbage collection via :data:`gc.callbacks`
+    """
+    def __init__(self) -> None:
+        self.pauses: List[float] = []
+        self._start: float = 0.0
+
+    def __call__(self, phase: str, info: Dict[str, int]) -> None:
+        if phase == "start":
+            self._start = time.perf_counter()
+        else:
+            self.pauses.append(time.perf_counter() - self._start)
+
+    def __enter__(self) -> "PauseRecorder":
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *args) -> None:
+        gc.callbacks.remove(self)
+
+
+def create_store(num_submodels: int, num_elements: int) -> model.DictObjectStore[model.Submodel]:
+    store: model.DictObjectStore[model.Submodel] = model.DictObjectStore()
+    for i in range(num_submodels):
+        submodel = create_submodel(num_elements)
+        submodel.id = "https://example.com/benchmark/submodel/{}".format(i)
+        store.add(submodel)
+    return store
+
+
+def run_workload(store: model.DictObjectStore[model.Submodel], num_requests: int) -> float:
+    submodels = list(store)
+    start_time = time.perf_counter()
+    for i in range(num_requests):
+        json.loads(json.dumps(submodels[i % len(submodels)], cls=AASToJsonEncoder), cls=AASFromJsonDecoder)
+    return time.perf_counter() - start_time
+
+
+def measure(label: str, store: model.DictObjectStore[model.Submodel], num_requests: int) -> None:
+    start_time = time.perf_counter()
+    gc.collect()
+    full_collection = time.perf_counter() - start_time
+    with PauseRecorder() as recorder:
+        duration = run_workload(store, num_requests)
+    pauses = recorder.pauses
+    print("{:<8} {:>18.1f} {:>13.3f} {:>12} {:>17.1f} {:>15.1f}".format(
+        label, full_collection * 1e3, duration, len(pauses), sum(pauses) * 1e3, max(pauses, default=0) * 1e3))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-s", "--submodels", type=int, default=100,
+                        help="Number of Submodels in the generated DictObjectStore")
+    parser.add_argument("-e", "--elements", type=int, default=10_000,
+                        help="Number of Properties in each generated Submodel")
+    parser.add_argument("-r", "--requests", type=int, default=20,
+                        help="Number of Submodels serialized and deserialized by the workload")
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    with garbage_collection.loading(freeze_loaded=False):
+        store = create_store(args.submodels, args.elements)
+    print("Loading time: {:.3f} s, tracked objects: {}".format(time.perf_counter() - start_time,
+                                                               len(gc.get_objects())))
+
+    print("{:<8} {:>18} {:>13} {:>12} {:>17} {:>15}".format(
+        "GC", "full collect [ms]", "workload [s]", "collections", "total pause [ms]", "max pause [ms]"))
+    measure("tracked", store, args.requests)
+    garbage_collection.freeze()
+    measure("frozen", store, args.requests)
+    gc.unfreeze()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# Copyright (c) 2025 the Eclipse BaSyx Authors
+#
+# This program and the accompanying materials are made available under the terms of the MIT License, available in
+# the LICENSE file of this project.
+#
+# SPDX-License-Identifier: MIT
+"""
+Memory benchmark: Measures the memory consumption per SubmodelElement of a large generated Submodel.
+
+Each generated element is a :class:`~basyx.aas.model.submodel.Property` with a semantic id, a value id and a
+:class:`~basyx.aas.model.base.Qualifier` and an :class:`~basyx.aas.model.base.Extension`, so that the numbers
+cover all of the small, but numerous objects of a typical model::
+
+    python -m test.benchmark.memory -n 100000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from basyx.aas import model
+
+
+def _external_reference(value: str) -> model.ExternalReference:
+    return model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, value),))
+
+
+def create_submodel(num_elements: int) -> model.Submodel:
+    submodel = model.Submodel("https://example.com/benchmark/submodel")
+    for i in range(num_elements):
+        submodel.submodel_element.add(model.Property(
+            "Property{}".format(i),
+            model.datatypes.Int,
+            i,
+            value_id=_external_reference("https://example.com/benchmark/value/{}".format(i)),
+            semantic_id=_external_reference("https://example.com/benchmark/semantic/{}".format(i % 100)),
+            qualifier=(model.Qualifier("Qualifier", model.datatypes.Int, i),),
+            extension=(model.Extension("Extension", model.datatypes.String, "value"),),
+        ))
+    return submodel
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-n", "--num-elements", type=int, default=100_000,
+                        help="Number of Properties in the generated Submodel")
+    args = parser.parse_args()
+
+    gc.collect()
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    submodel = create_submodel(args.num_elements)
+    duration = time.perf_counter() - start_time
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print("Elements:            {:>12}".format(len(submodel.submodel_element)))
+    print("Construction time:   {:>12.3f} s".format(duration))
+    print("Allocated memory:    {:>12.1f} MiB".format(current / 2**20))
+    print("Peak memory:         {:>12.1f} MiB".format(peak / 2**20))
+    print("Bytes per element:   {:>12.0f}".format(current / args.num_elements))
+
+
+if __name__ == "__main__":
+    main()
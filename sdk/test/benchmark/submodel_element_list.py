@@ -0,0 +1,69 @@
+# Copyright (c) 2025 the Eclipse BaSyx Authors
+#
+# This program and the accompanying materials are made available under the terms of the MIT License, available in
+# the LICENSE file of this project.
+#
+# SPDX-License-Identifier: MIT
+"""
+SubmodelElementList benchmark: Measures the construction time of large SubmodelElementLists.
+
+The lists are filled with :class:`Properties <basyx.aas.model.submodel.Property>` with the same semantic id, so that
+Constraint AASd-114 needs to be checked for each appended element. Each list size is measured for appending the
+elements one by one and for passing all of them to ``extend()`` at once::
+
+    python -m test.benchmark.submodel_element_list --max-exponent 6
+"""
+import argparse
+import time
+from typing import List
+
+from basyx.aas import model
+
+
+SEMANTIC_ID = model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, "https://example.com/benchmark"),))
+
+
+def create_elements(num_elements: int) -> List[model.Property]:
+    return [model.Property(None, model.datatypes.Int, i, semantic_id=SEMANTIC_ID) for i in range(num_elements)]
+
+
+def create_list() -> model.SubmodelElementList:
+    return model.SubmodelElementList("List", model.Property, value_type_list_element=model.datatypes.Int)
+
+
+def measure_append(num_elements: int) -> float:
+    elements = create_elements(num_elements)
+    list_ = create_list()
+    start_time = time.perf_counter()
+    for element in elements:
+        list_.value.append(element)
+    return time.perf_counter() - start_time
+
+
+def measure_extend(num_elements: int) -> float:
+    elements = create_elements(num_elements)
+    list_ = create_list()
+    start_time = time.perf_counter()
+    list_.value.extend(elements)
+    return time.perf_counter() - start_time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--min-exponent", type=int, default=3,
+                        help="Measure lists starting with 10^MIN_EXPONENT elements")
+    parser.add_argument("--max-exponent", type=int, default=5,
+                        help="Measure lists up to 10^MAX_EXPONENT elements")
+    args = parser.parse_args()
+
+    print("{:>10} {:>12} {:>12} {:>14}".format("Elements", "append [s]", "extend [s]", "append [µs/el]"))
+    for exponent in range(args.min_exponent, args.max_exponent + 1):
+        num_elements = 10 ** exponent
+        append_duration = measure_append(num_elements)
+        extend_duration = measure_extend(num_elements)
+        print("{:>10} {:>12.3f} {:>12.3f} {:>14.2f}".format(num_elements, append_duration, extend_duration,
+                                                            append_duration / num_elements * 1e6))
+
+
+if __name__ == "__main__":
+    main()
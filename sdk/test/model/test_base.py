@@ -5,6 +5,9 @@
 #
 # SPDX-License-Identifier: MIT
 
+import copy
+import gc
+import pickle
 import unittest
 from unittest import mock
 from typing import Callable, Dict, Iterable, List, Optional, Type, TypeVar
@@ -46,6 +49,14 @@ class KeyTest(unittest.TestCase):
         mlp1.id_short = "mlp1"
         self.assertEqual(model.Key(model.KeyTypes.MULTI_LANGUAGE_PROPERTY, "mlp1"), model.Key.from_referable(mlp1))
 
+    def test_copy(self):
+        key = model.Key(model.KeyTypes.SUBMODEL, "urn:x-test:submodel1")
+        self.assertFalse(hasattr(key, "__dict__"))
+        for key_copy in (copy.copy(key), copy.deepcopy(key), pickle.loads(pickle.dumps(key))):
+            self.assertEqual(key, key_copy)
+            with self.assertRaises(AttributeError):
+                key_copy.value = "urn:x-test:submodel2"
+
 
 class ExampleReferable(model.Referable):
     def __init__(self):
@@ -68,12 +79,19 @@ class MockBackend(backends.Backend):
     def commit_object(cls,
                       committed_object: "Referable",  # type: ignore
                       store_object: "Referable",  # type: ignore
-                      relative_path: List[str]) -> None: ...
+                      relative_path: List[str],
+                      changed_paths: Optional[List[List[str]]] = None) -> None: ...
 
     update_object = mock.Mock()
     commit_object = mock.Mock()
 
 
+class PartialCommitMockBackend(MockBackend):
+    supports_partial_commit = True
+    update_object = mock.Mock()
+    commit_object = mock.Mock()
+
+
 class ExampleIdentifiable(model.Identifiable):
     def __init__(self):
         super().__init__()
@@ -201,6 +219,38 @@ class ReferableTest(unittest.TestCase):
         example_referable.update(recursive=False)
         MockBackend.update_object.assert_not_called()
 
+    def test_update_max_age(self):
+        backends.register_backend("mockScheme", MockBackend)
+        example_referable = generate_example_referable_tree()
+        example_grandchild = example_referable.get_referable("exampleChild").get_referable("exampleGrandchild")
+        MockBackend.update_object.reset_mock()
+
+        with mock.patch("time.monotonic", return_value=100.0):
+            example_referable.update(max_age=10)
+        self.assertEqual(MockBackend.update_object.call_count, 2)
+        MockBackend.update_object.reset_mock()
+
+        # Both the referable and its grandchild with its own source are still fresh
+        with mock.patch("time.monotonic", return_value=105.0):
+            example_referable.update(max_age=10)
+        MockBackend.update_object.assert_not_called()
+
+        # Without a staleness budget, the data is always updated
+        with mock.patch("time.monotonic", return_value=105.0):
+            example_referable.update(recursive=False)
+        MockBackend.update_object.assert_called_once()
+        MockBackend.update_object.reset_mock()
+
+        # Only the grandchild is out of date now
+        with mock.patch("time.monotonic", return_value=111.0):
+            example_referable.update(max_age=10)
+        MockBackend.update_object.assert_called_once_with(
+            updated_object=example_grandchild,
+            store_object=example_grandchild,
+            relative_path=[]
+        )
+        MockBackend.update_object.reset_mock()
+
     def test_commit(self):
         backends.register_backend("mockScheme", MockBackend)
         example_referable = generate_example_referable_tree()
@@ -249,6 +299,61 @@ class ReferableTest(unittest.TestCase):
                       relative_path=[])
         ])
 
+    def test_dirty_tracking(self):
+        backends.register_backend("partialMockScheme", PartialCommitMockBackend)
+        example_referable = generate_example_referable_tree()
+        example_grandparent = example_referable.parent.parent
+        example_child = example_referable.get_referable("exampleChild")
+        example_grandchild = example_child.get_referable("exampleGrandchild")
+        example_grandparent.source = "partialMockScheme:exampleGrandparent"
+        example_grandchild.source = ""
+
+        # New objects have never been synchronised
+        self.assertEqual([[]], example_referable.get_dirty_paths())
+        example_referable.commit()
+        PartialCommitMockBackend.commit_object.assert_called_once_with(
+            committed_object=example_referable,
+            store_object=example_grandparent,
+            relative_path=["exampleParent", "exampleReferable"],
+            changed_paths=[["exampleParent", "exampleReferable"]])
+        PartialCommitMockBackend.commit_object.reset_mock()
+        self.assertEqual([], example_referable.get_dirty_paths())
+
+        # Without modifications, the partial commit is skipped
+        example_referable.commit()
+        PartialCommitMockBackend.commit_object.assert_not_called()
+
+        # Modifying an attribute marks the subtree of the object
+        example_grandchild.category = "VARIABLE"
+        self.assertEqual([["exampleChild", "exampleGrandchild"]], example_referable.get_dirty_paths())
+        example_referable.commit()
+        PartialCommitMockBackend.commit_object.assert_called_once_with(
+            committed_object=example_referable,
+            store_object=example_grandparent,
+            relative_path=["exampleParent", "exampleReferable"],
+            changed_paths=[["exampleParent", "exampleReferable", "exampleChild", "exampleGrandchild"]])
+        PartialCommitMockBackend.commit_object.reset_mock()
+
+        # Added Referables are marked on their own, removing a Referable modifies the parent
+        new_child = ExampleRefereableWithNamespace()
+        new_child.id_short = "newChild"
+        namespace_set = example_child.namespace_element_sets[0]
+        namespace_set.add(new_child)
+        self.assertEqual([["exampleChild", "newChild"]], example_referable.get_dirty_paths())
+        example_referable.commit()
+        PartialCommitMockBackend.commit_object.reset_mock()
+        namespace_set.remove(new_child)
+        self.assertEqual([["exampleChild"]], example_referable.get_dirty_paths())
+
+        # Non-detectable modifications can be recorded explicitly
+        example_referable.commit()
+        example_grandchild.mark_dirty()
+        self.assertEqual([["exampleChild", "exampleGrandchild"]], example_referable.get_dirty_paths())
+
+        # Updating from the data source synchronises the object
+        example_referable.update()
+        self.assertEqual([], example_referable.get_dirty_paths())
+
     def test_update_from(self):
         example_submodel = example_aas.create_example_submodel()
         example_relel = example_submodel.get_referable('ExampleRelationshipElement')
@@ -281,6 +386,123 @@ class ReferableTest(unittest.TestCase):
         # Sources of embedded objects should always be updated
         self.assertEqual("scheme:NewRelElSource", example_relel.source)
 
+    def test_update_from_change_summary(self):
+        example_submodel = example_aas.create_example_submodel()
+        example_submodel.commit()
+        example_collection = example_submodel.get_referable("ExampleSubmodelCollection")
+        example_list = example_collection.get_referable("ExampleSubmodelList")
+        example_list_items = list(example_list.value)
+
+        # Identical objects are not modified at all
+        summary = example_submodel.update_from(example_aas.create_example_submodel())
+        self.assertFalse(summary)
+        self.assertEqual([], example_submodel.get_dirty_paths())
+
+        other_submodel = example_aas.create_example_submodel()
+        other_collection = other_submodel.get_referable("ExampleSubmodelCollection")
+        other_collection.get_referable("ExampleSubmodelList").value[1].value = "new value"
+        other_collection.remove_referable("ExampleBlob")
+        other_collection.add_referable(model.Property("NewProperty", model.datatypes.Int, 1))
+        other_submodel.get_referable("ExampleRelationshipElement").add_qualifier(
+            model.Qualifier("NewQualifier", model.datatypes.String))
+
+        summary = example_submodel.update_from(other_submodel)
+        self.assertTrue(summary.structure_changed)
+        self.assertEqual({("ExampleRelationshipElement",): {"qualifier"},
+                          ("ExampleSubmodelCollection", "ExampleSubmodelList", example_list_items[1].id_short):
+                              {"value"}},
+                         summary.modified)
+        self.assertEqual([("ExampleSubmodelCollection", "NewProperty")], summary.added)
+        self.assertEqual([("ExampleSubmodelCollection", "ExampleBlob")], summary.removed)
+        # Elements of the SubmodelElementList are matched by position and keep their identity
+        self.assertEqual(example_list_items, list(example_list.value))
+        self.assertEqual("new value", example_list_items[1].value)
+        self.assertEqual("NewQualifier",
+                         example_submodel.get_referable("ExampleRelationshipElement").get_qualifier_by_type(
+                             "NewQualifier").type)
+        # Only the modified subtrees are marked as dirty. Removing the Blob modifies the collection itself.
+        self.assertEqual([["ExampleRelationshipElement"], ["ExampleSubmodelCollection"]],
+                         example_submodel.get_dirty_paths())
+
+    def test_content_hash(self):
+        example_submodel = example_aas.create_example_submodel()
+        other_submodel = example_aas.create_example_submodel()
+        self.assertEqual(example_submodel.content_hash, other_submodel.content_hash)
+        self.assertIsNotNone(example_submodel._content_hash)
+        example_collection = example_submodel.get_referable("ExampleSubmodelCollection")
+        example_list = example_collection.get_referable("ExampleSubmodelList")
+        collection_hash = example_collection.content_hash
+        relationship_hash = example_submodel.get_referable("ExampleRelationshipElement").content_hash
+
+        # Modifications invalidate the content hashes up the parent chain, but not of the siblings
+        example_list.value[0].value = "new value"
+        self.assertIsNone(example_list._content_hash)
+        self.assertIsNone(example_submodel._content_hash)
+        self.assertIsNotNone(example_submodel.get_referable("ExampleRelationshipElement")._content_hash)
+        self.assertNotEqual(example_submodel.content_hash, other_submodel.content_hash)
+        self.assertNotEqual(collection_hash, example_collection.content_hash)
+        self.assertEqual(relationship_hash, example_submodel.get_referable("ExampleRelationshipElement").content_hash)
+        other_submodel.get_referable("ExampleSubmodelCollection").get_referable("ExampleSubmodelList").value[0].value \
+            = "new value"
+        self.assertEqual(example_submodel.content_hash, other_submodel.content_hash)
+
+        # NamespaceSet operations and Qualifier modifications are detected as well
+        submodel_hash = example_submodel.content_hash
+        qualifier = model.Qualifier("test", model.datatypes.String, "a")
+        example_collection.add_qualifier(qualifier)
+        self.assertNotEqual(submodel_hash, example_submodel.content_hash)
+        qualifier_hash = example_submodel.content_hash
+        qualifier.value = "b"
+        self.assertNotEqual(qualifier_hash, example_submodel.content_hash)
+        example_collection.remove_qualifier_by_type("test")
+        self.assertEqual(submodel_hash, example_submodel.content_hash)
+        blob = example_collection.get_referable("ExampleBlob")
+        example_collection.remove_referable("ExampleBlob")
+        self.assertNotEqual(submodel_hash, example_submodel.content_hash)
+        # The content hash does not depend on the order of unordered NamespaceSets
+        example_collection.add_referable(blob)
+        self.assertEqual(submodel_hash, example_submodel.content_hash)
+
+        # Modifications of value objects and ConstrainedLists are recorded in their owner
+        administration = example_submodel.administration
+        assert administration is not None
+        administration.revision = "77"
+        self.assertIsNone(example_submodel._content_hash)
+        self.assertNotEqual(submodel_hash, example_submodel.content_hash)
+        administration.revision = "0"
+        self.assertEqual(submodel_hash, example_submodel.content_hash)
+        example_submodel.supplemental_semantic_id.append(model.ExternalReference(
+            (model.Key(model.KeyTypes.GLOBAL_REFERENCE, "https://acplt.org/Test_Semantic"),)))
+        self.assertNotEqual(submodel_hash, example_submodel.content_hash)
+        del example_submodel.supplemental_semantic_id[-1]
+        self.assertEqual(submodel_hash, example_submodel.content_hash)
+        example_collection.add_qualifier(qualifier)
+        qualifier.semantic_id = model.ExternalReference(
+            (model.Key(model.KeyTypes.GLOBAL_REFERENCE, "https://acplt.org/Test_Semantic"),))
+        qualifier_hash = example_collection.content_hash
+        qualifier.supplemental_semantic_id.append(qualifier.semantic_id)
+        self.assertNotEqual(qualifier_hash, example_collection.content_hash)
+
+        # A replaced value object is not owned anymore, while a copy is owned by the copied Referable
+        example_submodel.administration = model.AdministrativeInformation(version="1")
+        submodel_hash = example_submodel.content_hash
+        administration.version = "2"
+        self.assertEqual(submodel_hash, example_submodel._content_hash)
+        submodel_copy = copy.deepcopy(example_submodel)
+        assert submodel_copy.administration is not None
+        self.assertIsNot(example_submodel.administration, submodel_copy.administration)
+        submodel_copy.administration.version = "2"
+        self.assertEqual(submodel_hash, example_submodel._content_hash)
+        self.assertNotEqual(submodel_hash, submodel_copy.content_hash)
+
+    def test_update_from_slots(self):
+        prop = model.Property("prop", model.datatypes.Int, 1)
+        other_prop = model.Property("prop", model.datatypes.Int, 2, category="PARAMETER")
+        self.assertFalse(hasattr(prop, "__dict__"))
+        prop.update_from(other_prop)
+        self.assertEqual(2, prop.value)
+        self.assertEqual("PARAMETER", prop.category)
+
     def test_update_commit_qualifier_extension_semantic_id(self):
         submodel = model.Submodel("https://acplt.org/Test_Submodel")
         submodel.update()
@@ -322,6 +544,230 @@ class ReferableTest(unittest.TestCase):
             next(iter(collection.value))
         submodel.commit()
 
+    def test_observer(self):
+        A, C_ADD, C_REM, ID = (model.ModelEventKind.ATTRIBUTE_SET, model.ModelEventKind.CHILD_ADDED,
+                               model.ModelEventKind.CHILD_REMOVED, model.ModelEventKind.ID_CHANGED)
+        prop = model.Property("prop", model.datatypes.Int, 1)
+        qualifier = model.Qualifier("test", model.datatypes.String)
+        lst = model.SubmodelElementList("list", model.Property, value_type_list_element=model.datatypes.Int)
+        collection = model.SubmodelElementCollection("collection", [prop])
+        submodel = model.Submodel("https://acplt.org/Test_Submodel", submodel_element=[collection, lst])
+        events: List[model.ModelEvent] = []
+        submodel.add_observer(events.append)
+
+        prop.value = 2
+        prop.category = "PARAMETER"
+        prop.id_short = "prop2"
+        prop.id_short = "prop2"
+        self.assertEqual([(A, prop, "value", 2, 1), (A, prop, "category", "PARAMETER", None),
+                          (ID, prop, "id_short", "prop2", "prop")], events)
+        self.assertIs(prop, collection.get_referable("prop2"))
+
+        events.clear()
+        collection.remove_referable("prop2")
+        prop.value = 3
+        collection.add_referable(prop)
+        submodel.add_qualifier(qualifier)
+        qualifier.value = "a"
+        submodel.id = "https://acplt.org/Test_Submodel2"
+        self.assertEqual([(C_REM, collection, "value", prop, None), (C_ADD, collection, "value", prop, None),
+                          (C_ADD, submodel, "qualifier", qualifier, None), (A, submodel, "qualifier", qualifier, None),
+                          (ID, submodel, "id", "https://acplt.org/Test_Submodel2", "https://acplt.org/Test_Submodel")],
+                         events)
+
+        events.clear()
+        list_props = [model.Property(None, model.datatypes.Int, i) for i in range(3)]
+        lst.value.extend(list_props[:2])
+        lst.value[0] = list_props[2]
+        del lst.value[:]
+        self.assertEqual([(C_ADD, lst, "value", list_props[0], None), (C_ADD, lst, "value", list_props[1], None),
+                          (C_REM, lst, "value", list_props[0], None), (C_ADD, lst, "value", list_props[2], None),
+                          (C_REM, lst, "value", list_props[1], None), (C_REM, lst, "value", list_props[2], None)],
+                         events)
+
+        # Observers are notified about updates and can be registered on any Referable
+        events.clear()
+        collection_events: List[model.ModelEvent] = []
+        collection.add_observer(collection_events.append)
+        prop.update_from(model.Property("prop2", model.datatypes.Int, 4))
+        self.assertEqual([(A, prop, "value", 4, 3), (A, prop, "category", None, "PARAMETER")], events)
+        self.assertEqual(events, collection_events)
+
+        submodel.remove_observer(events.append)
+        collection.remove_observer(collection_events.append)
+        with self.assertRaises(ValueError):
+            collection.remove_observer(collection_events.append)
+        prop.value = 5
+        self.assertEqual(2, len(events))
+        self.assertEqual({}, model.base._OBSERVERS)
+
+        # Observers don't keep the observed objects alive
+        events.clear()
+        collection_events.clear()
+        collection.add_observer(events.append)
+        del collection, prop, submodel, lst, qualifier, list_props
+        gc.collect()
+        self.assertEqual({}, model.base._OBSERVERS)
+
+    def test_freeze(self):
+        prop = model.Property("prop", model.datatypes.Int, 1,
+                              description=model.MultiLanguageTextType({"en-US": "Property"}),
+                              qualifier=[model.Qualifier("test", model.datatypes.String)])
+        collection = model.SubmodelElementCollection("collection", [prop])
+        lst = model.SubmodelElementList("list", model.Property, value_type_list_element=model.datatypes.Int)
+        submodel = model.Submodel("https://acplt.org/Test_Submodel", submodel_element=[collection, lst])
+        content_hash = submodel.content_hash
+        self.assertFalse(submodel.frozen)
+        self.assertIsNone(submodel._get_frozen_cache())
+
+        submodel.freeze()
+        self.assertTrue(submodel.frozen)
+        self.assertTrue(prop.frozen)
+        self.assertEqual({}, prop._get_frozen_cache())
+        modifications = [
+            lambda: setattr(prop, "value", 2),
+            lambda: setattr(prop, "id_short", "prop2"),
+            lambda: setattr(submodel, "id", "https://acplt.org/Test_Submodel2"),
+            lambda: setattr(prop.qualifier.get_object_by_attribute("type", "test"), "value", "a"),
+            lambda: prop.description.__setitem__("de", "Eigenschaft"),  # type: ignore[union-attr]
+            lambda: prop.supplemental_semantic_id.clear(),
+            lambda: collection.add_referable(model.Property("prop2", model.datatypes.Int)),
+            lambda: collection.remove_referable("prop"),
+            lambda: lst.value.append(model.Property(None, model.datatypes.Int)),
+            lambda: submodel.update_from(model.Submodel("https://acplt.org/Test_Submodel")),
+            lambda: prop.mark_dirty(),
+        ]
+        for modification in modifications:
+            with self.assertRaises(model.FrozenObjectError):
+                modification()
+        self.assertEqual(1, prop.value)
+        self.assertIs(prop, collection.get_referable("prop"))
+        self.assertEqual(content_hash, submodel.content_hash)
+
+        # Frozen objects cannot be moved into another Namespace
+        prop2 = model.Property("prop2", model.datatypes.Int)
+        prop2.freeze()
+        collection2 = model.SubmodelElementCollection("collection2")
+        with self.assertRaises(model.FrozenObjectError):
+            collection2.add_referable(prop2)
+        self.assertEqual(0, len(collection2.value))
+
+        # Bookkeeping is still possible, e.g. for resolving id_short paths
+        self.assertIs(prop, submodel.get_referable(["collection", "prop"]))
+        submodel.commit()
+
+    def test_freeze_value_objects(self):
+        data_specification_content = model.DataSpecificationIEC61360(
+            model.PreferredNameTypeIEC61360({"en": "Test"}),
+            value_list={model.ValueReferencePair("1", model.ExternalReference(
+                (model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:value"),)))})
+        embedded_data_specification = model.EmbeddedDataSpecification(
+            model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:spec"),)),
+            data_specification_content)
+        administration = model.AdministrativeInformation(
+            version="1", revision="0", embedded_data_specifications=[embedded_data_specification])
+        submodel = model.Submodel("urn:x-test:submodel", administration=administration)
+        asset_information = model.AssetInformation(
+            global_asset_id="urn:x-test:asset", default_thumbnail=model.Resource("file:/thumbnail.png"))
+        aas = model.AssetAdministrationShell(asset_information, "urn:x-test:aas")
+        submodel_hash = submodel.content_hash
+        aas_hash = aas.content_hash
+        submodel.freeze()
+        aas.freeze()
+
+        value_reference_pair = next(iter(data_specification_content.value_list))  # type: ignore[arg-type]
+        modifications = [
+            lambda: setattr(administration, "revision", "77"),
+            lambda: setattr(administration, "creator", None),
+            lambda: setattr(embedded_data_specification, "data_specification_content", None),
+            lambda: setattr(data_specification_content, "unit", "m"),
+            lambda: data_specification_content.preferred_name.__setitem__("de", "Test"),
+            lambda: setattr(value_reference_pair, "value", "2"),
+            lambda: setattr(asset_information, "global_asset_id", "urn:x-test:asset2"),
+            lambda: asset_information.specific_asset_id.append(model.SpecificAssetId("serial", "1")),
+            lambda: setattr(asset_information.default_thumbnail, "path", "file:/other.png"),
+            # The value objects of a frozen object cannot be moved into another object
+            lambda: model.Submodel("urn:x-test:submodel2", administration=administration),
+            lambda: setattr(model.AssetAdministrationShell(model.AssetInformation(global_asset_id="urn:x-test:a"),
+                                                           "urn:x-test:aas2"), "asset_information", asset_information),
+        ]
+        for modification in modifications:
+            with self.assertRaises(model.FrozenObjectError):
+                modification()
+        self.assertEqual("0", administration.revision)
+        self.assertIs(submodel, administration._owner[0])  # type: ignore[index]
+        self.assertEqual(submodel_hash, submodel.content_hash)
+        self.assertEqual(aas_hash, aas.content_hash)
+
+        # Copies and objects updated from a frozen object are mutable
+        submodel_copy = copy.deepcopy(submodel)
+        submodel_copy.administration.revision = "1"  # type: ignore[union-attr]
+        specification_copy = submodel_copy.administration.embedded_data_specifications[0]  # type: ignore[union-attr]
+        specification_copy.data_specification_content.unit = "m"  # type: ignore[attr-defined]
+        aas2 = model.AssetAdministrationShell(model.AssetInformation(global_asset_id="urn:x-test:a"), "urn:x-test:aas")
+        aas2.update_from(aas)
+        self.assertIs(aas2, aas2.asset_information._owner[0])  # type: ignore[index]
+        aas2.asset_information.default_thumbnail.path = "file:/other.png"  # type: ignore[union-attr]
+        self.assertEqual("file:/thumbnail.png", asset_information.default_thumbnail.path)  # type: ignore[union-attr]
+        self.assertEqual(aas_hash, aas.content_hash)
+
+    def test_copy(self):
+        submodel = example_aas.create_example_submodel()
+        submodel.qualifier.add(model.Qualifier("test", model.datatypes.String, "value"))
+        collection = submodel.get_referable("ExampleSubmodelCollection")
+        content_hash = submodel.content_hash
+        submodel.freeze()
+        for submodel_copy in (copy.deepcopy(submodel), pickle.loads(pickle.dumps(submodel))):
+            self.assertIsNot(submodel, submodel_copy)
+            self.assertEqual(content_hash, submodel_copy.content_hash)
+            self.assertFalse(submodel_copy.frozen)
+
+            # The NamespaceSets and indexes of the copies are rebuilt
+            collection_copy = submodel_copy.get_referable("ExampleSubmodelCollection")
+            self.assertIsNot(collection, collection_copy)
+            self.assertIs(submodel_copy, collection_copy.parent)
+            self.assertIn(collection_copy, submodel_copy.submodel_element)
+            self.assertEqual([element.id_short for element in collection.value],
+                             [element.id_short for element in collection_copy.value])
+            for element in collection_copy.value:
+                self.assertIs(collection_copy, element.parent)
+                self.assertIs(element, collection_copy.get_referable(element.id_short))
+            qualifier = next(iter(submodel_copy.qualifier))
+            self.assertIs(submodel_copy, qualifier.parent)
+            self.assertIs(qualifier, submodel_copy.get_qualifier_by_type(qualifier.type))
+            with self.assertRaises(model.AASConstraintViolation):
+                submodel_copy.submodel_element.add(model.Property("ExampleSubmodelCollection", model.datatypes.Int))
+            submodel_copy.submodel_element.add(model.Property("NewProperty", model.datatypes.Int))
+            self.assertIs(submodel_copy, submodel_copy.get_referable("NewProperty").parent)
+            self.assertIsNone(submodel.submodel_element.get("id_short", "NewProperty"))
+
+            # Hooks are bound to the copies
+            collection_copy.semantic_id = None
+            with self.assertRaises(model.AASConstraintViolation):
+                collection_copy.supplemental_semantic_id.append(model.ExternalReference(
+                    (model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:supplemental"),)))
+
+        # Copies of a contained Referable don't include its ancestors
+        collection_copy = copy.deepcopy(collection)
+        self.assertIsNone(collection_copy.parent)
+        self.assertEqual(collection.content_hash, collection_copy.content_hash)
+
+        # Objects referenced multiple times are copied once
+        submodel_copy, elements_copy = copy.deepcopy((submodel, list(submodel.submodel_element)))
+        self.assertCountEqual(submodel_copy.submodel_element, elements_copy)
+
+    def test_copy_deep_hierarchy(self):
+        root = model.SubmodelElementCollection("collection0")
+        collection = root
+        for i in range(1, 2000):
+            child = model.SubmodelElementCollection(f"collection{i}")
+            collection.value.add(child)
+            collection = child
+        path = [f"collection{i}" for i in range(1, 2000)]
+        for root_copy in (copy.deepcopy(root), pickle.loads(pickle.dumps(root))):
+            self.assertEqual("collection1999", root_copy.get_referable(path).id_short)
+            self.assertIsNot(collection, root_copy.get_referable(path))
+
 
 class ExampleNamespaceReferable(model.UniqueIdShortNamespace, model.UniqueSemanticIdNamespace, model.Identifiable):
     def __init__(self, values=()):
@@ -614,6 +1060,50 @@ class ModelNamespaceTest(unittest.TestCase):
 
         self.namespace.get_referable(["List1", "0", "Prop1"])
 
+    def test_id_short_path_cache(self) -> None:
+        prop1 = model.Property("Prop1", model.datatypes.Int)
+        prop2 = model.Property(None, model.datatypes.Int)
+        prop3 = model.Property(None, model.datatypes.Int)
+        list_ = model.SubmodelElementList("List", model.Property, [prop2],
+                                          value_type_list_element=model.datatypes.Int)
+        collection = model.SubmodelElementCollection("Collection", [prop1, list_])
+        submodel = model.Submodel("urn:x-test:submodel", [collection])
+        self.assertTrue(submodel.path_cache_enabled)
+
+        self.assertIs(prop1, submodel.get_referable(["Collection", "Prop1"]))
+        self.assertIs(prop2, submodel.get_referable(("Collection", "List", "0")))
+        assert submodel._path_cache is not None
+        self.assertEqual({("Collection", "Prop1"): prop1, ("Collection", "List", "0"): prop2},
+                         {path: entry[0] for path, entry in submodel._path_cache.items()})
+
+        # Structural changes anywhere on the path invalidate the cache, but only increment the generation of the
+        # modified Namespace itself
+        generation = submodel.structure_generation
+        list_generation = list_.structure_generation
+        list_.value.insert(0, prop3)
+        self.assertEqual(generation, submodel.structure_generation)
+        self.assertGreater(list_.structure_generation, list_generation)
+        self.assertIs(prop3, submodel.get_referable(["Collection", "List", "0"]))
+        self.assertIs(prop2, submodel.get_referable(["Collection", "List", "1"]))
+
+        prop1.id_short = "Prop4"
+        with self.assertRaises(KeyError):
+            submodel.get_referable(["Collection", "Prop1"])
+        self.assertIs(prop1, submodel.get_referable(["Collection", "Prop4"]))
+
+        submodel.submodel_element.remove(collection)
+        with self.assertRaises(KeyError):
+            submodel.get_referable(["Collection", "Prop4"])
+        # Changes in a detached subtree don't affect the former parent
+        generation = submodel.structure_generation
+        collection.value.remove(prop1)
+        self.assertEqual(generation, submodel.structure_generation)
+
+        # Without the cache, paths are resolved just the same
+        collection.path_cache_enabled = False
+        self.assertIs(prop3, collection.get_referable(["List", "0"]))
+        self.assertIsNone(collection._path_cache)
+
     def test_renaming(self) -> None:
         self.namespace.set2.add(self.prop1)
         self.namespace.set2.add(self.prop2)
@@ -700,6 +1190,88 @@ class ModelNamespaceTest(unittest.TestCase):
                          "SubmodelElementCollection[foo] (Constraint AASd-117)", str(cm.exception))
         property.id_short = "bar"
 
+    def test_add_many(self) -> None:
+        self.namespace.set2.add_many([self.prop1, self.prop6])
+        self.assertEqual(2, len(self.namespace.set2))
+        self.assertIs(self.namespace, self.prop1.parent)
+        self.assertIs(self.prop6, self.namespace.set2.get("id_short", "Prop4"))
+
+        # Collision within the batch
+        with self.assertRaises(model.AASConstraintViolation) as cm:
+            self.namespace.set2.add_many([self.prop3, self.prop8])
+        self.assertEqual("Object with attribute (name='id_short', value='ProP2') is already present in this set of "
+                         "objects (Constraint AASd-022)", str(cm.exception))
+        self.assertEqual(2, len(self.namespace.set2))
+        self.assertIsNone(self.prop3.parent)
+        self.assertIsNone(self.prop8.parent)
+
+        # Collision with an element of another set of the namespace
+        self.namespace.set1.add(self.prop7)
+        with self.assertRaises(model.AASConstraintViolation) as cm:
+            self.namespace.set2.add_many([self.prop5, self.prop3])
+        self.assertEqual("Object with attribute (name='id_short', value='Prop2') is already present in another set in "
+                         "the same namespace (Constraint AASd-022)", str(cm.exception))
+        self.assertEqual(2, len(self.namespace.set2))
+        self.assertNotIn(self.prop5, self.namespace.set2)
+        self.assertIsNone(self.prop5.parent)
+
+        namespace2 = self._namespace_class()
+        with self.assertRaises(ValueError):
+            namespace2.set2.add_many([self.prop5, self.prop1])
+        self.assertEqual(0, len(namespace2.set2))
+        self.assertIsNone(self.prop5.parent)
+
+    def test_id_short_index(self) -> None:
+        prop1 = model.Property("Prop1", model.datatypes.Int)
+        prop2 = model.Property("Prop2", model.datatypes.Int)
+        prop3 = model.Property("Prop3", model.datatypes.Int)
+        operation = model.Operation("Operation", input_variable=[prop1], output_variable=[prop2])
+        self.assertEqual({"Prop1": prop1, "Prop2": prop2}, operation._id_short_index)
+        self.assertIs(prop2, operation.get_referable("Prop2"))
+
+        with self.assertRaises(model.AASConstraintViolation) as cm:
+            operation.in_output_variable.add(model.Property("Prop1", model.datatypes.Int))
+        self.assertEqual("Object with attribute (name='id_short', value='Prop1') is already present in another set in "
+                         "the same namespace (Constraint AASd-022)", str(cm.exception))
+        with self.assertRaises(model.AASConstraintViolation) as cm:
+            operation.input_variable.add(model.Property("Prop1", model.datatypes.Int))
+        self.assertEqual("Object with attribute (name='id_short', value='Prop1') is already present in this set of "
+                         "objects (Constraint AASd-022)", str(cm.exception))
+
+        prop1.id_short = "Prop4"
+        self.assertEqual({"Prop4": prop1, "Prop2": prop2}, operation._id_short_index)
+        operation.in_output_variable.add(prop3)
+        operation.output_variable.pop()
+        operation.input_variable.remove(prop1)
+        self.assertEqual({"Prop3": prop3}, operation._id_short_index)
+        operation.in_output_variable.clear()
+        self.assertEqual({}, operation._id_short_index)
+        with self.assertRaises(KeyError):
+            operation.get_referable("Prop3")
+
+        # Objects in case-insensitive NamespaceSets are found by their exact id_short via the index, but also
+        # case-insensitively
+        self.namespace.set2.add(self.prop1)
+        self.assertIs(self.prop1, self.namespace.get_referable("Prop1"))
+        self.assertIs(self.prop1, self.namespace.get_referable("PROP1"))
+
+    def test_add_many_rollback(self) -> None:
+        list_ = model.SubmodelElementList("List", model.Property, value_type_list_element=model.datatypes.Int)
+        list_.value.add(model.Property(None, model.datatypes.Int, 1))
+        prop1 = model.Property(None, model.datatypes.Int, 2)
+        prop2 = model.Property(None, model.datatypes.String, "foo")
+        with self.assertRaises(model.AASConstraintViolation) as cm:
+            list_.value.add_many([prop1, prop2])
+        self.assertEqual(109, cm.exception.constraint_id)
+        self.assertEqual(1, len(list_.value))
+        for prop in (prop1, prop2):
+            self.assertIsNone(prop.id_short)
+            self.assertIsNone(prop.parent)
+
+        list_.value.extend([prop1, model.Property(None, model.datatypes.Int, 3)])
+        self.assertEqual([1, 2, 3], [prop.value for prop in list_.value])
+        self.assertIs(list_, prop1.parent)
+
 
 class ExampleOrderedNamespace(model.UniqueIdShortNamespace, model.UniqueSemanticIdNamespace, model.Identifiable):
     def __init__(self, values=()):
@@ -760,6 +1332,75 @@ class ModelOrderedNamespaceTest(ModelNamespaceTest):
                          f"{self._namespace_class.__name__}[{self.namespace.id}]'",  # type: ignore[has-type]
                          str(cm2.exception))
 
+    def test_OrderedNamespace_positions(self) -> None:
+        props = [model.Property(f"Position{i}", model.datatypes.Int, semantic_id=model.ExternalReference(
+            (model.Key(model.KeyTypes.GLOBAL_REFERENCE, f"http://acplt.org/Position{i}"),))) for i in range(5)]
+        self.namespace.set2.extend(props[:3])
+        self.namespace.set2.insert(1, props[3])
+        self.namespace.set2.insert(-1, props[4])
+        self.assertEqual([props[0], props[3], props[1], props[4], props[2]], list(self.namespace.set2))
+        self.assertEqual([props[2], props[4], props[1], props[3], props[0]], list(reversed(self.namespace.set2)))
+        self.assertEqual(3, self.namespace.set2.index(props[4]))
+        self.assertEqual(3, self.namespace.set2.index(props[4], 2, -1))
+        # Bounds are clamped to the sequence, like by list.index()
+        self.assertEqual(3, self.namespace.set2.index(props[4], -7, 7))
+        with self.assertRaises(ValueError):
+            self.namespace.set2.index(props[4], 4)
+        with self.assertRaises(ValueError):
+            self.namespace.set2.index(props[4], -7, -7)
+        with self.assertRaises(ValueError):
+            self.namespace.set2.index(self.prop1)
+
+        self.namespace.set2[1:4] = [self.prop1, self.prop6]
+        self.assertEqual([props[0], self.prop1, self.prop6, props[2]], list(self.namespace.set2))
+        for prop in (props[1], props[3], props[4]):
+            self.assertIsNone(prop.parent)
+        del self.namespace.set2[::2]
+        self.assertEqual([self.prop1, props[2]], list(self.namespace.set2))
+        self.assertIsNone(props[0].parent)
+        self.assertIsNone(self.prop6.parent)
+
+
+class BlockSequenceTest(unittest.TestCase):
+    def test_list_semantics(self) -> None:
+        # Use a small block size to test splitting and rebalancing of blocks
+        with mock.patch.object(model.base._BlockSequence, "_BLOCK_SIZE", 4):
+            sequence: model.base._BlockSequence[object] = model.base._BlockSequence()
+            reference: List[object] = []
+            objects = [object() for _ in range(200)]
+            for i, obj in enumerate(objects):
+                position = (i * 7) % (len(reference) + 1) - (i % 3)
+                sequence.insert(position, obj)
+                reference.insert(position, obj)
+            self.assertEqual(reference, list(sequence))
+            self.assertEqual(list(reversed(reference)), list(reversed(sequence)))
+            for obj in objects:
+                self.assertEqual(reference.index(obj), sequence.index(obj))
+            for i in range(-len(reference), len(reference)):
+                self.assertIs(reference[i], sequence[i])
+            self.assertEqual(reference[10:50:3], sequence[10:50:3])
+
+            sequence[5] = reference[5] = object()
+            self.assertEqual(reference.index(reference[5]), sequence.index(reference[5]))
+            while len(reference) > 3:
+                position = (len(reference) * 5 + 3) % len(reference)
+                self.assertIs(reference.pop(position), sequence.pop(position))
+            self.assertEqual(reference, list(sequence))
+            self.assertEqual(3, len(sequence))
+            for obj in reference:
+                self.assertEqual(reference.index(obj), sequence.index(obj))
+
+            with self.assertRaises(IndexError):
+                sequence[3]
+            with self.assertRaises(ValueError):
+                sequence.index(object())
+            sequence.remove(reference[1])
+            self.assertEqual([reference[0], reference[2]], list(sequence))
+            sequence.clear()
+            self.assertEqual([], list(sequence))
+            with self.assertRaises(IndexError):
+                sequence.pop()
+
 
 class ExternalReferenceTest(unittest.TestCase):
     def test_constraints(self):
@@ -870,6 +1511,18 @@ class ModelReferenceTest(unittest.TestCase):
                 (model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:x"),))
         self.assertEqual('Reference is immutable', str(cm.exception))
 
+    def test_copy(self):
+        ref = model.ModelReference((model.Key(model.KeyTypes.SUBMODEL, "urn:x-test:x"),
+                                    model.Key(model.KeyTypes.PROPERTY, "test")),
+                                   model.Property,
+                                   model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE,
+                                                                      "urn:x-test:semantic"),)))
+        self.assertFalse(hasattr(ref, "__dict__"))
+        for ref_copy in (copy.copy(ref), copy.deepcopy(ref), pickle.loads(pickle.dumps(ref))):
+            self.assertEqual(ref, ref_copy)
+            self.assertIs(model.Property, ref_copy.type)
+            self.assertEqual(ref.referred_semantic_id, ref_copy.referred_semantic_id)
+
     def test_equality(self):
         ref = model.ModelReference((model.Key(model.KeyTypes.SUBMODEL, "urn:x-test:x"),),
                                    model.Submodel)
@@ -1044,6 +1697,51 @@ class ModelReferenceTest(unittest.TestCase):
         self.assertIs(ref4.type, model.Referable)
 
 
+class ReferencePoolTest(unittest.TestCase):
+    def test_intern(self) -> None:
+        pool = model.ReferencePool()
+        ref1 = model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:x"),))
+        ref2 = model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:x"),))
+        self.assertIs(ref1, pool.intern_reference(ref1))
+        self.assertIs(ref1, pool.intern_reference(ref2))
+        self.assertIs(ref1.key[0], pool.intern_key(model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:x")))
+
+        # Keys of new references are interned as well
+        ref3 = model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:x"),
+                                        model.Key(model.KeyTypes.FRAGMENT_REFERENCE, "fragment")))
+        self.assertIs(ref3, pool.intern_reference(ref3))
+        self.assertIs(ref1.key[0], ref3.key[0])
+
+        # ModelReferences of different type must not be merged, although they are considered equal
+        model_ref1 = model.ModelReference((model.Key(model.KeyTypes.SUBMODEL, "urn:x-test:x"),), model.Submodel)
+        model_ref2 = model.ModelReference((model.Key(model.KeyTypes.SUBMODEL, "urn:x-test:x"),),
+                                          model.Referable)  # type: ignore[type-abstract]
+        self.assertEqual(model_ref1, model_ref2)
+        self.assertIs(model_ref1, pool.intern_reference(model_ref1))
+        self.assertIs(model_ref2, pool.intern_reference(model_ref2))
+
+        # References with different referred_semantic_id must not be merged
+        ref4 = model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:x"),), ref3)
+        self.assertIs(ref4, pool.intern_reference(ref4))
+        self.assertIsNot(ref1, pool.intern_reference(ref4))
+
+    def test_weak_references(self) -> None:
+        pool = model.ReferencePool()
+        ref = pool.intern_reference(model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE,
+                                                                       "urn:x-test:x"),)))
+        self.assertEqual(1, len(pool._references))
+        del ref
+        gc.collect()
+        self.assertEqual(0, len(pool._references))
+        self.assertEqual(0, len(pool._keys))
+
+    def test_hash(self) -> None:
+        ref1 = model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:x"),))
+        ref2 = model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:x"),))
+        self.assertEqual(hash(ref1), hash(ref2))
+        self.assertEqual(hash(ref1), hash(ref1))
+
+
 class AdministrativeInformationTest(unittest.TestCase):
 
     def test_setting_version_revision(self) -> None:
@@ -1334,3 +2032,50 @@ class LangStringSetTest(unittest.TestCase):
             items[ltag] = text
         self.assertEqual(count, 2)
         self.assertEqual(items, {"fo": "bar", "aa": "baz"})
+
+
+class TrustedLoadTest(unittest.TestCase):
+    def test_trusted_load(self) -> None:
+        with model.trusted_load():
+            prop = model.Property("1_invalid", model.datatypes.String, display_name=model.MultiLanguageNameType(
+                {"EN": "a" * 100}))
+            reference = model.ExternalReference((model.Key(model.KeyTypes.SUBMODEL, ""),))
+            sm_list = model.SubmodelElementList("list", model.Property,
+                                                [model.Property(None, model.datatypes.String)])
+            entity = model.Entity("entity", model.EntityType.SELF_MANAGED_ENTITY)
+            # Structural checks are still performed
+            with self.assertRaises(model.AASConstraintViolation) as cm:
+                model.SubmodelElementCollection("collection", [model.Property("a", model.datatypes.String),
+                                                               model.Property("a", model.datatypes.String)])
+            self.assertEqual(22, cm.exception.constraint_id)
+        self.assertEqual("1_invalid", prop.id_short)
+
+        # Checks are performed again outside the context
+        with self.assertRaises(model.AASConstraintViolation):
+            prop.id_short = "2_invalid"
+
+        with self.assertRaises(model.AASConstraintViolation) as cm:
+            model.validate(prop)
+        self.assertEqual(2, cm.exception.constraint_id)
+        prop.id_short = "valid"
+        with self.assertRaises(ValueError) as cm_value:
+            model.validate(prop)
+        self.assertIn("language tag", str(cm_value.exception))
+        with self.assertRaises(model.AASConstraintViolation) as cm:
+            model.validate(reference)
+        self.assertEqual(122, cm.exception.constraint_id)
+        with self.assertRaises(model.AASConstraintViolation) as cm:
+            model.validate(sm_list)
+        self.assertEqual(109, cm.exception.constraint_id)
+        with self.assertRaises(model.AASConstraintViolation) as cm:
+            model.validate(entity)
+        self.assertEqual(14, cm.exception.constraint_id)
+
+        # Contained objects are validated as well, even within the context
+        submodel = model.Submodel("https://acplt.org/Test_Submodel", submodel_element=[entity])
+        with model.trusted_load(), self.assertRaises(model.AASConstraintViolation) as cm:
+            model.validate(submodel)
+        self.assertEqual(14, cm.exception.constraint_id)
+
+        for identifiable in example_aas.create_full_example():
+            model.validate(identifiable)
@@ -5,7 +5,9 @@
 #
 # SPDX-License-Identifier: MIT
 
+import copy
 import unittest
+from typing import Dict, Iterable, Iterator, List
 
 from basyx.aas import model
 
@@ -55,6 +57,120 @@ class ProvidersTest(unittest.TestCase):
         self.assertIsInstance(object_store1, model.DictObjectStore)
         self.assertIn(self.aas2, object_store1)
 
+    def test_store_bulk(self) -> None:
+        object_store: model.DictObjectStore[model.AssetAdministrationShell] = model.DictObjectStore()
+        object_store.add_many([self.aas1])
+        self.assertEqual({"urn:x-test:aas1": self.aas1}, object_store.get_many(["urn:x-test:aas1", "urn:x-test:aas2"]))
+        aas3 = model.AssetAdministrationShell(model.AssetInformation(global_asset_id="http://acplt.org/TestAsset/"),
+                                              "urn:x-test:aas1")
+        with self.assertRaises(KeyError) as cm:
+            object_store.add_many([aas3, self.aas2])
+        self.assertEqual("'Identifiable objects with ids urn:x-test:aas1 are already stored in this store'",
+                         str(cm.exception))
+        # The other objects are added nonetheless
+        self.assertEqual({self.aas1, self.aas2}, set(object_store))
+        object_store.discard_many([self.aas1, self.aas2, aas3])
+        self.assertEqual(0, len(object_store))
+
+    def test_indexed_store_id_change(self) -> None:
+        object_store: model.IndexedObjectStore[model.Submodel] = model.IndexedObjectStore([self.submodel1])
+        other_store: model.IndexedObjectStore[model.Submodel] = model.IndexedObjectStore([self.submodel1])
+        object_store.add(self.submodel1)
+        object_store.add(self.submodel2)
+        self.assertEqual(2, len(object_store))
+
+        self.submodel1.id = "urn:x-test:submodel3"
+        for store in (object_store, other_store):
+            self.assertIs(self.submodel1, store.get_identifiable("urn:x-test:submodel3"))
+            self.assertNotIn("urn:x-test:submodel1", store)
+            self.assertIn(self.submodel1, store)
+
+        with self.assertRaises(KeyError) as cm:
+            self.submodel1.id = "urn:x-test:submodel2"
+        self.assertEqual("'Identifiable object with same id urn:x-test:submodel2 is already "
+                         "stored in this store'", str(cm.exception))
+        self.assertEqual("urn:x-test:submodel3", self.submodel1.id)
+        self.assertIs(self.submodel1, object_store.get_identifiable("urn:x-test:submodel3"))
+
+        # Changes by update_from() are tracked as well
+        self.submodel1.update_from(model.Submodel("urn:x-test:submodel4"))
+        self.assertIs(self.submodel1, object_store.get_identifiable("urn:x-test:submodel4"))
+        self.assertIs(self.submodel1, other_store.get_identifiable("urn:x-test:submodel4"))
+
+        # Discarded objects don't notify the store anymore
+        object_store.discard(self.submodel1)
+        self.submodel1.id = "urn:x-test:submodel2"
+        self.assertIs(self.submodel2, object_store.get_identifiable("urn:x-test:submodel2"))
+        self.assertIs(self.submodel1, other_store.get_identifiable("urn:x-test:submodel2"))
+        self.assertEqual(1, len(object_store))
+
+        # The stores are neither part of the object's content nor of its copies
+        copied = copy.deepcopy(self.submodel1)
+        self.assertEqual(self.submodel1.content_hash, copied.content_hash)
+        copied.id = "urn:x-test:submodel5"
+        self.assertNotIn("urn:x-test:submodel5", other_store)
+
+    def test_indexed_store_find(self) -> None:
+        semantic_id = model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:semantic"),))
+        self.submodel1.id_short = "Submodel"
+        self.submodel2.semantic_id = semantic_id
+        self.aas1.asset_information.specific_asset_id.append(model.SpecificAssetId("serial", "1"))
+        objects = (self.aas1, self.aas2, self.submodel1, self.submodel2)
+        indexed_store: model.IndexedObjectStore[model.Identifiable] = model.IndexedObjectStore(
+            objects, model.BUILTIN_INDEXES)
+        dict_store: model.DictObjectStore[model.Identifiable] = model.DictObjectStore(objects)
+
+        for object_store in (indexed_store, dict_store):
+            self.assertEqual([self.aas1, self.aas2],
+                             list(object_store.find(model.TYPE_INDEX, model.AssetAdministrationShell)))
+            self.assertEqual(objects, tuple(object_store.find(model.TYPE_INDEX, model.Identifiable)))
+            self.assertEqual([self.submodel1], list(object_store.find(model.ID_SHORT_INDEX, "Submodel")))
+            self.assertEqual([self.submodel2], list(object_store.find(model.SEMANTIC_ID_INDEX, semantic_id)))
+            self.assertEqual([self.aas2], list(object_store.find(model.GLOBAL_ASSET_ID_INDEX,
+                                                                 "http://acplt.org/TestAsset2/")))
+            self.assertEqual([self.aas1], list(object_store.find(model.SPECIFIC_ASSET_ID_INDEX,
+                                                                 model.SpecificAssetId("serial", "1"))))
+
+        # The indexes are updated on assignment, also by update_from(), and on discard
+        self.submodel1.id_short = "Renamed"
+        self.assertEqual([], list(indexed_store.find(model.ID_SHORT_INDEX, "Submodel")))
+        self.assertEqual([self.submodel1], list(indexed_store.find(model.ID_SHORT_INDEX, "Renamed")))
+        self.aas2.update_from(model.AssetAdministrationShell(
+            model.AssetInformation(global_asset_id="http://acplt.org/TestAsset3/"), "urn:x-test:aas2"))
+        self.assertEqual([], list(indexed_store.find(model.GLOBAL_ASSET_ID_INDEX, "http://acplt.org/TestAsset2/")))
+        self.assertEqual([self.aas2], list(indexed_store.find(model.GLOBAL_ASSET_ID_INDEX,
+                                                              "http://acplt.org/TestAsset3/")))
+        indexed_store.discard(self.submodel2)
+        self.assertEqual([], list(indexed_store.find(model.SEMANTIC_ID_INDEX, semantic_id)))
+        self.assertEqual([self.submodel1], list(indexed_store.find(model.TYPE_INDEX, model.Submodel)))
+
+        # Modifications of the AssetInformation of a shell are noticed as well
+        self.aas1.asset_information.global_asset_id = "urn:x-test:asset:new"
+        self.assertEqual([self.aas1], list(indexed_store.find(model.GLOBAL_ASSET_ID_INDEX, "urn:x-test:asset:new")))
+        self.aas1.asset_information.specific_asset_id.append(model.SpecificAssetId("serial", "2"))
+        self.assertEqual([self.aas1], list(indexed_store.find(model.SPECIFIC_ASSET_ID_INDEX,
+                                                              model.SpecificAssetId("serial", "2"))))
+        del self.aas1.asset_information.specific_asset_id[0]
+        self.assertEqual([], list(indexed_store.find(model.SPECIFIC_ASSET_ID_INDEX,
+                                                     model.SpecificAssetId("serial", "1"))))
+        replaced_asset_information = self.aas1.asset_information
+        self.aas1.asset_information = model.AssetInformation(global_asset_id="urn:x-test:asset:replaced")
+        replaced_asset_information.global_asset_id = "urn:x-test:asset:detached"
+        self.assertEqual([], list(indexed_store.find(model.GLOBAL_ASSET_ID_INDEX, "urn:x-test:asset:detached")))
+        self.assertEqual([self.aas1], list(indexed_store.find(model.GLOBAL_ASSET_ID_INDEX,
+                                                              "urn:x-test:asset:replaced")))
+
+        self.assertEqual([], list(indexed_store.find(model.SPECIFIC_ASSET_ID_INDEX,
+                                                     model.SpecificAssetId("serial", "2"))))
+        indexed_store.reindex(self.aas1)
+        self.assertEqual([self.aas1], list(indexed_store.find(model.GLOBAL_ASSET_ID_INDEX,
+                                                              "urn:x-test:asset:replaced")))
+        with self.assertRaises(KeyError):
+            indexed_store.reindex(self.submodel2)
+
+        # Indexes, which are not maintained by the store, are checked for each object
+        self.assertEqual([self.aas1], list(indexed_store.find(model.AttributeIndex("id"), "urn:x-test:aas1")))
+
     def test_provider_multiplexer(self) -> None:
         aas_object_store: model.DictObjectStore[model.AssetAdministrationShell] = model.DictObjectStore()
         aas_object_store.add(self.aas1)
@@ -69,3 +185,290 @@ class ProvidersTest(unittest.TestCase):
         with self.assertRaises(KeyError) as cm:
             multiplexer.get_identifiable("urn:x-test:submodel3")
         self.assertEqual("'Identifier could not be found in any of the 2 consulted registries.'", str(cm.exception))
+
+
+class CountingObjectProvider(model.AbstractObjectProvider):
+    def __init__(self, object_store: model.AbstractObjectStore):
+        self.object_store = object_store
+        self.requests = 0
+
+    def get_identifiable(self, identifier: model.Identifier) -> model.Identifiable:
+        self.requests += 1
+        return self.object_store.get_identifiable(identifier)
+
+
+class ObjectProviderMultiplexerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.submodel1 = model.Submodel("urn:x-test:submodel1")
+        self.submodel2 = model.Submodel("urn:x-test:submodel2")
+        self.store1: model.DictObjectStore[model.Submodel] = model.DictObjectStore([self.submodel1])
+        self.store2: model.DictObjectStore[model.Submodel] = model.DictObjectStore([self.submodel2])
+        self.provider1 = CountingObjectProvider(self.store1)
+        self.provider2 = CountingObjectProvider(self.store2)
+
+    def test_routing(self) -> None:
+        multiplexer = model.ObjectProviderMultiplexer([self.provider1, self.provider2], route_cache_size=1)
+        for _ in range(3):
+            self.assertIs(self.submodel2, multiplexer.get_identifiable("urn:x-test:submodel2"))
+        self.assertEqual((1, 3), (self.provider1.requests, self.provider2.requests))
+
+        # The routing table is bounded
+        self.assertIs(self.submodel1, multiplexer.get_identifiable("urn:x-test:submodel1"))
+        self.assertIs(self.submodel2, multiplexer.get_identifiable("urn:x-test:submodel2"))
+        self.assertEqual((3, 4), (self.provider1.requests, self.provider2.requests))
+
+        # Stale routes fall back to querying all providers
+        self.store2.discard(self.submodel2)
+        self.store1.add(self.submodel2)
+        self.assertIs(self.submodel2, multiplexer.get_identifiable("urn:x-test:submodel2"))
+        self.assertEqual((4, 5), (self.provider1.requests, self.provider2.requests))
+
+    def test_negative_cache(self) -> None:
+        multiplexer = model.ObjectProviderMultiplexer([self.provider1, self.provider2], negative_cache_ttl=3600)
+        for _ in range(3):
+            with self.assertRaises(KeyError) as cm:
+                multiplexer.get_identifiable("urn:x-test:submodel3")
+            # Cached misses raise the same error as the first one
+            self.assertEqual("'Identifier could not be found in any of the 2 consulted registries.'",
+                             str(cm.exception))
+        self.assertEqual((1, 1), (self.provider1.requests, self.provider2.requests))
+        multiplexer.invalidate("urn:x-test:submodel3")
+        with self.assertRaises(KeyError):
+            multiplexer.get_identifiable("urn:x-test:submodel3")
+        self.assertEqual((2, 2), (self.provider1.requests, self.provider2.requests))
+
+        multiplexer.negative_cache_ttl = 0.0
+        multiplexer.invalidate()
+        with self.assertRaises(KeyError):
+            multiplexer.get_identifiable("urn:x-test:submodel3")
+        with self.assertRaises(KeyError):
+            multiplexer.get_identifiable("urn:x-test:submodel3")
+        self.assertEqual((4, 4), (self.provider1.requests, self.provider2.requests))
+
+    def test_store_invalidation(self) -> None:
+        multiplexer = model.ObjectProviderMultiplexer([self.store1, self.store2], negative_cache_ttl=3600)
+        with self.assertRaises(KeyError):
+            multiplexer.get_identifiable("urn:x-test:submodel3")
+        submodel3 = model.Submodel("urn:x-test:submodel3")
+        self.store2.add(submodel3)
+        self.assertIs(submodel3, multiplexer.get_identifiable("urn:x-test:submodel3"))
+        # The first provider wins, once its object is added
+        other_submodel3 = model.Submodel("urn:x-test:submodel3")
+        self.store1.add(other_submodel3)
+        self.assertIs(other_submodel3, multiplexer.get_identifiable("urn:x-test:submodel3"))
+
+    def test_invalidation_while_querying(self) -> None:
+        multiplexer = model.ObjectProviderMultiplexer([self.store2, self.provider1], negative_cache_ttl=3600)
+        submodel3 = model.Submodel("urn:x-test:submodel3")
+
+        # Simulates another thread adding the object to the first store, after it has been queried
+        def get_identifiable(identifier: model.Identifier) -> model.Identifiable:
+            self.store2.add(submodel3)
+            raise KeyError(identifier)
+        self.provider1.get_identifiable = get_identifiable  # type: ignore[method-assign]
+        with self.assertRaises(KeyError):
+            multiplexer.get_identifiable("urn:x-test:submodel3")
+        # The miss is not remembered, since the object has been added in the meantime
+        self.assertIs(submodel3, multiplexer.get_identifiable("urn:x-test:submodel3"))
+
+    def test_concurrent(self) -> None:
+        other_submodel2 = model.Submodel("urn:x-test:submodel2")
+        store3: model.DictObjectStore[model.Submodel] = model.DictObjectStore([other_submodel2])
+        multiplexer = model.ObjectProviderMultiplexer([self.store1, self.store2, store3], max_workers=3)
+        try:
+            self.assertIs(self.submodel1, multiplexer.get_identifiable("urn:x-test:submodel1"))
+            self.assertIs(self.submodel2, multiplexer.get_identifiable("urn:x-test:submodel2"))
+            with self.assertRaises(KeyError):
+                multiplexer.get_identifiable("urn:x-test:submodel3")
+        finally:
+            multiplexer.close()
+
+
+class CountingObjectStore(model.IndexedObjectStore[model.Identifiable]):
+    requests = 0
+    iterations = 0
+
+    def __iter__(self) -> Iterator[model.Identifiable]:
+        self.iterations += 1
+        return super().__iter__()
+
+    def get_identifiable(self, identifier: model.Identifier) -> model.Identifiable:
+        self.requests += 1
+        return super().get_identifiable(identifier)
+
+    def get_many(self, identifiers: Iterable[model.Identifier]) -> Dict[model.Identifier, model.Identifiable]:
+        self.requests += 1
+        return {identifier: self._backend[identifier] for identifier in identifiers if identifier in self._backend}
+
+
+class CachingObjectStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.submodels = [model.Submodel("urn:x-test:submodel{}".format(i)) for i in range(3)]
+        self.backing_store = CountingObjectStore(self.submodels)
+
+    def test_lru(self) -> None:
+        object_store = model.CachingObjectStore(self.backing_store, max_entries=2)
+        for identifier in ("urn:x-test:submodel0", "urn:x-test:submodel1", "urn:x-test:submodel0",
+                           "urn:x-test:submodel2", "urn:x-test:submodel0", "urn:x-test:submodel1"):
+            self.assertIs(self.backing_store.get_identifiable(identifier), object_store.get_identifiable(identifier))
+        # submodel1 has been evicted in favour of submodel2, since submodel0 has been used more recently
+        self.assertEqual((2, 4, 2), (object_store.hits, object_store.misses, object_store.evictions))
+        self.assertEqual(10, self.backing_store.requests)
+        self.assertIn("urn:x-test:submodel0", object_store)
+        self.assertIn(self.submodels[2], object_store)
+        self.assertNotIn("urn:x-test:submodel3", object_store)
+        self.assertEqual(3, len(object_store))
+        self.assertEqual(self.submodels, list(object_store))
+
+        with self.assertRaises(KeyError):
+            object_store.get_identifiable("urn:x-test:submodel3")
+
+    def test_size_and_ttl(self) -> None:
+        self.submodels[0].submodel_element.add(model.Property("prop", model.datatypes.Int))
+        object_store = model.CachingObjectStore(self.backing_store, max_entries=None, max_size=2)
+        object_store.get_identifiable("urn:x-test:submodel0")
+        object_store.get_identifiable("urn:x-test:submodel1")
+        self.assertEqual(1, object_store.evictions)
+        object_store.get_identifiable("urn:x-test:submodel1")
+        self.assertEqual(1, object_store.hits)
+
+        object_store = model.CachingObjectStore(self.backing_store, ttl=0)
+        object_store.get_identifiable("urn:x-test:submodel0")
+        object_store.get_identifiable("urn:x-test:submodel0")
+        self.assertEqual((0, 2, 0), (object_store.hits, object_store.misses, object_store.evictions))
+
+    def test_write_through(self) -> None:
+        object_store = model.CachingObjectStore(self.backing_store)
+        resolver = model.ReferenceResolver(object_store)
+        submodel = model.Submodel("urn:x-test:submodel3")
+        object_store.add(submodel)
+        self.assertIn(submodel, self.backing_store)
+        self.assertIs(submodel, resolver.get_identifiable("urn:x-test:submodel3"))
+        self.assertIs(submodel, object_store.get_identifiable("urn:x-test:submodel3"))
+        self.assertEqual(0, self.backing_store.requests)
+
+        object_store.discard(submodel)
+        self.assertNotIn(submodel, self.backing_store)
+        self.assertNotIn(submodel, object_store)
+        with self.assertRaises(KeyError):
+            resolver.get_identifiable("urn:x-test:submodel3")
+
+        # Modifications of the backing store invalidate the cache
+        object_store.get_identifiable("urn:x-test:submodel0")
+        self.backing_store.discard(self.submodels[0])
+        with self.assertRaises(KeyError):
+            object_store.get_identifiable("urn:x-test:submodel0")
+
+        # So do id changes
+        object_store.get_identifiable("urn:x-test:submodel1")
+        self.submodels[1].id = "urn:x-test:submodel4"
+        with self.assertRaises(KeyError):
+            object_store.get_identifiable("urn:x-test:submodel1")
+
+    def test_bulk(self) -> None:
+        object_store = model.CachingObjectStore(self.backing_store)
+        object_store.get_identifiable("urn:x-test:submodel0")
+        self.assertEqual({"urn:x-test:submodel0": self.submodels[0], "urn:x-test:submodel1": self.submodels[1]},
+                         object_store.get_many(["urn:x-test:submodel0", "urn:x-test:submodel1",
+                                                "urn:x-test:submodel3"]))
+        # The uncached identifiers are fetched with a single request to the backing store
+        self.assertEqual((1, 3), (object_store.hits, object_store.misses))
+        self.assertEqual(2, self.backing_store.requests)
+        object_store.get_many(["urn:x-test:submodel0", "urn:x-test:submodel1"])
+        self.assertEqual(2, self.backing_store.requests)
+
+        submodel = model.Submodel("urn:x-test:submodel3")
+        object_store.add_many([submodel])
+        self.assertIn(submodel, self.backing_store)
+        self.assertIs(submodel, object_store.get_identifiable("urn:x-test:submodel3"))
+        object_store.discard_many([submodel, self.submodels[0]])
+        self.assertEqual({"urn:x-test:submodel1": self.submodels[1]},
+                         object_store.get_many(["urn:x-test:submodel0", "urn:x-test:submodel1",
+                                                "urn:x-test:submodel3"]))
+
+    def test_find(self) -> None:
+        backing_store = CountingObjectStore(self.submodels, indexes=[model.TYPE_INDEX])
+        object_store = model.CachingObjectStore(backing_store)
+        self.assertEqual(self.submodels, list(object_store.find(model.TYPE_INDEX, model.Submodel)))
+        # The index of the backing store is used instead of iterating over all of its objects
+        self.assertEqual(0, backing_store.iterations)
+        self.assertEqual([], list(object_store.find(model.ID_SHORT_INDEX, "test")))
+        self.assertEqual(1, backing_store.iterations)
+
+
+class ReferenceResolverTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.prop = model.Property("prop", model.datatypes.Int, 1)
+        self.collection = model.SubmodelElementCollection("collection", [self.prop])
+        self.submodel = model.Submodel("urn:x-test:submodel", submodel_element=[self.collection])
+        self.object_store: model.DictObjectStore[model.Identifiable] = model.DictObjectStore([self.submodel])
+        self.provider = CountingObjectProvider(self.object_store)
+        self.resolver = model.ReferenceResolver(self.provider)
+        self.ref = model.ModelReference.from_referable(self.prop)
+
+    def test_resolve(self) -> None:
+        self.assertIs(self.prop, self.resolver.resolve(self.ref))
+        self.assertIs(self.prop, self.resolver.resolve(self.ref))
+        self.assertIs(self.submodel, self.resolver.resolve(model.ModelReference.from_referable(self.submodel)))
+        self.assertEqual(1, self.provider.requests)
+        # The resolver can be used as a provider itself
+        self.assertIs(self.collection, model.ModelReference.from_referable(self.collection).resolve(self.resolver))
+        self.assertEqual(1, self.provider.requests)
+
+        with self.assertRaises(model.UnexpectedTypeError):
+            self.resolver.resolve(model.ModelReference(self.ref.key, model.Range))
+        with self.assertRaises(KeyError) as cm:
+            self.resolver.resolve(model.ModelReference((model.Key(model.KeyTypes.SUBMODEL, "urn:x-test:other"),),
+                                                       model.Submodel))
+        self.assertEqual("'Could not resolve identifier urn:x-test:other'", str(cm.exception))
+
+        # Structural changes of the Identifiable invalidate the resolved Referables
+        self.collection.value.remove(self.prop)
+        with self.assertRaises(KeyError):
+            self.resolver.resolve(self.ref)
+        new_prop = model.Property("prop", model.datatypes.Int, 2)
+        self.collection.add_referable(new_prop)
+        self.assertIs(new_prop, self.resolver.resolve(self.ref))
+        self.assertEqual(2, self.provider.requests)
+
+        # Changes of the object store invalidate the Identifiable, if the resolver knows the store
+        resolver = model.ReferenceResolver(self.object_store)
+        self.assertIs(new_prop, resolver.resolve(self.ref))
+        self.object_store.discard(self.submodel)
+        submodel = model.Submodel("urn:x-test:submodel", submodel_element=[
+            model.SubmodelElementCollection("collection", [model.Property("prop", model.datatypes.Int, 3)])])
+        self.object_store.add(submodel)
+        self.assertIs(submodel, resolver.resolve(self.ref).parent.parent)  # type: ignore
+
+        # Other changes must be announced explicitly
+        self.assertIs(self.submodel, self.resolver.resolve(model.ModelReference.from_referable(self.submodel)))
+        self.resolver.invalidate("urn:x-test:submodel")
+        self.assertIs(submodel, self.resolver.resolve(model.ModelReference.from_referable(submodel)))
+        self.assertEqual(3, self.provider.requests)
+
+    def test_resolve_many(self) -> None:
+        other_submodel = model.Submodel("urn:x-test:submodel2", submodel_element=[
+            model.Property("prop", model.datatypes.Int, 2)])
+        self.object_store.add(other_submodel)
+        references = [self.ref,
+                      model.ModelReference.from_referable(self.collection),
+                      model.ModelReference.from_referable(other_submodel),
+                      model.ModelReference.from_referable(self.submodel),
+                      model.ModelReference.from_referable(other_submodel.get_referable("prop"))]
+        self.assertEqual([self.prop, self.collection, other_submodel, self.submodel,
+                          other_submodel.get_referable("prop")], self.resolver.resolve_many(references))
+        self.assertEqual(2, self.provider.requests)
+        self.resolver.invalidate()
+        self.resolver.resolve_many(references)
+        self.assertEqual(4, self.provider.requests)
+
+        broken_references: List[model.ModelReference] = [
+            model.ModelReference((model.Key(model.KeyTypes.SUBMODEL, "urn:x-test:submodel"),
+                                  model.Key(model.KeyTypes.PROPERTY, "unknown")), model.Property),
+            model.ModelReference((model.Key(model.KeyTypes.SUBMODEL, "urn:x-test:unknown"),), model.Submodel),
+            model.ModelReference(self.ref.key, model.Range),
+        ]
+        self.assertEqual([None, None, None, self.prop],
+                         self.resolver.resolve_many(broken_references + [self.ref], default=None))
+        with self.assertRaises(KeyError):
+            self.resolver.resolve_many(broken_references)
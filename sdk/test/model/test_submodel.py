@@ -5,6 +5,8 @@
 #
 # SPDX-License-Identifier: MIT
 
+import copy
+import pickle
 import unittest
 import dateutil.tz
 
@@ -275,6 +277,71 @@ class SubmodelElementListTest(unittest.TestCase):
                          "MultiLanguageProperty, got Property (Constraint AASd-108)", str(cm.exception))
         list_.value = [mlp1, mlp2]
 
+    def test_aasd_114_incremental(self):
+        semantic_id1 = model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:test"),))
+        semantic_id2 = model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:different"),))
+        mlp1 = model.MultiLanguageProperty(None, semantic_id=semantic_id1)
+        mlp2 = model.MultiLanguageProperty(None)
+        mlp3 = model.MultiLanguageProperty(None, semantic_id=semantic_id2)
+        list_ = model.SubmodelElementList("test_list", model.MultiLanguageProperty, [mlp1, mlp2])
+        with self.assertRaises(model.AASConstraintViolation) as cm:
+            list_.value.add(mlp3)
+        self.assertEqual(114, cm.exception.constraint_id)
+
+        # Once no contained element has a semantic_id anymore, any semantic_id is allowed again
+        list_.value.remove(mlp1)
+        list_.value.add(mlp3)
+        with self.assertRaises(model.AASConstraintViolation) as cm:
+            list_.value.add(mlp1)
+        self.assertEqual(114, cm.exception.constraint_id)
+
+        # Elements of the same batch are checked against each other as well
+        list_.value.clear()
+        with self.assertRaises(model.AASConstraintViolation) as cm:
+            list_.value.extend([mlp1, mlp2, mlp3])
+        self.assertEqual("Element to be added MultiLanguageProperty has semantic_id "
+                         "ExternalReference(key=(Key(type=GLOBAL_REFERENCE, value=urn:x-test:different),)), "
+                         "while already contained element MultiLanguageProperty has semantic_id "
+                         "ExternalReference(key=(Key(type=GLOBAL_REFERENCE, value=urn:x-test:test),)), "
+                         "which aren't equal. (Constraint AASd-114)", str(cm.exception))
+        self.assertEqual(0, len(list_.value))
+        list_.value.extend([mlp3, mlp2])
+        self.assertEqual([mlp3, mlp2], list(list_.value))
+
+    def test_generated_id_short(self):
+        list_ = model.SubmodelElementList("test_list", model.Property, value_type_list_element=model.datatypes.Int,
+                                          value=[model.Property(None, model.datatypes.Int, i) for i in range(3)])
+        id_shorts = [prop.id_short for prop in list_.value]
+        self.assertEqual(3, len(set(id_shorts)))
+        for id_short in id_shorts:
+            self.assertIsNotNone(id_short)
+        prop = list_.value[1]
+        self.assertIs(prop, list_.get_referable("1"))
+        del list_.value[1]
+        self.assertIsNone(prop.id_short)
+        list_.value.add(prop)
+        self.assertNotIn(prop.id_short, id_shorts)
+        self.assertIs(prop, list_.get_referable("2"))
+
+    def test_copy(self):
+        semantic_id = model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:test"),))
+        list_ = model.SubmodelElementList("test_list", model.Property, value_type_list_element=model.datatypes.Int,
+                                          value=[model.Property(None, model.datatypes.Int, i, semantic_id=semantic_id)
+                                                 for i in range(3)])
+        for list_copy in (copy.deepcopy(list_), pickle.loads(pickle.dumps(list_))):
+            self.assertEqual([0, 1, 2], [prop.value for prop in list_copy.value])
+            self.assertEqual(2, list_copy.value.index(list_copy.get_referable("2")))
+            # The constraints are still checked by the hooks of the copy
+            with self.assertRaises(model.AASConstraintViolation) as cm:
+                list_copy.value.append(model.Property(None, model.datatypes.Int, semantic_id=model.ExternalReference(
+                    (model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:different"),))))
+            self.assertEqual(114, cm.exception.constraint_id)
+            list_copy.value.append(model.Property(None, model.datatypes.Int, 3))
+            self.assertIs(list_copy.value[3], list_copy.get_referable("3"))
+            del list_copy.value[0]
+            self.assertEqual([1, 2, 3], [prop.value for prop in list_copy.value])
+        self.assertEqual(3, len(list_.value))
+
     def test_immutable_attributes(self):
         list_ = model.SubmodelElementList("test_list", model.File)
         with self.assertRaises(AttributeError):
@@ -325,3 +392,96 @@ class BasicEventElementTest(unittest.TestCase):
 
         timestamp_tzinfo_utc = model.datatypes.DateTime(2022, 11, 13, 23, 45, 30, 123456, dateutil.tz.UTC)
         bee.last_update = timestamp_tzinfo_utc
+
+
+class CloneTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.semantic_id = model.ExternalReference((model.Key(model.KeyTypes.GLOBAL_REFERENCE, "urn:x-test:test"),))
+        self.template = model.Submodel("https://acplt.org/Template", [
+            model.Property("serial_number", model.datatypes.String, "0", semantic_id=self.semantic_id,
+                           description=model.MultiLanguageTextType({"en": "Serial number"})),
+            model.SubmodelElementCollection("nameplate", [
+                model.MultiLanguageProperty("manufacturer", model.MultiLanguageTextType({"en": "Unknown"})),
+            ]),
+            model.SubmodelElementList("measurements", model.Property, [
+                model.Property(None, model.datatypes.Int, 0),
+            ], value_type_list_element=model.datatypes.Int),
+        ], kind=model.ModellingKind.TEMPLATE)
+
+    def test_clone(self) -> None:
+        self.template.freeze()
+        clone = self.template.clone("https://acplt.org/Instance", {
+            "serial_number": "1234",
+            ("nameplate", "manufacturer"): model.MultiLanguageTextType({"en": "ACME"}),
+            ("measurements", "0"): 5,
+        })
+        self.assertEqual("https://acplt.org/Instance", clone.id)
+        self.assertFalse(clone.frozen)
+        serial_number = clone.get_referable("serial_number")
+        assert isinstance(serial_number, model.Property)
+        self.assertEqual("1234", serial_number.value)
+        manufacturer = clone.get_referable(["nameplate", "manufacturer"])
+        assert isinstance(manufacturer, model.MultiLanguageProperty)
+        self.assertEqual({"en": "ACME"}, manufacturer.value)
+        measurement = clone.get_referable(["measurements", "0"])
+        assert isinstance(measurement, model.Property)
+        self.assertEqual(5, measurement.value)
+        template_serial_number = self.template.get_referable("serial_number")
+        assert isinstance(template_serial_number, model.Property)
+        self.assertEqual("0", template_serial_number.value)
+
+        # Immutable parts are shared with the template
+        self.assertIs(template_serial_number.semantic_id, serial_number.semantic_id)
+        self.assertIs(template_serial_number.description, serial_number.description)
+        assert serial_number.description is not None
+        with self.assertRaises(model.FrozenObjectError):
+            serial_number.description["de"] = "Seriennummer"
+        serial_number.description = model.MultiLanguageTextType({"de": "Seriennummer"})
+        self.assertEqual({"en": "Serial number"}, template_serial_number.description)
+
+        with self.assertRaises(KeyError):
+            self.template.clone("https://acplt.org/Instance", {"unknown": "1"})
+        with self.assertRaises(TypeError):
+            self.template.clone("https://acplt.org/Instance", {("measurements", "0"): "5"})
+
+    def test_clone_override_without_value(self) -> None:
+        self.template.submodel_element.add(model.Entity("entity", model.EntityType.CO_MANAGED_ENTITY))
+        with self.assertRaises(TypeError):
+            self.template.clone("https://acplt.org/Instance", {"nameplate": 1})
+        with self.assertRaises(TypeError):
+            self.template.clone("https://acplt.org/Instance", {"measurements": [1]})
+        with self.assertRaises(TypeError):
+            self.template.clone("https://acplt.org/Instance", {"entity": "x"})
+        with self.assertRaises(TypeError):
+            self.template.clone("https://acplt.org/Instance", {(): "x"})
+        collection = self.template.get_referable("nameplate")
+        assert isinstance(collection, model.SubmodelElementCollection)
+        with self.assertRaises(TypeError):
+            collection.clone("nameplate2", {(): 1})
+        self.assertEqual(1, len(collection.value))
+
+    def test_clone_submodel_element(self) -> None:
+        collection = self.template.get_referable("nameplate")
+        assert isinstance(collection, model.SubmodelElementCollection)
+        clone = collection.clone("nameplate2", {"manufacturer": model.MultiLanguageTextType({"en": "ACME"})})
+        self.assertIsNone(clone.parent)
+        self.assertEqual("nameplate2", clone.id_short)
+        manufacturer = clone.get_referable("manufacturer")
+        assert isinstance(manufacturer, model.MultiLanguageProperty)
+        self.assertEqual({"en": "ACME"}, manufacturer.value)
+        manufacturer = collection.get_referable("manufacturer")
+        assert isinstance(manufacturer, model.MultiLanguageProperty)
+        self.assertEqual({"en": "Unknown"}, manufacturer.value)
+        self.template.submodel_element.add(clone)
+
+        # LangStringSets of objects, which are not frozen, are copied
+        prop = self.template.get_referable("serial_number")
+        assert isinstance(prop, model.Property)
+        prop_clone = prop.clone("serial_number2", {(): "1"})
+        self.assertEqual("1", prop_clone.value)
+        self.assertIsNot(prop.description, prop_clone.description)
+
+        list_ = self.template.get_referable("measurements")
+        assert isinstance(list_, model.SubmodelElementList)
+        list_.value.append(list_.value[0].clone(None, {(): 1}))
+        self.assertEqual([0, 1], [element.value for element in list_.value])
@@ -0,0 +1,82 @@
+# Copyright (c) 2025 the Eclipse BaSyx Authors
+#
+# This program and the accompanying materials are made available under the terms of the MIT License, available in
+# the LICENSE file of this project.
+#
+# SPDX-License-Identifier: MIT
+
+import unittest
+
+from basyx.aas import model
+from basyx.aas.examples.data import example_aas
+from basyx.aas.util.diff import PatchOperation, PatchOperationType, apply_patch, diff_identifiables, \
+    diff_object_stores
+
+SUBMODEL_ID = "https://acplt.org/Test_Submodel"
+
+
+class DiffTest(unittest.TestCase):
+    def assertStoresEqual(self, expected: model.AbstractObjectStore, actual: model.AbstractObjectStore) -> None:
+        self.assertEqual({obj.id for obj in expected}, {obj.id for obj in actual})
+        for obj in expected:
+            self.assertEqual(obj.content_hash, actual.get_identifiable(obj.id).content_hash)
+
+    def test_diff_equal(self) -> None:
+        self.assertEqual([], diff_object_stores(example_aas.create_full_example(), example_aas.create_full_example()))
+
+    def test_diff_identifiables(self) -> None:
+        old = example_aas.create_example_submodel()
+        new = example_aas.create_example_submodel()
+        new_collection = new.get_referable("ExampleSubmodelCollection")
+        assert isinstance(new_collection, model.SubmodelElementCollection)
+        new_list = new_collection.get_referable("ExampleSubmodelList")
+        assert isinstance(new_list, model.SubmodelElementList)
+        new_list.value[1].value = "new value"
+        new_collection.remove_referable("ExampleBlob")
+        new_collection.add_referable(model.Property("NewProperty", model.datatypes.Int, 1))
+        new.get_referable("ExampleRelationshipElement").category = "VARIABLE"
+
+        patch = diff_identifiables(old, new)
+        self.assertCountEqual([
+            PatchOperation(PatchOperationType.REPLACE, SUBMODEL_ID, ("ExampleRelationshipElement",),
+                           new.get_referable("ExampleRelationshipElement")),
+            PatchOperation(PatchOperationType.REPLACE, SUBMODEL_ID,
+                           ("ExampleSubmodelCollection", "ExampleSubmodelList", "1"),
+                           new_list.value[1]),
+            PatchOperation(PatchOperationType.REMOVE, SUBMODEL_ID, ("ExampleSubmodelCollection", "ExampleBlob")),
+            PatchOperation(PatchOperationType.ADD, SUBMODEL_ID, ("ExampleSubmodelCollection", "NewProperty"),
+                           new_collection.get_referable("NewProperty"), "value"),
+        ], patch)
+
+        with self.assertRaises(ValueError):
+            diff_identifiables(old, example_aas.create_example_asset_administration_shell())
+
+    def test_apply_patch(self) -> None:
+        old = example_aas.create_full_example()
+        new = example_aas.create_full_example()
+        new_submodel = new.get_identifiable(SUBMODEL_ID)
+        assert isinstance(new_submodel, model.Submodel)
+        new_collection = new_submodel.get_referable("ExampleSubmodelCollection")
+        assert isinstance(new_collection, model.SubmodelElementCollection)
+        new_list = new_collection.get_referable("ExampleSubmodelList")
+        assert isinstance(new_list, model.SubmodelElementList)
+        new_list.value[0].value = "new value"
+        new_collection.remove_referable("ExampleBlob")
+        new_collection.add_referable(model.Property("NewProperty", model.datatypes.Int, 1))
+        new_submodel.category = "VARIABLE"
+        new.discard(new.get_identifiable("https://acplt.org/Test_ConceptDescription"))
+        new.add(model.Submodel("https://acplt.org/New_Submodel"))
+
+        patch = diff_object_stores(old, new)
+        replica = example_aas.create_full_example()
+        replica_submodel = replica.get_identifiable(SUBMODEL_ID)
+        apply_patch(replica, patch)
+        self.assertStoresEqual(new, replica)
+        # Replaced Identifiables keep their identity
+        self.assertIs(replica_submodel, replica.get_identifiable(SUBMODEL_ID))
+        # The patch is not bound to the store and can be applied again
+        apply_patch(old, patch)
+        self.assertStoresEqual(new, old)
+
+        with self.assertRaises(KeyError):
+            apply_patch(replica, [PatchOperation(PatchOperationType.REMOVE, SUBMODEL_ID, ("Unknown",))])
@@ -0,0 +1,40 @@
+# Copyright (c) 2025 the Eclipse BaSyx Authors
+#
+# This program and the accompanying materials are made available under the terms of the MIT License, available in
+# the LICENSE file of this project.
+#
+# SPDX-License-Identifier: MIT
+
+import gc
+import unittest
+
+from basyx.aas import model
+from basyx.aas.examples.data import example_aas
+from basyx.aas.util import garbage_collection
+
+
+class GarbageCollectionTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        gc.unfreeze()
+
+    def test_loading(self) -> None:
+        object_store: model.DictObjectStore[model.Identifiable] = model.DictObjectStore()
+        with garbage_collection.loading(freeze_loaded=False):
+            self.assertFalse(gc.isenabled())
+            object_store.add(example_aas.create_example_submodel())
+        self.assertTrue(gc.isenabled())
+        self.assertEqual(0, gc.get_freeze_count())
+
+        with self.assertRaises(ValueError):
+            with garbage_collection.loading():
+                raise ValueError()
+        self.assertTrue(gc.isenabled())
+        self.assertEqual(0, gc.get_freeze_count())
+
+        with garbage_collection.loading():
+            object_store.add(example_aas.create_example_asset_administration_shell())
+        self.assertTrue(gc.isenabled())
+        self.assertGreater(gc.get_freeze_count(), 0)
+        # Frozen objects are not part of any generation of the garbage collector anymore
+        tracked_ids = {id(obj) for obj in gc.get_objects()}
+        self.assertFalse(any(id(obj) in tracked_ids for obj in object_store))
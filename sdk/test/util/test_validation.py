@@ -0,0 +1,72 @@
+# Copyright (c) 2025 the Eclipse BaSyx Authors
+#
+# This program and the accompanying materials are made available under the terms of the MIT License, available in
+# the LICENSE file of this project.
+#
+# SPDX-License-Identifier: MIT
+
+import concurrent.futures
+import unittest
+
+from basyx.aas import model
+from basyx.aas.examples.data import example_aas
+from basyx.aas.util.validation import Violation, validate_store
+
+
+class ValidateStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.object_store: model.DictObjectStore[model.Identifiable] = model.DictObjectStore()
+        self.object_store.add(example_aas.create_example_submodel())
+        with model.trusted_load():
+            submodel_elements = [
+                model.SubmodelElementList("list", model.Property, [
+                    model.Property(None, model.datatypes.String, category="a" * 200),
+                ], value_type_list_element=model.datatypes.String),
+                model.ReferenceElement("reference", model.ModelReference(
+                    (model.Key(model.KeyTypes.SUBMODEL, "https://acplt.org/Test_Submodel"),
+                     model.Key(model.KeyTypes.PROPERTY, "Unknown")), model.Property)),
+                model.ReferenceElement("valid_reference", model.ModelReference(
+                    (model.Key(model.KeyTypes.SUBMODEL, "https://acplt.org/Test_Submodel"),
+                     model.Key(model.KeyTypes.SUBMODEL_ELEMENT_COLLECTION, "ExampleSubmodelCollection"),
+                     model.Key(model.KeyTypes.FILE, "ExampleFile"),
+                     model.Key(model.KeyTypes.FRAGMENT_REFERENCE, "fragment")), model.File)),
+                model.Entity("entity", model.EntityType.SELF_MANAGED_ENTITY),
+            ]
+            self.object_store.add(model.Submodel("https://acplt.org/Invalid_Submodel", id_short="1_invalid",
+                                                 category="a" * 200, submodel_element=submodel_elements))
+
+    def test_validate_store(self) -> None:
+        violations = validate_store(self.object_store, check_references=False)
+        self.assertCountEqual([
+            ("https://acplt.org/Invalid_Submodel", (), 2),
+            ("https://acplt.org/Invalid_Submodel", (), None),
+            ("https://acplt.org/Invalid_Submodel", ("list", "0"), None),
+            ("https://acplt.org/Invalid_Submodel", ("entity",), 14),
+        ], [(v.identifier, v.path, v.constraint_id) for v in violations])
+
+        violations = validate_store(self.object_store)
+        reference_violations = [v for v in violations if v.identifier == "https://acplt.org/Invalid_Submodel"
+                                and v.path == ("reference",)]
+        self.assertEqual(1, len(reference_violations))
+        self.assertIn("Unknown", reference_violations[0].message)
+        self.assertNotIn(("valid_reference",), [v.path for v in violations])
+
+    def test_validate_store_parallel(self) -> None:
+        for identifiable in example_aas.create_full_example():
+            if self.object_store.get(identifiable.id) is None:
+                self.object_store.add(identifiable)
+        expected = validate_store(self.object_store, max_workers=1)
+        self.assertEqual(expected, validate_store(self.object_store, max_workers=2, chunk_size=2))
+        self.assertIn(Violation("https://acplt.org/Invalid_Submodel", (), 2,
+                                "The id_short must start with a letter (Constraint AASd-002)"), expected)
+
+    def test_validate_store_concurrently(self) -> None:
+        # Concurrent calls, e.g. by a threaded server, use separate worker pools
+        other_store: model.DictObjectStore[model.Identifiable] = model.DictObjectStore(
+            example_aas.create_full_example())
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            futures = [executor.submit(validate_store, store, max_workers=2, chunk_size=1)
+                       for store in (self.object_store, other_store)]
+            violations, other_violations = (future.result() for future in futures)
+        self.assertCountEqual(validate_store(self.object_store, max_workers=1), violations)
+        self.assertCountEqual(validate_store(other_store, max_workers=1), other_violations)
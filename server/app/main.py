@@ -7,10 +7,12 @@ from basyx.aas.adapter import aasx
 
 from basyx.aas.backend.local_file import LocalFileObjectStore
 from basyx.aas.adapter.http import WSGIApp
+from basyx.aas.util import garbage_collection
 
 storage_path = os.getenv("STORAGE_PATH", "/storage")
 storage_type = os.getenv("STORAGE_TYPE", "LOCAL_FILE_READ_ONLY")
 base_path = os.getenv("API_BASE_PATH")
+freeze_objects = os.getenv("FREEZE_OBJECTS", "false").lower() in ("1", "true", "yes")
 
 wsgi_optparams = {}
 
@@ -21,23 +23,31 @@ if storage_type == "LOCAL_FILE_BACKEND":
     application = WSGIApp(LocalFileObjectStore(storage_path), aasx.DictSupplementaryFileContainer(), **wsgi_optparams)
 
 elif storage_type in "LOCAL_FILE_READ_ONLY":
-    object_store: model.DictObjectStore = model.DictObjectStore()
+    # The secondary indexes allow to answer the filters of the API (e.g. by idShort) without iterating all objects
+    object_store: model.IndexedObjectStore = model.IndexedObjectStore(indexes=model.BUILTIN_INDEXES)
     file_store: aasx.DictSupplementaryFileContainer = aasx.DictSupplementaryFileContainer()
 
-    for file in pathlib.Path(storage_path).iterdir():
-        if not file.is_file():
-            continue
-        print(f"Loading {file}")
-
-        if file.suffix.lower() == ".json":
-            with open(file) as f:
-                adapter.json.read_aas_json_file_into(object_store, f)
-        elif file.suffix.lower() == ".xml":
-            with open(file) as f:
-                adapter.xml.read_aas_xml_file_into(object_store, file)
-        elif file.suffix.lower() == ".aasx":
-            with aasx.AASXReader(file) as reader:
-                reader.read_into(object_store=object_store, file_store=file_store)
+    # The loaded objects are kept until the server stops. If they are immutable anyway, they are excluded from garbage
+    # collection as well.
+    with garbage_collection.loading(freeze_loaded=freeze_objects):
+        for file in pathlib.Path(storage_path).iterdir():
+            if not file.is_file():
+                continue
+            print(f"Loading {file}")
+
+            if file.suffix.lower() == ".json":
+                with open(file) as f:
+                    adapter.json.read_aas_json_file_into(object_store, f)
+            elif file.suffix.lower() == ".xml":
+                with open(file) as f:
+                    adapter.xml.read_aas_xml_file_into(object_store, file)
+            elif file.suffix.lower() == ".aasx":
+                with aasx.AASXReader(file) as reader:
+                    reader.read_into(object_store=object_store, file_store=file_store)
+
+        if freeze_objects:
+            for identifiable in object_store:
+                identifiable.freeze()
 
     application = WSGIApp(object_store, file_store, **wsgi_optparams)
 